@@ -107,6 +107,41 @@ def load_iotops_help():
         - name: Include multiple services in the support bundle with multiple --ops-service flags.
           text: >
             az iot ops support create-bundle --ops-service broker --ops-service connectors --ops-service deviceregistry
+
+        - name: Increase the number of concurrent fetches and bound the time spent on any single resource.
+          text: >
+            az iot ops support create-bundle --workers 16 --fetch-timeout 300
+
+        - name: Keep at most the last 5000 lines and 16 MiB of each container log.
+          text: >
+            az iot ops support create-bundle --log-tail 5000 --log-max-size 16
+
+        - name: Create a delta bundle capturing only what changed since a previous bundle.
+          text: >
+            az iot ops support create-bundle --since-bundle ./support_bundle_20241031T120000_aio.zip
+
+        - name: Include a 10% sample of broker traces from the last hour lasting at least 100ms.
+          text: >
+            az iot ops support create-bundle --ops-service broker --broker-trace-age 3600
+            --broker-trace-min-duration 100 --broker-trace-sample-rate 0.1
+    """
+
+    helps[
+        "iot ops support merge-bundle"
+    ] = """
+        type: command
+        short-summary: Merges a delta support bundle into the bundle it was created from.
+        long-summary: |
+            The delta must have been created with --since-bundle pointing at the base bundle.
+            Changed resources replace their base copies, removed resources are dropped and new
+            container log lines are appended. The merged bundle can be used with --since-bundle
+            to create the next delta.
+
+        examples:
+        - name: Merge a delta bundle into its base, producing the merged bundle in the current directory.
+          text: >
+            az iot ops support merge-bundle --base-bundle ./support_bundle_20241031T120000_aio.zip
+            --delta-bundle ./support_bundle_20241031T130000_aio.zip
     """
 
     helps[
@@ -1933,6 +1968,49 @@ def load_iotops_help():
             --custom-attribute work_location=factory
     """
 
+    helps[
+        "iot ops asset export"
+    ] = """
+        type: command
+        short-summary: Export the data-points and events of many assets to one file.
+        long-summary: |
+          Assets are paged from Resource Graph and rows are written to the file as they are read,
+          one row per data-point or event. The file name will be assets_sub_points.{file_type} and
+          the file can be imported with `az iot ops asset import`.
+        examples:
+        - name: Export the data-points and events of all assets in a resource group in CSV format.
+          text: >
+            az iot ops asset export -g myresourcegroup
+        - name: Export the data-points and events of all assets associated with an instance in JSON format to a specific output directory.
+          text: >
+            az iot ops asset export --instance myinstance --ig myinstanceresourcegroup --format json --output-dir myAssetsFiles
+        - name: Export the data-points and events of all assets in the subscription. Replace the file if one is present already.
+          text: >
+            az iot ops asset export --replace
+    """
+
+    helps[
+        "iot ops asset import"
+    ] = """
+        type: command
+        short-summary: Import data-points and events for many assets in a resource group.
+        long-summary: |
+          Each row of the file must include an asset column (Asset in csv files, asset otherwise) and may
+          include a dataset column (defaults to default). Rows with a data source are imported as data-points,
+          other rows are imported as events.
+
+          Assets are read once via Resource Graph and only assets whose data-points or events change are updated.
+          Updates run concurrently and throttled requests are retried.
+          For examples of file formats, please see aka.ms/aziotops-assets
+        examples:
+        - name: Import data-points and events for the assets listed in a file. Data-points and events with duplicate names will be ignored.
+          text: >
+            az iot ops asset import -g myresourcegroup --input-file site_assets.csv
+        - name: Import data-points and events for the assets listed in a file. Data-points and events with duplicate names will replace the current ones.
+          text: >
+            az iot ops asset import -g myresourcegroup --input-file site_assets.json --replace
+    """
+
     helps[
         "iot ops asset query"
     ] = """
@@ -69,6 +69,7 @@ def load_iotops_commands(self, _):
         is_preview=True,
     ) as cmd_group:
         cmd_group.command("create-bundle", "support_bundle")
+        cmd_group.command("merge-bundle", "merge_support_bundles")
 
     with self.command_group(
         "iot ops broker",
@@ -182,6 +183,8 @@ def load_iotops_commands(self, _):
     ) as cmd_group:
         cmd_group.command("create", "create_asset")
         cmd_group.command("delete", "delete_asset")
+        cmd_group.command("export", "export_assets")
+        cmd_group.command("import", "import_assets")
         cmd_group.command("query", "query_assets")
         cmd_group.show_command("show", "show_asset")
         cmd_group.command("update", "update_asset")
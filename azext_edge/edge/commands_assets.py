@@ -97,6 +97,40 @@ def delete_asset(
     )
 
 
+def export_assets(
+    cmd,
+    extension: str = "csv",
+    instance_name: Optional[str] = None,
+    instance_resource_group: Optional[str] = None,
+    output_dir: str = ".",
+    replace: bool = False,
+    resource_group_name: Optional[str] = None,
+) -> dict:
+    return Assets(cmd).export_sub_points(
+        extension=extension,
+        instance_name=instance_name,
+        instance_resource_group=instance_resource_group,
+        output_dir=output_dir,
+        replace=replace,
+        resource_group_name=resource_group_name,
+    )
+
+
+def import_assets(
+    cmd,
+    file_path: str,
+    resource_group_name: str,
+    replace: bool = False,
+    **kwargs
+) -> dict:
+    return Assets(cmd).import_sub_points(
+        file_path=file_path,
+        replace=replace,
+        resource_group_name=resource_group_name,
+        **kwargs
+    )
+
+
 # TODO: add in once GA
 def list_assets(
     cmd,
@@ -8,7 +8,7 @@ import json
 from pathlib import PurePath
 from typing import Any, Dict, Iterable, List, Optional, Union
 
-from azure.cli.core.azclierror import ArgumentUsageError
+from azure.cli.core.azclierror import ArgumentUsageError, InvalidArgumentValueError
 from knack.log import get_logger
 
 from .providers.base import DEFAULT_NAMESPACE, load_config_context
@@ -34,19 +34,84 @@ def support_bundle(
     include_mq_traces: Optional[bool] = None,
     context_name: Optional[str] = None,
     ops_services: Optional[List[str]] = None,
+    max_workers: Optional[int] = None,
+    element_timeout: Optional[int] = None,
+    since_bundle: Optional[str] = None,
+    broker_trace_age_seconds: Optional[int] = None,
+    broker_trace_services: Optional[List[str]] = None,
+    broker_trace_spans: Optional[List[str]] = None,
+    broker_trace_min_duration_ms: Optional[float] = None,
+    broker_trace_sample_rate: Optional[float] = None,
+    log_tail_lines: Optional[int] = None,
+    log_max_mb: Optional[int] = None,
 ) -> Union[Dict[str, Any], None]:
+    for log_limit, option in [(log_tail_lines, "--log-tail"), (log_max_mb, "--log-max-size")]:
+        if log_limit is not None and log_limit < 1:
+            raise ArgumentUsageError(f"{option} must be a positive integer.")
+    for fetch_limit, option in [(max_workers, "--workers"), (element_timeout, "--fetch-timeout")]:
+        if fetch_limit is not None and fetch_limit < 1:
+            raise InvalidArgumentValueError(f"{option} must be a positive integer.")
     load_config_context(context_name=context_name)
     from .providers.support_bundle import build_bundle
 
+    mq_trace_filter = None
+    if any(
+        arg is not None
+        for arg in [
+            broker_trace_age_seconds,
+            broker_trace_services,
+            broker_trace_spans,
+            broker_trace_min_duration_ms,
+            broker_trace_sample_rate,
+        ]
+    ):
+        from datetime import datetime, timedelta, timezone
+
+        from .providers.stats import TraceFilter
+
+        if broker_trace_sample_rate is not None and not 0 < broker_trace_sample_rate <= 1:
+            raise ArgumentUsageError("Broker trace sample rate (--broker-trace-sample-rate) must be in (0, 1].")
+        # trace filters imply trace capture
+        include_mq_traces = True
+        mq_trace_filter = TraceFilter(
+            start_time=(
+                datetime.now(timezone.utc) - timedelta(seconds=broker_trace_age_seconds)
+                if broker_trace_age_seconds
+                else None
+            ),
+            service_names=broker_trace_services,
+            span_names=broker_trace_spans,
+            min_duration_ms=broker_trace_min_duration_ms,
+            sample_rate=broker_trace_sample_rate,
+        )
+
     bundle_path: PurePath = get_bundle_path(bundle_dir=bundle_dir)
     return build_bundle(
         ops_services=ops_services,
         bundle_path=str(bundle_path),
         log_age_seconds=log_age_seconds,
         include_mq_traces=include_mq_traces,
+        max_workers=max_workers,
+        element_timeout=element_timeout,
+        since_bundle=since_bundle,
+        mq_trace_filter=mq_trace_filter,
+        log_tail_lines=log_tail_lines,
+        log_max_bytes=log_max_mb * 1024 * 1024 if log_max_mb else None,
     )
 
 
+def merge_support_bundles(
+    cmd,
+    base_bundle: str,
+    delta_bundle: str,
+    bundle_dir: Optional[str] = None,
+) -> Dict[str, Any]:
+    from .providers.support_bundle import merge_bundles
+
+    bundle_path: PurePath = get_bundle_path(bundle_dir=bundle_dir)
+    return merge_bundles(base_bundle_path=base_bundle, delta_bundle_path=delta_bundle, file_path=str(bundle_path))
+
+
 def check(
     cmd,
     detail_level: int = ResourceOutputDetailLevel.summary.value,
@@ -203,6 +203,85 @@ def load_iotops_arguments(self, _):
             help="Include mqtt broker traces in the support bundle. "
             "Usage may add considerable size to the produced bundle.",
         )
+        context.argument(
+            "max_workers",
+            options_list=["--workers"],
+            help="Maximum number of support resources fetched concurrently. Min value: 1. Default: 8.",
+            type=int,
+        )
+        context.argument(
+            "element_timeout",
+            options_list=["--fetch-timeout"],
+            help="Timeout in seconds for fetching a single support resource. Min value: 1. "
+            "Resources exceeding the timeout are excluded from the bundle. By default there is no timeout.",
+            type=int,
+        )
+        context.argument(
+            "since_bundle",
+            options_list=["--since-bundle"],
+            help="Path to a previously created support bundle. When provided a delta bundle is produced, "
+            "only capturing resources whose resourceVersion changed and container logs written since "
+            "the previous bundle was created.",
+        )
+        context.argument(
+            "log_tail_lines",
+            options_list=["--log-tail"],
+            help="Only capture this many of the most recent lines of each container log.",
+            type=int,
+        )
+        context.argument(
+            "log_max_mb",
+            options_list=["--log-max-size"],
+            help="Maximum size in MiB captured per container log. When exceeded only the most recent "
+            "content of the log is kept. Default: 128.",
+            type=int,
+        )
+        context.argument(
+            "base_bundle",
+            options_list=["--base-bundle"],
+            help="Path to the support bundle the delta bundle was created from with --since-bundle.",
+        )
+        context.argument(
+            "delta_bundle",
+            options_list=["--delta-bundle"],
+            help="Path to the delta support bundle to merge into the base bundle.",
+        )
+        context.argument(
+            "broker_trace_age_seconds",
+            options_list=["--broker-trace-age"],
+            help="Only capture broker traces whose root span started within this many seconds.",
+            type=int,
+            arg_group="Broker Trace Filter",
+        )
+        context.argument(
+            "broker_trace_services",
+            options_list=["--broker-trace-service"],
+            nargs="+",
+            help="Only capture broker traces with a span from one of the space-separated service names.",
+            arg_group="Broker Trace Filter",
+        )
+        context.argument(
+            "broker_trace_spans",
+            options_list=["--broker-trace-span"],
+            nargs="+",
+            help="Only capture broker traces with a span of one of the space-separated span names.",
+            arg_group="Broker Trace Filter",
+        )
+        context.argument(
+            "broker_trace_min_duration_ms",
+            options_list=["--broker-trace-min-duration"],
+            help="Only capture broker traces whose root span lasted at least this many milliseconds.",
+            type=float,
+            arg_group="Broker Trace Filter",
+        )
+        context.argument(
+            "broker_trace_sample_rate",
+            options_list=["--broker-trace-sample-rate"],
+            help="Fraction of broker traces to capture, between 0 and 1. Sampling is keyed on trace Id "
+            "so repeated captures keep the same traces. Any broker trace filter implies --broker-traces.",
+            type=float,
+            arg_group="Broker Trace Filter",
+        )
 
     with self.argument_context("iot ops check") as context:
         context.argument(
@@ -23,6 +23,7 @@ from kubernetes.client.models import (
 
 from ..common import K8sSecretType
 from ..util import is_enabled_str
+from ..util.cache import MISSING, TTLCache
 
 DEFAULT_NAMESPACE: str = "azure-iot-operations"
 
@@ -44,32 +45,67 @@ def load_config_context(context_name: Optional[str] = None):
     global DEFAULT_NAMESPACE
     DEFAULT_NAMESPACE = current_config.get("namespace") or "azure-iot-operations"
 
+    # Scope cached cluster reads to the loaded context and API server.
+    global _cache_scope
+    _cache_scope = (context_name or current_config.get("name"), client.Configuration.get_default_copy().host)
 
-_namespaced_service_cache: dict = {}
+
+_cache_scope: tuple = (None, None)
+
+_namespaced_service_cache = TTLCache()
+_namespaced_pods_cache = TTLCache()
+_custom_object_cache = TTLCache()
+_cluster_resource_api_cache = TTLCache(ttl_sec=1800.0)
+
+
+def _scoped_key(*key) -> tuple:
+    return (_cache_scope, *key)
+
+
+def invalidate_cluster_caches(
+    group: Optional[str] = None, version: Optional[str] = None, plural: Optional[str] = None
+) -> int:
+    """
+    Drops cached cluster reads for the current scope. If group, version and plural are provided
+    only the matching custom object entries are dropped.
+    """
+    if group and version and plural:
+        return _custom_object_cache.invalidate(
+            lambda key: key[0] == _cache_scope and key[1:4] == (group, version, plural)
+        )
+
+    caches = [_namespaced_service_cache, _namespaced_pods_cache, _custom_object_cache, _cluster_resource_api_cache]
+    return sum(cache.invalidate(lambda key: key[0] == _cache_scope) for cache in caches)
+
+
+def get_cluster_cache_stats() -> Dict[str, Dict[str, int]]:
+    return {
+        "namespacedServices": _namespaced_service_cache.stats(),
+        "namespacedPods": _namespaced_pods_cache.stats(),
+        "customObjects": _custom_object_cache.stats(),
+        "clusterResourceApis": _cluster_resource_api_cache.stats(),
+    }
 
 
 def get_namespaced_service(name: str, namespace: str, as_dict: bool = False) -> Union[V1Service, dict, None]:
-    def retrieve_namespaced_service_from_cache(key: tuple):
-        result = _namespaced_service_cache[key]
+    def retrieve_namespaced_service(result: V1Service):
         if as_dict:
             return generic.sanitize_for_serialization(obj=result)
         return result
 
-    target_service_key = (name, namespace)
-    if target_service_key in _namespaced_service_cache:
-        return retrieve_namespaced_service_from_cache(target_service_key)
+    target_service_key = _scoped_key(name, namespace)
+    cached_service = _namespaced_service_cache.get(target_service_key, MISSING)
+    if cached_service is not MISSING:
+        return retrieve_namespaced_service(cached_service)
 
     try:
         v1 = client.CoreV1Api()
         v1_service: V1Service = v1.read_namespaced_service(name=name, namespace=namespace)
-        _namespaced_service_cache[target_service_key] = v1_service
+        _namespaced_service_cache.set(target_service_key, v1_service)
     except ApiException as ae:
         logger.debug(str(ae))
     else:
-        return retrieve_namespaced_service_from_cache(target_service_key)
-
-
-_namespaced_pods_cache: dict = {}
+        return retrieve_namespaced_service(v1_service)
 
 
 def get_namespaced_pods_by_prefix(
@@ -81,39 +117,37 @@ def get_namespaced_pods_by_prefix(
     def filter_pods_by_prefix(pods: List[V1Pod], prefix: str) -> List[V1Pod]:
         return [pod for pod in pods if pod.metadata.name.startswith(prefix)]
 
-    def filter_pods_from_cache(key: tuple):
-        cached_pods = _namespaced_pods_cache[key]
-        result = filter_pods_by_prefix(pods=cached_pods, prefix=prefix)
+    def filter_pods(pods: List[V1Pod]):
+        result = filter_pods_by_prefix(pods=pods, prefix=prefix)
         if as_dict:
             return generic.sanitize_for_serialization(obj=result)
         return result
 
-    target_pods_key = (namespace, label_selector)
-    if target_pods_key in _namespaced_pods_cache:
-        return filter_pods_from_cache(target_pods_key)
+    target_pods_key = _scoped_key(namespace, label_selector)
+    cached_pods = _namespaced_pods_cache.get(target_pods_key, MISSING)
+    if cached_pods is not MISSING:
+        return filter_pods(cached_pods)
     try:
         v1 = client.CoreV1Api()
         if namespace:
             pods_list: V1PodList = v1.list_namespaced_pod(namespace, label_selector=label_selector)
         else:
             pods_list: V1PodList = v1.list_pod_for_all_namespaces(label_selector=label_selector)
-        _namespaced_pods_cache[target_pods_key] = pods_list.items
+        _namespaced_pods_cache.set(target_pods_key, pods_list.items)
     except ApiException as ae:
         logger.debug(str(ae))
     else:
-        return filter_pods_from_cache(target_pods_key)
-
-
-_custom_object_cache: dict = {}
+        return filter_pods(pods_list.items)
 
 
 def get_custom_objects(
     group: str, version: str, plural: str, namespace: Optional[str] = None, use_cache: bool = True
 ) -> Union[dict, None]:
-    target_resource_key = (group, version, plural, namespace)
+    target_resource_key = _scoped_key(group, version, plural, namespace)
     if use_cache:
-        if target_resource_key in _custom_object_cache:
-            return _custom_object_cache[target_resource_key]
+        cached_objects = _custom_object_cache.get(target_resource_key, MISSING)
+        if cached_objects is not MISSING:
+            return cached_objects
 
     try:
         custom_client = client.CustomObjectsApi()
@@ -123,32 +157,30 @@ def get_custom_objects(
             f = custom_client.list_namespaced_custom_object
         else:
             f = custom_client.list_cluster_custom_object
-        _custom_object_cache[target_resource_key] = f(**kwargs)
+        custom_objects = f(**kwargs)
+        _custom_object_cache.set(target_resource_key, custom_objects)
     except ApiException as ae:
         logger.debug(str(ae))
     else:
-        return _custom_object_cache[target_resource_key]
-
-
-_cluster_resource_api_cache: dict = {}
+        return custom_objects
 
 
 def get_cluster_custom_api(group: str, version: str, raise_on_404: bool = False) -> Union[V1APIResourceList, None]:
-    target_resource_api_key = (group, version)
-    if target_resource_api_key in _cluster_resource_api_cache:
-        return _cluster_resource_api_cache[target_resource_api_key]
+    target_resource_api_key = _scoped_key(group, version)
+    cached_api = _cluster_resource_api_cache.get(target_resource_api_key, MISSING)
+    if cached_api is not MISSING:
+        return cached_api
 
     try:
         custom_client = client.CustomObjectsApi()
-        _cluster_resource_api_cache[target_resource_api_key] = custom_client.get_api_resources(
-            group=group, version=version
-        )
+        resource_api = custom_client.get_api_resources(group=group, version=version)
+        _cluster_resource_api_cache.set(target_resource_api_key, resource_api)
     except ApiException as ae:
         logger.debug(msg=str(ae))
         if int(ae.status) == 404 and raise_on_404:
             raise ResourceNotFoundError(f"{group}/{version} resource API is not detected on the cluster.")
     else:
-        return _cluster_resource_api_cache[target_resource_api_key]
+        return resource_api
 
 
 class PodRequest:
@@ -343,6 +375,8 @@ def create_namespaced_custom_objects(
         raise RuntimeError(error_msg)
     else:
         return result
+    finally:
+        invalidate_cluster_caches(group=group, version=version, plural=plural)
 
 
 def delete_namespaced_custom_object(
@@ -364,6 +398,8 @@ def delete_namespaced_custom_object(
             if int(ae.status) == 404 and not raise_on_404:
                 return
             raise RuntimeError(error_msg)
+    finally:
+        invalidate_cluster_caches(group=group, version=version, plural=plural)
 
 
 def create_namespaced_configmap(
@@ -4,7 +4,6 @@
 # Licensed under the MIT License. See License file in the project root for license information.
 # ----------------------------------------------------------------------------------------------
 
-from rich.padding import Padding
 from typing import Any, Dict, List
 
 from azext_edge.edge.providers.check.base.pod import evaluate_pod_health
@@ -51,7 +50,11 @@ def evaluate_core_service_runtime(
     detail_level: int = ResourceOutputDetailLevel.summary.value,
     resource_name: str = None,
 ) -> Dict[str, Any]:
-    check_manager = CheckManager(check_name="evalCoreServiceRuntime", check_desc="Evaluate Akri core service")
+    check_manager = CheckManager(
+        check_name="evalCoreServiceRuntime",
+        check_desc="Evaluate Akri core service",
+        collect_displays=as_list,
+    )
 
     padding = 6
     akri_runtime_resources: List[dict] = get_namespaced_pods_by_prefix(
@@ -70,7 +73,8 @@ def evaluate_core_service_runtime(
             check_manager.add_target(target_name=CoreServiceResourceKinds.RUNTIME_RESOURCE.value)
             check_manager.add_display(
                 target_name=CoreServiceResourceKinds.RUNTIME_RESOURCE.value,
-                display=Padding("Unable to fetch pods.", (0, 0, 0, padding + 2)),
+                display="Unable to fetch pods.",
+                padding=(0, 0, 0, padding + 2),
             )
 
     for namespace, pods in get_resources_grouped_by_namespace(akri_runtime_resources):
@@ -78,9 +82,8 @@ def evaluate_core_service_runtime(
         check_manager.add_display(
             target_name=CoreServiceResourceKinds.RUNTIME_RESOURCE.value,
             namespace=namespace,
-            display=Padding(
-                f"Akri runtime resources in namespace {{[purple]{namespace}[/purple]}}", (0, 0, 0, padding)
-            ),
+            display=f"Akri runtime resources in namespace {{[purple]{namespace}[/purple]}}",
+            padding=(0, 0, 0, padding),
         )
 
         evaluate_pod_health(
@@ -5,7 +5,7 @@
 # ----------------------------------------------------------------------------------------------
 
 from .check_manager import CheckManager
-from .deployment import check_pre_deployment, check_post_deployment
+from .deployment import check_pre_deployment, check_post_deployment, run_checks_concurrently
 from .display import add_display_and_eval, display_as_list
 from .node import check_nodes
 from .pod import evaluate_pod_health
@@ -46,6 +46,7 @@ __all__ = [
     "process_resource_properties",
     "validate_one_of_conditions",
     "process_custom_resource_status",
+    "run_checks_concurrently",
     "validate_runtime_resource_ref",
     "get_valid_resource_names",
 ]
@@ -5,7 +5,7 @@
 # ----------------------------------------------------------------------------------------------
 
 from knack.log import get_logger
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..common import ALL_NAMESPACES_TARGET
 from ....common import CheckTaskStatus
@@ -63,11 +63,13 @@ class CheckManager:
     }
     """
 
-    def __init__(self, check_name: str, check_desc: str):
+    def __init__(self, check_name: str, check_desc: str, collect_displays: bool = True):
         self.check_name = check_name
         self.check_desc = check_desc
         self.targets = {}
         self.target_displays = {}
+        # displays are only shown for list (text) output, other outputs skip building and holding them
+        self.collect_displays = collect_displays
         self.worst_status = CheckTaskStatus.skipped.value
 
     def add_target(
@@ -142,26 +144,45 @@ class CheckManager:
             self.targets[target_name][namespace]["status"] = status
             self.worst_status = status
 
-    def add_display(self, target_name: str, display: Any, namespace: str = ALL_NAMESPACES_TARGET) -> None:
+    def add_display(
+        self,
+        target_name: str,
+        display: Any,
+        namespace: str = ALL_NAMESPACES_TARGET,
+        padding: Optional[Tuple[int, int, int, int]] = None,
+    ) -> None:
+        """
+        Adds a display to the target. When padding is provided the display is wrapped in a rich Padding,
+        which is only built if the result is requested as a list. Displays are dropped when the manager
+        does not collect displays.
+        """
+        if not self.collect_displays:
+            return
         if target_name not in self.target_displays:
             self.target_displays[target_name] = {}
         if namespace not in self.target_displays[target_name]:
             self.target_displays[target_name][namespace] = []
-        self.target_displays[target_name][namespace].append(display)
+        self.target_displays[target_name][namespace].append((display, padding))
 
     def as_dict(self, as_list: bool = False) -> Dict[str, Any]:
-        from copy import deepcopy
-
+        # targets and namespaces are copied shallowly, evaluations are append-only and shared with the result
         result = {
             "name": self.check_name,
             "description": self.check_desc,
-            "targets": {},
+            "targets": {
+                type: {namespace: dict(namespace_target) for namespace, namespace_target in namespaces.items()}
+                for type, namespaces in self.targets.items()
+            },
             "status": self.worst_status,
         }
-        result["targets"] = deepcopy(self.targets)
         if as_list:
+            from rich.padding import Padding
+
             for type in self.target_displays:
                 for namespace in self.target_displays[type]:
-                    result["targets"][type][namespace]["displays"] = deepcopy(self.target_displays[type][namespace])
+                    result["targets"][type][namespace]["displays"] = [
+                        Padding(display, padding) if padding else display
+                        for display, padding in self.target_displays[type][namespace]
+                    ]
 
         return result
@@ -5,26 +5,40 @@
 # ----------------------------------------------------------------------------------------------
 
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from typing import Any, Callable, Dict, List, Optional
 
 from azure.cli.core.azclierror import ValidationError
 from knack.log import get_logger
 from kubernetes.client.exceptions import ApiException
-from rich.padding import Padding
 
 from ....common import CheckTaskStatus, ListableEnum
 from ....providers.edge_api import EdgeResourceApi
 from ...base import client, load_config_context
-from ..common import NON_ERROR_STATUSES, CoreServiceResourceKinds, ResourceOutputDetailLevel
+from ..common import CHECK_MAX_WORKERS, NON_ERROR_STATUSES, CoreServiceResourceKinds, ResourceOutputDetailLevel
 from .check_manager import CheckManager
 from .node import check_nodes
 from .resource import enumerate_ops_service_resources
+from .resource_index import resource_index
 from .user_strings import UNABLE_TO_DETERMINE_VERSION_MSG
 
 logger = get_logger(__name__)
 
 
+def run_checks_concurrently(check_funcs: List[Callable[[], Any]], max_workers: int = CHECK_MAX_WORKERS) -> List[Any]:
+    """
+    Runs each check function on a thread pool and returns the results in the order of check_funcs.
+    Check functions must not share a CheckManager. The first exception raised by a check is re-raised.
+    """
+    if len(check_funcs) < 2:
+        return [check_func() for check_func in check_funcs]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(check_funcs)), thread_name_prefix="aio_check") as executor:
+        futures = [executor.submit(check_func) for check_func in check_funcs]
+        return [future.result() for future in futures]
+
+
 def validate_cluster_prechecks(**kwargs) -> None:
     context_name = kwargs.get("context_name")
     load_config_context(context_name=context_name)
@@ -80,9 +94,7 @@ def check_pre_deployment(
                 "checkStorageClasses": partial(_check_storage_classes, acs_config=acs_config, as_list=as_list),
             }
         )
-    for c in desired_checks:
-        output = desired_checks[c]()
-        result.append(output)
+    result.extend(run_checks_concurrently(list(desired_checks.values())))
     return result
 
 
@@ -96,6 +108,32 @@ def check_post_deployment(
     resource_kinds: Optional[List[str]] = None,
     resource_name: str = None,
     excluded_resources: Optional[List[str]] = None,
+) -> List[dict]:
+    # resources are indexed once for the check run so reference lookups do not re-scan them
+    with resource_index():
+        return _check_post_deployment(
+            evaluate_funcs=evaluate_funcs,
+            as_list=as_list,
+            detail_level=detail_level,
+            api_info=api_info,
+            check_name=check_name,
+            check_desc=check_desc,
+            resource_kinds=resource_kinds,
+            resource_name=resource_name,
+            excluded_resources=excluded_resources,
+        )
+
+
+def _check_post_deployment(
+    evaluate_funcs: Dict[ListableEnum, Callable],
+    as_list: bool = False,
+    detail_level: int = ResourceOutputDetailLevel.summary.value,
+    api_info: Optional[EdgeResourceApi] = None,
+    check_name: Optional[str] = None,
+    check_desc: Optional[str] = None,
+    resource_kinds: Optional[List[str]] = None,
+    resource_name: str = None,
+    excluded_resources: Optional[List[str]] = None,
 ) -> List[dict]:
     results = []
     lowercase_api_resources = {}
@@ -107,6 +145,7 @@ def check_post_deployment(
         results = [resource_enumeration]
         lowercase_api_resources = {k.lower(): v for k, v in api_resources.items()}
 
+    resource_evaluations = []
     for resource, evaluate_func in evaluate_funcs.items():
         should_check_resource = not resource_kinds or resource.value in resource_kinds
         append_resource = False
@@ -119,7 +158,11 @@ def check_post_deployment(
             append_resource = True
 
         if append_resource:
-            results.append(evaluate_func(detail_level=detail_level, as_list=as_list, resource_name=resource_name))
+            resource_evaluations.append(
+                partial(evaluate_func, detail_level=detail_level, as_list=as_list, resource_name=resource_name)
+            )
+
+    results.extend(run_checks_concurrently(resource_evaluations))
     return results
 
 
@@ -131,7 +174,11 @@ def _check_k8s_version(as_list: bool = False) -> Dict[str, Any]:
     version_client = client.VersionApi()
 
     target_k8s_version = "k8s"
-    check_manager = CheckManager(check_name="evalK8sVers", check_desc="Evaluate Kubernetes server")
+    check_manager = CheckManager(
+        check_name="evalK8sVers",
+        check_desc="Evaluate Kubernetes server",
+        collect_displays=as_list,
+    )
     check_manager.add_target(
         target_name=target_k8s_version,
         conditions=[f"(k8s version)>={MIN_K8S_VERSION}"],
@@ -151,7 +198,8 @@ def _check_k8s_version(as_list: bool = False) -> Dict[str, Any]:
         )
         check_manager.add_display(
             target_name=target_k8s_version,
-            display=Padding(api_error_text, (0, 0, 0, 8)),
+            display=api_error_text,
+            padding=(0, 0, 0, 8),
         )
     else:
         major_version = version_details.major
@@ -171,7 +219,8 @@ def _check_k8s_version(as_list: bool = False) -> Dict[str, Any]:
         check_manager.add_target_eval(target_name=target_k8s_version, status=semver_status, value=semver)
         check_manager.add_display(
             target_name=target_k8s_version,
-            display=Padding(k8s_semver_text, (0, 0, 0, 8)),
+            display=k8s_semver_text,
+            padding=(0, 0, 0, 8),
         )
 
     return check_manager.as_dict(as_list)
@@ -181,7 +230,11 @@ def _check_storage_classes(acs_config: dict, as_list: bool = False) -> Dict[str,
     from kubernetes.client.models import V1StorageClassList
 
     expected_classes = acs_config.get("feature.diskStorageClass", "")
-    check_manager = CheckManager(check_name="evalStorageClasses", check_desc="Evaluate storage classes")
+    check_manager = CheckManager(
+        check_name="evalStorageClasses",
+        check_desc="Evaluate storage classes",
+        collect_displays=as_list,
+    )
     target = "cluster/storage-classes"
     check_manager.add_target(
         target_name=target,
@@ -29,7 +29,8 @@ def add_display_and_eval(
     check_manager.add_display(
         target_name=target_name,
         namespace=namespace,
-        display=Padding(display_text, padding)
+        display=display_text,
+        padding=padding
     )
     check_manager.add_target_eval(
         target_name=target_name,
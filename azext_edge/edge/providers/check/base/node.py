@@ -34,7 +34,11 @@ def check_nodes(
 ) -> Dict[str, Any]:
     from ...base import client
 
-    check_manager = CheckManager(check_name="evalClusterNodes", check_desc="Evaluate cluster nodes")
+    check_manager = CheckManager(
+        check_name="evalClusterNodes",
+        check_desc="Evaluate cluster nodes",
+        collect_displays=as_list,
+    )
     padding = (0, 0, 0, 8)
     target = "cluster/nodes"
     check_manager.add_target(target_name=target, conditions=["len(cluster/nodes)>=1"])
@@ -52,7 +56,8 @@ def check_nodes(
         )
         check_manager.add_display(
             target_name=target,
-            display=Padding(api_error_text, (0, 0, 0, 8)),
+            display=api_error_text,
+            padding=(0, 0, 0, 8),
         )
     else:
         if not nodes or not nodes.items:
@@ -71,8 +76,8 @@ def check_nodes(
             storage_space_check=storage_space_check,
         )
 
-        check_manager.add_display(target_name=target, display=Padding("Node Resources", padding))
-        check_manager.add_display(target_name=target, display=Padding(table, padding))
+        check_manager.add_display(target_name=target, display="Node Resources", padding=padding)
+        check_manager.add_display(target_name=target, display=table, padding=padding)
 
     return check_manager.as_dict(as_list)
 
@@ -82,37 +87,14 @@ def _generate_node_table(
     nodes: V1NodeList,
     acs_kernel_check: Optional[bool] = False,
     storage_space_check: Optional[bool] = False,
-) -> Table:
+) -> Optional[Table]:
     from kubernetes.utils import parse_quantity
 
     from ....util.machinery import scoped_semver_import
 
     semver = scoped_semver_import()
 
-    # prep table
-    table = Table(show_header=True, header_style="bold", show_lines=True, caption_justify="left")
-    for column_name, justify in [
-        ("Name", "left"),
-        ("Architecture", "left"),
-        *([("Kernel version", "left")] if acs_kernel_check else []),
-        ("CPU (vCPU)", "left"),
-        ("Memory (GB)", "left"),
-        *([("Ephemeral\nStorage (GB)", "left")] if storage_space_check else []),
-    ]:
-        table.add_column(column_name, justify=f"{justify}")
-    table.add_row(
-        *[
-            COLOR_STR_FORMAT.format(color="cyan", value=value)
-            for value in [
-                "Minimum requirements",
-                ", ".join(AIO_SUPPORTED_ARCHITECTURES),
-                *([ACSA_MIN_NODE_KERNEL_VERSION] if acs_kernel_check else []),
-                MIN_NODE_VCPU,
-                MIN_NODE_MEMORY[:-1],
-                *([MIN_NODE_STORAGE[:-1]] if storage_space_check else []),
-            ]
-        ]
-    )
+    rows = []
     single_node = len(nodes.items) == 1
     node: V1Node
     for node in nodes.items:
@@ -216,7 +198,37 @@ def _generate_node_table(
         if control_plane_only_node:
             row_status = CheckTaskStatus.skipped
             node_name = f"[dim]{node_name}[/dim]"
-        table.add_row(COLOR_STR_FORMAT.format(color=row_status.color, value=node_name), *row_cells)
+        rows.append([COLOR_STR_FORMAT.format(color=row_status.color, value=node_name), *row_cells])
+
+    if not check_manager.collect_displays:
+        return None
+
+    # prep table
+    table = Table(show_header=True, header_style="bold", show_lines=True, caption_justify="left")
+    for column_name, justify in [
+        ("Name", "left"),
+        ("Architecture", "left"),
+        *([("Kernel version", "left")] if acs_kernel_check else []),
+        ("CPU (vCPU)", "left"),
+        ("Memory (GB)", "left"),
+        *([("Ephemeral\nStorage (GB)", "left")] if storage_space_check else []),
+    ]:
+        table.add_column(column_name, justify=f"{justify}")
+    table.add_row(
+        *[
+            COLOR_STR_FORMAT.format(color="cyan", value=value)
+            for value in [
+                "Minimum requirements",
+                ", ".join(AIO_SUPPORTED_ARCHITECTURES),
+                *([ACSA_MIN_NODE_KERNEL_VERSION] if acs_kernel_check else []),
+                MIN_NODE_VCPU,
+                MIN_NODE_MEMORY[:-1],
+                *([MIN_NODE_STORAGE[:-1]] if storage_space_check else []),
+            ]
+        ]
+    )
+    for row in rows:
+        table.add_row(*row)
     return table
 
 
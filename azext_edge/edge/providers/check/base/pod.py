@@ -5,7 +5,6 @@
 # ----------------------------------------------------------------------------------------------
 
 from knack.log import get_logger
-from rich.padding import Padding
 from rich.table import Table
 from kubernetes.client.models import V1Pod
 from typing import List, Tuple
@@ -44,6 +43,23 @@ def evaluate_pod_health(
     if not pods:
         return
 
+    pod_statuses = []
+    display_rows = []
+
+    for pod in pods:
+        pod_status_result: PodStatusResult = _process_pod_status(
+            check_manager=check_manager,
+            target=target,
+            pod=pod,
+            namespace=namespace,
+            detail_level=detail_level,
+        )
+        pod_statuses.append(pod_status_result.eval_status)
+        display_rows.append(pod_status_result.display_strings)
+
+    if not check_manager.collect_displays:
+        return
+
     # prep table
     table = Table(show_header=True, header_style="bold", show_lines=True, caption_justify="left")
 
@@ -57,26 +73,16 @@ def evaluate_pod_health(
     else:
         table = Table.grid(padding=(0, 0, 0, 2))
 
-    add_footer = False
-    pod_statuses = []
-
-    for pod in pods:
-        pod_status_result: PodStatusResult = _process_pod_status(
-            check_manager=check_manager,
-            target=target,
-            pod=pod,
-            namespace=namespace,
-            detail_level=detail_level,
-        )
-        pod_statuses.append(pod_status_result.eval_status)
-        table.add_row(*pod_status_result.display_strings)
+    for display_row in display_rows:
+        table.add_row(*display_row)
 
     add_footer = not all(status == CheckTaskStatus.success.value for status in pod_statuses)
 
     check_manager.add_display(
         target_name=target,
         namespace=namespace,
-        display=Padding(table, (0, 0, 0, padding)),
+        display=table,
+        padding=(0, 0, 0, padding),
     )
 
     if add_footer:
@@ -86,7 +92,8 @@ def evaluate_pod_health(
         check_manager.add_display(
             target_name=target,
             namespace=namespace,
-            display=Padding(footer, (0, 0, 0, padding)),
+            display=footer,
+            padding=(0, 0, 0, padding),
         )
 
 
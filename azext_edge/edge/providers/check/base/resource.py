@@ -18,6 +18,7 @@ from azext_edge.edge.providers.k8s.config_map import get_config_map
 
 from .check_manager import CheckManager
 from .display import process_value_color
+from .resource_index import get_resource_index
 from ..common import COLOR_STR_FORMAT, PADDING_SIZE, ResourceOutputDetailLevel, ValidationResourceType
 from ...base import get_cluster_custom_api, get_namespaced_secret
 from ...edge_api import EdgeResourceApi
@@ -43,7 +44,7 @@ def enumerate_ops_service_resources(
 
     resource_kind_map = {}
     target_api = api_info.as_str()
-    check_manager = CheckManager(check_name=check_name, check_desc=check_desc)
+    check_manager = CheckManager(check_name=check_name, check_desc=check_desc, collect_displays=as_list)
     check_manager.add_target(target_name=target_api)
 
     api_resources: V1APIResourceList = get_cluster_custom_api(group=api_info.group, version=api_info.version)
@@ -51,7 +52,7 @@ def enumerate_ops_service_resources(
     if not api_resources:
         check_manager.add_target_eval(target_name=target_api, status=CheckTaskStatus.error.value)
         missing_api_text = f"[bright_blue]{target_api}[/bright_blue] API resources [red]not[/red] detected."
-        check_manager.add_display(target_name=target_api, display=Padding(missing_api_text, (0, 0, 0, 8)))
+        check_manager.add_display(target_name=target_api, display=missing_api_text, padding=(0, 0, 0, 8))
         return check_manager.as_dict(as_list), resource_kind_map
 
     api_header_display = Padding(f"[bright_blue]{target_api}[/bright_blue] API resources", (0, 0, 0, 8))
@@ -65,7 +66,8 @@ def enumerate_ops_service_resources(
             resource_kind_map[r.kind] = True
             check_manager.add_display(
                 target_name=target_api,
-                display=Padding(f"[cyan]{r.kind}[/cyan]", (0, 0, 0, 12)),
+                display=f"[cyan]{r.kind}[/cyan]",
+                padding=(0, 0, 0, 12),
             )
 
     check_manager.add_target_eval(
@@ -114,9 +116,12 @@ def get_resources_by_name(
     resource_name: str,
     namespace: str = None,
 ) -> List[dict]:
-    resources: list = api_info.get_resources(kind=kind, namespace=namespace).get("items", [])
-    resources = filter_resources_by_name(resources, resource_name)
-    return resources
+    index = get_resource_index()
+    if resource_name and not any(char in resource_name for char in "*?["):
+        return index.get_resources(api_info, kind, name=resource_name.lower(), namespace=namespace)
+
+    resources = index.list_resources(api_info, kind, namespace=namespace)
+    return filter_resources_by_name(resources, resource_name)
 
 
 def get_resources_grouped_by_namespace(resources: List[dict]):
@@ -141,13 +146,13 @@ def process_dict_resource(
 ) -> None:
     if prop_name:
         check_manager.add_display(
-            target_name=target_name, namespace=namespace, display=Padding(f"{prop_name}:", (0, 0, 0, padding))
+            target_name=target_name, namespace=namespace, display=f"{prop_name}:", padding=(0, 0, 0, padding)
         )
         padding += PADDING_SIZE
     for key, value in resource.items():
         if isinstance(value, dict):
             check_manager.add_display(
-                target_name=target_name, namespace=namespace, display=Padding(f"{key}:", (0, 0, 0, padding))
+                target_name=target_name, namespace=namespace, display=f"{key}:", padding=(0, 0, 0, padding)
             )
             process_dict_resource(
                 check_manager=check_manager,
@@ -164,7 +169,8 @@ def process_dict_resource(
             check_manager.add_display(
                 target_name=target_name,
                 namespace=namespace,
-                display=Padding(display_text, (0, 0, 0, padding)),
+                display=display_text,
+                padding=(0, 0, 0, padding),
             )
 
             process_list_resource(
@@ -181,7 +187,8 @@ def process_dict_resource(
                 check_manager.add_display(
                     target_name=target_name,
                     namespace=namespace,
-                    display=Padding(display_text, (0, 0, 0, padding)),
+                    display=display_text,
+                    padding=(0, 0, 0, padding),
                 )
                 value_padding += PADDING_SIZE
                 display_text = ""
@@ -191,7 +198,8 @@ def process_dict_resource(
             check_manager.add_display(
                 target_name=target_name,
                 namespace=namespace,
-                display=Padding(display_text, (0, 0, 0, value_padding)),
+                display=display_text,
+                padding=(0, 0, 0, value_padding),
             )
 
 
@@ -209,13 +217,15 @@ def process_list_resource(
             check_manager.add_display(
                 target_name=target_name,
                 namespace=namespace,
-                display=Padding(f"- name: [cyan]{name}[/cyan]", (0, 0, 0, padding)),
+                display=f"- name: [cyan]{name}[/cyan]",
+                padding=(0, 0, 0, padding),
             )
         else:
             check_manager.add_display(
                 target_name=target_name,
                 namespace=namespace,
-                display=Padding(f"- item {resource.index(item) + 1}", (0, 0, 0, padding)),
+                display=f"- item {resource.index(item) + 1}",
+                padding=(0, 0, 0, padding),
             )
 
         if isinstance(item, dict):
@@ -230,7 +240,8 @@ def process_list_resource(
             check_manager.add_display(
                 target_name=target_name,
                 namespace=namespace,
-                display=Padding(f"[cyan]{item}[/cyan]", (0, 0, 0, padding + 2)),
+                display=f"[cyan]{item}[/cyan]",
+                padding=(0, 0, 0, padding + 2),
             )
 
 
@@ -281,21 +292,23 @@ def process_resource_property_by_type(
             return
 
         display_text = f"{display_name}:"
-        check_manager.add_display(target_name=target_name, namespace=namespace, display=Padding(display_text, padding))
+        check_manager.add_display(target_name=target_name, namespace=namespace, display=display_text, padding=padding)
 
         for property in properties:
             display_text = f"- {display_name} {properties.index(property) + 1}"
             check_manager.add_display(
                 target_name=target_name,
                 namespace=namespace,
-                display=Padding(display_text, (0, 0, 0, padding_left + 2)),
+                display=display_text,
+                padding=(0, 0, 0, padding_left + 2),
             )
             for prop, value in property.items():
                 display_text = f"{prop}: [cyan]{value}[/cyan]"
                 check_manager.add_display(
                     target_name=target_name,
                     namespace=namespace,
-                    display=Padding(display_text, (0, 0, 0, padding_left + PADDING_SIZE)),
+                    display=display_text,
+                    padding=(0, 0, 0, padding_left + PADDING_SIZE),
                 )
     elif isinstance(properties, str) or isinstance(properties, bool) or isinstance(properties, int):
         properties = str(properties) if properties else "undefined"
@@ -303,21 +316,22 @@ def process_resource_property_by_type(
             display_text = f"{display_name}: [cyan]{properties}[/cyan]"
         else:
             check_manager.add_display(
-                target_name=target_name, namespace=namespace, display=Padding(f"{display_name}:", padding)
+                target_name=target_name, namespace=namespace, display=f"{display_name}:", padding=padding
             )
             display_text = f"[cyan]{properties}[/cyan]"
             padding = (0, 0, 0, padding_left + 4)
 
-        check_manager.add_display(target_name=target_name, namespace=namespace, display=Padding(display_text, padding))
+        check_manager.add_display(target_name=target_name, namespace=namespace, display=display_text, padding=padding)
     elif isinstance(properties, dict):
         display_text = f"{display_name}:"
-        check_manager.add_display(target_name=target_name, namespace=namespace, display=Padding(display_text, padding))
+        check_manager.add_display(target_name=target_name, namespace=namespace, display=display_text, padding=padding)
         for prop, value in properties.items():
             display_text = f"{prop}: [cyan]{value}[/cyan]"
             check_manager.add_display(
                 target_name=target_name,
                 namespace=namespace,
-                display=Padding(display_text, (0, 0, 0, padding_left + 2)),
+                display=display_text,
+                padding=(0, 0, 0, padding_left + 2),
             )
 
 
@@ -341,20 +355,16 @@ def validate_one_of_conditions(
         check_manager.add_display(
             target_name=target_name,
             namespace=namespace,
-            display=Padding(
-                f"One of {conditions_names} should be specified",
-                (0, 0, 0, padding),
-            ),
+            display=f"One of {conditions_names} should be specified",
+            padding=(0, 0, 0, padding),
         )
         eval_status = CheckTaskStatus.error.value
     elif non_empty_conditions_count > 1:
         check_manager.add_display(
             target_name=target_name,
             namespace=namespace,
-            display=Padding(
-                f"Only one of {conditions_names} should be specified",
-                (0, 0, 0, padding),
-            ),
+            display=f"Only one of {conditions_names} should be specified",
+            padding=(0, 0, 0, padding),
         )
         eval_status = CheckTaskStatus.error.value
 
@@ -414,7 +424,8 @@ def process_custom_resource_status(
         check_manager.add_display(
             target_name=target_name,
             namespace=namespace,
-            display=Padding("Status [red]not found[/red].", (0, 0, 0, padding)),
+            display="Status [red]not found[/red].",
+            padding=(0, 0, 0, padding),
         )
         return
 
@@ -442,16 +453,15 @@ def process_custom_resource_status(
         check_manager.add_display(
             target_name=target_name,
             namespace=namespace,
-            display=Padding(
-                f"Status {{{decorate_resource_status(status_eval_status)}}}.",
-                (0, 0, 0, padding),
-            ),
+            display=f"Status {{{decorate_resource_status(status_eval_status)}}}.",
+            padding=(0, 0, 0, padding),
         )
     else:
         check_manager.add_display(
             target_name=target_name,
             namespace=namespace,
-            display=Padding("Status:", (0, 0, 0, padding)),
+            display="Status:",
+            padding=(0, 0, 0, padding),
         )
 
         for prop_name, prop_value in {
@@ -468,7 +478,8 @@ def process_custom_resource_status(
                 check_manager.add_display(
                     target_name=target_name,
                     namespace=namespace,
-                    display=Padding(status_text, (0, 0, 0, padding + 4)),
+                    display=status_text,
+                    padding=(0, 0, 0, padding + 4),
                 )
 
 
@@ -487,10 +498,4 @@ def validate_runtime_resource_ref(name: str, namespace: str, ref_type: Validatio
 def get_valid_resource_names(
     api: EdgeResourceApi, kind: Union[Enum, str], namespace: Optional[str] = None
 ) -> List[str]:
-    custom_objects = api.get_resources(kind=kind, namespace=namespace)
-    if custom_objects:
-        objects: List[dict] = custom_objects.get("items", [])
-        if objects:
-            return [get_resource_metadata_property(object, prop_name="name") for object in objects]
-
-    return []
+    return get_resource_index().get_names(api, kind, namespace=namespace)
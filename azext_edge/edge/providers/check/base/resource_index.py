@@ -0,0 +1,109 @@
+# coding=utf-8
+# ----------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License file in the project root for license information.
+# ----------------------------------------------------------------------------------------------
+
+from contextlib import contextmanager
+from enum import Enum
+from threading import Lock
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from knack.log import get_logger
+
+from ...edge_api import EdgeResourceApi
+
+logger = get_logger(__name__)
+
+
+class _KindIndex:
+    def __init__(self, resources: List[dict]):
+        self.resources = resources
+        self.by_namespace: Dict[str, List[dict]] = {}
+        self.by_name: Dict[str, List[dict]] = {}
+        self.by_namespaced_name: Dict[Tuple[str, str], dict] = {}
+
+        for resource in resources:
+            metadata = resource.get("metadata", {})
+            namespace, name = metadata.get("namespace"), metadata.get("name")
+            self.by_namespace.setdefault(namespace, []).append(resource)
+            self.by_name.setdefault(name, []).append(resource)
+            # duplicate names should not exist within a namespace, first one wins
+            self.by_namespaced_name.setdefault((namespace, name), resource)
+
+
+class ResourceIndex:
+    """
+    Per check run index of custom resources keyed on (kind, namespace, name). Each kind is listed
+    across all namespaces at most once, so evaluators can resolve references in constant time.
+    """
+
+    def __init__(self):
+        self._kinds: Dict[Tuple[str, str, str], _KindIndex] = {}
+        self._locks: Dict[Tuple[str, str, str], Lock] = {}
+        self._locks_guard = Lock()
+
+    def _get_kind(self, api: EdgeResourceApi, kind: Union[str, Enum]) -> _KindIndex:
+        if isinstance(kind, Enum):
+            kind = kind.value
+        key = (api.group, api.version, kind)
+        with self._locks_guard:
+            kind_lock = self._locks.setdefault(key, Lock())
+        # kinds are listed independently so concurrent checks only wait on the kind they need
+        with kind_lock:
+            if key not in self._kinds:
+                logger.debug(f"Indexing {kind} resources of {api.group}/{api.version}.")
+                custom_objects = api.get_resources(kind=kind) or {}
+                self._kinds[key] = _KindIndex(custom_objects.get("items", []))
+            return self._kinds[key]
+
+    def list_resources(
+        self, api: EdgeResourceApi, kind: Union[str, Enum], namespace: Optional[str] = None
+    ) -> List[dict]:
+        """
+        Returns a new list of the indexed resources of kind, optionally in namespace.
+        """
+        kind_index = self._get_kind(api, kind)
+        return list(kind_index.by_namespace.get(namespace, []) if namespace else kind_index.resources)
+
+    def get_resources(
+        self, api: EdgeResourceApi, kind: Union[str, Enum], name: str, namespace: Optional[str] = None
+    ) -> List[dict]:
+        """
+        Returns the resources of kind named name, in namespace or across all namespaces.
+        """
+        kind_index = self._get_kind(api, kind)
+        if namespace:
+            resource = kind_index.by_namespaced_name.get((namespace, name))
+            return [resource] if resource else []
+        return list(kind_index.by_name.get(name, []))
+
+    def get_names(self, api: EdgeResourceApi, kind: Union[str, Enum], namespace: Optional[str] = None) -> List[str]:
+        return [resource.get("metadata", {}).get("name") for resource in self.list_resources(api, kind, namespace)]
+
+
+_active_index: Optional[ResourceIndex] = None
+
+
+def get_resource_index() -> ResourceIndex:
+    """
+    Returns the active resource index, or a new unshared index if no check run is active.
+    """
+    return _active_index or ResourceIndex()
+
+
+@contextmanager
+def resource_index() -> Iterator[ResourceIndex]:
+    """
+    Activates a resource index for the duration of the context. Nested contexts reuse the outer index.
+    """
+    global _active_index
+    if _active_index:
+        yield _active_index
+        return
+
+    _active_index = ResourceIndex()
+    try:
+        yield _active_index
+    finally:
+        _active_index = None
@@ -101,6 +101,8 @@ BROKER_DIAGNOSTICS_PROPERTIES = [
 
 MAX_ASSET_EVENTS = 1000
 MAX_ASSET_DATAPOINTS = 1000
+# Offending data points and events listed by aggregated (below verbose) asset evaluations.
+MAX_ASSET_ITEM_OFFENDERS = 10
 
 # Check constants
 ALL_NAMESPACES_TARGET = "_all_"
@@ -212,3 +214,6 @@ PADDING_SIZE = 4
 DEFAULT_PROPERTY_DISPLAY_COLOR = "cyan"
 
 COLOR_STR_FORMAT = "[{color}]{value}[/{color}]"
+
+# Checks are dominated by cluster list calls, so they are run on a thread pool.
+CHECK_MAX_WORKERS = 8
@@ -4,7 +4,7 @@
 # Licensed under the MIT License. See License file in the project root for license information.
 # ----------------------------------------------------------------------------------------------
 
-from typing import List
+from typing import Dict, List
 
 from knack.log import get_logger
 from rich.padding import Padding
@@ -109,7 +109,8 @@ def _process_dataflow_resource_status(
         check_manager.add_display(
             target_name=target_name,
             namespace=namespace,
-            display=Padding(provisioning_status_display, (0, 0, 0, padding)),
+            display=provisioning_status_display,
+            padding=(0, 0, 0, padding),
         )
 
         # display error, failure cause
@@ -121,7 +122,8 @@ def _process_dataflow_resource_status(
             check_manager.add_display(
                 target_name=target_name,
                 namespace=namespace,
-                display=Padding(error_display, (0, 0, 0, padding))
+                display=error_display,
+                padding=(0, 0, 0, padding)
             )
         # show failure cause
         if provisioning_status_failure_cause:
@@ -139,7 +141,8 @@ def _process_dataflow_resource_status(
             check_manager.add_display(
                 target_name=target_name,
                 namespace=namespace,
-                display=Padding("Log Errors:", (0, 0, 0, inner_padding)),
+                display="Log Errors:",
+                padding=(0, 0, 0, inner_padding),
             )
 
     # runtime status (required for profiles)
@@ -159,7 +162,8 @@ def _process_dataflow_resource_status(
         check_manager.add_display(
             target_name=target_name,
             namespace=namespace,
-            display=Padding(runtime_status_display, (0, 0, 0, padding)),
+            display=runtime_status_display,
+            padding=(0, 0, 0, padding),
         )
     elif resource_kind == DataflowResourceKinds.DATAFLOWPROFILE.value:
         runtime_status_enum = CheckTaskStatus.error
@@ -194,7 +198,7 @@ def _process_dataflow_sourcesettings(
     target: str,
     namespace: str,
     dataflow_name: str,
-    endpoints: List[dict],
+    endpoints: Dict[str, dict],
     operation: dict,
     detail_level: int,
     padding: int,
@@ -212,9 +216,7 @@ def _process_dataflow_sourcesettings(
     endpoint_ref_status = endpoint_type_status = CheckTaskStatus.error
     endpoint_type_status_string = "invalid"
 
-    found_endpoint = next(
-        (endpoint for endpoint in endpoints if "name" in endpoint and endpoint["name"] == endpoint_ref), None
-    )
+    found_endpoint = endpoints.get(endpoint_ref)
     endpoint_type = found_endpoint["type"] if found_endpoint and "type" in found_endpoint else None
 
     if found_endpoint:
@@ -251,24 +253,21 @@ def _process_dataflow_sourcesettings(
 
     if detail_level > ResourceOutputDetailLevel.summary.value:
         check_manager.add_display(
-            target_name=target, namespace=namespace, display=Padding("\nSource:", (0, 0, 0, padding))
+            target_name=target, namespace=namespace, display="\nSource:", padding=(0, 0, 0, padding)
         )
         endpoint_name_display = f"{{{colorize_string(value=endpoint_ref)}}}"
         check_manager.add_display(
             target_name=target,
             namespace=namespace,
-            display=Padding(
-                f"Dataflow Endpoint {endpoint_name_display} {endpoint_ref_display}, {endpoint_validity_display}",
-                (0, 0, 0, padding + PADDING_SIZE),
-            ),
+            display=f"Dataflow Endpoint {endpoint_name_display} {endpoint_ref_display}, {endpoint_validity_display}",
+            padding=(0, 0, 0, padding + PADDING_SIZE),
         )
     elif not found_endpoint or not endpoint_type_valid:
         check_manager.add_display(
             target_name=target,
             namespace=namespace,
-            display=Padding(
-                "[red]Invalid source endpoint reference[/red]", (0, 0, 0, padding - PADDING_SIZE)
-            ),
+            display="[red]Invalid source endpoint reference[/red]",
+            padding=(0, 0, 0, padding - PADDING_SIZE),
         )
 
     if detail_level > ResourceOutputDetailLevel.detail.value:
@@ -293,13 +292,15 @@ def _process_dataflow_sourcesettings(
             check_manager.add_display(
                 target_name=target,
                 namespace=namespace,
-                display=Padding("Data Sources:", (0, 0, 0, inner_padding)),
+                display="Data Sources:",
+                padding=(0, 0, 0, inner_padding),
             )
             for data_source in data_sources:
                 check_manager.add_display(
                     target_name=target,
                     namespace=namespace,
-                    display=Padding(f"- {colorize_string(data_source)}", (0, 0, 0, inner_padding + 2)),
+                    display=f"- {colorize_string(data_source)}",
+                    padding=(0, 0, 0, inner_padding + 2),
                 )
 
 
@@ -313,7 +314,8 @@ def _process_dataflow_transformationsettings(
         check_manager.add_display(
             target_name=target,
             namespace=namespace,
-            display=Padding("\nBuilt-In Transformation:", (0, 0, 0, padding)),
+            display="\nBuilt-In Transformation:",
+            padding=(0, 0, 0, padding),
         )
         padding += PADDING_SIZE
         inner_padding = padding + PADDING_SIZE
@@ -323,13 +325,15 @@ def _process_dataflow_transformationsettings(
                 check_manager.add_display(
                     target_name=target,
                     namespace=namespace,
-                    display=Padding("Inputs:", (0, 0, 0, inner_padding)),
+                    display="Inputs:",
+                    padding=(0, 0, 0, inner_padding),
                 )
                 for input in inputs:
                     check_manager.add_display(
                         target_name=target,
                         namespace=namespace,
-                        display=Padding(f"- {colorize_string(input)}", (0, 0, 0, inner_padding + 2)),
+                        display=f"- {colorize_string(input)}",
+                        padding=(0, 0, 0, inner_padding + 2),
                     )
 
         # extra properties
@@ -351,7 +355,7 @@ def _process_dataflow_transformationsettings(
             datasets = settings.get("datasets", [])
             if datasets:
                 check_manager.add_display(
-                    target_name=target, namespace=namespace, display=Padding("Datasets:", (0, 0, 0, padding))
+                    target_name=target, namespace=namespace, display="Datasets:", padding=(0, 0, 0, padding)
                 )
             for dataset in datasets:
                 for label, key in [
@@ -374,7 +378,7 @@ def _process_dataflow_transformationsettings(
             filters = settings.get("filter", [])
             if filters:
                 check_manager.add_display(
-                    target_name=target, namespace=namespace, display=Padding("Filters:", (0, 0, 0, padding))
+                    target_name=target, namespace=namespace, display="Filters:", padding=(0, 0, 0, padding)
                 )
             for filter in filters:
                 for datasets_label, key in [
@@ -396,7 +400,7 @@ def _process_dataflow_transformationsettings(
             maps = settings.get("map", [])
             if maps:
                 check_manager.add_display(
-                    target_name=target, namespace=namespace, display=Padding("Maps:", (0, 0, 0, padding))
+                    target_name=target, namespace=namespace, display="Maps:", padding=(0, 0, 0, padding)
                 )
             for map in maps:
                 for label, key in [
@@ -421,7 +425,7 @@ def _process_dataflow_destinationsettings(
     target: str,
     namespace: str,
     dataflow_name: str,
-    endpoints: List[dict],
+    endpoints: Dict[str, dict],
     operation: dict,
     detail_level: int,
     padding: int,
@@ -429,15 +433,13 @@ def _process_dataflow_destinationsettings(
     settings = operation.get("destinationSettings", {})
     if detail_level > ResourceOutputDetailLevel.summary.value:
         check_manager.add_display(
-            target_name=target, namespace=namespace, display=Padding("\nDestination:", (0, 0, 0, padding))
+            target_name=target, namespace=namespace, display="\nDestination:", padding=(0, 0, 0, padding)
         )
     endpoint_ref = settings.get("endpointRef")
 
     # currently we are only looking for endpoint references in the same namespace
     # duplicate names should not exist, so check the first endpoint that matches the name ref
-    endpoint_match = next(
-        (endpoint for endpoint in endpoints if "name" in endpoint and endpoint["name"] == endpoint_ref), None
-    )
+    endpoint_match = endpoints.get(endpoint_ref)
 
     endpoint_validity = "valid"
     endpoint_status = CheckTaskStatus.success
@@ -461,18 +463,15 @@ def _process_dataflow_destinationsettings(
         check_manager.add_display(
             target_name=target,
             namespace=namespace,
-            display=Padding(
-                f"Dataflow Endpoint {endpoint_name_display} {endpoint_validity_display}",
-                (0, 0, 0, padding),
-            ),
+            display=f"Dataflow Endpoint {endpoint_name_display} {endpoint_validity_display}",
+            padding=(0, 0, 0, padding),
         )
     elif not endpoint_match:
         check_manager.add_display(
             target_name=target,
             namespace=namespace,
-            display=Padding(
-                "[red]Invalid destination endpoint reference[/red]", (0, 0, 0, padding - PADDING_SIZE)
-            ),
+            display="[red]Invalid destination endpoint reference[/red]",
+            padding=(0, 0, 0, padding - PADDING_SIZE),
         )
     # only show destination on verbose
     if detail_level > ResourceOutputDetailLevel.detail.value:
@@ -545,7 +544,8 @@ def _process_endpoint_authentication(
         check_manager.add_display(
             target_name=target,
             namespace=namespace,
-            display=Padding(f"[red]Unknown authentication method: {auth_method}", (0, 0, 0, padding)),
+            display=f"[red]Unknown authentication method: {auth_method}",
+            padding=(0, 0, 0, padding),
         )
         return
 
@@ -578,7 +578,8 @@ def _process_endpoint_TLS(
     check_manager.add_display(
         target_name=target,
         namespace=namespace,
-        display=Padding("TLS:", (0, 0, 0, padding)),
+        display="TLS:",
+        padding=(0, 0, 0, padding),
     )
     for label, key in [
         ("Mode", "mode"),
@@ -710,7 +711,8 @@ def _process_endpoint_kafkasettings(
         check_manager.add_display(
             target_name=target,
             namespace=namespace,
-            display=Padding("Batching:", (0, 0, 0, padding)),
+            display="Batching:",
+            padding=(0, 0, 0, padding),
         )
 
         for label, key in [
@@ -769,7 +771,8 @@ def _process_endpoint_fabriconelakesettings(
         check_manager.add_display(
             target_name=target,
             namespace=namespace,
-            display=Padding("Batching:", (0, 0, 0, padding)),
+            display="Batching:",
+            padding=(0, 0, 0, padding),
         )
 
         padding += PADDING_SIZE
@@ -814,7 +817,8 @@ def _process_endpoint_datalakestoragesettings(
         check_manager.add_display(
             target_name=target,
             namespace=namespace,
-            display=Padding("Batching:", (0, 0, 0, padding)),
+            display="Batching:",
+            padding=(0, 0, 0, padding),
         )
         padding += PADDING_SIZE
         for label, key in [
@@ -858,7 +862,8 @@ def _process_endpoint_dataexplorersettings(
         check_manager.add_display(
             target_name=target,
             namespace=namespace,
-            display=Padding("Batching:", (0, 0, 0, padding)),
+            display="Batching:",
+            padding=(0, 0, 0, padding),
         )
 
         padding += PADDING_SIZE
@@ -884,7 +889,8 @@ def _process_endpoint_localstoragesettings(
     check_manager.add_display(
         target_name=target,
         namespace=namespace,
-        display=Padding(f"Persistent Volume Claim: {persistent_volume_claim}", (0, 0, 0, padding)),
+        display=f"Persistent Volume Claim: {persistent_volume_claim}",
+        padding=(0, 0, 0, padding),
     )
     # endpoint authentication details
     _process_endpoint_authentication(
@@ -930,6 +936,7 @@ def evaluate_core_service_runtime(
     check_manager = CheckManager(
         check_name=dataflow_runtime_check_name,
         check_desc=dataflow_runtime_check_desc,
+        collect_displays=as_list,
     )
 
     operators = get_namespaced_pods_by_prefix(
@@ -947,7 +954,8 @@ def evaluate_core_service_runtime(
         check_manager.add_target(target_name=CoreServiceResourceKinds.RUNTIME_RESOURCE.value)
         check_manager.add_display(
             target_name=CoreServiceResourceKinds.RUNTIME_RESOURCE.value,
-            display=Padding("Unable to fetch pods.", (0, 0, 0, PADDING)),
+            display="Unable to fetch pods.",
+            padding=(0, 0, 0, PADDING),
         )
     for namespace, pods in get_resources_grouped_by_namespace(operators):
         check_manager.add_target(
@@ -957,10 +965,8 @@ def evaluate_core_service_runtime(
         check_manager.add_display(
             target_name=CoreServiceResourceKinds.RUNTIME_RESOURCE.value,
             namespace=namespace,
-            display=Padding(
-                f"Dataflow operator in namespace {{[purple]{namespace}[/purple]}}",
-                (0, 0, 0, PADDING),
-            ),
+            display=f"Dataflow operator in namespace {{[purple]{namespace}[/purple]}}",
+            padding=(0, 0, 0, PADDING),
         )
 
         evaluate_pod_health(
@@ -983,6 +989,7 @@ def evaluate_dataflows(
     check_manager = CheckManager(
         check_name=dataflows_check_name,
         check_desc=dataflows_check_desc,
+        collect_displays=as_list,
     )
     all_dataflows = get_resources_by_name(
         api_info=DATAFLOW_API_V1,
@@ -1000,7 +1007,8 @@ def evaluate_dataflows(
         )
         check_manager.add_display(
             target_name=target,
-            display=Padding(no_dataflows_text, (0, 0, 0, PADDING)),
+            display=no_dataflows_text,
+            padding=(0, 0, 0, PADDING),
         )
         return check_manager.as_dict(as_list=as_list)
     for namespace, dataflows in get_resources_grouped_by_namespace(all_dataflows):
@@ -1008,7 +1016,8 @@ def evaluate_dataflows(
         check_manager.add_display(
             target_name=target,
             namespace=namespace,
-            display=Padding(f"Dataflows in namespace {{[purple]{namespace}[/purple]}}", (0, 0, 0, PADDING)),
+            display=f"Dataflows in namespace {{[purple]{namespace}[/purple]}}",
+            padding=(0, 0, 0, PADDING),
         )
         # conditions
         check_manager.add_target_conditions(
@@ -1044,13 +1053,13 @@ def evaluate_dataflows(
             resource_name=None,
         )
 
-        endpoints = [
-            {
-                "name": endpoint.get("metadata", {}).get("name"),
-                "type": endpoint.get("spec", {}).get("endpointType"),
-            }
-            for endpoint in all_endpoints
-        ]
+        # keyed on name for reference lookup, the first endpoint wins as duplicate names should not exist
+        endpoints: Dict[str, dict] = {}
+        for endpoint in all_endpoints:
+            endpoint_name = endpoint.get("metadata", {}).get("name")
+            endpoints.setdefault(
+                endpoint_name, {"name": endpoint_name, "type": endpoint.get("spec", {}).get("endpointType")}
+            )
 
         for dataflow in list(dataflows):
             spec = dataflow.get("spec", {})
@@ -1062,10 +1071,8 @@ def evaluate_dataflows(
             check_manager.add_display(
                 target_name=target,
                 namespace=namespace,
-                display=Padding(
-                    f"\n- Dataflow {{{colorize_string(value=dataflow_name)}}} is {mode_display}",
-                    (0, 0, 0, PADDING),
-                ),
+                display=f"\n- Dataflow {{{colorize_string(value=dataflow_name)}}} is {mode_display}",
+                padding=(0, 0, 0, PADDING),
             )
 
             # if dataflow is disabled, skip evaluations and displays
@@ -1123,10 +1130,8 @@ def evaluate_dataflows(
                 check_manager.add_display(
                     target_name=target,
                     namespace=namespace,
-                    display=Padding(
-                        f"Dataflow Profile: {{{colorize_string(color=profile_ref_status.color, value=profile_ref)}}}",
-                        (0, 0, 0, INNER_PADDING),
-                    ),
+                    display=f"Dataflow Profile: {{{colorize_string(color=profile_ref_status.color, value=profile_ref)}}}",
+                    padding=(0, 0, 0, INNER_PADDING),
                 )
                 if profile_ref_status == CheckTaskStatus.error:
                     check_manager.add_display(
@@ -1159,7 +1164,8 @@ def evaluate_dataflows(
                 check_manager.add_display(
                     target_name=target,
                     namespace=namespace,
-                    display=Padding("Operations:", (0, 0, 0, INNER_PADDING)),
+                    display="Operations:",
+                    padding=(0, 0, 0, INNER_PADDING),
                 )
             operation_padding = INNER_PADDING + PADDING_SIZE
             sources = destinations = 0
@@ -1208,7 +1214,8 @@ def evaluate_dataflows(
                 check_manager.add_display(
                     target_name=target,
                     namespace=namespace,
-                    display=Padding(f"[red]{message}[/red]", (0, 0, 0, INNER_PADDING)),
+                    display=f"[red]{message}[/red]",
+                    padding=(0, 0, 0, INNER_PADDING),
                 )
             check_manager.add_target_eval(
                 target_name=target,
@@ -1229,7 +1236,8 @@ def evaluate_dataflows(
                 check_manager.add_display(
                     target_name=target,
                     namespace=namespace,
-                    display=Padding(f"[red]{message}[/red]", (0, 0, 0, INNER_PADDING)),
+                    display=f"[red]{message}[/red]",
+                    padding=(0, 0, 0, INNER_PADDING),
                 )
             check_manager.add_target_eval(
                 target_name=target,
@@ -1250,6 +1258,7 @@ def evaluate_dataflow_endpoints(
     check_manager = CheckManager(
         check_name=dataflow_endpoint_check_name,
         check_desc=dataflow_endpoint_check_desc,
+        collect_displays=as_list,
     )
     all_endpoints = get_resources_by_name(
         api_info=DATAFLOW_API_V1,
@@ -1265,7 +1274,8 @@ def evaluate_dataflow_endpoints(
         )
         check_manager.add_display(
             target_name=target,
-            display=Padding(no_endpoints_text, (0, 0, 0, PADDING)),
+            display=no_endpoints_text,
+            padding=(0, 0, 0, PADDING),
         )
         return check_manager.as_dict(as_list=as_list)
     for namespace, endpoints in get_resources_grouped_by_namespace(all_endpoints):
@@ -1273,9 +1283,8 @@ def evaluate_dataflow_endpoints(
         check_manager.add_display(
             target_name=target,
             namespace=namespace,
-            display=Padding(
-                f"Dataflow Endpoints in namespace {{[purple]{namespace}[/purple]}}", (0, 0, 0, PADDING)
-            ),
+            display=f"Dataflow Endpoints in namespace {{[purple]{namespace}[/purple]}}",
+            padding=(0, 0, 0, PADDING),
         )
         for endpoint in list(endpoints):
             spec = endpoint.get("spec", {})
@@ -1297,10 +1306,8 @@ def evaluate_dataflow_endpoints(
             check_manager.add_display(
                 target_name=target,
                 namespace=namespace,
-                display=Padding(
-                    f"\n- {endpoint_string} {detected_string}, {type_string}",
-                    (0, 0, 0, PADDING),
-                ),
+                display=f"\n- {endpoint_string} {detected_string}, {type_string}",
+                padding=(0, 0, 0, PADDING),
             )
             status = endpoint.get("status", {})
             _process_dataflow_resource_status(
@@ -1339,10 +1346,8 @@ def evaluate_dataflow_endpoints(
                     check_manager.add_display(
                         target_name=target,
                         namespace=namespace,
-                        display=Padding(
-                            colorize_string(color="red", value=f"Unknown endpoint type: {endpoint_type}"),
-                            (0, 0, 0, INNER_PADDING),
-                        ),
+                        display=colorize_string(color="red", value=f"Unknown endpoint type: {endpoint_type}"),
+                        padding=(0, 0, 0, INNER_PADDING),
                     )
     return check_manager.as_dict(as_list=as_list)
 
@@ -1355,6 +1360,7 @@ def evaluate_dataflow_profiles(
     check_manager = CheckManager(
         check_name=dataflow_profile_check_name,
         check_desc=dataflow_profile_check_desc,
+        collect_displays=as_list,
     )
     target = dataflow_profile_target
 
@@ -1373,7 +1379,8 @@ def evaluate_dataflow_profiles(
         )
         check_manager.add_display(
             target_name=target,
-            display=Padding(no_profiles_text, (0, 0, 0, PADDING)),
+            display=no_profiles_text,
+            padding=(0, 0, 0, PADDING),
         )
         return check_manager.as_dict(as_list=as_list)
     for namespace, profiles in get_resources_grouped_by_namespace(all_profiles):
@@ -1385,9 +1392,8 @@ def evaluate_dataflow_profiles(
         check_manager.add_display(
             target_name=target,
             namespace=namespace,
-            display=Padding(
-                f"Dataflow Profiles in namespace {{[purple]{namespace}[/purple]}}", (0, 0, 0, PADDING)
-            ),
+            display=f"Dataflow Profiles in namespace {{[purple]{namespace}[/purple]}}",
+            padding=(0, 0, 0, PADDING),
         )
 
         # warn if no default dataflow profile (unless possibly filtered)
@@ -1401,10 +1407,8 @@ def evaluate_dataflow_profiles(
             check_manager.add_display(
                 target_name=target,
                 namespace=namespace,
-                display=Padding(
-                    f"\n- Profile {{{colorize_string(value=profile_name)}}} {colorize_string(color='green', value='detected')}",
-                    (0, 0, 0, PADDING),
-                ),
+                display=f"\n- Profile {{{colorize_string(value=profile_name)}}} {colorize_string(color='green', value='detected')}",
+                padding=(0, 0, 0, PADDING),
             )
 
             # evaluate status
@@ -1447,7 +1451,8 @@ def evaluate_dataflow_profiles(
                 check_manager.add_display(
                     target_name=target,
                     namespace=namespace,
-                    display=Padding("[red]No instance count set[/red]", (0, 0, 0, INNER_PADDING)),
+                    display="[red]No instance count set[/red]",
+                    padding=(0, 0, 0, INNER_PADDING),
                 )
 
             # diagnostics on higher detail levels
@@ -1458,7 +1463,8 @@ def evaluate_dataflow_profiles(
                 check_manager.add_display(
                     target_name=target,
                     namespace=namespace,
-                    display=Padding("Diagnostic Logs:", (0, 0, 0, log_padding)),
+                    display="Diagnostic Logs:",
+                    padding=(0, 0, 0, log_padding),
                 )
 
                 # diagnostic logs
@@ -1495,7 +1501,8 @@ def evaluate_dataflow_profiles(
                     check_manager.add_display(
                         target_name=target,
                         namespace=namespace,
-                        display=Padding("Diagnostic Metrics:", (0, 0, 0, log_padding)),
+                        display="Diagnostic Metrics:",
+                        padding=(0, 0, 0, log_padding),
                     )
 
                     diagnostic_metrics_prometheusPort = diagnostic_metrics.get("prometheusPort")
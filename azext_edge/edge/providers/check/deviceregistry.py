@@ -4,7 +4,7 @@
 # Licensed under the MIT License. See License file in the project root for license information.
 # ----------------------------------------------------------------------------------------------
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from .base import (
     CheckManager,
@@ -17,7 +17,6 @@ from .base import (
     get_resources_grouped_by_namespace,
 )
 
-from rich.padding import Padding
 
 from ...common import CheckTaskStatus
 
@@ -27,6 +26,7 @@ from .common import (
     ASSET_PROPERTIES,
     MAX_ASSET_DATAPOINTS,
     MAX_ASSET_EVENTS,
+    MAX_ASSET_ITEM_OFFENDERS,
     PADDING_SIZE,
     ResourceOutputDetailLevel,
 )
@@ -65,7 +65,7 @@ def evaluate_assets(
     detail_level: int = ResourceOutputDetailLevel.summary.value,
     resource_name: str = None,
 ) -> Dict[str, Any]:
-    check_manager = CheckManager(check_name="evalAssets", check_desc="Evaluate Assets")
+    check_manager = CheckManager(check_name="evalAssets", check_desc="Evaluate Assets", collect_displays=as_list)
 
     asset_namespace_conditions = ["spec.assetEndpointProfileRef"]
 
@@ -80,7 +80,7 @@ def evaluate_assets(
     if not all_assets:
         fetch_assets_warning_text = "Unable to fetch assets in any namespaces."
         check_manager.add_target(target_name=target_assets)
-        check_manager.add_display(target_name=target_assets, display=Padding(fetch_assets_warning_text, (0, 0, 0, 8)))
+        check_manager.add_display(target_name=target_assets, display=fetch_assets_warning_text, padding=(0, 0, 0, 8))
         check_manager.add_target_eval(
             target_name=target_assets,
             status=CheckTaskStatus.skipped.value,
@@ -93,10 +93,8 @@ def evaluate_assets(
         check_manager.add_display(
             target_name=target_assets,
             namespace=namespace,
-            display=Padding(
-                f"Device Registry assets in namespace {{[purple]{namespace}[/purple]}}",
-                (0, 0, 0, 8)
-            )
+            display=f"Device Registry assets in namespace {{[purple]{namespace}[/purple]}}",
+            padding=(0, 0, 0, 8)
         )
 
         assets: List[dict] = list(assets)
@@ -115,7 +113,8 @@ def evaluate_assets(
             check_manager.add_display(
                 target_name=target_assets,
                 namespace=namespace,
-                display=Padding(asset_status_text, (0, 0, 0, padding)),
+                display=asset_status_text,
+                padding=(0, 0, 0, padding),
             )
 
             asset_spec = asset["spec"]
@@ -193,42 +192,20 @@ def evaluate_assets(
                     padding=(0, 0, 0, spec_padding)
                 )
 
-                for index, data_point in enumerate(data_points):
-                    data_point_data_source = data_point.get("dataSource", "")
-                    datapoint_padding = spec_padding + PADDING_SIZE
-                    data_point_data_source_value = {f"spec.datasets[0].dataPoints.[{index}].dataSource": data_point_data_source}
-                    data_point_data_source_status = CheckTaskStatus.success.value
-                    if data_point_data_source:
-                        data_point_data_source_text = (
-                            f"- Data source: {{[bright_blue]{data_point_data_source}[/bright_blue]}} [green]detected[/green]."
-                        )
-                    else:
-                        data_point_data_source_text = (
-                            "Data source [red]not detected[/red]."
-                        )
-                        data_point_data_source_status = CheckTaskStatus.error.value
-
-                    add_display_and_eval(
-                        check_manager=check_manager,
-                        target_name=target_assets,
-                        display_text=data_point_data_source_text,
-                        eval_status=data_point_data_source_status,
-                        eval_value=data_point_data_source_value,
-                        resource_name=asset_name,
-                        namespace=namespace,
-                        padding=(0, 0, 0, datapoint_padding)
-                    )
-
-                    if detail_level > ResourceOutputDetailLevel.summary.value:
-                        process_resource_properties(
-                            check_manager=check_manager,
-                            detail_level=detail_level,
-                            target_name=target_assets,
-                            prop_value=data_point,
-                            properties=ASSET_DATAPOINT_PROPERTIES,
-                            namespace=namespace,
-                            padding=(0, 0, 0, datapoint_padding + PADDING_SIZE)
-                        )
+                _evaluate_asset_items(
+                    check_manager=check_manager,
+                    target_assets=target_assets,
+                    namespace=namespace,
+                    asset_name=asset_name,
+                    items=data_points,
+                    detail_level=detail_level,
+                    item_key="spec.datasets[0].dataPoints",
+                    item_label="data points",
+                    prop_name="dataSource",
+                    prop_label="Data source",
+                    properties=ASSET_DATAPOINT_PROPERTIES,
+                    padding=spec_padding + PADDING_SIZE,
+                )
 
             if detail_level > ResourceOutputDetailLevel.summary.value:
                 process_resource_properties(
@@ -280,42 +257,20 @@ def evaluate_assets(
                     padding=(0, 0, 0, spec_padding)
                 )
 
-                for index, event in enumerate(events):
-                    event_notifier = event.get("eventNotifier", "")
-                    event_padding = spec_padding + PADDING_SIZE
-                    event_notifier_value = {f"spec.events.[{index}].eventNotifier": event_notifier}
-                    event_notifier_status = CheckTaskStatus.success.value
-                    if event_notifier:
-                        event_notifier_text = (
-                            f"- Event notifier: {{[bright_blue]{event_notifier}[/bright_blue]}} [green]detected[/green]."
-                        )
-                    else:
-                        event_notifier_text = (
-                            "Event notifier [red]not detected[/red]."
-                        )
-                        event_notifier_status = CheckTaskStatus.error.value
-
-                    add_display_and_eval(
-                        check_manager=check_manager,
-                        target_name=target_assets,
-                        display_text=event_notifier_text,
-                        eval_status=event_notifier_status,
-                        eval_value=event_notifier_value,
-                        resource_name=asset_name,
-                        namespace=namespace,
-                        padding=(0, 0, 0, event_padding)
-                    )
-
-                    if detail_level > ResourceOutputDetailLevel.summary.value:
-                        process_resource_properties(
-                            check_manager=check_manager,
-                            detail_level=detail_level,
-                            target_name=target_assets,
-                            prop_value=event,
-                            properties=ASSET_EVENT_PROPERTIES,
-                            namespace=namespace,
-                            padding=(0, 0, 0, event_padding + PADDING_SIZE)
-                        )
+                _evaluate_asset_items(
+                    check_manager=check_manager,
+                    target_assets=target_assets,
+                    namespace=namespace,
+                    asset_name=asset_name,
+                    items=events,
+                    detail_level=detail_level,
+                    item_key="spec.events",
+                    item_label="events",
+                    prop_name="eventNotifier",
+                    prop_label="Event notifier",
+                    properties=ASSET_EVENT_PROPERTIES,
+                    padding=spec_padding + PADDING_SIZE,
+                )
 
             # status
             status = asset_spec.get("status", "")
@@ -333,12 +288,104 @@ def evaluate_assets(
     return check_manager.as_dict(as_list)
 
 
+def _evaluate_asset_items(
+    check_manager: CheckManager,
+    target_assets: str,
+    namespace: str,
+    asset_name: str,
+    items: List[dict],
+    detail_level: int,
+    item_key: str,
+    item_label: str,
+    prop_name: str,
+    prop_label: str,
+    properties: List[Tuple[str, str, bool]],
+    padding: int,
+) -> None:
+    """
+    Evaluates the prop_name property of asset data points or events.
+
+    Below verbose detail, items are evaluated as one aggregate of detected and missing counts with the
+    first MAX_ASSET_ITEM_OFFENDERS offending indices, so output stays constant in size for large assets.
+    Verbose detail evaluates and displays every item.
+    """
+    if detail_level == ResourceOutputDetailLevel.verbose.value:
+        for index, item in enumerate(items):
+            prop_value = item.get(prop_name, "")
+            eval_status = CheckTaskStatus.success.value
+            if prop_value:
+                display_text = f"- {prop_label}: {{[bright_blue]{prop_value}[/bright_blue]}} [green]detected[/green]."
+            else:
+                display_text = f"{prop_label} [red]not detected[/red]."
+                eval_status = CheckTaskStatus.error.value
+
+            add_display_and_eval(
+                check_manager=check_manager,
+                target_name=target_assets,
+                display_text=display_text,
+                eval_status=eval_status,
+                eval_value={f"{item_key}.[{index}].{prop_name}": prop_value},
+                resource_name=asset_name,
+                namespace=namespace,
+                padding=(0, 0, 0, padding)
+            )
+            process_resource_properties(
+                check_manager=check_manager,
+                detail_level=detail_level,
+                target_name=target_assets,
+                prop_value=item,
+                properties=properties,
+                namespace=namespace,
+                padding=(0, 0, 0, padding + PADDING_SIZE)
+            )
+        return
+
+    offenders = []
+    missing_count = 0
+    for index, item in enumerate(items):
+        if not item.get(prop_name):
+            missing_count += 1
+            if len(offenders) < MAX_ASSET_ITEM_OFFENDERS:
+                offenders.append((index, item.get("name")))
+
+    items_count = len(items)
+    aggregate_key = f"{item_key}.{prop_name}"
+    eval_value = {aggregate_key: {"detected": items_count - missing_count, "missing": missing_count}}
+    if missing_count:
+        eval_value[aggregate_key]["firstMissing"] = [index for index, _ in offenders]
+        offender_names = ", ".join(f"{{[bright_blue]{name or index}[/bright_blue]}}" for index, name in offenders)
+        more_text = f" and {missing_count - len(offenders)} more" if missing_count > len(offenders) else ""
+        display_text = (
+            f"- {prop_label} [red]not detected[/red] for {missing_count} of {items_count} {item_label}: "
+            f"{offender_names}{more_text}."
+        )
+        eval_status = CheckTaskStatus.error.value
+    else:
+        display_text = f"- {prop_label} [green]detected[/green] for all {items_count} {item_label}."
+        eval_status = CheckTaskStatus.success.value
+
+    add_display_and_eval(
+        check_manager=check_manager,
+        target_name=target_assets,
+        display_text=display_text,
+        eval_status=eval_status,
+        eval_value=eval_value,
+        resource_name=asset_name,
+        namespace=namespace,
+        padding=(0, 0, 0, padding)
+    )
+
+
 def evaluate_asset_endpoint_profiles(
     as_list: bool = False,
     detail_level: int = ResourceOutputDetailLevel.summary.value,
     resource_name: str = None,
 ) -> Dict[str, Any]:
-    check_manager = CheckManager(check_name="evalAssetEndpointProfiles", check_desc="Evaluate Asset Endpoint Profiles")
+    check_manager = CheckManager(
+        check_name="evalAssetEndpointProfiles",
+        check_desc="Evaluate Asset Endpoint Profiles",
+        collect_displays=as_list,
+    )
 
     endpoint_namespace_conditions = ["spec.uuid"]
 
@@ -352,7 +399,7 @@ def evaluate_asset_endpoint_profiles(
     if not all_asset_endpoint_profiles:
         fetch_asset_endpoint_profiles_warning_text = "Unable to fetch asset endpoint profiles in any namespaces."
         check_manager.add_target(target_name=target_asset_endpoint_profiles)
-        check_manager.add_display(target_name=target_asset_endpoint_profiles, display=Padding(fetch_asset_endpoint_profiles_warning_text, (0, 0, 0, 8)))
+        check_manager.add_display(target_name=target_asset_endpoint_profiles, display=fetch_asset_endpoint_profiles_warning_text, padding=(0, 0, 0, 8))
         check_manager.add_target_eval(
             target_name=target_asset_endpoint_profiles,
             status=CheckTaskStatus.skipped.value,
@@ -365,10 +412,8 @@ def evaluate_asset_endpoint_profiles(
         check_manager.add_display(
             target_name=target_asset_endpoint_profiles,
             namespace=namespace,
-            display=Padding(
-                f"Asset Endpoint Profiles in namespace {{[purple]{namespace}[/purple]}}",
-                (0, 0, 0, 8)
-            )
+            display=f"Asset Endpoint Profiles in namespace {{[purple]{namespace}[/purple]}}",
+            padding=(0, 0, 0, 8)
         )
 
         asset_endpoint_profiles: List[dict] = list(asset_endpoint_profiles)
@@ -386,7 +431,8 @@ def evaluate_asset_endpoint_profiles(
             check_manager.add_display(
                 target_name=target_asset_endpoint_profiles,
                 namespace=namespace,
-                display=Padding(asset_endpoint_profile_status_text, (0, 0, 0, padding)),
+                display=asset_endpoint_profile_status_text,
+                padding=(0, 0, 0, padding),
             )
 
             spec_padding = padding + PADDING_SIZE
@@ -433,10 +479,8 @@ def evaluate_asset_endpoint_profiles(
                 check_manager.add_display(
                     target_name=target_asset_endpoint_profiles,
                     namespace=namespace,
-                    display=Padding(
-                        "Transport authentication:",
-                        (0, 0, 0, spec_padding)
-                    )
+                    display="Transport authentication:",
+                    padding=(0, 0, 0, spec_padding)
                 )
                 transport_authentication_own_certificates = transport_authentication.get("ownCertificates", None)
                 transport_authentication_own_certificates_value = {"spec.transportAuthentication.ownCertificates": transport_authentication_own_certificates}
@@ -492,10 +536,8 @@ def evaluate_asset_endpoint_profiles(
                 check_manager.add_display(
                     target_name=target_asset_endpoint_profiles,
                     namespace=namespace,
-                    display=Padding(
-                        "User authentication:",
-                        (0, 0, 0, spec_padding)
-                    )
+                    display="User authentication:",
+                    padding=(0, 0, 0, spec_padding)
                 )
 
                 # check required mode
@@ -637,7 +679,8 @@ def _process_asset_status(
             check_manager.add_display(
                 target_name=target_assets,
                 namespace=namespace,
-                display=Padding(error_text, (0, 0, 0, padding + PADDING_SIZE)),
+                display=error_text,
+                padding=(0, 0, 0, padding + PADDING_SIZE),
             )
         status_status = CheckTaskStatus.error.value
     else:
@@ -83,6 +83,7 @@ def evaluate_broker_listeners(
     check_manager = CheckManager(
         check_name="evalBrokerListeners",
         check_desc="Evaluate MQTT Broker Listeners",
+        collect_displays=as_list,
     )
 
     target_listeners = "brokerlisteners.mqttbroker.iotoperations.azure.com"
@@ -108,7 +109,8 @@ def evaluate_broker_listeners(
         )
         check_manager.add_display(
             target_name=target_listeners,
-            display=Padding(fetch_listeners_error_text, (0, 0, 0, DEFAULT_PADDING)),
+            display=fetch_listeners_error_text,
+            padding=(0, 0, 0, DEFAULT_PADDING),
         )
         return check_manager.as_dict(as_list)
 
@@ -121,9 +123,8 @@ def evaluate_broker_listeners(
         check_manager.add_display(
             target_name=target_listeners,
             namespace=namespace,
-            display=Padding(
-                f"Broker Listeners in namespace {{[purple]{namespace}[/purple]}}", (0, 0, 0, DEFAULT_PADDING)
-            ),
+            display=f"Broker Listeners in namespace {{[purple]{namespace}[/purple]}}",
+            padding=(0, 0, 0, DEFAULT_PADDING),
         )
 
         listeners = list(listeners)
@@ -143,7 +144,8 @@ def evaluate_broker_listeners(
         check_manager.add_display(
             target_name=target_listeners,
             namespace=namespace,
-            display=Padding(listener_count_desc, (0, 0, 0, DEFAULT_PADDING)),
+            display=listener_count_desc,
+            padding=(0, 0, 0, DEFAULT_PADDING),
         )
 
         processed_services = {}
@@ -204,10 +206,8 @@ def evaluate_broker_listeners(
                             check_manager.add_display(
                                 target_name=target_listeners,
                                 namespace=namespace,
-                                display=Padding(
-                                    f"{label}: {colorize_string(val)}",
-                                    (0, 0, 0, 12),
-                                ),
+                                display=f"{label}: {colorize_string(val)}",
+                                padding=(0, 0, 0, 12),
                             )
 
                 if authn:
@@ -241,7 +241,8 @@ def evaluate_broker_listeners(
                         check_manager.add_display(
                             target_name=target_listeners,
                             namespace=namespace,
-                            display=Padding(authn_display, (0, 0, 0, 12)),
+                            display=authn_display,
+                            padding=(0, 0, 0, 12),
                         )
 
                     check_manager.add_target_eval(
@@ -285,7 +286,8 @@ def evaluate_broker_listeners(
                         check_manager.add_display(
                             target_name=target_listeners,
                             namespace=namespace,
-                            display=Padding(authz_display, (0, 0, 0, 12)),
+                            display=authz_display,
+                            padding=(0, 0, 0, 12),
                         )
 
                     check_manager.add_target_eval(
@@ -323,7 +325,8 @@ def evaluate_broker_listeners(
                         check_manager.add_display(
                             target_name=target_listeners,
                             namespace=namespace,
-                            display=Padding("TLS:", (0, 0, 0, listener_properties_padding)),
+                            display="TLS:",
+                            padding=(0, 0, 0, listener_properties_padding),
                         )
                         # TODO - add check for refs
                         for prop_name, prop_value in {
@@ -374,7 +377,7 @@ def evaluate_brokers(
     detail_level: int = ResourceOutputDetailLevel.summary.value,
     resource_name: str = None,
 ) -> Dict[str, Any]:
-    check_manager = CheckManager(check_name="evalBrokers", check_desc="Evaluate MQTT Brokers")
+    check_manager = CheckManager(check_name="evalBrokers", check_desc="Evaluate MQTT Brokers", collect_displays=as_list)
 
     target_brokers = "brokers.mqttbroker.iotoperations.azure.com"
     broker_conditions = ["len(brokers)==1", "spec.mode"]
@@ -395,7 +398,8 @@ def evaluate_brokers(
         )
         check_manager.add_display(
             target_name=target_brokers,
-            display=Padding(fetch_brokers_error_text, (0, 0, 0, DEFAULT_PADDING)),
+            display=fetch_brokers_error_text,
+            padding=(0, 0, 0, DEFAULT_PADDING),
         )
         return check_manager.as_dict(as_list)
 
@@ -404,7 +408,8 @@ def evaluate_brokers(
         check_manager.add_display(
             target_name=target_brokers,
             namespace=namespace,
-            display=Padding(f"MQTT Brokers in namespace {{[purple]{namespace}[/purple]}}", (0, 0, 0, DEFAULT_PADDING)),
+            display=f"MQTT Brokers in namespace {{[purple]{namespace}[/purple]}}",
+            padding=(0, 0, 0, DEFAULT_PADDING),
         )
         brokers = list(brokers)
         brokers_count = len(brokers)
@@ -421,7 +426,8 @@ def evaluate_brokers(
         check_manager.add_display(
             target_name=target_brokers,
             namespace=namespace,
-            display=Padding(brokers_count_text, (0, 0, 0, DEFAULT_PADDING)),
+            display=brokers_count_text,
+            padding=(0, 0, 0, DEFAULT_PADDING),
         )
 
         added_distributed_conditions = False
@@ -436,7 +442,8 @@ def evaluate_brokers(
             check_manager.add_display(
                 target_name=target_brokers,
                 namespace=namespace,
-                display=Padding(target_broker_text, (0, 0, 0, DEFAULT_PADDING)),
+                display=target_broker_text,
+                padding=(0, 0, 0, DEFAULT_PADDING),
             )
             broker_properties_padding = DEFAULT_PADDING + 4
 
@@ -472,15 +479,14 @@ def evaluate_brokers(
                 check_manager.add_display(
                     target_name=target_brokers,
                     namespace=namespace,
-                    display=Padding("\nCardinality", (0, 0, 0, 12)),
+                    display="\nCardinality",
+                    padding=(0, 0, 0, 12),
                 )
                 check_manager.add_display(
                     target_name=target_brokers,
                     namespace=namespace,
-                    display=Padding(
-                        f"cardinality {colorize_string(color='red', value='not detected')}.",
-                        (0, 0, 0, 16),
-                    ),
+                    display=f"cardinality {colorize_string(color='red', value='not detected')}.",
+                    padding=(0, 0, 0, 16),
                 )
             else:
                 broker_cardinality_eval_status = _evaluate_broker_cardinality(
@@ -518,7 +524,8 @@ def evaluate_brokers(
                     check_manager.add_display(
                         target_name=target_brokers,
                         namespace=namespace,
-                        display=Padding("\nBroker Diagnostics", (0, 0, 0, 12)),
+                        display="\nBroker Diagnostics",
+                        padding=(0, 0, 0, 12),
                     )
 
                     if detail_level == ResourceOutputDetailLevel.detail.value:
@@ -545,15 +552,14 @@ def evaluate_brokers(
                 check_manager.add_display(
                     target_name=target_brokers,
                     namespace=namespace,
-                    display=Padding("\nBroker Diagnostics", (0, 0, 0, 12)),
+                    display="\nBroker Diagnostics",
+                    padding=(0, 0, 0, 12),
                 )
                 check_manager.add_display(
                     target_name=target_brokers,
                     namespace=namespace,
-                    display=Padding(
-                        colorize_string(color="yellow", value="Unable to fetch broker diagnostics."),
-                        diagnostic_detail_padding,
-                    ),
+                    display=colorize_string(color="yellow", value="Unable to fetch broker diagnostics."),
+                    padding=diagnostic_detail_padding,
                 )
 
             check_manager.add_target_eval(
@@ -575,10 +581,8 @@ def evaluate_brokers(
             check_manager.add_display(
                 target_name=target_brokers,
                 namespace=namespace,
-                display=Padding(
-                    "\nRuntime Health",
-                    (0, 0, 0, DEFAULT_PADDING),
-                ),
+                display="\nRuntime Health",
+                padding=(0, 0, 0, DEFAULT_PADDING),
             )
 
             pods: List[dict] = []
@@ -643,6 +647,7 @@ def evaluate_broker_authentications(
     check_manager = CheckManager(
         check_name="evalBrokerAuthentications",
         check_desc="Evaluate MQTT Broker Authentications",
+        collect_displays=as_list,
     )
 
     target_authentications = "brokerauthentications.mqttbroker.iotoperations.azure.com"
@@ -666,7 +671,8 @@ def evaluate_broker_authentications(
         )
         check_manager.add_display(
             target_name=target_authentications,
-            display=Padding(fetch_authentications_error_text, (0, 0, 0, DEFAULT_PADDING)),
+            display=fetch_authentications_error_text,
+            padding=(0, 0, 0, DEFAULT_PADDING),
         )
         return check_manager.as_dict(as_list)
 
@@ -679,10 +685,8 @@ def evaluate_broker_authentications(
         check_manager.add_display(
             target_name=target_authentications,
             namespace=namespace,
-            display=Padding(
-                f"Broker Authentications in namespace {{{colorize_string(color='purple', value=namespace)}}}",
-                (0, 0, 0, DEFAULT_PADDING),
-            ),
+            display=f"Broker Authentications in namespace {{{colorize_string(color='purple', value=namespace)}}}",
+            padding=(0, 0, 0, DEFAULT_PADDING),
         )
 
         authentications = list(authentications)
@@ -785,6 +789,7 @@ def evaluate_broker_authorizations(
     check_manager = CheckManager(
         check_name="evalBrokerAuthorizations",
         check_desc="Evaluate MQTT Broker Authorizations",
+        collect_displays=as_list,
     )
 
     target_authorizations = "brokerauthorizations.mqttbroker.iotoperations.azure.com"
@@ -808,7 +813,8 @@ def evaluate_broker_authorizations(
         )
         check_manager.add_display(
             target_name=target_authorizations,
-            display=Padding(fetch_authorizations_error_text, (0, 0, 0, DEFAULT_PADDING)),
+            display=fetch_authorizations_error_text,
+            padding=(0, 0, 0, DEFAULT_PADDING),
         )
         return check_manager.as_dict(as_list)
 
@@ -820,9 +826,8 @@ def evaluate_broker_authorizations(
         check_manager.add_display(
             target_name=target_authorizations,
             namespace=namespace,
-            display=Padding(
-                f"Broker Authorizations in namespace {{[purple]{namespace}[/purple]}}", (0, 0, 0, DEFAULT_PADDING)
-            ),
+            display=f"Broker Authorizations in namespace {{[purple]{namespace}[/purple]}}",
+            padding=(0, 0, 0, DEFAULT_PADDING),
         )
 
         authorizations = list(authorizations)
@@ -880,7 +885,8 @@ def evaluate_broker_authorizations(
                 check_manager.add_display(
                     target_name=target_authorizations,
                     namespace=namespace,
-                    display=Padding(authz_policies_desc, (0, 0, 0, 12)),
+                    display=authz_policies_desc,
+                    padding=(0, 0, 0, 12),
                 )
 
             check_manager.add_target_eval(
@@ -963,7 +969,8 @@ def _evaluate_broker_reference(
     check_manager.add_display(
         target_name=target_name,
         namespace=namespace,
-        display=Padding(f"{display_text} {ref_display}", (0, 0, 0, padding)),
+        display=f"{display_text} {ref_display}",
+        padding=(0, 0, 0, padding),
     )
 
 
@@ -994,10 +1001,8 @@ def _evaluate_listener_service(
         check_manager.add_display(
             target_name=target_listeners,
             namespace=namespace,
-            display=Padding(
-                f"\n{colorize_string(color='red', value='Unable')} to fetch service {{{colorize_string(color='red', value=listener_spec_service_name)}}}.",
-                (0, 0, 0, 12),
-            ),
+            display=f"\n{colorize_string(color='red', value='Unable')} to fetch service {{{colorize_string(color='red', value=listener_spec_service_name)}}}.",
+            padding=(0, 0, 0, 12),
         )
         check_manager.add_target_eval(
             target_name=target_listener_service,
@@ -1018,10 +1023,8 @@ def _evaluate_listener_service(
         check_manager.add_display(
             target_name=target_listener_service,
             namespace=namespace,
-            display=Padding(
-                f"Service {{{colorize_string(listener_spec_service_name)}}} of type {colorize_string(listener_spec_service_type)}",
-                (0, 0, 0, DEFAULT_PADDING),
-            ),
+            display=f"Service {{{colorize_string(listener_spec_service_name)}}} of type {colorize_string(listener_spec_service_type)}",
+            padding=(0, 0, 0, DEFAULT_PADDING),
         )
 
         if listener_spec_service_type.lower() == "loadbalancer":
@@ -1051,17 +1054,16 @@ def _evaluate_listener_service(
                 check_manager.add_display(
                     target_name=target_listener_service,
                     namespace=namespace,
-                    display=Padding(
-                        ingress_rules_desc + ingress_count_colored,
-                        (0, 0, 0, 12),
-                    ),
+                    display=ingress_rules_desc + ingress_count_colored,
+                    padding=(0, 0, 0, 12),
                 )
 
                 if ingress_rules:
                     check_manager.add_display(
                         target_name=target_listener_service,
                         namespace=namespace,
-                        display=Padding("\nIngress", (0, 0, 0, 12)),
+                        display="\nIngress",
+                        padding=(0, 0, 0, 12),
                     )
 
             for ingress in ingress_rules:
@@ -1072,7 +1074,8 @@ def _evaluate_listener_service(
                         check_manager.add_display(
                             target_name=target_listener_service,
                             namespace=namespace,
-                            display=Padding(rule_desc, (0, 0, 0, 16)),
+                            display=rule_desc,
+                            padding=(0, 0, 0, 16),
                         )
                 else:
                     listener_service_eval_status = CheckTaskStatus.warning.value
@@ -1102,7 +1105,8 @@ def _evaluate_listener_service(
                 check_manager.add_display(
                     target_name=target_listener_service,
                     namespace=namespace,
-                    display=Padding(cluster_ip_desc, (0, 0, 0, 12)),
+                    display=cluster_ip_desc,
+                    padding=(0, 0, 0, 12),
                 )
             check_manager.add_target_eval(
                 target_name=target_listener_service,
@@ -1138,10 +1142,8 @@ def _evaluate_broker_diagnostics_service(
         check_manager.add_display(
             target_name=target_brokers,
             namespace=namespace,
-            display=Padding(
-                diag_service_desc,
-                (0, 0, 0, 12),
-            ),
+            display=diag_service_desc,
+            padding=(0, 0, 0, 12),
         )
     else:
         clusterIP = diagnostics_service.get("spec", {}).get("clusterIP")
@@ -1161,10 +1163,8 @@ def _evaluate_broker_diagnostics_service(
         check_manager.add_display(
             target_name=target_brokers,
             namespace=namespace,
-            display=Padding(
-                diag_service_desc,
-                (0, 0, 0, 12),
-            ),
+            display=diag_service_desc,
+            padding=(0, 0, 0, 12),
         )
         if ports and detail_level != ResourceOutputDetailLevel.summary.value:
             for port in ports:
@@ -1214,7 +1214,8 @@ def _display_sub_check_results(
         check_manager.add_display(
             target_name=target_name,
             namespace=namespace,
-            display=Padding(error_display, (0, 0, 0, parent_padding + 4)),
+            display=error_display,
+            padding=(0, 0, 0, parent_padding + 4),
         )
 
 
@@ -1611,7 +1612,8 @@ def _evaluate_broker_cardinality(
         check_manager.add_display(
             target_name=target_brokers,
             namespace=namespace,
-            display=Padding("\nCardinality", (0, 0, 0, 12)),
+            display="\nCardinality",
+            padding=(0, 0, 0, 12),
         )
 
         for display in [
@@ -1623,6 +1625,7 @@ def _evaluate_broker_cardinality(
             check_manager.add_display(
                 target_name=target_brokers,
                 namespace=namespace,
-                display=Padding(display, (0, 0, 0, padding + 4)),
+                display=display,
+                padding=(0, 0, 0, padding + 4),
             )
     return broker_eval_status
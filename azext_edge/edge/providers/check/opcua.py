@@ -4,7 +4,6 @@
 # Licensed under the MIT License. See License file in the project root for license information.
 # ----------------------------------------------------------------------------------------------
 
-from rich.padding import Padding
 from typing import Any, Dict, List
 
 from ..base import get_namespaced_pods_by_prefix
@@ -50,7 +49,11 @@ def evaluate_core_service_runtime(
     detail_level: int = ResourceOutputDetailLevel.summary.value,
     resource_name: str = None,
 ) -> Dict[str, Any]:
-    check_manager = CheckManager(check_name="evalCoreServiceRuntime", check_desc="Evaluate OPC UA broker core service")
+    check_manager = CheckManager(
+        check_name="evalCoreServiceRuntime",
+        check_desc="Evaluate OPC UA broker core service",
+        collect_displays=as_list,
+    )
 
     padding = 6
     opcua_runtime_resources: List[dict] = []
@@ -73,7 +76,8 @@ def evaluate_core_service_runtime(
             check_manager.add_target(target_name=CoreServiceResourceKinds.RUNTIME_RESOURCE.value)
             check_manager.add_display(
                 target_name=CoreServiceResourceKinds.RUNTIME_RESOURCE.value,
-                display=Padding("Unable to fetch pods.", (0, 0, 0, padding + 2)),
+                display="Unable to fetch pods.",
+                padding=(0, 0, 0, padding + 2),
             )
 
     for namespace, pods in get_resources_grouped_by_namespace(opcua_runtime_resources):
@@ -81,9 +85,8 @@ def evaluate_core_service_runtime(
         check_manager.add_display(
             target_name=CoreServiceResourceKinds.RUNTIME_RESOURCE.value,
             namespace=namespace,
-            display=Padding(
-                f"OPC UA broker runtime resources in namespace {{[purple]{namespace}[/purple]}}", (0, 0, 0, padding)
-            ),
+            display=f"OPC UA broker runtime resources in namespace {{[purple]{namespace}[/purple]}}",
+            padding=(0, 0, 0, padding),
         )
 
         evaluate_pod_health(
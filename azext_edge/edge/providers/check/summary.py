@@ -4,16 +4,16 @@
 # Licensed under the MIT License. See License file in the project root for license information.
 # ----------------------------------------------------------------------------------------------
 
+from functools import partial
 from typing import List, NamedTuple
 
-from rich.padding import Padding
 from rich.table import Table
 from rich.console import NewLine
 
 from ...common import OPCUA_SERVICE, CheckTaskStatus, OpsServiceType
 from ...providers.edge_api import DATAFLOW_API_V1, DEVICEREGISTRY_API_V1, MQ_ACTIVE_API
 from .akri import check_akri_deployment
-from .base import CheckManager
+from .base import CheckManager, run_checks_concurrently
 from .base.display import colorize_string
 from .common import ResourceOutputDetailLevel
 from .dataflow import PADDING, check_dataflows_deployment
@@ -69,30 +69,38 @@ def check_summary(
         ),
     ]
 
-    check_manager = CheckManager(check_name="evalAIOSummary", check_desc="Service summary checks")
-    for check in service_checks:
+    # run service checks concurrently, each service evaluates with its own check managers
+    service_results = run_checks_concurrently(
+        [
+            partial(
+                check.check_func,
+                detail_level=ResourceOutputDetailLevel.summary.value,
+                resource_name=resource_name,
+                as_list=as_list,
+                resource_kinds=resource_kinds,
+            )
+            for check in service_checks
+        ]
+    )
 
-        # run checks for service
-        result = check.check_func(
-            detail_level=ResourceOutputDetailLevel.summary.value,
-            resource_name=resource_name,
-            as_list=as_list,
-            resource_kinds=resource_kinds,
-        )
+    check_manager = CheckManager(
+        check_name="evalAIOSummary",
+        check_desc="Service summary checks",
+        collect_displays=as_list,
+    )
+    for check, result in zip(service_checks, service_results):
 
         # add service check results to check manager
         target = check.target
         check_manager.add_target(target_name=target)
         check_manager.add_display(
             target_name=target,
-            display=Padding(
-                check.title,
-                (0, 0, 0, PADDING),
-            ),
+            display=check.title,
+            padding=(0, 0, 0, PADDING),
         )
 
-        # create grid for service check results
-        grid = Table.grid(padding=(0, 0, 0, 2))
+        # create grid for service check results, only shown for list output
+        grid = Table.grid(padding=(0, 0, 0, 2)) if check_manager.collect_displays else None
         add_footer = False
 
         # parse check results
@@ -110,10 +118,11 @@ def check_summary(
                 value={obj.get("name", "checkResult"): status},
             )
             # add row to grid
-            grid.add_row(colorize_string(value=emoji, color=color), description)
+            if grid is not None:
+                grid.add_row(colorize_string(value=emoji, color=color), description)
 
         # display grid
-        check_manager.add_display(target_name=target, display=Padding(grid, (0, 0, 0, PADDING)))
+        check_manager.add_display(target_name=target, display=grid, padding=(0, 0, 0, PADDING))
 
         # service check suggestion footer
         if add_footer:
@@ -121,6 +130,6 @@ def check_summary(
                 f" See details by running: az iot ops check --svc {check.svc}"
             )
             check_manager.add_display(target_name=target, display=NewLine())
-            check_manager.add_display(target_name=target, display=Padding(footer, (0, 0, 0, PADDING)))
+            check_manager.add_display(target_name=target, display=footer, padding=(0, 0, 0, PADDING))
 
     return check_manager.as_dict(as_list=as_list)
@@ -4,6 +4,7 @@
 # Licensed under the MIT License. See License file in the project root for license information.
 # ----------------------------------------------------------------------------------------------
 
+from functools import partial
 from typing import Any, Dict, List, Optional
 
 from azure.cli.core.azclierror import ArgumentUsageError
@@ -11,7 +12,8 @@ from azext_edge.edge.providers.edge_api.dataflow import DataflowResourceKinds
 from rich.console import Console
 
 from ..common import OPCUA_SERVICE, ListableEnum, OpsServiceType
-from .check.base import check_pre_deployment, display_as_list
+from .check.base import check_pre_deployment, display_as_list, run_checks_concurrently
+from .check.base.resource_index import resource_index
 from .check.common import COLOR_STR_FORMAT, ResourceOutputDetailLevel
 from .check.deviceregistry import check_deviceregistry_deployment
 from .check.mq import check_mq_deployment
@@ -53,10 +55,10 @@ def run_checks(
         )
         result["title"] = f"Evaluation for {title_subject}" if ops_service else "IoT Operations Summary"
 
+        deployment_checks = []
         if pre_deployment:
-            result["preDeployment"] = check_pre_deployment(as_list)
+            deployment_checks.append(partial(check_pre_deployment, as_list))
         if post_deployment:
-            result["postDeployment"] = []
             service_check_dict = {
                 OpsServiceType.akri.value: check_akri_deployment,
                 OpsServiceType.mq.value: check_mq_deployment,
@@ -65,9 +67,24 @@ def run_checks(
                 OpsServiceType.dataflow.value: check_dataflows_deployment,
                 None: check_summary,
             }
-            service_result = service_check_dict[ops_service](
-                detail_level=detail_level, resource_name=resource_name, as_list=as_list, resource_kinds=resource_kinds
+            deployment_checks.append(
+                partial(
+                    service_check_dict[ops_service],
+                    detail_level=detail_level,
+                    resource_name=resource_name,
+                    as_list=as_list,
+                    resource_kinds=resource_kinds,
+                )
             )
+        # pre and post deployment checks are independent, so they run concurrently
+        with resource_index():
+            deployment_results = run_checks_concurrently(deployment_checks)
+
+        if pre_deployment:
+            result["preDeployment"] = deployment_results.pop(0)
+        if post_deployment:
+            result["postDeployment"] = []
+            service_result = deployment_results.pop(0)
             if isinstance(service_result, list):
                 for obj in service_result:
                     result["postDeployment"].append(obj)
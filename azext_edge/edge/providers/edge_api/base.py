@@ -5,12 +5,27 @@
 # ----------------------------------------------------------------------------------------------
 
 from enum import Enum
-from typing import Dict, FrozenSet, Iterable, List, Union, Optional
-from kubernetes.client.models import V1APIResourceList
-from ...providers.base import get_cluster_custom_api, get_custom_objects
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterable, List, Union, Optional
 
 from azure.cli.core.azclierror import ResourceNotFoundError
 
+if TYPE_CHECKING:
+    from kubernetes.client.models import V1APIResourceList
+
+
+# The cluster accessors import the kubernetes client on first use, so that the command table and help,
+# which build EdgeResourceApi definitions, load without it.
+def get_cluster_custom_api(group: str, version: str, raise_on_404: bool = False) -> Optional["V1APIResourceList"]:
+    from ...providers.base import get_cluster_custom_api as _get_cluster_custom_api
+
+    return _get_cluster_custom_api(group=group, version=version, raise_on_404=raise_on_404)
+
+
+def get_custom_objects(group: str, version: str, plural: str, namespace: Optional[str] = None) -> Optional[dict]:
+    from ...providers.base import get_custom_objects as _get_custom_objects
+
+    return _get_custom_objects(group=group, version=version, plural=plural, namespace=namespace)
+
 
 class EdgeResourceApi:
     def __init__(self, group: str, version: str, moniker: str, label: Optional[str] = None):
@@ -18,7 +33,7 @@ class EdgeResourceApi:
         self.version: str = version
         self.moniker: str = moniker
         self.label: Optional[str] = label
-        self._api: V1APIResourceList = None
+        self._api: "V1APIResourceList" = None
         self._kinds: Dict[str, str] = None
 
     def as_str(self) -> str:
@@ -4,11 +4,13 @@
 # Licensed under the MIT License. See License file in the project root for license information.
 # ----------------------------------------------------------------------------------------------
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from copy import deepcopy
 from enum import Enum
-from json import dumps
+from json import dump
 from pathlib import Path, PurePath
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
+from time import sleep
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
 from uuid import uuid4
 
 from azure.cli.core.azclierror import ValidationError
@@ -35,7 +37,6 @@ from ...util.az_client import (
     REGISTRY_API_VERSION,
     get_msi_mgmt_client,
     get_resource_client,
-    wait_for_terminal_state,
 )
 from ...util.id_tools import is_valid_resource_id, parse_resource_id
 from .common import (
@@ -72,6 +73,11 @@ DEFAULT_CONSOLE = Console()
 
 DEPLOYMENT_CHUNK_LEN = 800
 DEPLOYMENT_DATA_SIZE_KB = 1024
+# Bounds concurrent ARM and Resource Graph list calls while analyzing an instance.
+CLONE_FETCH_MAX_WORKERS = 8
+# Linked restore deploys independent split templates concurrently.
+RESTORE_MAX_CONCURRENCY = 4
+RESTORE_POLL_INTERVAL_SEC = 1
 
 
 class StateResourceKey(Enum):
@@ -171,6 +177,12 @@ def get_ops_extension_name(extension_names: List[str]) -> Optional[str]:
             return part
 
 
+class SplitDeployment(NamedTuple):
+    content: dict
+    # indexes of split deployments which must succeed before this one is deployed
+    depends_on: Tuple[int, ...]
+
+
 class DeploymentContainer:
     """
     An abstraction for an ARM deployment resource, which deploys a set of resources.
@@ -408,6 +420,7 @@ class InstanceRestore:
     ) -> Optional["LROPoller"]:
         deployment_params = {"properties": {"mode": "Incremental", "template": content, "parameters": parameters}}
 
+        # throttled (429) submissions are retried by the retry policy of the client pipeline
         headers = {"x-ms-correlation-request-id": str(uuid4()), "CommandName": "iot ops clone"}
         return self.resource_client.deployments.begin_create_or_update(
             resource_group_name=self.resource_group_name,
@@ -488,23 +501,48 @@ class InstanceRestore:
         deployment_name = default_bundle_name(self.instance_record["name"])
         DEFAULT_CONSOLE.print()
 
-        deployment_work = []
         if self.template_mode == TemplateMode.LINKED.value:
-            deployment_work.extend(self.template_content.get_split_content())
+            deployment_work = self.template_content.get_split_deployments()
         else:
-            deployment_work.append(self.template_content.content)
-        total_pages = len(deployment_work)
+            deployment_work = [self.template_content.get_deployment()]
 
         with DEFAULT_CONSOLE.status("Preparing replication...") as console:
             self._handle_federation(use_self_hosted_issuer)
             # TODO: Show warnings if they exist from federation
 
-            for i in range(total_pages):
-                status = f"Replicating {deployment_name} {i + 1}/{total_pages}"
-                console.update(status=status)
+            self._deploy_split(
+                deployment_work=deployment_work,
+                parameters=parameters,
+                deployment_name=deployment_name,
+                console=console,
+            )
+
+        DEFAULT_CONSOLE.print()
+
+    def _deploy_split(
+        self,
+        deployment_work: List[SplitDeployment],
+        parameters: dict,
+        deployment_name: str,
+        console: Any,
+    ):
+        """
+        Deploys split templates once their dependencies succeed, with up to RESTORE_MAX_CONCURRENCY
+        in flight. A single template is submitted without waiting for completion.
+        """
+        total_pages = len(deployment_work)
+        pending = list(range(total_pages))
+        running: Dict[int, "LROPoller"] = {}
+        succeeded = set()
+
+        while pending or running:
+            for i in [i for i in pending if all(d in succeeded for d in deployment_work[i].depends_on)]:
+                if len(running) >= RESTORE_MAX_CONCURRENCY:
+                    break
+                pending.remove(i)
                 page = f"_{i + 1}" if total_pages > 1 else ""
-                poller = self._deploy_template(
-                    content=deployment_work[i],
+                running[i] = self._deploy_template(
+                    content=deployment_work[i].content,
                     parameters=parameters,
                     deployment_name=f"{deployment_name}{page}",
                 )
@@ -513,10 +551,20 @@ class InstanceRestore:
                     f"->[link={deployment_link}]Link to {self.cluster_name} deployment {i + 1}/{total_pages}[/link]",
                     highlight=False,
                 )
-                if total_pages > 1:
-                    wait_for_terminal_state(poller)
-
-        DEFAULT_CONSOLE.print()
+            if total_pages == 1:
+                return
+            if not running:
+                raise ValidationError("Unable to order linked deployments, their dependencies cannot be satisfied.")
+
+            console.update(status=f"Replicating {deployment_name} {len(succeeded)}/{total_pages}")
+            done = [i for i in running if running[i].done()]
+            if not done:
+                sleep(RESTORE_POLL_INTERVAL_SEC)
+                continue
+            for i in done:
+                # raises if the deployment failed
+                running.pop(i).result()
+                succeeded.add(i)
 
     # TODO: re-use with work module
     def _get_deployment_link(self, deployment_name: str) -> str:
@@ -713,6 +761,7 @@ class CloneManager:
         self.metadata_map: dict = {}
         self.instance_identities: List[str] = []
         self.active_deployment: Dict[StateResourceKey, List[str]] = {}
+        self.fetched: Dict[str, Any] = {}
 
     def analyze_cluster(self, force: Optional[bool] = None) -> "CloneState":
         """
@@ -733,6 +782,9 @@ class CloneManager:
             self._build_parameters()
             self._build_metadata()
 
+            # Remote state is fetched up front and concurrently, then the template is assembled serially.
+            self.fetched = self._fetch_resources()
+
             self._analyze_extensions()
             self._analyze_instance()
             self._analyze_instance_identity()
@@ -856,6 +908,94 @@ class CloneManager:
             """
         )["data"]
 
+    def _list_instance_resources(self, operations: Any, **kwargs) -> List[dict]:
+        return list(
+            operations.list_by_resource_group(
+                resource_group_name=self.resource_group_name, instance_name=self.instance_name, **kwargs
+            )
+        )
+
+    def _filter_by_extended_location(self, resources: Iterable[dict]) -> List[dict]:
+        ext_loc_id = self.instance_record["extendedLocation"]["name"].lower()
+        return [r for r in resources if r["extendedLocation"]["name"].lower() == ext_loc_id]
+
+    def _fetch_resources(self) -> Dict[str, Any]:
+        """
+        Fetches the remote resources needed to build the clone template on a bounded thread pool.
+        Fetches depending on another fetch (broker children, dataflows per profile and secret provider
+        class identities) are submitted as soon as the fetch they depend on completes.
+        """
+        client = self.instances.iotops_mgmt_client
+        ssc_client = self.instances.ssc_mgmt_client
+
+        with ThreadPoolExecutor(max_workers=CLONE_FETCH_MAX_WORKERS) as executor:
+            futures: Dict[str, Future] = {
+                "extensions": executor.submit(
+                    self.resource_map.connected_cluster.get_extensions_by_type,
+                    EXTENSION_TYPE_PLATFORM,
+                    EXTENSION_TYPE_ACS,
+                    EXTENSION_TYPE_SSC,
+                    EXTENSION_TYPE_OPS,
+                ),
+                "brokers": executor.submit(self._list_instance_resources, client.broker),
+                "endpoints": executor.submit(self._list_instance_resources, client.dataflow_endpoint),
+                "profiles": executor.submit(self._list_instance_resources, client.dataflow_profile),
+                "assetEndpoints": executor.submit(
+                    self.get_resources_of_type, resource_type="microsoft.deviceregistry/assetendpointprofiles"
+                ),
+                "assets": executor.submit(self.get_resources_of_type, resource_type="microsoft.deviceregistry/assets"),
+                "sscSpcs": executor.submit(
+                    lambda: list(
+                        ssc_client.azure_key_vault_secret_provider_classes.list_by_resource_group(
+                            resource_group_name=self.resource_group_name
+                        )
+                    )
+                ),
+                "sscSecretSyncs": executor.submit(
+                    lambda: list(
+                        ssc_client.secret_syncs.list_by_resource_group(resource_group_name=self.resource_group_name)
+                    )
+                ),
+            }
+
+            # Let us keep things simple atm
+            default_broker = futures["brokers"].result()[0]
+            for key, operations in [
+                ("authns", client.broker_authentication),
+                ("authzs", client.broker_authorization),
+                ("listeners", client.broker_listener),
+            ]:
+                futures[key] = executor.submit(
+                    self._list_instance_resources, operations, broker_name=default_broker["name"]
+                )
+
+            dataflow_futures = [
+                executor.submit(
+                    lambda profile_name: list(
+                        client.dataflow.list_by_profile_resource(
+                            resource_group_name=self.resource_group_name,
+                            instance_name=self.instance_name,
+                            dataflow_profile_name=profile_name,
+                        )
+                    ),
+                    profile["name"],
+                )
+                for profile in futures["profiles"].result()
+            ]
+
+            ssc_spcs = self._filter_by_extended_location(futures["sscSpcs"].result())
+            client_ids = [spc["properties"]["clientId"] for spc in ssc_spcs if "clientId" in spc["properties"]]
+            if client_ids:
+                futures["sscIdentities"] = executor.submit(self.get_identities_by_client_id, client_ids)
+
+            # Results are keyed and ordered as planned, independent of completion order.
+            fetched = {key: future.result() for key, future in futures.items()}
+            fetched["dataflows"] = [dataflow for future in dataflow_futures for dataflow in future.result()]
+            fetched["sscSpcs"] = ssc_spcs
+            fetched["sscSecretSyncs"] = self._filter_by_extended_location(fetched["sscSecretSyncs"])
+            fetched.setdefault("sscIdentities", [])
+        return fetched
+
     def _analyze_extensions(self):
         depends_on_map = {
             EXTENSION_TYPE_SSC: [EXTENSION_TYPE_TO_MONIKER_MAP[EXTENSION_TYPE_PLATFORM]],
@@ -871,9 +1011,7 @@ class CloneManager:
         api_version = (
             self.resource_map.connected_cluster.clusters.extensions.clusterconfig_mgmt_client._config.api_version
         )
-        extension_map = self.resource_map.connected_cluster.get_extensions_by_type(
-            EXTENSION_TYPE_PLATFORM, EXTENSION_TYPE_ACS, EXTENSION_TYPE_SSC, EXTENSION_TYPE_OPS
-        )
+        extension_map = self.fetched["extensions"]
         for extension_type in extension_map:
             extension_moniker = EXTENSION_TYPE_TO_MONIKER_MAP[extension_type]
             depends_on = depends_on_map.get(extension_type)
@@ -975,11 +1113,8 @@ class CloneManager:
 
     def _analyze_instance_resources(self):
         api_version = self.version_guru.get_instance_api()
-        brokers_iter = self.instances.iotops_mgmt_client.broker.list_by_resource_group(
-            resource_group_name=self.resource_group_name, instance_name=self.instance_name
-        )
         # Let us keep things simple atm
-        default_broker = list(brokers_iter)[0]
+        default_broker = self.fetched["brokers"][0]
         self._add_resource(
             key=StateResourceKey.BROKER,
             api_version=api_version,
@@ -998,11 +1133,7 @@ class CloneManager:
         self._add_deployment(
             key=StateResourceKey.AUTHN,
             api_version=api_version,
-            data_iter=self.instances.iotops_mgmt_client.broker_authentication.list_by_resource_group(
-                resource_group_name=self.resource_group_name,
-                instance_name=self.instance_name,
-                broker_name=default_broker["name"],
-            ),
+            data_iter=self.fetched["authns"],
             depends_on=broker_resource_id_expr,
             parameters=nested_params,
         )
@@ -1011,11 +1142,7 @@ class CloneManager:
         self._add_deployment(
             key=StateResourceKey.AUTHZ,
             api_version=api_version,
-            data_iter=self.instances.iotops_mgmt_client.broker_authorization.list_by_resource_group(
-                resource_group_name=self.resource_group_name,
-                instance_name=self.instance_name,
-                broker_name=default_broker["name"],
-            ),
+            data_iter=self.fetched["authzs"],
             depends_on=broker_resource_id_expr,
             parameters=nested_params,
         )
@@ -1031,11 +1158,7 @@ class CloneManager:
         self._add_deployment(
             key=StateResourceKey.LISTENER,
             api_version=api_version,
-            data_iter=self.instances.iotops_mgmt_client.broker_listener.list_by_resource_group(
-                resource_group_name=self.resource_group_name,
-                instance_name=self.instance_name,
-                broker_name=default_broker["name"],
-            ),
+            data_iter=self.fetched["listeners"],
             depends_on=listener_depends_on,
             parameters=nested_params,
         )
@@ -1048,19 +1171,13 @@ class CloneManager:
         self._add_deployment(
             key=StateResourceKey.ENDPOINT,
             api_version=api_version,
-            data_iter=self.instances.iotops_mgmt_client.dataflow_endpoint.list_by_resource_group(
-                resource_group_name=self.resource_group_name, instance_name=self.instance_name
-            ),
+            data_iter=self.fetched["endpoints"],
             depends_on=instance_resource_id_expr,
             parameters=nested_params,
         )
 
         # profile
-        profile_iter = list(
-            self.instances.iotops_mgmt_client.dataflow_profile.list_by_resource_group(
-                resource_group_name=self.resource_group_name, instance_name=self.instance_name
-            )
-        )
+        profile_iter = self.fetched["profiles"]
         self._add_deployment(
             key=StateResourceKey.PROFILE,
             api_version=api_version,
@@ -1071,20 +1188,10 @@ class CloneManager:
 
         # dataflow
         if profile_iter:
-            dataflows = []
-            for profile in profile_iter:
-                dataflows.extend(
-                    self.instances.iotops_mgmt_client.dataflow.list_by_profile_resource(
-                        resource_group_name=self.resource_group_name,
-                        instance_name=self.instance_name,
-                        dataflow_profile_name=profile["name"],
-                    )
-                )
-
             self._add_deployment(
                 key=StateResourceKey.DATAFLOW,
                 api_version=api_version,
-                data_iter=dataflows,
+                data_iter=self.fetched["dataflows"],
                 depends_on=[
                     get_resource_id_by_parts(
                         "Microsoft.Resources/deployments", self.active_deployment[StateResourceKey.PROFILE][-1]
@@ -1105,7 +1212,7 @@ class CloneManager:
             "microsoft.iotoperations/instances", TemplateParams.INSTANCE_NAME
         )
 
-        asset_endpoints = self.get_resources_of_type(resource_type="microsoft.deviceregistry/assetendpointprofiles")
+        asset_endpoints = self.fetched["assetEndpoints"]
         self._add_deployment(
             key=StateResourceKey.ASSET_ENDPOINT_PROFILE,
             api_version=REGISTRY_API_VERSION,
@@ -1121,7 +1228,7 @@ class CloneManager:
         )
 
         # TODO: Should this not wait on AEP?
-        assets = self.get_resources_of_type(resource_type="microsoft.deviceregistry/assets")
+        assets = self.fetched["assets"]
         if assets and asset_endpoints:
             self._add_deployment(
                 key=StateResourceKey.ASSET,
@@ -1139,22 +1246,12 @@ class CloneManager:
             **build_parameter(name=TemplateParams.CUSTOM_LOCATION_NAME.value),
             **build_parameter(name=TemplateParams.LOCATION.value),
         }
-        ssc_client = self.instances.ssc_mgmt_client
-        ssc_api_version = ssc_client._config.api_version
+        ssc_api_version = self.instances.ssc_mgmt_client._config.api_version
         instance_resource_id_expr = get_resource_id_by_param(
             "microsoft.iotoperations/instances", TemplateParams.INSTANCE_NAME
         )
-        ext_loc_id = self.instance_record["extendedLocation"]["name"].lower()
-        ssc_spcs = list(
-            ssc_client.azure_key_vault_secret_provider_classes.list_by_resource_group(
-                resource_group_name=self.resource_group_name
-            )
-        )
-
-        ssc_spcs = [spc for spc in ssc_spcs if spc["extendedLocation"]["name"].lower() == ext_loc_id]
-        client_ids = [spc["properties"]["clientId"] for spc in ssc_spcs if "clientId" in spc["properties"]]
-        if client_ids:
-            self.instance_identities.extend([mid["id"] for mid in self.get_identities_by_client_id(client_ids)])
+        ssc_spcs = self.fetched["sscSpcs"]
+        self.instance_identities.extend([mid["id"] for mid in self.fetched["sscIdentities"]])
 
         self._add_deployment(
             key=StateResourceKey.SSC_SPC,
@@ -1164,14 +1261,7 @@ class CloneManager:
             parameters=nested_params,
         )
 
-        ssc_secretsyncs = list(
-            ssc_client.secret_syncs.list_by_resource_group(resource_group_name=self.resource_group_name)
-        )
-        ssc_secretsyncs = [
-            secretsync
-            for secretsync in ssc_secretsyncs
-            if secretsync["extendedLocation"]["name"].lower() == ext_loc_id
-        ]
+        ssc_secretsyncs = self.fetched["sscSecretSyncs"]
         if ssc_secretsyncs and ssc_spcs:
             self._add_deployment(
                 key=StateResourceKey.SSC_SECRETSYNC,
@@ -1271,30 +1361,60 @@ class TemplateContent:
     def content(self) -> dict:
         return deepcopy(self._content)
 
+    def get_deployment(self) -> SplitDeployment:
+        """
+        The whole template as a single deployment. The template is the model itself rather than a copy.
+        """
+        return SplitDeployment(content=self._content, depends_on=())
+
     def get_split_content(self) -> List[dict]:
         """
         Used with the instance restore client. The root template and template for each
-        nested deployment (in consideration) gets separated and added to a queue to be deployed serially.
+        nested deployment (in consideration) gets separated.
         """
-        content = self.content
-        result = [content]
-        parameters = content.get("parameters", {})
-        resources: Dict[str, Dict[str, dict]] = content.get("resources", {})
-        for key in list(resources.keys()):
+        return [deployment.content for deployment in self.get_split_deployments()]
+
+    def _iter_linked_deployments(self) -> Iterable[Tuple[str, dict]]:
+        resources: Dict[str, Dict[str, dict]] = self._content.get("resources", {})
+        for key in resources:
             if resources[key].get("type", "").lower() != "microsoft.resources/deployments":
                 continue
             nested_resources: List[dict] = resources[key]["properties"]["template"].get("resources", [])
             if not nested_resources:
                 continue
-            nested_type = nested_resources[0].get("type", "").lower()
-            if nested_type not in self.linked_type_map:
+            if nested_resources[0].get("type", "").lower() not in self.linked_type_map:
                 continue
+            yield key, resources[key]
 
-            # TODO: Bring back efficient parameter usage for linked templates.
-            resources[key]["properties"]["template"]["parameters"] = parameters
+    def _get_root_content(self, resources: dict) -> dict:
+        # Split operations replace the root resources, everything else is shared with the model.
+        content = dict(self._content)
+        content["resources"] = resources
+        return content
 
-            result.append(resources[key]["properties"].pop("template"))
+    def get_split_deployments(self) -> List[SplitDeployment]:
+        """
+        The root template followed by the template of each nested deployment (in consideration), in order.
+        Split deployments depend on the root deployment and on any other split deployment in their dependsOn.
+        Templates share unmodified members with the model rather than copying it.
+        """
+        parameters = self._content.get("parameters", {})
+        resources = dict(self._content.get("resources", {}))
+        split: List[Tuple[str, dict, List[str]]] = []
+        for key, deployment in self._iter_linked_deployments():
+            # TODO: Bring back efficient parameter usage for linked templates.
+            template = {**deployment["properties"]["template"], "parameters": parameters}
+            split.append((key, template, deployment.get("dependsOn", [])))
             del resources[key]
+
+        # deployment names and their resourceId references end with '_{symbolic name}')
+        split_index = {f"'_{key}')": i + 1 for i, (key, _, _) in enumerate(split)}
+        result = [SplitDeployment(content=self._get_root_content(resources), depends_on=())]
+        for _, template, depends_on in split:
+            split_depends_on = {
+                index for ref, index in split_index.items() if any(ref in dependency for dependency in depends_on)
+            }
+            result.append(SplitDeployment(content=template, depends_on=(0, *sorted(split_depends_on))))
         return result
 
     def _get_deployments(
@@ -1305,34 +1425,26 @@ class TemplateContent:
         separated and the nested deployment template reference is updated to templateLink using either relativePath
         or uri when linked_base_uri is provided.
         """
-        content = self.content
         result = []
-        resources: Dict[str, Dict[str, dict]] = content.get("resources", {})
+        resources = dict(self._content.get("resources", {}))
         if linked_base_uri and root_dir:
             sep = "" if linked_base_uri.endswith("/") else "/"
             root_dir = f"{linked_base_uri}{sep}{root_dir}"
-        for key in resources:
-            if resources[key].get("type", "").lower() != "microsoft.resources/deployments":
-                continue
-            nested_resources: List[dict] = resources[key]["properties"]["template"].get("resources", [])
-            if not nested_resources:
-                continue
-            nested_type = nested_resources[0].get("type", "").lower()
-            if nested_type not in self.linked_type_map:
-                continue
-
+        for key, deployment in self._iter_linked_deployments():
+            nested_type = deployment["properties"]["template"]["resources"][0]["type"].lower()
             self.linked_type_map[nested_type] += 1
             kind = nested_type.split("/")[-1]
             linked_name = f"{kind}_{self.linked_type_map[nested_type]}"
             linked_rel_path = f"{root_dir}/{linked_name}.json"
 
             template_link = {"relativePath": linked_rel_path} if not linked_base_uri else {"uri": linked_rel_path}
-            resources[key]["properties"]["templateLink"] = template_link
+            properties = {prop: value for prop, value in deployment["properties"].items() if prop != "template"}
+            properties["templateLink"] = template_link
+            resources[key] = {**deployment, "properties": properties}
 
-            result.append((linked_name, resources[key]["properties"]["template"]))
-            del resources[key]["properties"]["template"]
+            result.append((linked_name, deployment["properties"]["template"]))
 
-        return content, result
+        return self._get_root_content(resources), result
 
     def write(
         self,
@@ -1349,19 +1461,22 @@ class TemplateContent:
         if template_mode == TemplateMode.LINKED.value:
             content, deployments = self._get_deployments(bundle_path.name, linked_base_uri)
 
-        content = content or self.content
-        template_str = dumps(content, indent=2)
-        with open(file=f"{bundle_path}.{file_ext}", mode="w", encoding="utf8") as template_file:
-            template_file.write(template_str)
+        write_json(file_path=f"{bundle_path}.{file_ext}", content=content or self._content)
 
         # This is where assets_1.json, assetendpointprofiles_1.json, etc will be written.
         if deployments:
             Path(bundle_path).mkdir(exist_ok=True)
             for deployment in deployments:
-                with open(
-                    file=f"{bundle_path.joinpath(deployment[0])}.{file_ext}", mode="w", encoding="utf8"
-                ) as template_file:
-                    template_file.write(dumps(deployment[1], indent=2))
+                write_json(file_path=f"{bundle_path.joinpath(deployment[0])}.{file_ext}", content=deployment[1])
+
+
+def write_json(file_path: str, content: dict):
+    """
+    Writes content as indented JSON. json.dump encodes incrementally, so the full JSON string is
+    never held in memory.
+    """
+    with open(file=file_path, mode="w", encoding="utf8") as json_file:
+        dump(content, json_file, indent=2)
 
 
 class TemplateGen:
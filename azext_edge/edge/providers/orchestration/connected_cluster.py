@@ -7,6 +7,7 @@
 from typing import List, Optional, Union, Dict
 from ...util.resource_graph import ResourceGraph
 
+RESOURCE_SYNC_RULE_TYPE = "microsoft.extendedlocation/customlocations/resourcesyncrules"
 
 QUERIES = {
     "get_custom_location_for_namespace": """
@@ -51,6 +52,19 @@ QUERIES = {
             or type startswith 'microsoft.secretsync'
         | project id, name, apiVersion, type
         """,
+    "get_aio_custom_location_resources": """
+        resources
+        | where type startswith 'microsoft.iotoperations'
+            or type startswith 'microsoft.deviceregistry'
+            or type startswith 'microsoft.secretsync'
+            or type =~ '{resource_sync_rule_type}'
+        | extend customLocationId = tolower(iff(
+            type =~ '{resource_sync_rule_type}',
+            substring(id, 0, indexof(tolower(id), '/resourcesyncrules/')),
+            tostring(extendedLocation.name)))
+        | where customLocationId in ({custom_location_ids})
+        | project id, name, apiVersion, type, customLocationId
+        """,
     "get_resource_sync_rules": """
         resources
         | where type =~ "microsoft.extendedlocation/customlocations/resourcesyncrules"
@@ -135,6 +149,21 @@ class ConnectedCluster:
         result = self.resource_graph.query_resources(query=query)
         return self._process_query_result(result)
 
+    def get_aio_custom_location_resources(self, custom_location_ids: List[str]) -> Optional[List[dict]]:
+        """
+        Fetches the aio resources and resource sync rules of all custom locations in one query. Each record
+        has a lower case customLocationId to partition by.
+        """
+        if not custom_location_ids:
+            return None
+        query = QUERIES["get_aio_custom_location_resources"].format(
+            resource_sync_rule_type=RESOURCE_SYNC_RULE_TYPE,
+            custom_location_ids=", ".join(f"'{cl_id.lower()}'" for cl_id in custom_location_ids),
+        )
+
+        result = self.resource_graph.query_resources(query=query)
+        return self._process_query_result(result)
+
     def get_resource_sync_rules(self, custom_location_id: str) -> Optional[List[dict]]:
         query = QUERIES["get_resource_sync_rules"].format(custom_location_id=custom_location_id)
 
@@ -4,9 +4,9 @@
 # Licensed under the MIT License. See License file in the project root for license information.
 # ----------------------------------------------------------------------------------------------
 
-from sys import maxsize
+from collections import deque
 from time import sleep
-from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
 
 from azure.cli.core.azclierror import ArgumentUsageError
 from knack.log import get_logger
@@ -16,14 +16,32 @@ from rich.live import Live
 from rich.progress import Progress, SpinnerColumn, TimeElapsedColumn
 from rich.table import Table
 
-from ...util.az_client import get_resource_client, wait_for_terminal_states
+from ...util.az_client import get_resource_client
 from ...util.common import should_continue_prompt
+from ...util.id_tools import parse_resource_id
 from .common import EXTENSION_TYPE_OPS
 from .resource_map import IoTOperationsResource, IoTOperationsResourceMap
 from .resources import Instances
 
 logger = get_logger(__name__)
 
+# Bounds concurrent deletes to stay well under ARM write throttling limits.
+DEFAULT_DELETION_MAX_CONCURRENCY = 16
+DELETION_POLL_INTERVAL_SEC = 1
+# Resource types that reference sibling types of the same parent, the reverse of the creation order.
+# Keyed on the referenced type, with the types that must be deleted before it.
+DELETION_TYPE_DEPENDENCIES: Dict[str, List[str]] = {
+    "microsoft.iotoperations/instances/dataflowendpoints": [
+        "microsoft.iotoperations/instances/dataflowprofiles/dataflows"
+    ],
+    "microsoft.iotoperations/instances/brokers/authentications": [
+        "microsoft.iotoperations/instances/brokers/listeners"
+    ],
+    "microsoft.iotoperations/instances/brokers/authorizations": [
+        "microsoft.iotoperations/instances/brokers/listeners"
+    ],
+    "microsoft.deviceregistry/assetendpointprofiles": ["microsoft.deviceregistry/assets"],
+}
 
 if TYPE_CHECKING:
     from azure.core.polling import LROPoller
@@ -59,6 +77,7 @@ class DeletionManager:
         cluster_name: Optional[str] = None,
         include_dependencies: Optional[bool] = None,
         no_progress: Optional[bool] = None,
+        max_concurrency: int = DEFAULT_DELETION_MAX_CONCURRENCY,
     ):
         from azure.cli.core.commands.client_factory import get_subscription_id
 
@@ -68,6 +87,7 @@ class DeletionManager:
         self.resource_group_name = resource_group_name
         self.instances = Instances(self.cmd)
         self.include_dependencies = include_dependencies
+        self.max_concurrency = max_concurrency
         self.subscription_id = get_subscription_id(cli_ctx=cmd.cli_ctx)
         self.resource_client = get_resource_client(self.subscription_id)
 
@@ -163,13 +183,13 @@ class DeletionManager:
             todo_resource_sync_rules.extend(self.resource_map.get_resource_sync_rules(cl.resource_id))
             todo_resources.extend(self.resource_map.get_resources(cl.resource_id))
 
-        batched_work = self._batch_resources(
+        deletion_graph = self._build_deletion_graph(
             resources=todo_resources,
             resource_sync_rules=todo_resource_sync_rules,
             custom_locations=todo_custom_locations,
             extensions=todo_extensions,
         )
-        if not batched_work:
+        if not deletion_graph:
             logger.warning("Nothing to delete :)")
             return
 
@@ -182,57 +202,112 @@ class DeletionManager:
                 return
 
         try:
-            for batches_key in batched_work:
-                self._render_display(f"[red]Deleting {batches_key}...")
-                for batch in batched_work[batches_key]:
-                    # TODO: @digimaun - Show summary as result
-                    lros = self._delete_batch(batch)
-                    [lro.result() for lro in lros]
+            # TODO: @digimaun - Show summary as result
+            self._delete_graph(deletion_graph)
         finally:
             self._stop_display()
 
-    def _batch_resources(
+    def _build_deletion_graph(
         self,
         resources: Optional[List[IoTOperationsResource]] = None,
         resource_sync_rules: Optional[List[IoTOperationsResource]] = None,
         custom_locations: Optional[List[IoTOperationsResource]] = None,
         extensions: Optional[List[IoTOperationsResource]] = None,
-    ) -> Dict[str, List[List[IoTOperationsResource]]]:
-        batched_work: Dict[str, List[List[IoTOperationsResource]]] = {}
-
-        if resources:
-            # resource_map.get_resources will sort resources in descending order by segment then display name
-            resource_batches: List[List[IoTOperationsResource]] = []
-            last_segments = maxsize
-            current_batch = []
-            for resource in resources:
-                current_segments = resource.segments
-                if current_segments < last_segments and current_batch:
-                    resource_batches.append(current_batch)
-                    current_batch = []
-                current_batch.append(resource)
-                last_segments = current_segments
-            if current_batch:
-                resource_batches.append(current_batch)
-            batched_work["resources"] = resource_batches
-
-        if resource_sync_rules:
-            batched_work["resource sync rules"] = [resource_sync_rules]
-
-        if custom_locations:
-            batched_work["custom locations"] = [custom_locations]
-
-        if extensions:
-            batched_work["extensions"] = [extensions]
-
-        return batched_work
-
-    def _delete_batch(self, resource_batch: List[IoTOperationsResource]) -> Tuple["LROPoller"]:
-        return wait_for_terminal_states(
-            *[
-                self.resource_client.resources.begin_delete_by_id(
-                    resource_id=resource.resource_id, api_version=resource.api_version
+    ) -> Dict[str, Tuple[IoTOperationsResource, Set[str]]]:
+        """
+        Returns resources keyed on lowered resource Id, each with the Ids that must be deleted before it.
+
+        A resource is blocked by its child resources (by resource Id), by resources of the types in
+        DELETION_TYPE_DEPENDENCIES under the same parent and by every resource of an earlier tier.
+        Tiers are resources and resource sync rules, then custom locations, then extensions.
+        """
+        deletion_graph: Dict[str, Tuple[IoTOperationsResource, Set[str]]] = {}
+        prior_tier_ids: Set[str] = set()
+        for tier in [(resources or []) + (resource_sync_rules or []), custom_locations or [], extensions or []]:
+            tier_ids = set()
+            for resource in tier:
+                resource_id = resource.resource_id.lower()
+                if resource_id in deletion_graph:
+                    continue
+                deletion_graph[resource_id] = (resource, set(prior_tier_ids))
+                tier_ids.add(resource_id)
+
+            for resource_id in tier_ids:
+                # walk up the resource Id to block present ancestors on this resource
+                parent_id = resource_id
+                while "/" in parent_id:
+                    parent_id = parent_id.rsplit("/", 1)[0]
+                    if parent_id in tier_ids:
+                        deletion_graph[parent_id][1].add(resource_id)
+
+            tier_ids_by_type: Dict[str, List[str]] = {}
+            for resource_id in tier_ids:
+                tier_ids_by_type.setdefault(_get_resource_type(resource_id), []).append(resource_id)
+            for resource_type, dependency_types in DELETION_TYPE_DEPENDENCIES.items():
+                for resource_id in tier_ids_by_type.get(resource_type, []):
+                    # only resources under the same parent (instance, broker or resource group) reference it
+                    parent_prefix = resource_id.rsplit("/", 2)[0] + "/"
+                    for dependency_type in dependency_types:
+                        deletion_graph[resource_id][1].update(
+                            dependency_id
+                            for dependency_id in tier_ids_by_type.get(dependency_type, [])
+                            if dependency_id.startswith(parent_prefix)
+                        )
+            prior_tier_ids.update(tier_ids)
+
+        return deletion_graph
+
+    def _delete_graph(self, deletion_graph: Dict[str, Tuple[IoTOperationsResource, Set[str]]]):
+        """
+        Begins each deletion as soon as everything blocking it is deleted, with at most
+        max_concurrency deletions in flight.
+        """
+        blockers = {resource_id: set(blocked_by) for resource_id, (_, blocked_by) in deletion_graph.items()}
+        dependents: Dict[str, List[str]] = {}
+        for resource_id, blocked_by in blockers.items():
+            for blocker_id in blocked_by:
+                dependents.setdefault(blocker_id, []).append(resource_id)
+
+        ready = deque(resource_id for resource_id in deletion_graph if not blockers[resource_id])
+        in_flight: Dict[str, "LROPoller"] = {}
+        deleted_count = 0
+        total_count = len(deletion_graph)
+        last_status = None
+        while ready or in_flight:
+            while ready and len(in_flight) < self.max_concurrency:
+                resource_id = ready.popleft()
+                in_flight[resource_id] = self._delete_resource(deletion_graph[resource_id][0])
+
+            status = (deleted_count, len(in_flight))
+            if status != last_status:
+                self._render_display(
+                    f"[red]Deleting resources... {deleted_count}/{total_count} deleted, {len(in_flight)} in progress."
                 )
-                for resource in resource_batch
-            ]
+                last_status = status
+
+            done_ids = [resource_id for resource_id, poller in in_flight.items() if poller.done()]
+            if not done_ids:
+                sleep(DELETION_POLL_INTERVAL_SEC)
+                continue
+
+            for resource_id in done_ids:
+                # raises if the deletion failed
+                in_flight.pop(resource_id).result()
+                deleted_count += 1
+                for dependent_id in dependents.get(resource_id, []):
+                    blockers[dependent_id].discard(resource_id)
+                    if not blockers[dependent_id]:
+                        ready.append(dependent_id)
+
+    def _delete_resource(self, resource: IoTOperationsResource) -> "LROPoller":
+        return self.resource_client.resources.begin_delete_by_id(
+            resource_id=resource.resource_id, api_version=resource.api_version
         )
+
+
+def _get_resource_type(resource_id: str) -> Optional[str]:
+    parsed_id = parse_resource_id(resource_id)
+    if "namespace" not in parsed_id:
+        return None
+    child_types = [parsed_id[f"child_type_{i}"] for i in range(1, (parsed_id.get("last_child_num") or 0) + 1)]
+    return "/".join([parsed_id["namespace"], parsed_id["type"], *child_types]).lower()
@@ -10,7 +10,7 @@ from knack.log import get_logger
 from rich.tree import Tree
 
 from .common import EXTENSION_TYPE_OPS
-from .connected_cluster import ConnectedCluster
+from .connected_cluster import RESOURCE_SYNC_RULE_TYPE, ConnectedCluster
 
 logger = get_logger(__name__)
 
@@ -91,36 +91,33 @@ class IoTOperationsResourceMap:
 
         custom_locations = self.connected_cluster.get_aio_custom_locations()
         if custom_locations:
+            cl_containers: Dict[str, CustomLocationsContainer] = {}
             for cl in custom_locations:
                 cl_container = CustomLocationsContainer(
                     resource=IoTOperationsResource(
                         resource_id=cl["id"], display_name=cl["name"], api_version=cl["apiVersion"]
                     )
                 )
-
-                cl_sync_rules = self.connected_cluster.get_resource_sync_rules(cl["id"])
-                if cl_sync_rules:
-                    for sync_rule in cl_sync_rules:
-                        cl_container.resource_sync_rules.append(
-                            IoTOperationsResource(
-                                resource_id=sync_rule["id"],
-                                display_name=sync_rule["name"],
-                                api_version=sync_rule["apiVersion"],
-                            )
-                        )
-
-                cl_resources = self.connected_cluster.get_aio_resources(cl["id"])
-                if cl_resources:
-                    for resource in cl_resources:
-                        cl_container.related_resources.append(
-                            IoTOperationsResource(
-                                resource_id=resource["id"],
-                                display_name=resource["name"],
-                                api_version=resource["apiVersion"],
-                            )
-                        )
-
                 refreshed_cluster_container.custom_locations[cl["id"]] = cl_container
+                cl_containers[cl["id"].lower()] = cl_container
+
+            # resources and sync rules of every custom location are fetched together and partitioned here
+            cl_resources = self.connected_cluster.get_aio_custom_location_resources(
+                [cl["id"] for cl in custom_locations]
+            )
+            for resource in cl_resources or []:
+                cl_container = cl_containers.get(resource["customLocationId"])
+                if not cl_container:
+                    continue
+                ops_resource = IoTOperationsResource(
+                    resource_id=resource["id"],
+                    display_name=resource["name"],
+                    api_version=resource["apiVersion"],
+                )
+                if resource["type"].lower() == RESOURCE_SYNC_RULE_TYPE:
+                    cl_container.resource_sync_rules.append(ops_resource)
+                else:
+                    cl_container.related_resources.append(ops_resource)
 
         extensions = self.connected_cluster.get_aio_extensions()
         if extensions:
@@ -5,8 +5,10 @@
 # ----------------------------------------------------------------------------------------------
 
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from copy import deepcopy
 from rich.console import Console
-from typing import TYPE_CHECKING, Dict, List, Iterable, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Iterable, Optional, Tuple, Union
 from knack.log import get_logger
 from azure.cli.core.azclierror import (
     InvalidArgumentValueError,
@@ -16,7 +18,11 @@ from azure.cli.core.azclierror import (
 from .user_strings import DUPLICATE_EVENT_ERROR, DUPLICATE_POINT_ERROR, INVALID_OBSERVABILITY_MODE_ERROR
 from ....util import assemble_nargs_to_dict
 from ....common import FileType
-from ....util.az_client import get_registry_mgmt_client, wait_for_terminal_state, REGISTRY_API_VERSION
+from ....util.az_client import (
+    get_registry_mgmt_client,
+    wait_for_terminal_state,
+    REGISTRY_API_VERSION
+)
 from ....util.queryable import Queryable
 
 if TYPE_CHECKING:
@@ -28,6 +34,10 @@ logger = get_logger(__name__)
 ASSET_RESOURCE_TYPE = "Microsoft.DeviceRegistry/assets"
 VALID_DATA_OBSERVABILITY_MODES = frozenset(["None", "Gauge", "Counter", "Histogram", "Log"])
 VALID_EVENT_OBSERVABILITY_MODES = frozenset(["None", "Log"])
+# Bulk import snapshots assets through Resource Graph in batches of names and replaces changed assets concurrently.
+ASSET_IMPORT_QUERY_BATCH = 200
+ASSET_IMPORT_MAX_CONCURRENCY = 8
+ASSET_READ_ONLY_PROPERTIES = frozenset(["provisioningState", "status", "uuid", "version"])
 
 
 class Assets(Queryable):
@@ -208,18 +218,9 @@ class Assets(Queryable):
             software_revision=software_revision
         )
         query = f"Resources | where type =~\"{ASSET_RESOURCE_TYPE}\" " + query_body
-
-        if any([instance_name, instance_resource_group]):
-            instance_query = "Resources | where type =~ 'microsoft.iotoperations/instances' "
-            if instance_name:
-                instance_query += f"| where name =~ \"{instance_name}\""
-            if instance_resource_group:
-                instance_query += f"| where resourceGroup =~ \"{instance_resource_group}\""
-
-            # fetch the custom location + join on innerunique. Then remove the extra customLocation1 generated
-            query = f"{instance_query} | extend customLocation = tostring(extendedLocation.name) "\
-                f"| project customLocation | join kind=innerunique ({query}) on customLocation "\
-                "| project-away customLocation1"
+        query = _join_instance_query(
+            query=query, instance_name=instance_name, instance_resource_group=instance_resource_group
+        )
         return self.query(query=query)
 
     def update(
@@ -597,6 +598,138 @@ class Assets(Queryable):
             asset = asset.as_dict()
         return asset["properties"]["events"]
 
+    def import_sub_points(
+        self,
+        file_path: str,
+        resource_group_name: str,
+        replace: bool = False,
+        **kwargs
+    ) -> Dict[str, Union[List[str], Dict[str, str]]]:
+        """
+        Imports data-points and events for many assets from one file. Each row names its asset (and optionally
+        dataset) and rows with a data source are treated as data-points, otherwise as events. Assets are read from
+        a single Resource Graph snapshot and only assets whose datasets or events change are replaced.
+        """
+        from ....util import deserialize_file_content
+        file_rows = _group_sub_points_by_asset(list(deserialize_file_content(file_path=file_path) or []))
+        assets = self._get_import_snapshot(asset_names=list(file_rows), resource_group_name=resource_group_name)
+
+        result = {"updated": [], "unchanged": [], "failed": {}}
+        changed_assets = {}
+        for asset_name, (dataset_points, events) in file_rows.items():
+            asset = assets[asset_name.lower()]
+            if _merge_asset_sub_points(asset, dataset_points=dataset_points, events=events, replace=replace):
+                changed_assets[asset["name"]] = asset
+            else:
+                result["unchanged"].append(asset["name"])
+
+        if not changed_assets:
+            return result
+
+        # connectivity is checked once per custom location rather than once per asset
+        from .helpers import check_cluster_connectivity
+        location_assets = {asset["extendedLocation"]["name"].lower(): asset for asset in changed_assets.values()}
+        for asset in location_assets.values():
+            check_cluster_connectivity(self.cmd, asset)
+
+        def _replace_asset(asset: dict):
+            body = {key: asset[key] for key in ["location", "extendedLocation", "tags"] if key in asset}
+            # the snapshot properties include server populated values which are not sent back
+            body["properties"] = {
+                key: value for key, value in asset["properties"].items() if key not in ASSET_READ_ONLY_PROPERTIES
+            }
+            poller = self.ops.begin_create_or_replace(resource_group_name, asset["name"], body)
+            return wait_for_terminal_state(poller, **kwargs)
+
+        with console.status(f"Updating {len(changed_assets)} assets..."), ThreadPoolExecutor(
+            max_workers=ASSET_IMPORT_MAX_CONCURRENCY
+        ) as executor:
+            futures = {executor.submit(_replace_asset, asset): name for name, asset in changed_assets.items()}
+            for future in as_completed(futures):
+                asset_name = futures[future]
+                try:
+                    future.result()
+                    result["updated"].append(asset_name)
+                except Exception as e:
+                    logger.debug(f"Failed to update {asset_name}: {e}")
+                    result["failed"][asset_name] = str(e)
+
+        result["updated"].sort()
+        return result
+
+    def _get_import_snapshot(self, asset_names: List[str], resource_group_name: str) -> Dict[str, dict]:
+        queries = []
+        for i in range(0, len(asset_names), ASSET_IMPORT_QUERY_BATCH):
+            names = ", ".join(f"\"{name}\"" for name in asset_names[i:i + ASSET_IMPORT_QUERY_BATCH])
+            queries.append(
+                f"Resources | where type =~\"{ASSET_RESOURCE_TYPE}\" "
+                f"| where resourceGroup =~ \"{resource_group_name}\" | where name in~ ({names}) "
+                "| project id, name, location, extendedLocation, tags, properties"
+            )
+        # name batches are independent, so they are queried concurrently
+        assets = {}
+        for page in self.resource_graph.iter_partitioned_pages(queries=queries):
+            for asset in page:
+                assets[asset["name"].lower()] = asset
+
+        missing_assets = [name for name in asset_names if name.lower() not in assets]
+        if missing_assets:
+            raise InvalidArgumentValueError(
+                f"The following assets were not found in resource group {resource_group_name}: "
+                f"{', '.join(missing_assets)}."
+            )
+        return assets
+
+    def export_sub_points(
+        self,
+        extension: str = FileType.csv.value,
+        instance_name: Optional[str] = None,
+        instance_resource_group: Optional[str] = None,
+        output_dir: str = ".",
+        replace: bool = False,
+        resource_group_name: Optional[str] = None,
+    ) -> Dict[str, Union[str, int]]:
+        """
+        Exports the data-points and events of every matching asset to one file. Assets are paged from Resource
+        Graph and rows are streamed to the file, so memory does not grow with the number of assets. The file can
+        be imported with import_sub_points.
+        """
+        from ....util import dump_rows_to_file
+        query = f"Resources | where type =~\"{ASSET_RESOURCE_TYPE}\" "
+        if resource_group_name:
+            query += f"| where resourceGroup =~ \"{resource_group_name}\" "
+        query += "| extend customLocation = tostring(extendedLocation.name) "
+        query = _join_instance_query(
+            query=query, instance_name=instance_name, instance_resource_group=instance_resource_group
+        )
+        query += " | project id, name, properties"
+        # the instance join can match assets of another subscription, so it is not partitioned
+        partition_by_subscription = not any([instance_name, instance_resource_group])
+
+        counts = {"assets": 0, "dataPoints": 0, "events": 0}
+
+        def _iter_rows():
+            for page in self.resource_graph.iter_resource_pages(
+                query=query, partition_by_subscription=partition_by_subscription
+            ):
+                for asset in page:
+                    counts["assets"] += 1
+                    csv_format = extension == FileType.csv.value
+                    for sub_point_type, row in _iter_asset_sub_point_rows(asset, csv_format=csv_format):
+                        counts[sub_point_type] += 1
+                        yield row
+
+        with console.status("Exporting assets..."):
+            file_path = dump_rows_to_file(
+                rows=_iter_rows(),
+                file_name="assets_sub_points",
+                extension=extension,
+                fieldnames=_build_bulk_csv_fieldnames(),
+                output_dir=output_dir,
+                replace=replace
+            )
+        return {"file_path": file_path, **counts}
+
     def list_events(
         self,
         asset_name: str,
@@ -694,16 +827,153 @@ def _process_asset_sub_points_file_path(
     if point_key is None:
         return file_points
 
-    if not original_items:
-        original_items = []
-    original_points = {point[point_key]: point for point in original_items}
-    file_points = {point[point_key]: point for point in file_points}
-    for key in file_points:
+    merged_points, ignored_keys = _merge_sub_points(
+        original_items=original_items, file_points=file_points, point_key=point_key, replace=replace
+    )
+    for key in ignored_keys:
+        logger.warning(f"{key} is already present in the asset and will be ignored.")
+    return merged_points
+
+
+def _merge_sub_points(
+    original_items: Optional[List[dict]],
+    file_points: List[dict],
+    point_key: str,
+    replace: bool = False
+) -> Tuple[List[dict], List[str]]:
+    """Returns the merged points and the keys of file points ignored as duplicates."""
+    original_points = {point[point_key]: point for point in original_items or []}
+    ignored_keys = []
+    for point in file_points:
+        key = point[point_key]
         if key in original_points and not replace:
-            logger.warning(f"{key} is already present in the asset and will be ignored.")
+            ignored_keys.append(key)
+        else:
+            original_points[key] = point
+    return list(original_points.values()), ignored_keys
+
+
+def _group_sub_points_by_asset(
+    file_rows: List[Dict[str, str]]
+) -> Dict[str, Tuple[Dict[str, List[dict]], List[dict]]]:
+    """
+    Groups bulk import rows by asset name into (data-points by dataset name, events). Asset and dataset columns
+    are removed from the rows before they are converted like single asset imports.
+    """
+    grouped = {}
+    # rows match their asset regardless of casing, the first spelling is kept as the asset name
+    asset_names = {}
+    for row in file_rows:
+        # empty csv cells are treated as missing values
+        row = {key: value for key, value in row.items() if value != ""}
+        asset_name = row.pop("Asset", None) or row.pop("asset", None)
+        dataset_name = row.pop("Dataset", None) or row.pop("dataset", None) or "default"
+        if not asset_name:
+            raise InvalidArgumentValueError(f"An asset name is required for every row in the file: {row}.")
+        key = asset_name.lower()
+        asset_names.setdefault(key, asset_name)
+        dataset_points, events = grouped.setdefault(key, ({}, []))
+        _convert_sub_points_from_csv([row])
+        if row.get("dataSource"):
+            dataset_points.setdefault(dataset_name, []).append(row)
+        else:
+            events.append(row)
+    return {asset_names[key]: sub_points for key, sub_points in grouped.items()}
+
+
+def _merge_asset_sub_points(
+    asset: dict,
+    dataset_points: Dict[str, List[dict]],
+    events: List[dict],
+    replace: bool = False
+) -> bool:
+    """Merges the file data-points and events into the asset. Returns whether the asset changed."""
+    original_datasets = deepcopy(asset["properties"].get("datasets", []))
+    original_events = asset["properties"].get("events", [])
+    ignored_keys = []
+    for dataset_name, file_points in dataset_points.items():
+        dataset = _get_dataset(asset, dataset_name, create_if_none=True)
+        dataset["dataPoints"], ignored = _merge_sub_points(
+            original_items=dataset.get("dataPoints", []), file_points=file_points, point_key="name", replace=replace
+        )
+        ignored_keys.extend(ignored)
+    if events:
+        asset["properties"]["events"], ignored = _merge_sub_points(
+            original_items=original_events, file_points=events, point_key="name", replace=replace
+        )
+        ignored_keys.extend(ignored)
+    if ignored_keys:
+        logger.warning(
+            f"{len(ignored_keys)} data-points or events are already present in asset {asset['name']} "
+            "and will be ignored."
+        )
+    return (
+        asset["properties"].get("datasets", []) != original_datasets
+        or asset["properties"].get("events", []) != original_events
+    )
+
+
+def _iter_asset_sub_point_rows(asset: dict, csv_format: bool = False) -> Iterable[Tuple[str, dict]]:
+    """
+    Yields the sub point type and bulk import row of each data-point and event of the asset. Csv rows use the
+    non portal csv headers with the configuration flattened into columns, other rows keep the asset representation
+    of the point.
+    """
+    asset_name = asset["name"]
+    for dataset in asset["properties"].get("datasets") or []:
+        dataset_name = dataset.get("name") or "default"
+        for point in dataset.get("dataPoints") or []:
+            if csv_format:
+                row = {"Asset": asset_name, "Dataset": dataset_name, **_sub_point_to_csv_row(point, "dataPoints")}
+            else:
+                row = {"asset": asset_name, "dataset": dataset_name, **point}
+            yield "dataPoints", row
+    for event in asset["properties"].get("events") or []:
+        if csv_format:
+            row = {"Asset": asset_name, **_sub_point_to_csv_row(event, "events")}
         else:
-            original_points[key] = file_points[key]
-    return list(original_points.values())
+            row = {"asset": asset_name, **event}
+        yield "events", row
+
+
+def _sub_point_to_csv_row(point: dict, sub_point_type: str) -> Dict[str, str]:
+    """Returns a new csv row for the point, leaving the point as is."""
+    configuration = json.loads(point.get(f"{sub_point_type[:-1]}Configuration") or "{}")
+    values = {**point, **configuration}
+    return {
+        csv_key: values[asset_key]
+        for asset_key, csv_key in _build_ordered_csv_conversion_map(sub_point_type).items()
+        if values.get(asset_key) is not None
+    }
+
+
+def _build_bulk_csv_fieldnames() -> List[str]:
+    fieldnames = ["Asset", "Dataset"]
+    for sub_point_type in ["dataPoints", "events"]:
+        for csv_key in _build_ordered_csv_conversion_map(sub_point_type).values():
+            if csv_key not in fieldnames:
+                fieldnames.append(csv_key)
+    return fieldnames
+
+
+def _join_instance_query(
+    query: str,
+    instance_name: Optional[str] = None,
+    instance_resource_group: Optional[str] = None
+) -> str:
+    if not any([instance_name, instance_resource_group]):
+        return query
+
+    instance_query = "Resources | where type =~ 'microsoft.iotoperations/instances' "
+    if instance_name:
+        instance_query += f"| where name =~ \"{instance_name}\""
+    if instance_resource_group:
+        instance_query += f"| where resourceGroup =~ \"{instance_resource_group}\""
+
+    # fetch the custom location + join on innerunique. Then remove the extra customLocation1 generated
+    return f"{instance_query} | extend customLocation = tostring(extendedLocation.name) "\
+        f"| project customLocation | join kind=innerunique ({query}) on customLocation "\
+        "| project-away customLocation1"
 
 
 def _build_query_body(
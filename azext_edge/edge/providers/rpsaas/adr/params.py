@@ -253,6 +253,46 @@ def load_adr_arguments(self, _):
             help="Custom query to use. All other query arguments will be ignored.",
         )
 
+    with self.argument_context("iot ops asset export") as context:
+        context.argument(
+            "extension",
+            options_list=["--format", "-f"],
+            help="File format.",
+            arg_type=get_enum_type([FileType.csv.value, FileType.json.value]),
+        )
+        context.argument(
+            "instance_name",
+            options_list=["--instance"],
+            help="Only export assets associated with this instance.",
+        )
+        context.argument(
+            "instance_resource_group",
+            options_list=["--instance-resource-group", "--ig"],
+            help="Only export assets associated with instances in this resource group.",
+        )
+        context.argument(
+            "replace",
+            options_list=["--replace"],
+            help="Replace the local file if present.",
+            arg_type=get_three_state_flag(),
+        )
+
+    with self.argument_context("iot ops asset import") as context:
+        context.argument(
+            "replace",
+            options_list=["--replace"],
+            help="Replace duplicate asset data-points and events with those from the file. If false, the file "
+            "data-points and events will be ignored. Duplicates will be determined by name.",
+            arg_type=get_three_state_flag(),
+        )
+        context.argument(
+            "file_path",
+            options_list=["--input-file", "--if"],
+            help="File path for the file containing the data-points and events. Each row requires an asset column "
+            "and may include a dataset column. The following file types are supported: "
+            f"{', '.join(FileType.list())}.",
+        )
+
     with self.argument_context("iot ops asset query") as context:
         context.argument(
             "disabled",
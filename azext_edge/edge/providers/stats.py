@@ -6,8 +6,13 @@
 
 import binascii
 import json
-from datetime import datetime
-from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime, timezone
+from multiprocessing import get_context
+from queue import Full, Queue
+from threading import Event, Thread
+from typing import TYPE_CHECKING, Callable, Deque, List, NamedTuple, Optional, Tuple, Union
 
 from azure.cli.core.azclierror import ResourceNotFoundError
 from knack.log import get_logger
@@ -15,12 +20,20 @@ from rich.console import Console
 
 from ..common import AIO_BROKER_DIAGNOSTICS_SERVICE, PROTOBUF_SERVICE_API_PORT, PodState
 from ..util import get_timestamp_now_utc
+from ..util.framing import FramedReader
 from .base import V1Pod, get_namespaced_pods_by_prefix, portforward_socket
 
 logger = get_logger(__name__)
 
 console = Console(highlight=True)
 
+# Bound on socket frames buffered ahead of decoding, and on decode work in flight.
+TRACE_QUEUE_MAX_FRAMES = 256
+TRACE_QUEUE_PUT_TIMEOUT_SEC = 0.5
+# Below this many traces the cost of spawning worker processes outweighs parallel decoding.
+TRACE_PROCESS_POOL_MIN_TRACES = 500
+TRACE_PROCESS_POOL_MAX_WORKERS = 4
+
 if TYPE_CHECKING:
     # pylint: disable=no-name-in-module
     from socket import socket
@@ -29,6 +42,66 @@ if TYPE_CHECKING:
     from opentelemetry.proto.trace.v1.trace_pb2 import TracesData
 
 
+class TraceFilter(NamedTuple):
+    """
+    Client-side trace filter, evaluated on the decoded protobuf before any dict conversion.
+
+    start_time/end_time bound the root span start. service_names and span_names match if any span
+    of the trace has a listed resource service.name or name. min_duration_ms applies to the root span.
+    sample_rate keeps a deterministic fraction of traces keyed on trace Id.
+    """
+
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    service_names: Optional[List[str]] = None
+    span_names: Optional[List[str]] = None
+    min_duration_ms: Optional[float] = None
+    sample_rate: Optional[float] = None
+
+    def matches(self, traces_data: "TracesData") -> bool:
+        root_span = None
+        service_match = not self.service_names
+        span_match = not self.span_names
+        for resource_span in traces_data.resource_spans:
+            if not service_match:
+                service_match = any(
+                    a.key == "service.name" and a.value.string_value in self.service_names
+                    for a in resource_span.resource.attributes
+                )
+            for scope_span in resource_span.scope_spans:
+                for span in scope_span.spans:
+                    if not span.parent_span_id:
+                        root_span = span
+                    if not span_match:
+                        span_match = span.name in self.span_names
+
+        if not (service_match and span_match):
+            return False
+        if not any([self.start_time, self.end_time, self.min_duration_ms, self.sample_rate is not None]):
+            return True
+        if root_span is None:
+            return False
+
+        start_nano = root_span.start_time_unix_nano
+        if self.start_time and start_nano < _to_unix_nano(self.start_time):
+            return False
+        if self.end_time and start_nano > _to_unix_nano(self.end_time):
+            return False
+        if self.min_duration_ms and (root_span.end_time_unix_nano - start_nano) < self.min_duration_ms * 1e6:
+            return False
+        if self.sample_rate is not None:
+            # hash the trace Id so the same traces are kept across collections
+            sample_key = int.from_bytes(root_span.trace_id[-8:], byteorder="big") / 2**64
+            return sample_key < self.sample_rate
+        return True
+
+
+def _to_unix_nano(timestamp: datetime) -> int:
+    if not timestamp.tzinfo:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return int(timestamp.timestamp() * 1e9)
+
+
 def _preprocess_stats(
     namespace: Optional[str] = None, diag_service_pod_prefix: str = AIO_BROKER_DIAGNOSTICS_SERVICE
 ) -> Tuple[str, V1Pod]:
@@ -58,22 +131,23 @@ def get_traces(
     pod_protobuf_port: int = PROTOBUF_SERVICE_API_PORT,
     trace_ids: Optional[List[str]] = None,
     trace_dir: Optional[str] = None,
+    trace_filter: Optional[TraceFilter] = None,
 ) -> Union[List["TracesData"], List[Tuple["ZipInfo", str]], None]:
     """
     trace_ids: List[str] hex representation of trace Ids.
+    trace_filter: Optional filter applied to fetched traces before they are converted.
     """
     if not any([trace_ids, trace_dir]):
         raise ValueError("At least trace_ids or trace_dir is required.")
 
     from zipfile import ZIP_DEFLATED, ZipFile, ZipInfo
 
-    from google.protobuf.json_format import MessageToDict
     from rich.progress import MofNCompleteColumn, Progress
 
     from ..util import normalize_dir
 
     # pylint: disable=no-name-in-module
-    from .proto.diagnostics_service_pb2 import Request, Response, TraceRetrievalInfo
+    from .proto.diagnostics_service_pb2 import Request, TraceRetrievalInfo
 
     namespace, diagnostic_pod = _preprocess_stats(namespace=namespace, diag_service_pod_prefix=diag_service_pod_prefix)
 
@@ -111,96 +185,209 @@ def get_traces(
                 # pylint: disable=consider-using-with
                 myzip = ZipFile(file=str(normalized_dir_path), mode="w", compression=ZIP_DEFLATED)
 
-            progress_set = False
+            include_trace = bool(trace_ids)
+            include_entries = bool(trace_dir) or for_support_bundle
             progress_task = None
-            total_trace_count = 0
-            current_trace_count = 0
-            try:
-                while True:
-                    if current_trace_count and current_trace_count >= total_trace_count:
-                        break
-                    rbytes = _fetch_bytes(socket, 4)
-                    response_size = int.from_bytes(rbytes, byteorder="big")
-                    response_bytes = _fetch_bytes(socket, response_size)
-
-                    if response_bytes == b"":
-                        logger.warning("TCP socket closed. Trace processing aborted.")
-                        return
-
-                    response = Response.FromString(response_bytes)
-                    current_trace_count = current_trace_count + 1
-
-                    if not total_trace_count:
-                        total_trace_count = response.retrieved_trace.total_trace_count
-                        if total_trace_count == 0:
-                            logger.warning("No traces to fetch. Processing aborted.")
-                            break
-
-                    if not progress.disable and not progress_set:
-                        progress_task = progress.add_task(
-                            "[deep_sky_blue4]Gathering traces...", total=response.retrieved_trace.total_trace_count
-                        )
-                        progress_set = True
-
-                    msg_dict = MessageToDict(message=response.retrieved_trace.trace, use_integers_for_enums=True)
-                    root_span, resource_name, timestamp = _determine_root_span(message_dict=msg_dict)
-
-                    if progress_set:
-                        progress.update(progress_task, advance=1)
-                    if not all([root_span, resource_name, timestamp]):
-                        logger.debug("Could not process root span. Skipping trace.")
-                        continue
-
-                    span_trace_id = root_span["traceId"]
-                    span_name = root_span["name"]
-
-                    if trace_ids:
-                        traces.append(msg_dict)
-                    if trace_dir or for_support_bundle:
-                        archive = f"{resource_name}.{span_name}.{span_trace_id}"
-                        pb_suffix = ".otlp.pb"
-                        tempo_suffix = ".tempo.json"
-
-                        datetime_tuple = tuple(timestamp.timetuple())
-                        zinfo_pb = ZipInfo(filename=f"{archive}{pb_suffix}", date_time=datetime_tuple)
-                        # Fixed in Py 3.9 https://github.com/python/cpython/issues/70373
-                        zinfo_pb.file_size = 0
-                        zinfo_pb.compress_size = 0
-
-                        zinfo_tempo = ZipInfo(filename=f"{archive}{tempo_suffix}", date_time=datetime_tuple)
-                        zinfo_tempo.file_size = 0
-                        zinfo_tempo.compress_size = 0
-
-                        otlp_format_pair = (zinfo_pb, response.retrieved_trace.trace.SerializeToString())
-                        tempo_format_pair = (
-                            zinfo_tempo,
-                            json.dumps(_convert_otlp_to_tempo(msg_dict), sort_keys=True),
-                        )
-
-                        if for_support_bundle:
-                            traces.append(otlp_format_pair)
-                            traces.append(tempo_format_pair)
-                            continue
-
-                        # Original OTLP
-                        myzip.writestr(
-                            zinfo_or_arcname=otlp_format_pair[0],
-                            data=otlp_format_pair[1],
-                        )
-                        # Tempo
-                        myzip.writestr(
-                            zinfo_or_arcname=tempo_format_pair[0],
-                            data=tempo_format_pair[1],
-                        )
 
+            def _handle_processed(processed: Optional[Tuple[Optional[dict], List[Tuple["ZipInfo", bytes]]]]):
+                if progress_task is not None:
+                    progress.update(progress_task, advance=1)
+                if not processed:
+                    logger.debug("Trace filtered out or root span could not be processed. Skipping trace.")
+                    return
+
+                msg_dict, entries = processed
+                if include_trace:
+                    traces.append(msg_dict)
+                if for_support_bundle:
+                    traces.extend(entries)
+                elif trace_dir:
+                    for zinfo, data in entries:
+                        myzip.writestr(zinfo_or_arcname=zinfo, data=data)
+
+            def _handle_total(total_trace_count: int):
+                nonlocal progress_task
+                if not progress.disable:
+                    progress_task = progress.add_task("[deep_sky_blue4]Gathering traces...", total=total_trace_count)
+
+            frames: Queue = Queue(maxsize=TRACE_QUEUE_MAX_FRAMES)
+            stop_event = Event()
+            reader = Thread(
+                target=_read_trace_frames, args=(socket, frames, stop_event), name="aio_trace_reader", daemon=True
+            )
+            reader.start()
+            try:
+                completed = _process_trace_frames(
+                    frames=frames,
+                    include_trace=include_trace,
+                    include_entries=include_entries,
+                    trace_filter=trace_filter,
+                    on_total=_handle_total,
+                    on_processed=_handle_processed,
+                )
+                if not completed:
+                    return
                 if traces:
                     return traces
 
             finally:
+                stop_event.set()
                 if trace_dir:
                     myzip.close()
 
 
+def _process_trace_frames(
+    frames: Queue,
+    include_trace: bool,
+    include_entries: bool,
+    on_total: Callable[[int], None],
+    on_processed: Callable[[Optional[tuple]], None],
+    trace_filter: Optional[TraceFilter] = None,
+) -> bool:
+    """
+    Consumes frames produced by _read_trace_frames, decoding them inline for small trace sets or on a
+    process pool for large ones. Results are handed to on_processed in frame order.
+
+    Returns False if the socket closed before all traces were received.
+    """
+    executor: Optional[ProcessPoolExecutor] = None
+    pending: Deque[Future] = deque()
+    started = False
+    try:
+        while True:
+            frame = frames.get()
+            if frame is None:
+                break
+            if isinstance(frame, Exception):
+                raise frame
+
+            total_trace_count, response_bytes = frame
+            if response_bytes == b"":
+                logger.warning("TCP socket closed. Trace processing aborted.")
+                return False
+            if total_trace_count == 0:
+                logger.warning("No traces to fetch. Processing aborted.")
+                break
+
+            if not started:
+                started = True
+                on_total(total_trace_count)
+                if total_trace_count >= TRACE_PROCESS_POOL_MIN_TRACES:
+                    executor = ProcessPoolExecutor(
+                        max_workers=TRACE_PROCESS_POOL_MAX_WORKERS, mp_context=get_context("spawn")
+                    )
+
+            if not executor:
+                on_processed(_process_trace_frame(response_bytes, include_trace, include_entries, trace_filter))
+                continue
+
+            pending.append(
+                executor.submit(_process_trace_frame, response_bytes, include_trace, include_entries, trace_filter)
+            )
+            while len(pending) > TRACE_QUEUE_MAX_FRAMES or (pending and pending[0].done()):
+                on_processed(pending.popleft().result())
+
+        while pending:
+            on_processed(pending.popleft().result())
+        return True
+    finally:
+        if executor:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _read_trace_frames(socket: "socket", frames: Queue, stop_event: Event):
+    """
+    Drains length-prefixed Response frames from socket into frames as (total_trace_count, response_bytes).
+    Only the first frame is decoded, to learn how many frames to expect. None marks the end of the stream,
+    an empty response_bytes a closed socket and an exception instance a read failure.
+    """
+    # pylint: disable=no-name-in-module
+    from .proto.diagnostics_service_pb2 import Response
+
+    def _put(item) -> bool:
+        while not stop_event.is_set():
+            try:
+                frames.put(item, timeout=TRACE_QUEUE_PUT_TIMEOUT_SEC)
+                return True
+            except Full:
+                continue
+        return False
+
+    try:
+        reader = FramedReader(socket)
+        total_trace_count = 0
+        current_trace_count = 0
+        while not current_trace_count or current_trace_count < total_trace_count:
+            frame = reader.read_frame()
+            if frame is None:
+                _put((total_trace_count, b""))
+                return
+
+            current_trace_count += 1
+            if not total_trace_count:
+                total_trace_count = Response.FromString(frame).retrieved_trace.total_trace_count
+                if total_trace_count == 0:
+                    _put((total_trace_count, bytes(frame)))
+                    return
+
+            # the frame aliases the reader buffer, so a copy is queued
+            if not _put((total_trace_count, bytes(frame))):
+                return
+        _put(None)
+    except Exception as e:  # pylint: disable=broad-except
+        if not stop_event.is_set():
+            _put(e)
+
+
+def _process_trace_frame(
+    response_bytes: bytes,
+    include_trace: bool,
+    include_entries: bool,
+    trace_filter: Optional[TraceFilter] = None,
+) -> Optional[Tuple[Optional[dict], List[Tuple["ZipInfo", Union[bytes, str]]]]]:
+    """
+    Decodes a serialized Response and builds its OTLP and Tempo zip entries. Runs in a worker process
+    for large trace sets, so it only takes and returns picklable values.
+
+    Returns None if the trace is filtered out or its root span cannot be determined, otherwise the
+    trace as a dict (if include_trace) and the (ZipInfo, data) pairs (if include_entries).
+    """
+    from zipfile import ZipInfo
+
+    from google.protobuf.json_format import MessageToDict
+
+    # pylint: disable=no-name-in-module
+    from .proto.diagnostics_service_pb2 import Response
+
+    trace = Response.FromString(response_bytes).retrieved_trace.trace
+    if trace_filter and not trace_filter.matches(trace):
+        return None
+    msg_dict = MessageToDict(message=trace, use_integers_for_enums=True)
+    root_span, resource_name, timestamp = _determine_root_span(message_dict=msg_dict)
+    if not all([root_span, resource_name, timestamp]):
+        return None
+
+    entries = []
+    if include_entries:
+        archive = f"{resource_name}.{root_span['name']}.{root_span['traceId']}"
+        datetime_tuple = tuple(timestamp.timetuple())
+        zinfo_pb = ZipInfo(filename=f"{archive}.otlp.pb", date_time=datetime_tuple)
+        # Fixed in Py 3.9 https://github.com/python/cpython/issues/70373
+        zinfo_pb.file_size = 0
+        zinfo_pb.compress_size = 0
+
+        zinfo_tempo = ZipInfo(filename=f"{archive}.tempo.json", date_time=datetime_tuple)
+        zinfo_tempo.file_size = 0
+        zinfo_tempo.compress_size = 0
+
+        entries.append((zinfo_pb, trace.SerializeToString()))
+        # the dict is only converted in place when it is not also returned
+        tempo_dict = _convert_otlp_to_tempo(msg_dict, in_place=not include_trace)
+        entries.append((zinfo_tempo, json.dumps(tempo_dict, sort_keys=True)))
+
+    return (msg_dict if include_trace else None), entries
+
+
 def _determine_root_span(message_dict: dict) -> Tuple[str, str, Union[datetime, None]]:
     """
     Attempts to determine root span, and normalizes traceId, spanId and parentSpanId to hex.
@@ -237,13 +424,13 @@ def _determine_root_span(message_dict: dict) -> Tuple[str, str, Union[datetime,
     return root_span, resource_name, timestamp
 
 
-def _convert_otlp_to_tempo(message_dict: dict) -> dict:
+def _convert_otlp_to_tempo(message_dict: dict, in_place: bool = False) -> dict:
     """
-    Convert OTLP payload to Grafana Tempo.
+    Convert OTLP payload to Grafana Tempo. Unless in_place, message_dict is left unmodified.
     """
     from copy import deepcopy
 
-    new_dict = deepcopy(message_dict)
+    new_dict = message_dict if in_place else deepcopy(message_dict)
 
     new_dict["batches"] = new_dict.pop("resourceSpans")
     for batch in new_dict.get("batches", []):
@@ -252,20 +439,3 @@ def _convert_otlp_to_tempo(message_dict: dict) -> dict:
             inst_lib_span["instrumentationLibrary"] = inst_lib_span.pop("scope", {})
 
     return new_dict
-
-
-def _fetch_bytes(socket: "socket", size: int) -> bytes:
-    result_bytes = socket.recv(size)
-    if result_bytes == b"":
-        return result_bytes
-
-    result_bytes_len = len(result_bytes)
-    while result_bytes_len < size:
-        remaining_bytes_size = size - result_bytes_len
-        interm_bytes = socket.recv(remaining_bytes_size)
-        if interm_bytes == b"":
-            break
-        result_bytes += interm_bytes
-        result_bytes_len += len(interm_bytes)
-
-    return result_bytes
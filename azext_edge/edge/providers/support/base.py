@@ -4,8 +4,13 @@
 # Licensed under the MIT License. See License file in the project root for license information.
 # ----------------------------------------------------------------------------------------------
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from math import ceil
 from pathlib import PurePath
-from typing import List, Dict, Optional, Iterable, Tuple, TypeVar, Union
+from tempfile import SpooledTemporaryFile
+from time import time
+from typing import IO, Callable, Iterator, List, Dict, NamedTuple, Optional, Iterable, Tuple, TypeVar, Union
 from functools import partial
 
 from azext_edge.edge.common import BundleResourceKind, PodState
@@ -28,6 +33,7 @@ from kubernetes.client.models import (
 
 from ..edge_api import EdgeResourceApi
 from ..base import client, get_custom_objects
+from .snapshot import POD_KIND, get_cluster_snapshot
 from ...util import get_timestamp_now_utc
 
 logger = get_logger(__name__)
@@ -35,6 +41,73 @@ generic = client.ApiClient()
 
 DAY_IN_SECONDS: int = 60 * 60 * 24
 POD_STATUS_FAILED_EVICTED: str = "evicted"
+POD_LOG_CHUNK_BYTES: int = 64 * 1024
+POD_LOG_MAX_BYTES: int = 128 * 1024 * 1024
+POD_LOG_MAX_WORKERS: int = 4
+# Container logs beyond this size are spooled to disk until they are written to the bundle.
+POD_LOG_SPOOL_BYTES: int = 1024 * 1024
+
+
+class PodLogCapture(NamedTuple):
+    tail_lines: Optional[int] = None
+    max_bytes: Optional[int] = POD_LOG_MAX_BYTES
+    # container log capture times of a previous bundle keyed by zinfo
+    previous_epochs: Optional[Dict[str, float]] = None
+
+
+_pod_log_capture = PodLogCapture()
+
+
+@contextmanager
+def pod_log_capture(
+    tail_lines: Optional[int] = None,
+    max_bytes: Optional[int] = POD_LOG_MAX_BYTES,
+    previous_epochs: Optional[Dict[str, float]] = None,
+) -> Iterator[PodLogCapture]:
+    """
+    Applies log limits to every container log captured within the context. Container logs captured
+    by a previous bundle are only read from the time that bundle read them, so consecutive bundles
+    do not repeat log lines.
+    """
+    global _pod_log_capture
+    _pod_log_capture = PodLogCapture(tail_lines=tail_lines, max_bytes=max_bytes, previous_epochs=previous_epochs)
+    try:
+        yield _pod_log_capture
+    finally:
+        _pod_log_capture = PodLogCapture()
+
+
+class PodLog:
+    """
+    A container log spooled to a temporary file. Iterating yields the log in chunks and closes the
+    file, so the bundle writer streams it into the archive without holding it in memory.
+    """
+
+    def __init__(self, spool: IO[bytes], start: int, end: int, truncated_bytes: int = 0):
+        self.spool = spool
+        self.start = start
+        self.end = end
+        self.truncated_bytes = truncated_bytes
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def __iter__(self) -> Iterator[bytes]:
+        try:
+            if self.truncated_bytes:
+                yield f"[log truncated, first {self.truncated_bytes} bytes omitted]\n".encode()
+            self.spool.seek(self.start)
+            while True:
+                chunk = self.spool.read(POD_LOG_CHUNK_BYTES)
+                if not chunk:
+                    return
+                yield chunk
+        finally:
+            self.close()
+
+    def close(self):
+        self.spool.close()
+
 
 K8sRuntimeResources = TypeVar(
     "K8sRuntimeResources",
@@ -107,13 +180,17 @@ def process_v1_pods(
     custom_api = client.CustomObjectsApi()
 
     processed = []
+    log_targets: List[Tuple[str, str, List[V1Container]]] = []
     if not prefix_names:
         prefix_names = []
 
-    if namespace:
-        pods: V1PodList = v1_api.list_namespaced_pod(namespace=namespace, label_selector=label_selector)
-    else:
-        pods: V1PodList = v1_api.list_pod_for_all_namespaces(label_selector=label_selector)
+    pods: V1PodList = _list_runtime_resources(
+        kind=POD_KIND,
+        list_all=v1_api.list_pod_for_all_namespaces,
+        list_namespaced=v1_api.list_namespaced_pod,
+        namespace=namespace,
+        label_selector=label_selector,
+    )
 
     if exclude_prefixes:
         pods = exclude_resources_with_prefix(pods, exclude_prefixes)
@@ -143,7 +220,8 @@ def process_v1_pods(
             }
         )
         pod_spec: V1PodSpec = p.spec
-        pod_containers: List[V1Container] = pod_spec.containers
+        # copy so init containers are not appended to the (possibly shared) pod spec
+        pod_containers: List[V1Container] = list(pod_spec.containers)
 
         if pod_prefix_for_init_container_logs:
             # check if pod name starts with any prefix in pod_prefix_for_init_container_logs
@@ -160,17 +238,7 @@ def process_v1_pods(
         ):
             logger.info(f"Pod {pod_name} in namespace {pod_namespace} is evicted. Skipping log capture.")
         else:
-            processed.extend(
-                _capture_pod_container_logs(
-                    directory_path=directory_path,
-                    pod_containers=pod_containers,
-                    pod_name=pod_name,
-                    pod_namespace=pod_namespace,
-                    v1_api=v1_api,
-                    since_seconds=since_seconds,
-                    capture_previous_logs=capture_previous_logs,
-                )
-            )
+            log_targets.append((pod_namespace, pod_name, pod_containers))
 
         if include_metrics:
             try:
@@ -188,6 +256,16 @@ def process_v1_pods(
             except ApiException as e:
                 logger.debug(e.body)
 
+    processed.extend(
+        _capture_pod_container_logs(
+            directory_path=directory_path,
+            log_targets=log_targets,
+            v1_api=v1_api,
+            since_seconds=since_seconds,
+            capture_previous_logs=capture_previous_logs,
+        )
+    )
+
     return processed
 
 
@@ -201,14 +279,14 @@ def process_deployments(
 ) -> List[dict]:
     v1_apps = client.AppsV1Api()
 
-    if namespace:
-        deployments: V1DeploymentList = v1_apps.list_namespaced_deployment(
-            namespace=namespace, label_selector=label_selector, field_selector=field_selector
-        )
-    else:
-        deployments: V1DeploymentList = v1_apps.list_deployment_for_all_namespaces(
-            label_selector=label_selector, field_selector=field_selector
-        )
+    deployments: V1DeploymentList = _list_runtime_resources(
+        kind=BundleResourceKind.deployment.value,
+        list_all=v1_apps.list_deployment_for_all_namespaces,
+        list_namespaced=v1_apps.list_namespaced_deployment,
+        namespace=namespace,
+        label_selector=label_selector,
+        field_selector=field_selector,
+    )
 
     return _process_kubernetes_resources(
         directory_path=directory_path,
@@ -229,14 +307,14 @@ def process_statefulset(
 ) -> Union[Tuple[List[dict], dict], List[dict]]:
     v1_apps = client.AppsV1Api()
 
-    if namespace:
-        statefulsets: V1StatefulSetList = v1_apps.list_namespaced_stateful_set(
-            namespace=namespace, label_selector=label_selector, field_selector=field_selector
-        )
-    else:
-        statefulsets: V1StatefulSetList = v1_apps.list_stateful_set_for_all_namespaces(
-            label_selector=label_selector, field_selector=field_selector
-        )
+    statefulsets: V1StatefulSetList = _list_runtime_resources(
+        kind=BundleResourceKind.statefulset.value,
+        list_all=v1_apps.list_stateful_set_for_all_namespaces,
+        list_namespaced=v1_apps.list_namespaced_stateful_set,
+        namespace=namespace,
+        label_selector=label_selector,
+        field_selector=field_selector,
+    )
     namespace_pods_work = {}
 
     processed = _process_kubernetes_resources(
@@ -268,14 +346,14 @@ def process_services(
 ) -> List[dict]:
     v1_api = client.CoreV1Api()
 
-    if namespace:
-        services: V1ServiceList = v1_api.list_namespaced_service(
-            namespace=namespace, label_selector=label_selector, field_selector=field_selector
-        )
-    else:
-        services: V1ServiceList = v1_api.list_service_for_all_namespaces(
-            label_selector=label_selector, field_selector=field_selector
-        )
+    services: V1ServiceList = _list_runtime_resources(
+        kind=BundleResourceKind.service.value,
+        list_all=v1_api.list_service_for_all_namespaces,
+        list_namespaced=v1_api.list_namespaced_service,
+        namespace=namespace,
+        label_selector=label_selector,
+        field_selector=field_selector,
+    )
 
     return _process_kubernetes_resources(
         directory_path=directory_path,
@@ -295,12 +373,13 @@ def process_replicasets(
 ) -> List[dict]:
     v1_apps = client.AppsV1Api()
 
-    if namespace:
-        replicasets: V1ReplicaSetList = v1_apps.list_namespaced_replica_set(
-            namespace=namespace, label_selector=label_selector
-        )
-    else:
-        replicasets: V1ReplicaSetList = v1_apps.list_replica_set_for_all_namespaces(label_selector=label_selector)
+    replicasets: V1ReplicaSetList = _list_runtime_resources(
+        kind=BundleResourceKind.replicaset.value,
+        list_all=v1_apps.list_replica_set_for_all_namespaces,
+        list_namespaced=v1_apps.list_namespaced_replica_set,
+        namespace=namespace,
+        label_selector=label_selector,
+    )
 
     return _process_kubernetes_resources(
         directory_path=directory_path,
@@ -320,14 +399,14 @@ def process_daemonsets(
 ) -> List[dict]:
     v1_apps = client.AppsV1Api()
 
-    if namespace:
-        daemonsets: V1DaemonSetList = v1_apps.list_namespaced_daemon_set(
-            namespace=namespace, label_selector=label_selector, field_selector=field_selector
-        )
-    else:
-        daemonsets: V1DaemonSetList = v1_apps.list_daemon_set_for_all_namespaces(
-            label_selector=label_selector, field_selector=field_selector
-        )
+    daemonsets: V1DaemonSetList = _list_runtime_resources(
+        kind=BundleResourceKind.daemonset.value,
+        list_all=v1_apps.list_daemon_set_for_all_namespaces,
+        list_namespaced=v1_apps.list_namespaced_daemon_set,
+        namespace=namespace,
+        label_selector=label_selector,
+        field_selector=field_selector,
+    )
 
     return _process_kubernetes_resources(
         directory_path=directory_path,
@@ -346,14 +425,14 @@ def process_config_maps(
 ) -> List[dict]:
     v1_api = client.CoreV1Api()
 
-    if namespace:
-        config_maps = v1_api.list_namespaced_config_map(
-            namespace=namespace, label_selector=label_selector, field_selector=field_selector
-        )
-    else:
-        config_maps = v1_api.list_config_map_for_all_namespaces(
-            label_selector=label_selector, field_selector=field_selector
-        )
+    config_maps = _list_runtime_resources(
+        kind=BundleResourceKind.configmap.value,
+        list_all=v1_api.list_config_map_for_all_namespaces,
+        list_namespaced=v1_api.list_namespaced_config_map,
+        namespace=namespace,
+        label_selector=label_selector,
+        field_selector=field_selector,
+    )
 
     return _process_kubernetes_resources(
         directory_path=directory_path,
@@ -476,14 +555,14 @@ def process_persistent_volume_claims(
 ) -> List[dict]:
     v1_api = client.CoreV1Api()
 
-    if namespace:
-        pvcs: V1PersistentVolumeClaimList = v1_api.list_namespaced_persistent_volume_claim(
-            namespace=namespace, label_selector=label_selector, field_selector=field_selector
-        )
-    else:
-        pvcs: V1PersistentVolumeClaimList = v1_api.list_persistent_volume_claim_for_all_namespaces(
-            label_selector=label_selector, field_selector=field_selector
-        )
+    pvcs: V1PersistentVolumeClaimList = _list_runtime_resources(
+        kind=BundleResourceKind.pvc.value,
+        list_all=v1_api.list_persistent_volume_claim_for_all_namespaces,
+        list_namespaced=v1_api.list_namespaced_persistent_volume_claim,
+        namespace=namespace,
+        label_selector=label_selector,
+        field_selector=field_selector,
+    )
 
     return _process_kubernetes_resources(
         directory_path=directory_path,
@@ -501,8 +580,11 @@ def process_jobs(
     exclude_prefixes: Optional[List[str]] = None,
 ) -> List[dict]:
     batch_v1_api = client.BatchV1Api()
-    jobs: V1JobList = batch_v1_api.list_job_for_all_namespaces(
-        label_selector=label_selector, field_selector=field_selector
+    jobs: V1JobList = _list_runtime_resources(
+        kind=BundleResourceKind.job.value,
+        list_all=batch_v1_api.list_job_for_all_namespaces,
+        label_selector=label_selector,
+        field_selector=field_selector,
     )
 
     return _process_kubernetes_resources(
@@ -521,8 +603,11 @@ def process_cron_jobs(
     prefix_names: Optional[List[str]] = None,
 ) -> List[dict]:
     batch_v1_api = client.BatchV1Api()
-    cron_jobs: V1CronJobList = batch_v1_api.list_cron_job_for_all_namespaces(
-        label_selector=label_selector, field_selector=field_selector
+    cron_jobs: V1CronJobList = _list_runtime_resources(
+        kind=BundleResourceKind.cronjob.value,
+        list_all=batch_v1_api.list_cron_job_for_all_namespaces,
+        label_selector=label_selector,
+        field_selector=field_selector,
     )
 
     return _process_kubernetes_resources(
@@ -576,44 +661,157 @@ def default_bundle_name(system_name: str) -> str:
 
 def _capture_pod_container_logs(
     directory_path: str,
-    pod_containers: List[V1Container],
-    pod_name: str,
-    pod_namespace: str,
+    log_targets: List[Tuple[str, str, List[V1Container]]],
     v1_api: client.CoreV1Api,
     capture_previous_logs: bool = True,
     since_seconds: int = DAY_IN_SECONDS,
 ) -> List[dict]:
-
-    processed = []
+    """
+    Fetches current (and optionally previous run) container logs for a set of
+    (namespace, pod name, containers) targets concurrently, within the active pod_log_capture limits.
+    """
+    log_capture = _pod_log_capture
     capture_previous_log_runs = [False]
 
     if capture_previous_logs:
         capture_previous_log_runs.append(True)
 
-    for container in pod_containers:
-        for capture_previous in capture_previous_log_runs:
-            try:
-                logger_debug_previous = "previous run " if capture_previous else ""
-                logger.debug(f"Reading {logger_debug_previous}log from pod {pod_name} container {container.name}")
-                log: str = v1_api.read_namespaced_pod_log(
-                    name=pod_name,
-                    namespace=pod_namespace,
-                    since_seconds=since_seconds,
-                    container=container.name,
-                    previous=capture_previous,
-                )
-                zinfo_previous_segment = "previous." if capture_previous else ""
-                zinfo = f"{pod_namespace}/{directory_path}/pod.{pod_name}.{container.name}.{zinfo_previous_segment}log"
-                processed.append(
-                    {
-                        "data": log,
-                        "zinfo": zinfo,
-                    }
-                )
-            except ApiException as e:
-                logger.debug(e.body)
+    log_requests = [
+        (pod_namespace, pod_name, container.name, capture_previous)
+        for pod_namespace, pod_name, pod_containers in log_targets
+        for container in pod_containers
+        for capture_previous in capture_previous_log_runs
+    ]
+    if not log_requests:
+        return []
+
+    def _capture(log_request: Tuple[str, str, str, bool]) -> Optional[dict]:
+        pod_namespace, pod_name, container_name, capture_previous = log_request
+        zinfo_previous_segment = "previous." if capture_previous else ""
+        zinfo = f"{pod_namespace}/{directory_path}/pod.{pod_name}.{container_name}.{zinfo_previous_segment}log"
+        log_since_seconds = since_seconds
+        previous_epoch = (log_capture.previous_epochs or {}).get(zinfo)
+        capture_epoch = time()
+        if previous_epoch:
+            # rounded up, so the window overlaps the previous capture rather than leaving a gap
+            log_since_seconds = max(ceil(capture_epoch - previous_epoch), 1)
+        try:
+            logger_debug_previous = "previous run " if capture_previous else ""
+            logger.debug(f"Reading {logger_debug_previous}log from pod {pod_name} container {container_name}")
+            log = _read_pod_container_log(
+                v1_api=v1_api,
+                pod_name=pod_name,
+                pod_namespace=pod_namespace,
+                container_name=container_name,
+                since_seconds=log_since_seconds,
+                previous=capture_previous,
+                tail_lines=log_capture.tail_lines,
+                max_bytes=log_capture.max_bytes,
+            )
+            return {
+                "data": log,
+                "zinfo": zinfo,
+                "captureEpoch": capture_epoch,
+            }
+        except ApiException as e:
+            logger.debug(e.body)
 
-    return processed
+    with ThreadPoolExecutor(max_workers=min(POD_LOG_MAX_WORKERS, len(log_requests))) as executor:
+        return [log for log in executor.map(_capture, log_requests) if log]
+
+
+def _read_pod_container_log(
+    v1_api: client.CoreV1Api,
+    pod_name: str,
+    pod_namespace: str,
+    container_name: str,
+    since_seconds: int = DAY_IN_SECONDS,
+    previous: bool = False,
+    tail_lines: Optional[int] = None,
+    max_bytes: Optional[int] = POD_LOG_MAX_BYTES,
+) -> PodLog:
+    """
+    Streams a container log in chunks into a spooled temporary file. When max_bytes is exceeded only
+    the most recent max_bytes of the log are kept, and the spool never grows past twice max_bytes.
+    """
+    log_kwargs = {}
+    if tail_lines:
+        log_kwargs["tail_lines"] = tail_lines
+
+    response = v1_api.read_namespaced_pod_log(
+        name=pod_name,
+        namespace=pod_namespace,
+        since_seconds=since_seconds,
+        container=container_name,
+        previous=previous,
+        _preload_content=False,
+        **log_kwargs,
+    )
+    spool = SpooledTemporaryFile(max_size=POD_LOG_SPOOL_BYTES)
+    start = 0
+    end = 0
+    dropped_bytes = 0
+    try:
+        for chunk in response.stream(POD_LOG_CHUNK_BYTES):
+            spool.write(chunk)
+            end += len(chunk)
+            if max_bytes and end - start > max_bytes:
+                start = end - max_bytes
+                if start >= max_bytes:
+                    _drop_spool_head(spool, start)
+                    dropped_bytes += start
+                    end -= start
+                    start = 0
+    except Exception:
+        spool.close()
+        raise
+    finally:
+        response.release_conn()
+
+    truncated_bytes = dropped_bytes + start
+    if truncated_bytes:
+        logger.debug(f"Truncated {truncated_bytes} bytes from log of pod {pod_name} container {container_name}")
+    return PodLog(spool=spool, start=start, end=end, truncated_bytes=truncated_bytes)
+
+
+def _drop_spool_head(spool: IO[bytes], head_bytes: int):
+    """
+    Moves the spool content after head_bytes to the start of the spool.
+    """
+    read_at = head_bytes
+    write_at = 0
+    while True:
+        spool.seek(read_at)
+        chunk = spool.read(POD_LOG_CHUNK_BYTES)
+        if not chunk:
+            break
+        spool.seek(write_at)
+        spool.write(chunk)
+        read_at += len(chunk)
+        write_at += len(chunk)
+    spool.truncate(write_at)
+    spool.seek(write_at)
+
+
+def _list_runtime_resources(
+    kind: str,
+    list_all: Callable[..., K8sRuntimeResources],
+    list_namespaced: Optional[Callable[..., K8sRuntimeResources]] = None,
+    namespace: Optional[str] = None,
+    **selectors: Optional[str],
+) -> K8sRuntimeResources:
+    """
+    Lists runtime resources of kind from the active cluster snapshot, or from the cluster when there is
+    no snapshot or the snapshot cannot answer the request.
+    """
+    snapshot = get_cluster_snapshot()
+    if snapshot:
+        resources = snapshot.list_resources(kind=kind, fetch=list_all, namespace=namespace, **selectors)
+        if resources is not None:
+            return resources
+    if namespace and list_namespaced:
+        return list_namespaced(namespace=namespace, **selectors)
+    return list_all(**selectors)
 
 
 def _process_kubernetes_resources(
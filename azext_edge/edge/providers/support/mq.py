@@ -11,7 +11,7 @@ from zipfile import ZipInfo
 from knack.log import get_logger
 
 from ..edge_api import MQ_ACTIVE_API, EdgeResourceApi
-from ..stats import get_traces
+from ..stats import TraceFilter, get_traces
 from .base import (
     DAY_IN_SECONDS,
     assemble_crd_work,
@@ -32,12 +32,12 @@ MQ_NAME_LABEL = NAME_LABEL_FORMAT.format(label=MQ_ACTIVE_API.label)
 MQ_DIRECTORY_PATH = MQ_ACTIVE_API.moniker
 
 
-def fetch_diagnostic_traces():
+def fetch_diagnostic_traces(trace_filter: Optional[TraceFilter] = None):
     namespaces = get_mq_namespaces()
     result = []
     for namespace in namespaces:
         try:
-            traces = get_traces(namespace=namespace, trace_ids=["!support_bundle!"])
+            traces = get_traces(namespace=namespace, trace_ids=["!support_bundle!"], trace_filter=trace_filter)
             if traces:
                 for trace in traces:
                     zinfo = ZipInfo(
@@ -124,6 +124,7 @@ def prepare_bundle(
     log_age_seconds: int = DAY_IN_SECONDS,
     apis: Optional[Iterable[EdgeResourceApi]] = None,
     include_mq_traces: Optional[bool] = None,
+    mq_trace_filter: Optional[TraceFilter] = None,
 ) -> dict:
     mq_to_run = {}
 
@@ -133,7 +134,7 @@ def prepare_bundle(
 
     support_runtime_elements["pods"] = partial(fetch_pods, since_seconds=log_age_seconds)
     if include_mq_traces:
-        support_runtime_elements["traces"] = fetch_diagnostic_traces
+        support_runtime_elements["traces"] = partial(fetch_diagnostic_traces, trace_filter=mq_trace_filter)
 
     mq_to_run.update(support_runtime_elements)
 
@@ -0,0 +1,230 @@
+# coding=utf-8
+# ----------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License file in the project root for license information.
+# ----------------------------------------------------------------------------------------------
+
+import re
+from contextlib import contextmanager
+from threading import Lock
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Set
+
+from knack.log import get_logger
+from kubernetes.client.exceptions import ApiException
+
+logger = get_logger(__name__)
+
+POD_KIND = "Pod"
+
+# selector operators
+OP_IN = "in"
+OP_NOT_IN = "notin"
+OP_EXISTS = "exists"
+OP_NOT_EXISTS = "!"
+OP_EQUALS = "="
+OP_NOT_EQUALS = "!="
+
+# Field selectors the snapshot answers from resource metadata. Others are left to the cluster.
+SNAPSHOT_FIELD_SELECTOR_KEYS = frozenset(["metadata.name", "metadata.namespace"])
+
+SET_REQUIREMENT_PATTERN = re.compile(r"^\s*([^\s!=(),]+)\s+(in|notin)\s+\(([^)]*)\)\s*$")
+
+
+class SelectorRequirement(NamedTuple):
+    key: str
+    operator: str
+    values: Set[str]
+
+
+def _split_selector(selector: str) -> List[str]:
+    # split on commas that are not within a set requirement's parentheses
+    parts = []
+    depth = 0
+    current = ""
+    for char in selector:
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        if char == "," and depth == 0:
+            parts.append(current)
+            current = ""
+            continue
+        current += char
+    parts.append(current)
+    return [part.strip() for part in parts if part.strip()]
+
+
+def parse_selector(selector: Optional[str]) -> List[SelectorRequirement]:
+    """
+    Parse a Kubernetes label or field selector into requirements.
+    Supports equality (=, ==, !=), set (in, notin) and existence (key, !key) requirements.
+    """
+    requirements = []
+    if not selector:
+        return requirements
+
+    for part in _split_selector(selector):
+        set_match = SET_REQUIREMENT_PATTERN.match(part)
+        if set_match:
+            key, operator, values = set_match.groups()
+            requirements.append(
+                SelectorRequirement(key, operator, {value.strip() for value in values.split(",") if value.strip()})
+            )
+        elif "!=" in part:
+            key, value = part.split("!=", 1)
+            requirements.append(SelectorRequirement(key.strip(), OP_NOT_EQUALS, {value.strip()}))
+        elif "=" in part:
+            key, value = part.split("==", 1) if "==" in part else part.split("=", 1)
+            requirements.append(SelectorRequirement(key.strip(), OP_EQUALS, {value.strip()}))
+        elif part.startswith("!"):
+            requirements.append(SelectorRequirement(part[1:].strip(), OP_NOT_EXISTS, set()))
+        else:
+            requirements.append(SelectorRequirement(part, OP_EXISTS, set()))
+
+    return requirements
+
+
+def matches_requirements(values: Dict[str, str], requirements: List[SelectorRequirement]) -> bool:
+    for requirement in requirements:
+        exists = requirement.key in values
+        value = values.get(requirement.key)
+        if requirement.operator in [OP_IN, OP_EQUALS]:
+            if not exists or value not in requirement.values:
+                return False
+        elif requirement.operator in [OP_NOT_IN, OP_NOT_EQUALS]:
+            if exists and value in requirement.values:
+                return False
+        elif requirement.operator == OP_EXISTS:
+            if not exists:
+                return False
+        elif requirement.operator == OP_NOT_EXISTS:
+            if exists:
+                return False
+    return True
+
+
+def _get_field_values(resource: Any) -> Dict[str, str]:
+    metadata = resource.metadata
+    return {"metadata.name": metadata.name, "metadata.namespace": metadata.namespace}
+
+
+class _KindSnapshot:
+    def __init__(self, resources: Any):
+        self.resources = resources
+        self.namespace_index: Dict[str, List[Any]] = {}
+        self.label_index: Dict[str, Dict[str, List[Any]]] = {}
+
+        for resource in resources.items:
+            metadata = resource.metadata
+            self.namespace_index.setdefault(metadata.namespace, []).append(resource)
+            for key, value in (metadata.labels or {}).items():
+                self.label_index.setdefault(key, {}).setdefault(value, []).append(resource)
+
+    def candidates(self, namespace: Optional[str], requirements: List[SelectorRequirement]) -> List[Any]:
+        # narrow on the most selective indexed requirement before full evaluation
+        candidates = self.namespace_index.get(namespace, []) if namespace else self.resources.items
+        for requirement in requirements:
+            if requirement.operator not in [OP_IN, OP_EQUALS]:
+                continue
+            key_index = self.label_index.get(requirement.key, {})
+            indexed = [resource for value in requirement.values for resource in key_index.get(value, [])]
+            if len(indexed) < len(candidates):
+                candidates = indexed
+        return candidates
+
+
+class ClusterSnapshot:
+    """
+    Per-invocation snapshot of cluster runtime resources. Each resource kind is listed across all
+    namespaces at most once, and label, field and namespace filtering is answered in memory.
+    Kinds that cannot be listed across all namespaces (i.e. under namespace scoped RBAC) are not
+    snapshot, and requests for them are left to the cluster.
+    """
+
+    def __init__(self):
+        self._kinds: Dict[str, Optional[_KindSnapshot]] = {}
+        self._locks: Dict[str, Lock] = {}
+        self._locks_guard = Lock()
+        self.list_calls = 0
+        self.queries = 0
+
+    def _get_kind(self, kind: str, fetch: Callable[[], Any]) -> Optional[_KindSnapshot]:
+        with self._locks_guard:
+            kind_lock = self._locks.setdefault(kind, Lock())
+        with kind_lock:
+            if kind not in self._kinds:
+                logger.debug(f"Listing {kind} resources for cluster snapshot.")
+                self.list_calls += 1
+                try:
+                    self._kinds[kind] = _KindSnapshot(fetch())
+                except ApiException as e:
+                    if e.status != 403:
+                        raise
+                    logger.debug(f"Unable to list {kind} resources across namespaces, they will not be snapshot.")
+                    self._kinds[kind] = None
+        return self._kinds[kind]
+
+    def list_resources(
+        self,
+        kind: str,
+        fetch: Callable[[], Any],
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+    ) -> Optional[Any]:
+        """
+        Returns a new list object (i.e. V1PodList) holding the snapshot resources of kind matching the
+        namespace and selectors. fetch lists every resource of kind across all namespaces and is only
+        invoked the first time kind is requested. The returned items list is not shared so callers may
+        filter it in place.
+
+        Returns None when the snapshot cannot answer the request, because the field selector is not
+        one of SNAPSHOT_FIELD_SELECTOR_KEYS or kind could not be listed across namespaces.
+        """
+        field_requirements = parse_selector(field_selector)
+        if any(requirement.key not in SNAPSHOT_FIELD_SELECTOR_KEYS for requirement in field_requirements):
+            return None
+        snapshot = self._get_kind(kind, fetch)
+        if not snapshot:
+            return None
+        self.queries += 1
+
+        label_requirements = parse_selector(label_selector)
+        items = [
+            resource
+            for resource in snapshot.candidates(namespace, label_requirements)
+            if (not namespace or resource.metadata.namespace == namespace)
+            and matches_requirements(resource.metadata.labels or {}, label_requirements)
+            and matches_requirements(_get_field_values(resource), field_requirements)
+        ]
+
+        resources = snapshot.resources
+        return type(resources)(
+            api_version=resources.api_version, kind=resources.kind, metadata=resources.metadata, items=items
+        )
+
+
+_active_snapshot: Optional[ClusterSnapshot] = None
+
+
+def get_cluster_snapshot() -> Optional[ClusterSnapshot]:
+    return _active_snapshot
+
+
+@contextmanager
+def cluster_snapshot() -> Iterator[ClusterSnapshot]:
+    """
+    Activates a cluster snapshot for the duration of the context. Runtime resource processing in
+    support.base will answer list requests from the snapshot while it is active.
+    """
+    global _active_snapshot
+    snapshot = ClusterSnapshot()
+    _active_snapshot = snapshot
+    try:
+        yield snapshot
+    finally:
+        _active_snapshot = None
+        logger.debug(
+            f"Cluster snapshot answered {snapshot.queries} resource queries with {snapshot.list_calls} list calls."
+        )
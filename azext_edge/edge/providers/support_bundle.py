@@ -4,10 +4,15 @@
 # Licensed under the MIT License. See License file in the project root for license information.
 # ----------------------------------------------------------------------------------------------
 
-from typing import List, Optional
-from zipfile import ZipFile, ZIP_DEFLATED
+import json
+from queue import Empty, Queue
+from threading import Event, Thread
+from time import monotonic, time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from zipfile import BadZipFile, ZipFile, ZipInfo, ZIP_DEFLATED
 
 import yaml
+from azure.cli.core.azclierror import FileOperationError, InvalidArgumentValueError
 from knack.log import get_logger
 from rich.console import Console, NewLine
 
@@ -30,6 +35,9 @@ from ..providers.edge_api import (
 
 logger = get_logger(__name__)
 
+if TYPE_CHECKING:
+    from .stats import TraceFilter
+
 console = Console()
 
 COMPAT_CERTMANAGER_APIS = EdgeApiManager(resource_apis=[CERTMANAGER_API_V1, TRUSTMANAGER_API_V1])
@@ -42,13 +50,28 @@ COMPAT_ARCCONTAINERSTORAGE_APIS = EdgeApiManager(resource_apis=[ARCCONTAINERSTOR
 COMPAT_SECRETSTORE_APIS = EdgeApiManager(resource_apis=[SECRETSYNC_API_V1, SECRETSTORE_API_V1])
 COMPAT_AZUREMONITOR_APIS = EdgeApiManager(resource_apis=[AZUREMONITOR_API_V1])
 
+DEFAULT_BUNDLE_MAX_WORKERS = 8
+BUNDLE_POLL_INTERVAL_SEC = 0.25
+BUNDLE_MANIFEST_NAME = "bundle_manifest.json"
+# Log lines a delta can repeat are bounded by the time taken to read the log, so merges only compare this many.
+BUNDLE_MERGE_LOG_OVERLAP_LINES = 10000
+
 
 def build_bundle(
     bundle_path: str,
     log_age_seconds: Optional[int] = None,
     ops_services: Optional[List[str]] = None,
     include_mq_traces: Optional[bool] = None,
+    max_workers: Optional[int] = None,
+    element_timeout: Optional[int] = None,
+    use_snapshot: bool = True,
+    since_bundle: Optional[str] = None,
+    mq_trace_filter: Optional["TraceFilter"] = None,
+    log_tail_lines: Optional[int] = None,
+    log_max_bytes: Optional[int] = None,
 ):
+    from contextlib import nullcontext
+
     from rich.live import Live
     from rich.progress import Progress
     from rich.table import Table
@@ -68,6 +91,8 @@ def build_bundle(
     from .support.azuremonitor import prepare_bundle as prepare_azuremonitor_bundle
     from .support.certmanager import prepare_bundle as prepare_certmanager_bundle
     from .support.meso import prepare_bundle as prepare_meso_bundle
+    from .support.base import POD_LOG_MAX_BYTES, pod_log_capture
+    from .support.snapshot import cluster_snapshot
 
     def collect_default_works(
         pending_work: dict,
@@ -83,6 +108,14 @@ def build_bundle(
         deployed_meta_apis = COMPAT_META_APIS.get_deployed()
         pending_work["meta"] = prepare_meta_bundle(log_age_seconds, deployed_meta_apis)
 
+    capture_epoch = time()
+    previous_manifest = None
+    if since_bundle:
+        previous_manifest = read_bundle_manifest(since_bundle)
+        # Only capture logs written since the previous bundle started collecting.
+        elapsed_seconds = max(int(capture_epoch - previous_manifest["captureEpoch"]), 1)
+        log_age_seconds = min(log_age_seconds, elapsed_seconds) if log_age_seconds else elapsed_seconds
+
     pending_work = {k: {} for k in OpsServiceType.list()}
 
     api_map = {
@@ -162,7 +195,7 @@ def build_bundle(
         if service_moniker == OpsServiceType.deviceregistry.value:
             bundle = bundle_method(deployed_apis)
         elif service_moniker == OpsServiceType.mq.value:
-            bundle = bundle_method(log_age_seconds, deployed_apis, include_mq_traces)
+            bundle = bundle_method(log_age_seconds, deployed_apis, include_mq_traces, mq_trace_filter)
         elif service_moniker in [
             OpsServiceType.schemaregistry.value,
             OpsServiceType.akri.value,
@@ -181,72 +214,371 @@ def build_bundle(
     for service in pending_work:
         total_work_count = total_work_count + len(pending_work[service])
 
-    bundle = {service: {} for service, _ in pending_work.items()}
-
     grid = Table.grid(expand=False)
-    with Live(grid, console=console, transient=True) as live:
+    # Runtime resources are listed once per kind and shared across services via the snapshot.
+    snapshot_context = cluster_snapshot() if use_snapshot else nullcontext()
+    log_context = pod_log_capture(
+        tail_lines=log_tail_lines,
+        max_bytes=log_max_bytes or POD_LOG_MAX_BYTES,
+        previous_epochs=previous_manifest["logs"] if previous_manifest else None,
+    )
+    with snapshot_context, log_context, ZipFile(
+        file=bundle_path, mode="w", compression=ZIP_DEFLATED
+    ) as bundle_zip, Live(grid, console=console, transient=True) as live:
+        zip_writer = BundleZipWriter(bundle_zip, capture_epoch=capture_epoch, previous_manifest=previous_manifest)
         uber_progress = Progress()
         uber_task = uber_progress.add_task(
             "[green]Building support bundle",
             total=total_work_count,
         )
+        service_tasks = {
+            service: uber_progress.add_task(f"[cyan]Processing {service}", total=len(pending_work[service]))
+            for service in pending_work
+            if pending_work[service]
+        }
+
+        def visually_process(in_flight: List[Tuple[str, str]]):
+            elements = ", ".join(f"[medium_purple4]{element}[/medium_purple4]" for _, element in in_flight[:3])
+            if len(in_flight) > 3:
+                elements = f"{elements} (+{len(in_flight) - 3} more)"
+            header = f"Fetching {elements} data..." if in_flight else "Finalizing..."
+            grid = Table.grid(expand=False)
+            grid.add_column()
+
+            grid.add_row(NewLine(1))
+            grid.add_row(header)
+            grid.add_row(NewLine(1))
+            grid.add_row(uber_progress)
+            live.update(grid, refresh=True)
+
+        def advance(ops_service: str, _: str):
+            if not uber_progress.finished:
+                uber_progress.update(service_tasks[ops_service], advance=1)
+                uber_progress.update(uber_task, advance=1)
+
+        process_pending_work(
+            pending_work=pending_work,
+            on_result=zip_writer.write_element,
+            max_workers=max_workers,
+            element_timeout=element_timeout,
+            on_complete=advance,
+            on_poll=visually_process,
+        )
+        zip_writer.write_manifest()
 
-        def visually_process(description: str, support_segment: dict, ops_service: str):
-            namespace_task = uber_progress.add_task(f"[cyan]{description}", total=len(support_segment))
-            for element in support_segment:
-                header = f"Fetching [medium_purple4]{element}[/medium_purple4] data..."
-                grid = Table.grid(expand=False)
-                grid.add_column()
-
-                grid.add_row(NewLine(1))
-                grid.add_row(header)
-                grid.add_row(NewLine(1))
-                grid.add_row(uber_progress)
-                live.update(grid, refresh=True)
-
-                try:
-                    # Produce as much support collateral as possible.
-                    bundle[ops_service][element] = support_segment[element]()
-                except Exception as e:
-                    # @digimaun - bdb.BdbQuit?
-                    logger.debug(f"Unable to process {ops_service} {element}:\n{e}")
-                finally:
-                    if not uber_progress.finished:
-                        uber_progress.update(namespace_task, advance=1)
-                        uber_progress.update(uber_task, advance=1)
-
-        for service in pending_work:
-            if pending_work[service]:
-                visually_process(
-                    description=f"Processing {service}",
-                    support_segment=pending_work[service],
-                    ops_service=service,
-                )
-
-    write_zip(file_path=bundle_path, bundle=bundle)
     return {"bundlePath": bundle_path}
 
 
-def write_zip(bundle: dict, file_path: str):
-    with ZipFile(file=file_path, mode="w", compression=ZIP_DEFLATED) as myzip:
-        todo: List[dict] = []
-        for ops_service in bundle:
-            for element in bundle[ops_service]:
-                if isinstance(bundle[ops_service][element], list):
-                    todo.extend(bundle[ops_service][element])
+def process_pending_work(
+    pending_work: Dict[str, Dict[str, Callable]],
+    on_result: Callable[[str, str, Any, int], None],
+    max_workers: Optional[int] = None,
+    element_timeout: Optional[int] = None,
+    on_complete: Optional[Callable[[str, str], None]] = None,
+    on_poll: Optional[Callable[[List[Tuple[str, str]]], None]] = None,
+):
+    """
+    Runs every pending work element on a bounded pool of daemon threads. Each result is handed to
+    on_result on the calling thread as soon as it completes, together with the position of its element
+    in pending work. Consumers use that position for precedence, so it never depends on thread timing.
+
+    Elements exceeding element_timeout seconds (measured from when they start executing) are
+    abandoned and left out of the bundle. Their threads are daemons, so a hung cluster call
+    cannot keep the process from exiting.
+    """
+    keys = [(ops_service, element) for ops_service in pending_work for element in pending_work[ops_service]]
+    pool = _DaemonWorkerPool(
+        work=[pending_work[ops_service][element] for ops_service, element in keys],
+        max_workers=max_workers or DEFAULT_BUNDLE_MAX_WORKERS,
+    )
+    pending = set(range(len(keys)))
+    try:
+        while pending:
+            if on_poll:
+                on_poll([keys[index] for index in sorted(pending) if index in pool.started_at])
+            for index, result, error in pool.get_completed(timeout=BUNDLE_POLL_INTERVAL_SEC):
+                if index not in pending:
+                    # finished after it was abandoned
+                    continue
+                ops_service, element = keys[index]
+                pending.discard(index)
+                if error:
+                    # Produce as much support collateral as possible.
+                    logger.debug(f"Unable to process {ops_service} {element}:\n{error}")
                 else:
-                    todo.append(bundle[ops_service][element])
-
-        added_path = {}
-        for t in todo:
-            if t:
-                data = t.get("data")
-                zinfo = t.get("zinfo")
-                if data and zinfo not in added_path:
-                    if isinstance(data, dict):
-                        data = yaml.safe_dump(t["data"], indent=2)
-                    myzip.writestr(zinfo_or_arcname=zinfo, data=data)
-                    added_path[zinfo] = True
+                    try:
+                        on_result(ops_service, element, result, index)
+                    except Exception as e:
+                        logger.debug(f"Unable to process {ops_service} {element}:\n{e}")
+                if on_complete:
+                    on_complete(ops_service, element)
+
+            if element_timeout:
+                for index in pool.get_expired(pending, element_timeout):
+                    ops_service, element = keys[index]
+                    logger.warning(f"Processing {ops_service} {element} exceeded {element_timeout}s and was skipped.")
+                    pending.discard(index)
+                    pool.abandon(index)
+                    if on_complete:
+                        on_complete(ops_service, element)
+    finally:
+        pool.stop()
+
+
+class _DaemonWorkerPool:
+    """
+    Runs indexed work on a bounded number of daemon threads. When work is abandoned a replacement
+    thread is started, and the abandoned thread stops taking work once its call returns.
+    """
+
+    def __init__(self, work: List[Callable], max_workers: int):
+        self.work = work
+        self.started_at: Dict[int, float] = {}
+        self._work_queue: "Queue[int]" = Queue()
+        self._done_queue: "Queue[Tuple[int, Any, Optional[Exception]]]" = Queue()
+        self._abandoned = set()
+        self._stop_event = Event()
+        for index in range(len(work)):
+            self._work_queue.put(index)
+        for _ in range(min(max_workers, len(work))):
+            self._start_worker()
+
+    def _start_worker(self):
+        Thread(target=self._run, name="aio_bundle", daemon=True).start()
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                index = self._work_queue.get_nowait()
+            except Empty:
+                return
+            self.started_at[index] = monotonic()
+            try:
+                self._done_queue.put((index, self.work[index](), None))
+            except Exception as e:
+                self._done_queue.put((index, None, e))
+            if index in self._abandoned:
+                return
+
+    def get_completed(self, timeout: float) -> List[Tuple[int, Any, Optional[Exception]]]:
+        completed = []
+        try:
+            completed.append(self._done_queue.get(timeout=timeout))
+            while True:
+                completed.append(self._done_queue.get_nowait())
+        except Empty:
+            pass
+        return completed
+
+    def get_expired(self, indexes: Iterable[int], timeout: float) -> List[int]:
+        now = monotonic()
+        return sorted(index for index in indexes if index in self.started_at and now - self.started_at[index] > timeout)
+
+    def abandon(self, index: int):
+        self._abandoned.add(index)
+        self._start_worker()
+
+    def stop(self):
+        self._stop_event.set()
+
+
+class BundleZipWriter:
+    """
+    Writes support collateral into an open bundle archive as it is produced, so only the entry
+    being written is held in memory. Entries that are not str, bytes or dict are iterables of bytes
+    chunks, such as container logs, and are streamed into the archive. For a given zinfo the entry
+    of the lowest precedence wins, ties go to the first written. A replaced entry is dropped from the
+    archive directory; its bytes stay in the file but readers no longer see it.
+
+    A manifest is kept of the resourceVersion of every resource, the resources each completed work
+    element returned and the capture time of every container log. When a previous bundle manifest is
+    provided, resources whose resourceVersion is unchanged are omitted from the archive.
+    """
+
+    def __init__(
+        self, zip_file: ZipFile, capture_epoch: Optional[float] = None, previous_manifest: Optional[dict] = None
+    ):
+        self.zip_file = zip_file
+        self.previous_manifest = previous_manifest
+        # precedence, owning element resources and whether it was written to the archive, by arcname
+        self._added_paths: Dict[str, Tuple[int, Optional[List[str]], bool]] = {}
+        self.manifest = {
+            "captureEpoch": capture_epoch or time(),
+            "resources": {},
+            "elements": {},
+            "logs": {},
+        }
+
+    def write_element(
+        self, ops_service: str, element: str, result: Union[dict, List[dict], None], precedence: int = 0
+    ):
+        """
+        Writes the result of a completed work element, recording the element as captured.
+        """
+        self.write(
+            result,
+            element_resources=self.manifest["elements"].setdefault(f"{ops_service}/{element}", []),
+            precedence=precedence,
+        )
+
+    def write(
+        self,
+        result: Union[dict, List[dict], None],
+        element_resources: Optional[List[str]] = None,
+        precedence: int = 0,
+    ):
+        entries = result if isinstance(result, list) else [result]
+        previous_resources = self.previous_manifest["resources"] if self.previous_manifest else {}
+        for entry in entries:
+            if not entry:
+                continue
+            data = entry.get("data")
+            zinfo = entry.get("zinfo")
+            arcname = zinfo.filename if isinstance(zinfo, ZipInfo) else zinfo
+            if not data or not self._claim(arcname, precedence, element_resources):
+                _close_entry_data(data)
+                continue
+            if isinstance(data, dict):
+                resource_version = (data.get("metadata") or {}).get("resourceVersion")
+                if resource_version:
+                    self.manifest["resources"][arcname] = resource_version
+                    if element_resources is not None:
+                        element_resources.append(arcname)
+                    if previous_resources.get(arcname) == resource_version:
+                        continue
+                data = yaml.safe_dump(data, indent=2)
+            elif arcname.endswith(".log"):
+                self.manifest["logs"][arcname] = entry.get("captureEpoch") or self.manifest["captureEpoch"]
+            self._added_paths[arcname] = (precedence, element_resources, True)
+            if isinstance(data, (str, bytes)):
+                self.zip_file.writestr(zinfo_or_arcname=zinfo, data=data)
+                continue
+            try:
+                with self.zip_file.open(zinfo, mode="w", force_zip64=True) as zip_entry:
+                    for chunk in data:
+                        zip_entry.write(chunk)
+            finally:
+                _close_entry_data(data)
+
+    def _claim(self, arcname: str, precedence: int, element_resources: Optional[List[str]]) -> bool:
+        """
+        Returns whether an entry of the given precedence is written for arcname, removing the entry
+        it replaces.
+        """
+        if arcname not in self._added_paths:
+            self._added_paths[arcname] = (precedence, element_resources, False)
+            return True
+        added_precedence, added_element_resources, written = self._added_paths[arcname]
+        if precedence >= added_precedence:
+            return False
+        if added_element_resources and arcname in added_element_resources:
+            added_element_resources.remove(arcname)
+        if written:
+            replaced = self.zip_file.getinfo(arcname)
+            self.zip_file.filelist.remove(replaced)
+            del self.zip_file.NameToInfo[arcname]
+        self._added_paths[arcname] = (precedence, element_resources, False)
+        return True
+
+    def write_manifest(self):
+        if self.previous_manifest:
+            self.manifest["baseCaptureEpoch"] = self.previous_manifest["captureEpoch"]
+            self.manifest["removed"] = self._carry_forward()
+        for element_resources in self.manifest["elements"].values():
+            element_resources.sort()
+        self.zip_file.writestr(zinfo_or_arcname=BUNDLE_MANIFEST_NAME, data=json.dumps(self.manifest, indent=2))
+
+    def _carry_forward(self) -> List[str]:
+        """
+        Returns the previous resources that are gone. A resource is only gone when the element that
+        returned it completed again without it. Elements that failed, timed out or were not selected
+        keep their previous resources, and logs without new lines keep their previous capture time.
+        """
+        previous_resources = self.previous_manifest["resources"]
+        removed = set()
+        for element_key, arcnames in self.previous_manifest["elements"].items():
+            if element_key in self.manifest["elements"]:
+                removed.update(arcname for arcname in arcnames if arcname not in self.manifest["resources"])
+                continue
+            self.manifest["elements"][element_key] = list(arcnames)
+            for arcname in arcnames:
+                self.manifest["resources"].setdefault(arcname, previous_resources[arcname])
+        for arcname, log_epoch in self.previous_manifest["logs"].items():
+            self.manifest["logs"].setdefault(arcname, log_epoch)
+        return sorted(removed)
+
+
+def _close_entry_data(data: Any):
+    # streamed entries may hold a spooled file
+    close = getattr(data, "close", None)
+    if close:
+        close()
+
+
+def read_bundle_manifest(bundle_path: str) -> dict:
+    try:
+        with ZipFile(file=bundle_path, mode="r") as bundle_zip:
+            return json.loads(bundle_zip.read(BUNDLE_MANIFEST_NAME))
+    except (OSError, BadZipFile, KeyError, ValueError) as e:
+        raise FileOperationError(f"Unable to read the bundle manifest from {bundle_path}: {e}")
+
+
+def merge_bundles(base_bundle_path: str, delta_bundle_path: str, file_path: str) -> dict:
+    """
+    Merges a delta bundle created with since_bundle into its base bundle. Resources from the delta
+    replace their base counterparts, resources removed since the base are dropped and new log lines
+    are appended to the base log. The merged bundle can be the base of the next delta.
+    """
+    base_manifest = read_bundle_manifest(base_bundle_path)
+    delta_manifest = read_bundle_manifest(delta_bundle_path)
+    if delta_manifest.get("baseCaptureEpoch") != base_manifest["captureEpoch"]:
+        raise InvalidArgumentValueError(
+            f"The bundle {delta_bundle_path} is not a delta of {base_bundle_path}. "
+            "Use the bundle that was passed to --since-bundle as the base."
+        )
+    removed = set(delta_manifest.get("removed", []))
+
+    with ZipFile(file=base_bundle_path, mode="r") as base_zip, ZipFile(
+        file=delta_bundle_path, mode="r"
+    ) as delta_zip, ZipFile(file=file_path, mode="w", compression=ZIP_DEFLATED) as merged_zip:
+        base_names = set(base_zip.namelist())
+        delta_names = set(delta_zip.namelist())
+        for name in base_zip.namelist():
+            if name in removed or name == BUNDLE_MANIFEST_NAME:
+                continue
+            if name in delta_names and not name.endswith(".log"):
+                continue
+            data = base_zip.read(name)
+            if name in delta_names:
+                data = _append_log(data, delta_zip.read(name))
+            merged_zip.writestr(zinfo_or_arcname=name, data=data)
+
+        for name in delta_zip.namelist():
+            # logs present in both bundles were appended above
+            if name not in base_names or not name.endswith(".log"):
+                merged_zip.writestr(zinfo_or_arcname=name, data=delta_zip.read(name))
+
+    return {"bundlePath": file_path}
+
+
+def _append_log(base_log: bytes, delta_log: bytes) -> bytes:
+    """
+    Appends delta_log to base_log, dropping the leading delta lines that repeat the last base lines.
+    Delta log windows start up to a second before the base capture to never miss lines.
+    """
+    base_lines = base_log.splitlines()[-BUNDLE_MERGE_LOG_OVERLAP_LINES:]
+    delta_lines = delta_log.splitlines(keepends=True)
+    delta_keys = [line.rstrip(b"\r\n") for line in delta_lines[:BUNDLE_MERGE_LOG_OVERLAP_LINES]]
+    overlap = 0
+    # the earliest matching start is the longest overlap
+    for start in range(max(len(base_lines) - len(delta_keys), 0), len(base_lines)):
+        if base_lines[start] == delta_keys[0] and base_lines[start:] == delta_keys[: len(base_lines) - start]:
+            overlap = len(base_lines) - start
+            break
+
+    if base_log and not base_log.endswith(b"\n"):
+        base_log += b"\n"
+    return base_log + b"".join(delta_lines[overlap:])
 
 
 def str_presenter(dumper, data):
@@ -25,6 +25,7 @@ from .common import (
 from .file_operations import (
     deserialize_file_content,
     dump_content_to_file,
+    dump_rows_to_file,
     normalize_dir,
     read_file_content,
 )
@@ -36,6 +37,7 @@ __all__ = [
     "chunk_list",
     "deserialize_file_content",
     "dump_content_to_file",
+    "dump_rows_to_file",
     "generate_secret",
     "generate_self_signed_cert",
     "get_timestamp_now_utc",
@@ -5,8 +5,9 @@
 # ----------------------------------------------------------------------------------------------
 
 import sys
-from time import sleep
-from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Tuple
+from threading import Event, Lock
+from time import monotonic, time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, NamedTuple, Optional, Tuple, Type, TypeVar
 
 from azure.cli.core.azclierror import ValidationError
 from knack.log import get_logger
@@ -23,16 +24,183 @@ JSON = MutableMapping[str, Any]  # pylint: disable=unsubscriptable-object
 ensure_azure_namespace_path()
 
 from azure.core.pipeline.policies import HttpLoggingPolicy, UserAgentPolicy
-from azure.identity import AzureCliCredential
 
-AZURE_CLI_CREDENTIAL = AzureCliCredential()
+# Clients share one connection pooled session. Pools are sized for the concurrent callers of the extension.
+CLIENT_POOL_CONNECTIONS = 16
+CLIENT_POOL_MAXSIZE = 32
+# Cached tokens are refreshed this long before they expire.
+TOKEN_REFRESH_MARGIN_SEC = 300
 
 POLL_RETRIES = 240
 POLL_WAIT_SEC = 15
+# Local completion checks back off from POLL_INITIAL_WAIT_SEC up to the wait_sec of the caller.
+POLL_INITIAL_WAIT_SEC = 0.25
+
+T = TypeVar("T")
 
 logger = get_logger(__name__)
 
 
+class CachedTokenCredential:
+    """
+    Wraps a credential, caching its tokens by scopes and tenant until they are close to expiring. Azure CLI
+    tokens are acquired through a subprocess, so every new client pipeline would otherwise pay for one.
+
+    Either a credential or a credential_factory is given. The factory defers creating the credential (and
+    importing its library) until the first token is requested. When given, the identity callable returns the
+    account the credential currently signs in as, and tokens are cached per identity.
+    """
+
+    def __init__(
+        self,
+        credential: Optional[Any] = None,
+        credential_factory: Optional[Callable[[], Any]] = None,
+        identity: Optional[Callable[[], tuple]] = None,
+    ):
+        if credential is None and credential_factory is None:
+            raise ValueError("A credential or credential_factory is required.")
+        self._credential = credential
+        self._credential_factory = credential_factory
+        self._identity = identity
+        self._tokens: Dict[tuple, Any] = {}
+        # tokens for different keys are acquired concurrently, requests for the same key wait for one acquisition
+        self._token_locks: Dict[tuple, Lock] = {}
+        self._lock = Lock()
+
+    @property
+    def credential(self) -> Any:
+        if self._credential is None:
+            with self._lock:
+                if self._credential is None:
+                    self._credential = self._credential_factory()
+        return self._credential
+
+    def get_token(self, *scopes: str, claims: Optional[str] = None, tenant_id: Optional[str] = None, **kwargs):
+        credential = self.credential
+        if claims:
+            # claims challenges always need a new token
+            return credential.get_token(*scopes, claims=claims, tenant_id=tenant_id, **kwargs)
+
+        token_key = (self._identity() if self._identity else None, scopes, tenant_id)
+        with self._lock:
+            token_lock = self._token_locks.setdefault(token_key, Lock())
+        with token_lock:
+            token = self._tokens.get(token_key)
+            if not token or token.expires_on - TOKEN_REFRESH_MARGIN_SEC <= time():
+                token = credential.get_token(*scopes, tenant_id=tenant_id, **kwargs)
+                self._tokens[token_key] = token
+            return token
+
+    def clear(self):
+        with self._lock:
+            self._tokens.clear()
+            self._token_locks.clear()
+
+
+def _get_cli_credential():
+    from azure.identity import AzureCliCredential
+
+    return AzureCliCredential()
+
+
+def _get_cli_identity() -> Tuple[str, Optional[str], Optional[str], Optional[str]]:
+    """
+    Returns the active cloud name and the tenant, user type and user name of the default Azure CLI account,
+    read from the loaded CLI profile. They change with az login, az account set and az cloud set.
+    """
+    from azure.cli.core._config import ENV_VAR_PREFIX, GLOBAL_CONFIG_DIR
+    from azure.cli.core._session import ACCOUNT
+    from azure.cli.core.cloud import AZURE_PUBLIC_CLOUD
+    from knack.config import CLIConfig
+
+    cloud_name = CLIConfig(config_dir=GLOBAL_CONFIG_DIR, config_env_var_prefix=ENV_VAR_PREFIX).get(
+        "cloud", "name", AZURE_PUBLIC_CLOUD.name
+    )
+    account = next(
+        (
+            subscription
+            for subscription in ACCOUNT.get("subscriptions") or []
+            if subscription.get("isDefault") and subscription.get("environmentName") == cloud_name
+        ),
+        {},
+    )
+    user = account.get("user") or {}
+    return cloud_name, account.get("tenantId"), user.get("type"), user.get("name")
+
+
+AZURE_CLI_CREDENTIAL = CachedTokenCredential(credential_factory=_get_cli_credential, identity=_get_cli_identity)
+
+# Clients are pooled by (client type, subscription, Azure CLI identity, client kwargs such as api version or
+# cloud endpoints), so clients holding tokens of a previous account or cloud are not reused.
+_client_pool: Dict[tuple, Any] = {}
+_client_pool_lock = Lock()
+_shared_session = None
+
+
+def _get_shared_session():
+    global _shared_session
+    if not _shared_session:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        # retries are handled by the pipeline retry policy, as with sessions owned by the transport
+        adapter = HTTPAdapter(
+            pool_connections=CLIENT_POOL_CONNECTIONS,
+            pool_maxsize=CLIENT_POOL_MAXSIZE,
+            max_retries=Retry(total=False, redirect=False, raise_on_status=False),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _shared_session = session
+    return _shared_session
+
+
+def _get_pooled_client(client_type: Type[T], subscription_id: str, logging_policy: bool = True, **kwargs) -> T:
+    """
+    Returns the pooled client of client_type for the subscription and kwargs, creating it if needed.
+    Clients built with non primitive kwargs (custom policies or transports) are not pooled.
+    """
+    pool_key = None
+    if all(isinstance(value, (str, int, float, bool, list, tuple)) for value in kwargs.values()):
+        pool_key = (client_type, subscription_id, _get_cli_identity(), repr(sorted(kwargs.items())))
+
+    with _client_pool_lock:
+        if pool_key in _client_pool:
+            return _client_pool[pool_key]
+
+        from azure.core.pipeline.transport import RequestsTransport
+
+        if logging_policy and "http_logging_policy" not in kwargs:
+            kwargs["http_logging_policy"] = get_default_logging_policy()
+        if "transport" not in kwargs:
+            kwargs["transport"] = RequestsTransport(session=_get_shared_session(), session_owner=False)
+
+        client = client_type(
+            credential=AZURE_CLI_CREDENTIAL,
+            subscription_id=subscription_id,
+            user_agent_policy=UserAgentPolicy(user_agent=USER_AGENT),
+            **kwargs,
+        )
+        if pool_key:
+            _client_pool[pool_key] = client
+        return client
+
+
+def clear_client_pool():
+    """
+    Drops pooled clients and cached tokens, for hosts that keep the extension loaded across account changes.
+    """
+    global _shared_session
+    with _client_pool_lock:
+        _client_pool.clear()
+        if _shared_session:
+            _shared_session.close()
+            _shared_session = None
+    AZURE_CLI_CREDENTIAL.clear()
+
+
 if TYPE_CHECKING:
     from azure.core.polling import LROPoller
 
@@ -57,85 +225,37 @@ if TYPE_CHECKING:
 def get_extloc_mgmt_client(subscription_id: str, **kwargs) -> "CustomLocations":
     from ..vendor.clients.extendedlocmgmt import CustomLocations
 
-    if "http_logging_policy" not in kwargs:
-        kwargs["http_logging_policy"] = get_default_logging_policy()
-
-    return CustomLocations(
-        credential=AZURE_CLI_CREDENTIAL,
-        subscription_id=subscription_id,
-        user_agent_policy=UserAgentPolicy(user_agent=USER_AGENT),
-        **kwargs,
-    )
+    return _get_pooled_client(CustomLocations, subscription_id=subscription_id, **kwargs)
 
 
 def get_ssc_mgmt_client(subscription_id: str, **kwargs) -> "MicrosoftSecretSyncController":
     from ..vendor.clients.secretsyncmgmt import MicrosoftSecretSyncController
 
-    if "http_logging_policy" not in kwargs:
-        kwargs["http_logging_policy"] = get_default_logging_policy()
-
-    return MicrosoftSecretSyncController(
-        credential=AZURE_CLI_CREDENTIAL,
-        subscription_id=subscription_id,
-        user_agent_policy=UserAgentPolicy(user_agent=USER_AGENT),
-        **kwargs,
-    )
+    return _get_pooled_client(MicrosoftSecretSyncController, subscription_id=subscription_id, **kwargs)
 
 
 def get_msi_mgmt_client(subscription_id: str, **kwargs) -> "ManagedServiceIdentityClient":
     from ..vendor.clients.msimgmt import ManagedServiceIdentityClient
 
-    if "http_logging_policy" not in kwargs:
-        kwargs["http_logging_policy"] = get_default_logging_policy()
-
-    return ManagedServiceIdentityClient(
-        credential=AZURE_CLI_CREDENTIAL,
-        subscription_id=subscription_id,
-        user_agent_policy=UserAgentPolicy(user_agent=USER_AGENT),
-        **kwargs,
-    )
+    return _get_pooled_client(ManagedServiceIdentityClient, subscription_id=subscription_id, **kwargs)
 
 
 def get_clusterconfig_mgmt_client(subscription_id: str, **kwargs) -> "KubernetesConfigurationClient":
     from ..vendor.clients.clusterconfigmgmt import KubernetesConfigurationClient
 
-    if "http_logging_policy" not in kwargs:
-        kwargs["http_logging_policy"] = get_default_logging_policy()
-
-    return KubernetesConfigurationClient(
-        credential=AZURE_CLI_CREDENTIAL,
-        subscription_id=subscription_id,
-        user_agent_policy=UserAgentPolicy(user_agent=USER_AGENT),
-        **kwargs,
-    )
+    return _get_pooled_client(KubernetesConfigurationClient, subscription_id=subscription_id, **kwargs)
 
 
 def get_connectedk8s_mgmt_client(subscription_id: str, **kwargs) -> "ConnectedKubernetesClient":
     from ..vendor.clients.connectedclustermgmt import ConnectedKubernetesClient
 
-    if "http_logging_policy" not in kwargs:
-        kwargs["http_logging_policy"] = get_default_logging_policy()
-
-    return ConnectedKubernetesClient(
-        credential=AZURE_CLI_CREDENTIAL,
-        subscription_id=subscription_id,
-        user_agent_policy=UserAgentPolicy(user_agent=USER_AGENT),
-        **kwargs,
-    )
+    return _get_pooled_client(ConnectedKubernetesClient, subscription_id=subscription_id, **kwargs)
 
 
 def get_storage_mgmt_client(subscription_id: str, **kwargs) -> "StorageManagementClient":
     from ..vendor.clients.storagemgmt import StorageManagementClient
 
-    if "http_logging_policy" not in kwargs:
-        kwargs["http_logging_policy"] = get_default_logging_policy()
-
-    return StorageManagementClient(
-        credential=AZURE_CLI_CREDENTIAL,
-        subscription_id=subscription_id,
-        user_agent_policy=UserAgentPolicy(user_agent=USER_AGENT),
-        **kwargs,
-    )
+    return _get_pooled_client(StorageManagementClient, subscription_id=subscription_id, **kwargs)
 
 
 REGISTRY_PREVIEW_API_VERSION = "2024-09-01-preview"
@@ -147,96 +267,81 @@ def get_registry_mgmt_client(subscription_id: str, **kwargs) -> "MicrosoftDevice
         MicrosoftDeviceRegistryManagementService,
     )
 
-    if "http_logging_policy" not in kwargs:
-        kwargs["http_logging_policy"] = get_default_logging_policy()
-
-    return MicrosoftDeviceRegistryManagementService(
-        credential=AZURE_CLI_CREDENTIAL,
-        subscription_id=subscription_id,
-        user_agent_policy=UserAgentPolicy(user_agent=USER_AGENT),
-        **kwargs,
-    )
+    return _get_pooled_client(MicrosoftDeviceRegistryManagementService, subscription_id=subscription_id, **kwargs)
 
 
 def get_iotops_mgmt_client(subscription_id: str, **kwargs) -> "MicrosoftIoTOperationsManagementService":
     from ..vendor.clients.iotopsmgmt import MicrosoftIoTOperationsManagementService
 
-    if "http_logging_policy" not in kwargs:
-        kwargs["http_logging_policy"] = get_default_logging_policy()
-
-    return MicrosoftIoTOperationsManagementService(
-        credential=AZURE_CLI_CREDENTIAL,
-        subscription_id=subscription_id,
-        user_agent_policy=UserAgentPolicy(user_agent=USER_AGENT),
-        **kwargs,
-    )
+    return _get_pooled_client(MicrosoftIoTOperationsManagementService, subscription_id=subscription_id, **kwargs)
 
 
 def get_resource_client(subscription_id: str, **kwargs) -> "ResourceManagementClient":
     from ..vendor.clients.resourcesmgmt import ResourceManagementClient
 
-    if "http_logging_policy" not in kwargs:
-        kwargs["http_logging_policy"] = get_default_logging_policy()
-
-    return ResourceManagementClient(
-        credential=AZURE_CLI_CREDENTIAL,
-        subscription_id=subscription_id,
-        user_agent_policy=UserAgentPolicy(user_agent=USER_AGENT),
-        **kwargs,
-    )
+    return _get_pooled_client(ResourceManagementClient, subscription_id=subscription_id, **kwargs)
 
 
 def get_authz_client(subscription_id: str, **kwargs) -> "AuthorizationManagementClient":
     from ..vendor.clients.authzmgmt import AuthorizationManagementClient
 
-    if "http_logging_policy" not in kwargs:
-        kwargs["http_logging_policy"] = get_default_logging_policy()
-
-    return AuthorizationManagementClient(
-        credential=AZURE_CLI_CREDENTIAL,
-        subscription_id=subscription_id,
-        user_agent_policy=UserAgentPolicy(user_agent=USER_AGENT),
-        **kwargs,
-    )
+    return _get_pooled_client(AuthorizationManagementClient, subscription_id=subscription_id, **kwargs)
 
 
 def get_keyvault_client(subscription_id: str, **kwargs) -> "KeyVaultClient":
     from ..vendor.clients.keyvault import KeyVaultClient
 
     # TODO: this only supports azure public cloud for now
-    client = KeyVaultClient(
-        credential=AZURE_CLI_CREDENTIAL,
+    return _get_pooled_client(
+        KeyVaultClient,
         subscription_id=subscription_id,
-        user_agent_policy=UserAgentPolicy(user_agent=USER_AGENT),
+        logging_policy=False,
         credential_scopes=["https://vault.azure.net/.default"],
         **kwargs,
     )
 
-    return client
-
 
-def wait_for_terminal_state(poller: "LROPoller", wait_sec: int = POLL_WAIT_SEC, **_) -> JSON:
-    # resource client does not handle sigint well
-    counter = 0
-    while counter < POLL_RETRIES:
-        sleep(wait_sec)
-        counter = counter + 1
-        if poller.done():
-            break
+def iter_completed_pollers(
+    *pollers: "LROPoller", retries: int = POLL_RETRIES, wait_sec: float = POLL_WAIT_SEC, **_
+) -> Iterator["LROPoller"]:
+    """
+    Yields pollers as each one completes, giving up on the rest after retries * wait_sec seconds.
+
+    Service polling, including honouring Retry-After, happens on each poller's own thread. Pollers signal
+    completion through done callbacks, and between signals completion is checked with exponential backoff from
+    POLL_INITIAL_WAIT_SEC up to wait_sec, so short operations return right away and waits stay interruptible.
+    """
+    # resource client does not handle sigint well, so never block on the pollers themselves
+    completed = Event()
+    for poller in pollers:
+        poller.add_done_callback(lambda _: completed.set())
+
+    pending = list(pollers)
+    deadline = monotonic() + retries * wait_sec
+    interval = min(POLL_INITIAL_WAIT_SEC, wait_sec)
+    while pending:
+        completed.clear()
+        for poller in [poller for poller in pending if poller.done()]:
+            pending.remove(poller)
+            yield poller
+        remaining = deadline - monotonic()
+        if not pending or remaining <= 0:
+            return
+        completed.wait(min(interval, remaining))
+        interval = min(interval * 2, wait_sec)
+
+
+def wait_for_terminal_state(poller: "LROPoller", wait_sec: float = POLL_WAIT_SEC, **_) -> JSON:
+    for _ in iter_completed_pollers(poller, retries=POLL_RETRIES, wait_sec=wait_sec):
+        pass
     return poller.result()
 
 
 def wait_for_terminal_states(
-    *pollers: "LROPoller", retries: int = POLL_RETRIES, wait_sec: int = POLL_WAIT_SEC, **_
+    *pollers: "LROPoller", retries: int = POLL_RETRIES, wait_sec: float = POLL_WAIT_SEC, **_
 ) -> Tuple["LROPoller"]:
-    counter = 0
-    while counter < retries:
-        sleep(wait_sec)
-        counter = counter + 1
-        batch_done = all(poller.done() for poller in pollers)
-        if batch_done:
-            break
-
+    for _ in iter_completed_pollers(*pollers, retries=retries, wait_sec=wait_sec):
+        pass
     return pollers
 
 
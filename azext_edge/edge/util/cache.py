@@ -0,0 +1,96 @@
+# coding=utf-8
+# ----------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License file in the project root for license information.
+# ----------------------------------------------------------------------------------------------
+
+"""
+cache: Defines a thread-safe, size and TTL bounded LRU cache.
+
+"""
+
+from collections import OrderedDict
+from threading import RLock
+from time import monotonic
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+DEFAULT_CACHE_MAX_ENTRIES = 256
+DEFAULT_CACHE_TTL_SEC = 300.0
+
+MISSING = object()
+
+
+class TTLCache:
+    """
+    LRU cache with per-entry expiry. Entries beyond max_entries are evicted least recently used first,
+    and entries older than their TTL are treated as absent.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        ttl_sec: Optional[float] = DEFAULT_CACHE_TTL_SEC,
+    ):
+        self.max_entries = max_entries
+        self.ttl_sec = ttl_sec
+        self._entries: "OrderedDict[Hashable, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._lock = RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key, MISSING)
+            if entry is not MISSING:
+                value, expires_at = entry
+                if expires_at is None or monotonic() < expires_at:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any, ttl_sec: Optional[float] = MISSING):
+        ttl_sec = self.ttl_sec if ttl_sec is MISSING else ttl_sec
+        expires_at = monotonic() + ttl_sec if ttl_sec is not None else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._entries.get(key, MISSING)
+            return entry is not MISSING and (entry[1] is None or monotonic() < entry[1])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> int:
+        """
+        Removes entries whose key satisfies predicate, or all entries if no predicate is provided.
+        Returns the number of removed entries.
+        """
+        with self._lock:
+            if not predicate:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -256,22 +256,38 @@ def upsert_by_discriminator(initial: List[dict], disc_key: str, config: dict) ->
     return initial
 
 
-def chunk_list(data: list, chunk_len: int, data_size: int = 1024, size_unit: str = "kb") -> List[list]:
-    if size_unit.lower() == "mb":
-        data_size *= 1024
+def chunk_list(
+    data: list, chunk_len: int, data_size: int = 1024, size_unit: str = "kb", pack: bool = False
+) -> List[list]:
+    """
+    Splits data into chunks of at most chunk_len items whose JSON serialization is at most data_size.
 
-    result = []
-    current_chunk = []
+    Each item is serialized once and chunk sizes are tracked as running totals. By default item order
+    is kept. With pack, items are placed largest first into the first chunk with room, which reduces
+    the number of chunks at the cost of order. An item larger than data_size is placed in its own chunk.
+    """
+    size_limit = data_size * 1024
+    if size_unit.lower() == "mb":
+        size_limit *= 1024
 
-    for item in data:
-        current_chunk.append(item)
+    # json.dumps of a list is "[" + ", ".join(items) + "]"
+    item_sizes = [len(json.dumps(item).encode("utf-8")) for item in data]
 
-        serialized_size = len(json.dumps(current_chunk).encode("utf-8")) / 1024  # convert bytes to kb
+    if pack:
+        return _pack_chunks(data, item_sizes, chunk_len, size_limit)
 
-        if len(current_chunk) > chunk_len or serialized_size > data_size:
-            current_chunk.pop()
+    result = []
+    current_chunk = []
+    current_size = 2
+    for item, item_size in zip(data, item_sizes):
+        added_size = item_size + (2 if current_chunk else 0)
+        if current_chunk and (len(current_chunk) >= chunk_len or current_size + added_size > size_limit):
             result.append(current_chunk)
-            current_chunk = [item]
+            current_chunk = []
+            current_size = 2
+            added_size = item_size
+        current_chunk.append(item)
+        current_size += added_size
 
     if current_chunk:
         result.append(current_chunk)
@@ -279,6 +295,30 @@ def chunk_list(data: list, chunk_len: int, data_size: int = 1024, size_unit: str
     return result
 
 
+def _pack_chunks(data: list, item_sizes: List[int], chunk_len: int, size_limit: int) -> List[list]:
+    chunks: List[list] = []
+    chunk_sizes: List[int] = []
+    # indexes of chunks that may still take items, full chunks are dropped so scans stay short
+    open_chunks: List[int] = []
+
+    for item_index in sorted(range(len(data)), key=lambda i: item_sizes[i], reverse=True):
+        item_size = item_sizes[item_index]
+        for position, chunk_index in enumerate(open_chunks):
+            if chunk_sizes[chunk_index] + item_size + 2 <= size_limit:
+                chunks[chunk_index].append(data[item_index])
+                chunk_sizes[chunk_index] += item_size + 2
+                if len(chunks[chunk_index]) >= chunk_len:
+                    open_chunks.pop(position)
+                break
+        else:
+            chunks.append([data[item_index]])
+            chunk_sizes.append(item_size + 2)
+            if chunk_len > 1:
+                open_chunks.append(len(chunks) - 1)
+
+    return chunks
+
+
 def to_safe_filename(name: str) -> str:
     return re.sub(r"[^\w\-.]", "_", name).strip(".")
 
@@ -9,7 +9,7 @@ import json
 import yaml
 import os
 from pathlib import PurePath
-from typing import Any, Callable, List, Optional, Union
+from typing import Any, Callable, Iterable, List, Optional, Union
 from azure.cli.core.azclierror import FileOperationError, InvalidArgumentValueError
 from knack.log import get_logger
 
@@ -25,12 +25,7 @@ def dump_content_to_file(
     output_dir: Optional[str] = None,
     replace: bool = False,
 ) -> PurePath:
-    output_dir = normalize_dir(output_dir)
-    file_path = os.path.join(output_dir, f"{file_name}.{extension}")
-    if os.path.exists(file_path):
-        if not replace:
-            raise FileExistsError(f"File {file_path} already exists. Please choose another file name or add replace.")
-        logger.warning(f"The file {file_path} will be overwritten.")
+    file_path = _get_output_file_path(file_name=file_name, extension=extension, output_dir=output_dir, replace=replace)
     if extension.endswith("csv"):
         with open(file_path, "w", newline="", encoding="utf-8") as f:
             if not fieldnames:
@@ -51,6 +46,50 @@ def dump_content_to_file(
     return file_path
 
 
+def dump_rows_to_file(
+    rows: Iterable[dict],
+    file_name: str,
+    extension: str,
+    fieldnames: List[str],
+    output_dir: Optional[str] = None,
+    replace: bool = False,
+) -> PurePath:
+    """
+    Streams rows to a csv file or a json array file one row at a time, so memory does not grow with the
+    number of rows.
+    """
+    if extension not in ["csv", "json"]:
+        raise InvalidArgumentValueError(f"Rows can only be streamed to csv or json files, not {extension}.")
+    file_path = _get_output_file_path(file_name=file_name, extension=extension, output_dir=output_dir, replace=replace)
+    with open(file_path, "w", newline="" if extension == "csv" else None, encoding="utf-8") as f:
+        if extension == "csv":
+            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
+            writer.writeheader()
+            for row in rows:
+                writer.writerow(row)
+            return file_path
+
+        separator = "[\n"
+        for row in rows:
+            f.write(separator)
+            f.write(json.dumps(row))
+            separator = ",\n"
+        f.write("[]\n" if separator == "[\n" else "\n]\n")
+    return file_path
+
+
+def _get_output_file_path(
+    file_name: str, extension: str, output_dir: Optional[str] = None, replace: bool = False
+) -> str:
+    output_dir = normalize_dir(output_dir)
+    file_path = os.path.join(output_dir, f"{file_name}.{extension}")
+    if os.path.exists(file_path):
+        if not replace:
+            raise FileExistsError(f"File {file_path} already exists. Please choose another file name or add replace.")
+        logger.warning(f"The file {file_path} will be overwritten.")
+    return file_path
+
+
 def normalize_dir(dir_path: Optional[str] = None) -> PurePath:
     if not dir_path:
         dir_path = "."
@@ -0,0 +1,84 @@
+# coding=utf-8
+# ----------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License file in the project root for license information.
+# ----------------------------------------------------------------------------------------------
+
+"""
+framing: Defines a buffered reader for length-prefixed frames over a socket.
+
+"""
+
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from socket import socket
+
+DEFAULT_FRAME_PREFIX_BYTES = 4
+DEFAULT_FRAME_BUFFER_BYTES = 64 * 1024
+DEFAULT_MAX_FRAME_BYTES = 256 * 1024 * 1024
+
+
+class FramedReader:
+    """
+    Reads length-prefixed frames from a socket into a reusable buffer via recv_into.
+
+    The buffer grows geometrically to fit the largest frame seen, so steady-state reads do not allocate.
+    Returned views alias the buffer and are only valid until the next read; copy with bytes() to retain.
+    """
+
+    def __init__(
+        self,
+        socket: "socket",
+        prefix_size: int = DEFAULT_FRAME_PREFIX_BYTES,
+        byteorder: str = "big",
+        max_frame_size: int = DEFAULT_MAX_FRAME_BYTES,
+        initial_buffer_size: int = DEFAULT_FRAME_BUFFER_BYTES,
+    ):
+        self.socket = socket
+        self.prefix_size = prefix_size
+        self.byteorder = byteorder
+        self.max_frame_size = max_frame_size
+        self._buffer = bytearray(max(initial_buffer_size, prefix_size))
+        self._view = memoryview(self._buffer)
+
+    def _ensure_capacity(self, size: int):
+        if size <= len(self._buffer):
+            return
+        capacity = len(self._buffer)
+        while capacity < size:
+            capacity *= 2
+        self._buffer = bytearray(capacity)
+        self._view = memoryview(self._buffer)
+
+    def read_exact(self, size: int) -> Optional[memoryview]:
+        """
+        Reads exactly size bytes. Returns None if the socket is closed before any byte is read,
+        and raises ConnectionAbortedError if it is closed part way through.
+        """
+        self._ensure_capacity(size)
+        received = 0
+        while received < size:
+            received_now = self.socket.recv_into(self._view[received:size], size - received)
+            if not received_now:
+                if not received:
+                    return None
+                raise ConnectionAbortedError(f"Socket closed after {received} of {size} expected bytes.")
+            received += received_now
+        return self._view[:size]
+
+    def read_frame(self) -> Optional[memoryview]:
+        """
+        Reads the next frame payload. Returns None if the socket is closed on a frame boundary
+        or the peer sends an empty frame.
+        """
+        prefix = self.read_exact(self.prefix_size)
+        if prefix is None:
+            return None
+
+        frame_size = int.from_bytes(prefix, byteorder=self.byteorder)
+        if frame_size > self.max_frame_size:
+            raise ValueError(f"Frame of {frame_size} bytes exceeds the {self.max_frame_size} byte limit.")
+        if not frame_size:
+            return None
+        return self.read_exact(frame_size)
@@ -5,12 +5,18 @@
 # ----------------------------------------------------------------------------------------------
 
 import json
-from typing import List, Optional, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from queue import Full, Queue
+from threading import Event
+from typing import Iterator, List, Optional, Tuple, TYPE_CHECKING
 
 from azure.cli.core.util import send_raw_request
 
 GRAPH_API_VERSION = "2022-10-01"
 GRAPH_RESOURCE_PATH = f"/providers/Microsoft.ResourceGraph/resources?api-version={GRAPH_API_VERSION}"
+# Partitioned queries are paged concurrently, each fetching a bounded number of pages ahead of the consumer.
+RESOURCE_GRAPH_MAX_CONCURRENCY = 4
+RESOURCE_GRAPH_PREFETCH_PAGES = 2
 
 if TYPE_CHECKING:
     from requests.models import Response
@@ -36,9 +42,111 @@ class ResourceGraph:
         """
         return self._process_resource_query(query=query, page_size=page_size)
 
-    def _process_resource_query(self, query: str, page_size: Optional[int] = None) -> List[dict]:
-        result = {"data": []}
-        request_payload = {"subscriptions": self.subscriptions, "query": query, "options": {}}
+    def iter_resources(
+        self, query: str, page_size: Optional[int] = None, partition_by_subscription: bool = False
+    ) -> Iterator[dict]:
+        """Query Azure Resource Graph (ARG), yielding resources as their pages arrive.
+
+        Args:
+          query: An ARG compatible query string.
+          page_size: Integer corresponding to max records per page.
+          partition_by_subscription: See iter_resource_pages.
+
+        Returns:
+          An iterator of resources.
+        """
+        for page in self.iter_resource_pages(
+            query=query, page_size=page_size, partition_by_subscription=partition_by_subscription
+        ):
+            yield from page
+
+    def iter_resource_pages(
+        self, query: str, page_size: Optional[int] = None, partition_by_subscription: bool = False
+    ) -> Iterator[List[dict]]:
+        """Query Azure Resource Graph (ARG), yielding one page of resources at a time.
+
+        Args:
+          query: An ARG compatible query string.
+          page_size: Integer corresponding to max records per page. Currently Id must be included
+            for skipToken paging to work correctly.
+          partition_by_subscription: Query each subscription separately and concurrently. Only use
+            for queries whose results do not span subscriptions (no summarize, top or distinct).
+
+        Returns:
+          An iterator of the resources of each page, so callers can process large results with bounded memory.
+        """
+        return self.iter_partitioned_pages(
+            queries=[query], page_size=page_size, partition_by_subscription=partition_by_subscription
+        )
+
+    def iter_partitioned_pages(
+        self, queries: List[str], page_size: Optional[int] = None, partition_by_subscription: bool = False
+    ) -> Iterator[List[dict]]:
+        """Query Azure Resource Graph (ARG) with independent queries, yielding pages as they arrive.
+
+        Each query (and each subscription when partition_by_subscription is set) is paged on its own,
+        with up to RESOURCE_GRAPH_MAX_CONCURRENCY partitions in flight. Partitions fetch at most
+        RESOURCE_GRAPH_PREFETCH_PAGES pages ahead of the consumer. Pages of different partitions
+        interleave in arrival order.
+        """
+        subscription_sets = [self.subscriptions]
+        if partition_by_subscription and len(self.subscriptions) > 1:
+            subscription_sets = [[subscription] for subscription in self.subscriptions]
+        partitions = [(subscriptions, query) for query in queries for subscriptions in subscription_sets]
+
+        if not partitions:
+            return
+        if len(partitions) == 1:
+            yield from self._iter_partition_pages(*partitions[0], page_size=page_size)
+            return
+        yield from self._iter_concurrent_pages(partitions, page_size=page_size)
+
+    def _iter_concurrent_pages(
+        self, partitions: List[Tuple[List[str], str]], page_size: Optional[int] = None
+    ) -> Iterator[List[dict]]:
+        max_workers = min(RESOURCE_GRAPH_MAX_CONCURRENCY, len(partitions))
+        pages = Queue(maxsize=RESOURCE_GRAPH_PREFETCH_PAGES * max_workers)
+        stop = Event()
+
+        def _put(item: tuple) -> bool:
+            # stop putting once the consumer is gone, otherwise the worker would block forever
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except Full:
+                    continue
+            return False
+
+        def _fetch(subscriptions: List[str], query: str):
+            try:
+                for page in self._iter_partition_pages(subscriptions, query, page_size=page_size):
+                    if stop.is_set() or not _put((page, None)):
+                        return
+                _put((None, None))
+            except Exception as e:  # pylint: disable=broad-except
+                _put((None, e))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for subscriptions, query in partitions:
+                executor.submit(_fetch, subscriptions, query)
+            try:
+                remaining = len(partitions)
+                while remaining:
+                    page, error = pages.get()
+                    if error:
+                        raise error
+                    if page is None:
+                        remaining -= 1
+                        continue
+                    yield page
+            finally:
+                stop.set()
+
+    def _iter_partition_pages(
+        self, subscriptions: List[str], query: str, page_size: Optional[int] = None
+    ) -> Iterator[List[dict]]:
+        request_payload = {"subscriptions": subscriptions, "query": query, "options": {}}
         if page_size:
             request_payload["options"]["$top"] = page_size
 
@@ -52,11 +160,12 @@ class ResourceGraph:
                 method="POST",
             )
             response_payload: dict = raw_request_response.json()
-            result["data"].extend(response_payload.get("data", []))
+            yield response_payload.get("data", [])
 
             if "$skipToken" not in response_payload:
                 break
 
             request_payload["options"] = {"$skipToken": response_payload["$skipToken"]}
 
-        return result
+    def _process_resource_query(self, query: str, page_size: Optional[int] = None) -> dict:
+        return {"data": list(self.iter_resources(query=query, page_size=page_size))}
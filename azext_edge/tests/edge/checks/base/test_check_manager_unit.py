@@ -170,3 +170,43 @@ def assert_check_manager_dict(
                 expected_target_displays[target]
                 == result_check_dict_displays["targets"][target][expected_namespace]["displays"]
             )
+
+
+def test_check_manager_displays():
+    from rich.padding import Padding
+
+    target = generate_random_string()
+    namespace = generate_random_string()
+    check_manager = CheckManager(check_name=generate_random_string(), check_desc=generate_random_string())
+    check_manager.add_target(target_name=target, namespace=namespace)
+    check_manager.add_target_eval(target_name=target, namespace=namespace, status=CheckTaskStatus.success.value)
+
+    raw_display = Padding(generate_random_string(), (0, 0, 0, 2))
+    padded_text = generate_random_string()
+    check_manager.add_display(target_name=target, namespace=namespace, display=raw_display)
+    check_manager.add_display(target_name=target, namespace=namespace, display=padded_text, padding=(0, 0, 0, 8))
+
+    result = check_manager.as_dict()
+    assert "displays" not in result["targets"][target][namespace]
+
+    # displays set on the result do not leak back into the check manager
+    result = check_manager.as_dict(as_list=True)
+    displays = result["targets"][target][namespace]["displays"]
+    assert displays[0] is raw_display
+    assert isinstance(displays[1], Padding)
+    assert displays[1].renderable == padded_text
+    assert displays[1].left == 8
+    assert "displays" not in check_manager.as_dict()["targets"][target][namespace]
+    assert result["targets"][target][namespace]["evaluations"] == [{"status": CheckTaskStatus.success.value}]
+
+    # managers that do not collect displays drop them, evaluations are kept
+    check_manager = CheckManager(
+        check_name=generate_random_string(), check_desc=generate_random_string(), collect_displays=False
+    )
+    check_manager.add_target(target_name=target, namespace=namespace)
+    check_manager.add_target_eval(target_name=target, namespace=namespace, status=CheckTaskStatus.success.value)
+    check_manager.add_display(target_name=target, namespace=namespace, display=padded_text, padding=(0, 0, 0, 8))
+    assert not check_manager.target_displays
+    result = check_manager.as_dict(as_list=True)
+    assert "displays" not in result["targets"][target][namespace]
+    assert result["targets"][target][namespace]["evaluations"] == [{"status": CheckTaskStatus.success.value}]
@@ -4,6 +4,7 @@
 # Licensed under the MIT License. See License file in the project root for license information.
 # ----------------------------------------------------------------------------------------------
 
+from functools import partial
 from typing import List
 from unittest.mock import Mock
 
@@ -288,3 +289,29 @@ def test_check_pre_deployment(mocker, acs_config, storage_space_check):
     for idx, check in enumerate(expected_checks):
         assert result[idx]["name"] == check
         assert result[idx]["status"] == "success"
+
+
+@pytest.mark.parametrize("check_count", [0, 1, 5, 20])
+def test_run_checks_concurrently(check_count):
+    from threading import Barrier
+    from time import sleep
+
+    from azext_edge.edge.providers.check.base.deployment import run_checks_concurrently
+
+    # checks that finish in reverse order still produce results in submission order
+    barrier = Barrier(min(check_count, 8)) if check_count > 1 else None
+
+    def _check(index: int):
+        if barrier and index < barrier.parties:
+            barrier.wait(timeout=5)
+        sleep((check_count - index) * 0.001)
+        return {"name": f"check{index}"}
+
+    check_funcs = [partial(_check, index) for index in range(check_count)]
+    assert run_checks_concurrently(check_funcs) == [{"name": f"check{index}"} for index in range(check_count)]
+
+    def _failing_check():
+        raise ValueError("check failed")
+
+    with pytest.raises(ValueError):
+        run_checks_concurrently(check_funcs + [_failing_check])
@@ -37,13 +37,8 @@ def test_add_display_and_eval(mocked_check_manager, resource_name, namespace, pa
     kwargs = mocked_check_manager.add_display.call_args.kwargs
     assert kwargs["target_name"] == target_name
     assert kwargs["namespace"] == namespace
-    assert kwargs["display"].renderable == display_text
-    assert (
-        kwargs["display"].top,
-        kwargs["display"].right,
-        kwargs["display"].bottom,
-        kwargs["display"].left
-    ) == padding
+    assert kwargs["display"] == display_text
+    assert kwargs["padding"] == padding
 
     mocked_check_manager.add_target_eval.assert_called_once_with(
         target_name=target_name,
@@ -252,3 +252,23 @@ def test_check_nodes(mocked_node_client, kernel_version_check, storage_space_che
 
 def bool_to_status(status: bool):
     return "success" if status else "error"
+
+
+@pytest.mark.parametrize(
+    "mocked_node_client",
+    [[{"architecture": "amd64", "cpu": 4, "memory": "16G", "ephemeral-storage": "30G", "kernel_version": "5.4.0"}]],
+    indirect=True,
+)
+def test_check_nodes_not_as_list(mocker, mocked_node_client):
+    from azext_edge.edge.providers.check.base.node import check_nodes
+
+    mocked_table = mocker.patch("azext_edge.edge.providers.check.base.node.Table")
+    result = check_nodes(as_list=False)
+
+    # node evaluations are kept, the display table is never built
+    mocked_table.assert_not_called()
+    assert "displays" not in result["targets"]["cluster/nodes"]["_all_"]
+    assert result == check_nodes(as_list=True) | {"targets": result["targets"]}
+    node_targets = [target for target in result["targets"] if target.startswith("cluster/nodes/")]
+    assert len(node_targets) == 1
+    assert result["targets"][node_targets[0]]["_all_"]["status"] == "success"
@@ -14,6 +14,7 @@ from azext_edge.edge.providers.check.base import (
     filter_resources_by_name,
     generate_target_resource_name,
     get_resources_by_name,
+    get_valid_resource_names,
     get_resource_metadata_property,
     process_dict_resource,
     process_list_resource,
@@ -168,11 +169,15 @@ def test_generate_target_resource_name(api_info, resource_kind, expected_name):
             "test*",
             "namespace",
             [
-                {"metadata": {"name": "test1"}},
-                {"metadata": {"name": "test2"}},
-                {"metadata": {"name": "nontest"}},
+                {"metadata": {"name": "test1", "namespace": "namespace"}},
+                {"metadata": {"name": "test2", "namespace": "namespace"}},
+                {"metadata": {"name": "test3", "namespace": "other"}},
+                {"metadata": {"name": "nontest", "namespace": "namespace"}},
+            ],
+            [
+                {"metadata": {"name": "test1", "namespace": "namespace"}},
+                {"metadata": {"name": "test2", "namespace": "namespace"}},
             ],
-            [{"metadata": {"name": "test1"}}, {"metadata": {"name": "test2"}}],
         ),
         (
             "asset",
@@ -181,9 +186,23 @@ def test_generate_target_resource_name(api_info, resource_kind, expected_name):
             [
                 {"metadata": {"name": "asset1", "namespace": "default"}},
                 {"metadata": {"name": "asset2", "namespace": "default"}},
+                {"metadata": {"name": "asset1", "namespace": "other"}},
             ],
             [{"metadata": {"name": "asset1", "namespace": "default"}}],
         ),
+        (
+            "asset",
+            "ASSET1",
+            None,
+            [
+                {"metadata": {"name": "asset1", "namespace": "default"}},
+                {"metadata": {"name": "asset1", "namespace": "other"}},
+            ],
+            [
+                {"metadata": {"name": "asset1", "namespace": "default"}},
+                {"metadata": {"name": "asset1", "namespace": "other"}},
+            ],
+        ),
         (
             "asset",
             "nonexistent",
@@ -191,25 +210,41 @@ def test_generate_target_resource_name(api_info, resource_kind, expected_name):
             [{"metadata": {"name": "test1"}}, {"metadata": {"name": "test2"}}],
             [],
         ),
+        (
+            "asset",
+            None,
+            None,
+            [{"metadata": {"name": "test1"}}, {"metadata": {"name": "test2"}}],
+            [{"metadata": {"name": "test1"}}, {"metadata": {"name": "test2"}}],
+        ),
     ],
 )
 def test_get_resources_by_name(
     mocker, kind, resource_name, namespace, returned_resources, expected_filtered_resources
 ):
+    from azext_edge.edge.providers.check.base.resource_index import resource_index
+
     # Set up the mock
     api_info_patch = mocker.patch("azext_edge.edge.providers.edge_api.EdgeResourceApi")
     api_info_patch.get_resources.return_value = {"items": returned_resources}
 
-    patched = mocker.patch(
-        "azext_edge.edge.providers.check.base.resource.filter_resources_by_name",
-        return_value=expected_filtered_resources,
-    )
-
     result = get_resources_by_name(api_info_patch, kind, resource_name, namespace)
 
     # Assert the results
     assert result == expected_filtered_resources
-    patched.assert_called_once_with(returned_resources, resource_name)
+    api_info_patch.get_resources.assert_called_once_with(kind=kind)
+
+    # within a check run each kind is listed once regardless of the number of lookups
+    api_info_patch.get_resources.reset_mock()
+    with resource_index():
+        for _ in range(3):
+            assert get_resources_by_name(api_info_patch, kind, resource_name, namespace) == expected_filtered_resources
+        assert get_valid_resource_names(api_info_patch, kind, namespace) == [
+            resource["metadata"]["name"]
+            for resource in returned_resources
+            if not namespace or resource["metadata"].get("namespace") == namespace
+        ]
+    api_info_patch.get_resources.assert_called_once_with(kind=kind)
 
 
 @pytest.mark.parametrize(
@@ -317,7 +352,7 @@ def test_process_dict_resource(mocker, mocked_check_manager, resource, prop_name
     for call_args, expected in zip(call_args_list, expected_calls):
         assert call_args.kwargs["target_name"] == expected["target_name"]
         assert call_args.kwargs["namespace"] == expected["namespace"]
-        assert call_args.kwargs["display"].renderable == expected["displayText"]
+        assert call_args.kwargs["display"] == expected["displayText"]
 
     if any(isinstance(value, list) for value in resource.values()):
         assert mock_process_list_resource.called
@@ -408,7 +443,7 @@ def test_process_list_resource(mocker, mocked_check_manager, resource, expected_
     for call_args, expected in zip(call_args_list, expected_calls):
         assert call_args.kwargs["target_name"] == expected["target_name"]
         assert call_args.kwargs["namespace"] == expected["namespace"]
-        assert call_args.kwargs["display"].renderable == expected["displayText"]
+        assert call_args.kwargs["display"] == expected["displayText"]
 
     # Verify calls to process_dict_resource
     if any(isinstance(item, dict) for item in resource):
@@ -668,7 +703,7 @@ def test_process_resource_property_by_type(mocked_check_manager, properties, dis
         actual_call = call_args[1]  # call_args[1] contains the kwargs
         assert actual_call["target_name"] == expected["target_name"]
         assert actual_call["namespace"] == expected["namespace"]
-        assert actual_call["display"].renderable == expected["displayText"]
+        assert actual_call["display"] == expected["displayText"]
 
 
 @pytest.mark.parametrize(
@@ -773,7 +808,7 @@ def test_validate_one_of_conditions(
     for call_args, expected in zip(display_call_args_list, expected_display_calls):
         assert call_args.kwargs["target_name"] == expected["target_name"]
         assert call_args.kwargs["namespace"] == expected["namespace"]
-        assert call_args.kwargs["display"].renderable == expected["displayText"]
+        assert call_args.kwargs["display"] == expected["displayText"]
 
     # Verify the expected calls to check_manager.add_target_conditions
     assert mocked_check_manager.add_target_conditions.call_args_list == expected_conditions_calls
@@ -920,7 +955,7 @@ def test_process_custom_resource_status(
     # Verify the expected display texts
     display_call_args_list = mocked_check_manager.add_display.call_args_list
     for call_args, expected_text in zip(display_call_args_list, expected_display_texts):
-        assert call_args.kwargs["display"].renderable == expected_text
+        assert call_args.kwargs["display"] == expected_text
 
     # Verify the expected calls to add_target_conditions
     assert mocked_check_manager.add_target_conditions.call_args_list == expected_conditions_calls
@@ -13,8 +13,8 @@ from azext_edge.edge.providers.check.common import CoreServiceResourceKinds, Pod
 @pytest.fixture
 def mocked_check_manager(mocker):
     manager = mocker.patch("azext_edge.edge.providers.check.base.CheckManager", autospec=True)
-    # add `targets` attribute
-    manager.configure_mock(targets={})
+    # add `targets` and `collect_displays` attributes
+    manager.configure_mock(targets={}, collect_displays=True)
     return manager
 
 
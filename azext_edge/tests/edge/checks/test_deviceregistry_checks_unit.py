@@ -4,8 +4,10 @@
 # Licensed under the MIT License. See License file in the project root for license information.
 # ----------------------------------------------------------------------------------------------
 
+import re
+
 import pytest
-from azext_edge.edge.providers.check.common import ResourceOutputDetailLevel
+from azext_edge.edge.providers.check.common import MAX_ASSET_ITEM_OFFENDERS, ResourceOutputDetailLevel
 from azext_edge.edge.providers.check.deviceregistry import evaluate_assets, evaluate_asset_endpoint_profiles
 from azext_edge.edge.providers.edge_api.deviceregistry import DeviceRegistryResourceKinds
 
@@ -291,6 +293,12 @@ def test_assets_checks(
         asset['metadata']['namespace'] = namespace
     result = evaluate_assets(detail_level=detail_level, resource_name=resource_name)
 
+    # below verbose, per item evaluations are aggregated into detected and missing counts
+    if detail_level != ResourceOutputDetailLevel.verbose.value:
+        namespace_evaluations = [
+            [_to_aggregated_item_eval(*eval) for eval in evals] for evals in namespace_evaluations
+        ]
+
     assert result["name"] == "evalAssets"
     assert result["targets"]["deviceregistry.microsoft.com"]
     target = result["targets"]["deviceregistry.microsoft.com"]
@@ -303,6 +311,62 @@ def test_assets_checks(
         assert_evaluations(target[namespace], namespace_evaluations)
 
 
+def _to_aggregated_item_eval(path: str, expected):
+    item_path = re.fullmatch(r"value/(.+)\.\[\d+\]\.(\w+)", path)
+    if not item_path:
+        return (path, expected)
+    return (f"value/{item_path.group(1)}.{item_path.group(2)}/missing", 0 if expected else 1)
+
+
+@pytest.mark.parametrize("detail_level", ResourceOutputDetailLevel.list())
+@pytest.mark.parametrize("missing_every", [1, 7, 1500])
+def test_assets_checks_large_asset(
+    mocker, mock_generate_deviceregistry_asset_target_resources, detail_level, missing_every
+):
+    data_points_count = 1500
+    data_points = [
+        {"name": f"datapoint-{index}", "dataSource": f"ns=3;s={index}"} if index % missing_every else
+        {"name": f"datapoint-{index}"}
+        for index in range(data_points_count)
+    ]
+    namespace = generate_random_string()
+    asset = {
+        "metadata": {"name": "asset-1", "namespace": namespace},
+        "spec": {"assetEndpointProfileRef": "endpoint", "datasets": [{"dataPoints": data_points}]},
+    }
+    mocker.patch(
+        "azext_edge.edge.providers.edge_api.base.EdgeResourceApi.get_resources",
+        side_effect=[{"items": [asset]}, {"items": [{"metadata": {"name": "endpoint"}, "spec": {}}]}],
+    )
+
+    result = evaluate_assets(as_list=True, detail_level=detail_level, resource_name="asset-1")
+    target = result["targets"]["deviceregistry.microsoft.com"][namespace]
+    evaluations = target["evaluations"]
+    missing_indices = list(range(0, data_points_count, missing_every))
+
+    if detail_level == ResourceOutputDetailLevel.verbose.value:
+        item_evals = evaluations[2:]
+        assert len(item_evals) == data_points_count
+        assert [idx for idx, item in enumerate(item_evals) if item["status"] == "error"] == missing_indices
+        return
+
+    # endpoint profile, data point count and one aggregated data source evaluation
+    assert len(evaluations) == 3
+    assert evaluations[2]["status"] == "error"
+    assert evaluations[2]["value"]["spec.datasets[0].dataPoints.dataSource"] == {
+        "detected": data_points_count - len(missing_indices),
+        "missing": len(missing_indices),
+        "firstMissing": missing_indices[:MAX_ASSET_ITEM_OFFENDERS],
+    }
+    display_text = target["displays"][-1].renderable
+    assert f"for {len(missing_indices)} of {data_points_count} data points" in display_text
+    assert "datapoint-0" in display_text
+    if len(missing_indices) > MAX_ASSET_ITEM_OFFENDERS:
+        assert f"and {len(missing_indices) - MAX_ASSET_ITEM_OFFENDERS} more" in display_text
+    else:
+        assert "more" not in display_text
+
+
 @pytest.mark.parametrize("detail_level", ResourceOutputDetailLevel.list())
 @pytest.mark.parametrize(
     "resource_name",
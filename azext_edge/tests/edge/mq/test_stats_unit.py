@@ -25,6 +25,7 @@ from azext_edge.edge.providers.proto.diagnostics_service_pb2 import (
 )
 
 from ...generators import generate_random_string
+from ...helpers import build_recv_into
 from .traces_data import TEST_TRACE, TEST_TRACE_PARTIAL
 
 
@@ -153,7 +154,9 @@ def test_get_traces(
     request_len_b = len(serialized_request).to_bytes(4, byteorder="big")
 
     portforward_socket_mock = mocker.patch("azext_edge.edge.providers.stats.portforward_socket")
-    portforward_socket_mock().__enter__().recv.side_effect = recv_side_effect
+    # parametrized frames are (length, payload) pairs, only the payloads are served with real length prefixes
+    stream = b"".join(len(payload).to_bytes(4, byteorder="big") + payload for payload in recv_side_effect[1::2])
+    portforward_socket_mock().__enter__().recv_into.side_effect = build_recv_into(stream, max_chunk=1000)
     result = get_traces(
         namespace=namespace, trace_ids=trace_ids, trace_dir=trace_dir
     )
@@ -187,65 +190,161 @@ def test_get_traces(
     # pylint: enable=unnecessary-dunder-call
 
 
-@pytest.mark.parametrize(
-    "total_bytes,fetch_bytes",
-    [
-        pytest.param(10, 10),
-        pytest.param(10, 5),
-        pytest.param(10, 1),
-        pytest.param(10, 3),
-        pytest.param(10, 0),
-        pytest.param(10, -1),  # -1 is a special value to exercise partial fetching of bytes
-    ],
-)
-def test__fetch_bytes(mocker, total_bytes: int, fetch_bytes: int):
-    import math
-    import secrets
+def _build_trace_frames(count: int) -> list:
+    frames = []
+    for i in range(count):
+        trace_data = deepcopy(TEST_TRACE.data)
+        for resource_span in trace_data["resourceSpans"]:
+            for span in resource_span["scopeSpans"][0]["spans"]:
+                if "parentSpanId" not in span:
+                    span["name"] = f"root{i}"
+        frames.append(
+            Response(
+                retrieved_trace=RetrievedTraceWrapper(
+                    trace=ParseDict(trace_data, TracesData()),
+                    current_trace_count=i + 1,
+                    total_trace_count=count,
+                )
+            ).SerializeToString()
+        )
+    return frames
 
-    from azext_edge.edge.providers.stats import _fetch_bytes
 
-    if fetch_bytes > 0:
-        total_fetches = math.ceil(total_bytes / fetch_bytes)
-    elif fetch_bytes == 0:
-        total_fetches = 1
-    elif fetch_bytes == -1:
-        total_fetches = 2
-    else:
-        raise RuntimeError("Unsupported scenario.")
+@pytest.mark.parametrize("pool_min_traces", [1, 1000])
+def test__process_trace_frames(mocker, pool_min_traces: int):
+    from concurrent.futures import ThreadPoolExecutor
+    from queue import Queue
 
-    socket_mock = mocker.MagicMock()
+    from azext_edge.edge.providers.stats import _process_trace_frames
 
-    handle_fetch_count = 0
-
-    def handle_fetch(*args, **kwargs):
-        nonlocal handle_fetch_count
-        if args[0] >= fetch_bytes:
-            if fetch_bytes == -1:
-                if handle_fetch_count > 0:
-                    return_bytes = 0
-                else:
-                    return_bytes = 1
-            else:
-                return_bytes = fetch_bytes
-        else:
-            return_bytes = args[0]
-
-        handle_fetch_count = handle_fetch_count + 1
-        return secrets.token_bytes(return_bytes)
-
-    socket_mock.recv.side_effect = handle_fetch
-    result = _fetch_bytes(socket_mock, size=total_bytes)
-    assert socket_mock.recv.call_count == total_fetches
-
-    if fetch_bytes == 0:
-        assert result == b""
-        return
+    mocker.patch("azext_edge.edge.providers.stats.TRACE_PROCESS_POOL_MIN_TRACES", pool_min_traces)
+    pool_patch = mocker.patch(
+        "azext_edge.edge.providers.stats.ProcessPoolExecutor",
+        side_effect=lambda max_workers, mp_context: ThreadPoolExecutor(max_workers=max_workers),
+    )
 
-    if fetch_bytes == -1:
-        assert len(result) == 1
-        return
+    trace_count = 20
+    frames = Queue()
+    for response_bytes in _build_trace_frames(trace_count):
+        frames.put((trace_count, response_bytes))
+    frames.put(None)
+
+    totals = []
+    processed = []
+    assert _process_trace_frames(
+        frames=frames,
+        include_trace=True,
+        include_entries=True,
+        on_total=totals.append,
+        on_processed=processed.append,
+    )
+    assert totals == [trace_count]
+    assert pool_patch.call_count == (1 if pool_min_traces <= trace_count else 0)
+
+    # results are delivered in frame order regardless of which worker decoded them
+    assert len(processed) == trace_count
+    for i, (msg_dict, entries) in enumerate(processed):
+        assert msg_dict["resourceSpans"]
+        assert [zinfo.filename.split(".")[1] for zinfo, _ in entries] == [f"root{i}", f"root{i}"]
+        assert entries[0][0].filename.endswith(".otlp.pb")
+        assert entries[1][0].filename.endswith(".tempo.json")
+        assert "batches" in entries[1][1]
+
+
+def test__process_trace_frames_socket_closed():
+    from queue import Queue
+
+    from azext_edge.edge.providers.stats import _process_trace_frames
+
+    frames = Queue()
+    frames.put((2, _build_trace_frames(2)[0]))
+    frames.put((2, b""))
+
+    processed = []
+    assert not _process_trace_frames(
+        frames=frames,
+        include_trace=False,
+        include_entries=True,
+        on_total=lambda _: None,
+        on_processed=processed.append,
+    )
+    assert len(processed) == 1
 
-    assert len(result) == total_bytes
+
+def test__read_trace_frames(mocker):
+    from queue import Queue
+    from threading import Event
+
+    from azext_edge.edge.providers.stats import _read_trace_frames
+
+    trace_count = 3
+    response_frames = _build_trace_frames(trace_count)
+    socket_mock = mocker.MagicMock()
+    stream = b"".join(len(r).to_bytes(length=4, byteorder="big") + r for r in response_frames)
+    socket_mock.recv_into.side_effect = build_recv_into(stream)
+
+    frames = Queue()
+    _read_trace_frames(socket_mock, frames, Event())
+    assert [frames.get() for _ in range(trace_count)] == [(trace_count, r) for r in response_frames]
+    assert frames.get() is None
+
+    # read failures are handed to the consumer
+    socket_mock.recv_into.side_effect = ConnectionResetError()
+    _read_trace_frames(socket_mock, frames, Event())
+    assert isinstance(frames.get(), ConnectionResetError)
+
+
+def test_trace_filter():
+    from datetime import datetime, timedelta, timezone
+
+    from azext_edge.edge.providers.stats import TraceFilter, _process_trace_frame
+
+    traces_data = ParseDict(TEST_TRACE.data, TracesData())
+    root_span = [
+        span
+        for resource_span in traces_data.resource_spans
+        for scope_span in resource_span.scope_spans
+        for span in scope_span.spans
+        if not span.parent_span_id
+    ][0]
+    root_start = datetime.fromtimestamp(root_span.start_time_unix_nano / 1e9, tz=timezone.utc)
+    root_duration_ms = (root_span.end_time_unix_nano - root_span.start_time_unix_nano) / 1e6
+    span_names = {
+        span.name
+        for resource_span in traces_data.resource_spans
+        for scope_span in resource_span.scope_spans
+        for span in scope_span.spans
+    }
+    child_span_name = next(name for name in span_names if name != root_span.name)
+
+    assert TraceFilter().matches(traces_data)
+    assert TraceFilter(service_names=[TEST_TRACE.resource_name]).matches(traces_data)
+    assert not TraceFilter(service_names=[generate_random_string()]).matches(traces_data)
+    assert TraceFilter(span_names=[child_span_name]).matches(traces_data)
+    assert not TraceFilter(span_names=[generate_random_string()]).matches(traces_data)
+    assert TraceFilter(start_time=root_start - timedelta(seconds=1)).matches(traces_data)
+    assert not TraceFilter(start_time=root_start + timedelta(seconds=1)).matches(traces_data)
+    assert TraceFilter(end_time=root_start + timedelta(seconds=1)).matches(traces_data)
+    assert not TraceFilter(end_time=root_start - timedelta(seconds=1)).matches(traces_data)
+    # naive datetimes are treated as UTC
+    assert TraceFilter(start_time=root_start.replace(tzinfo=None) - timedelta(seconds=1)).matches(traces_data)
+    assert TraceFilter(min_duration_ms=root_duration_ms).matches(traces_data)
+    assert not TraceFilter(min_duration_ms=root_duration_ms + 1).matches(traces_data)
+    assert TraceFilter(sample_rate=1).matches(traces_data)
+    assert not TraceFilter(sample_rate=0).matches(traces_data)
+
+    # root span dependent filters do not match partial traces
+    partial_traces_data = ParseDict(TEST_TRACE_PARTIAL.data, TracesData())
+    partial_service_name = TEST_TRACE_PARTIAL.data["resourceSpans"][0]["resource"]["attributes"][0]["value"]
+    assert TraceFilter(service_names=[partial_service_name["stringValue"]]).matches(partial_traces_data)
+    assert not TraceFilter(sample_rate=1).matches(partial_traces_data)
+
+    # filtered traces are dropped before conversion
+    response_bytes = Response(
+        retrieved_trace=RetrievedTraceWrapper(trace=traces_data, current_trace_count=1, total_trace_count=1)
+    ).SerializeToString()
+    assert _process_trace_frame(response_bytes, True, True, TraceFilter(sample_rate=1))
+    assert _process_trace_frame(response_bytes, True, True, TraceFilter(sample_rate=0)) is None
 
 
 def test___determine_root_span():
@@ -33,12 +33,6 @@ def mocked_instance(mocker):
     yield patched()
 
 
-@pytest.fixture
-def mocked_sleep(mocker):
-    patched = mocker.patch("azext_edge.edge.util.az_client.sleep", return_value=None)
-    yield patched
-
-
 @pytest.fixture
 def mocked_cl_resources(mocker):
     patched = mocker.patch(
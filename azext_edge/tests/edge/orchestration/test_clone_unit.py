@@ -32,16 +32,20 @@ from azext_edge.edge.common import (
 )
 from azext_edge.edge.providers.orchestration.clone import (
     DEPLOYMENT_CHUNK_LEN,
+    RESTORE_MAX_CONCURRENCY,
     SERVICE_ACCOUNT_DATAFLOW,
     SERVICE_ACCOUNT_SECRETSYNC,
     TEMPLATE_PARAMS_SET,
     CloneManager,
     InstanceRestore,
+    SplitDeployment,
+    TemplateContent,
     TemplateMode,
     VersionGuru,
     default_bundle_name,
     get_fc_name,
     parse_version,
+    write_json,
 )
 from azext_edge.edge.providers.orchestration.common import (
     EXTENSION_TYPE_ACS,
@@ -142,9 +146,25 @@ MOCK_SR_RESOURCE_ID = (
 
 @pytest.fixture
 def mock_open_write(mocker):
-    m = mock_open()
-    patched = mocker.patch("azext_edge.edge.providers.orchestration.clone.open", m)
-    yield patched
+    yield _mock_open_capture(mocker)
+
+
+def _mock_open_capture(mocker) -> Mock:
+    """
+    Patches open in clone. The content of each file written is kept in written, in open order.
+    """
+    from io import StringIO
+
+    written_files = []
+
+    class _WrittenFile(StringIO):
+        def close(self):
+            written_files.append(self.getvalue())
+            super().close()
+
+    patched = mocker.patch("azext_edge.edge.providers.orchestration.clone.open", side_effect=lambda **_: _WrittenFile())
+    patched.written = written_files
+    return patched
 
 
 @pytest.fixture
@@ -811,7 +831,7 @@ def test_clone_manager(
     target_path = PurePath(*write_to)
     template_content.write(target_path)
     mock_open_write.assert_called_once_with(file=f"{target_path}.json", mode="w", encoding="utf8")
-    mock_open_write().write.assert_called_once_with(json.dumps(content, indent=2))
+    assert mock_open_write.written == [json.dumps(content, indent=2)]
 
 
 @pytest.mark.parametrize(
@@ -944,7 +964,317 @@ def test_clone_scale(
     target_path = PurePath(*write_to)
     template_content.write(target_path)
     mock_open_write.assert_called_once_with(file=f"{target_path}.json", mode="w", encoding="utf8")
-    mock_open_write().write.assert_called_once_with(json.dumps(content, indent=2))
+    assert mock_open_write.written == [json.dumps(content, indent=2)]
+
+
+FETCH_DEPENDENCIES = {
+    "brokers": ["authns", "authzs", "listeners"],
+    "profiles": ["dataflows:profile0", "dataflows:profile1"],
+    "sscSpcs": ["sscIdentities"],
+}
+
+
+def _get_fetch_clone_manager(slow_keys: List[str]) -> Tuple[CloneManager, List[Tuple[str, str]], dict]:
+    """
+    Returns a clone manager with every remote fetch replaced by a fake, recording when each fetch starts and
+    ends. Fetches of slow_keys finish only once every other fetch they can run beside has finished.
+    """
+    from threading import Event, Lock
+
+    ext_loc_name = generate_random_string()
+    events: List[Tuple[str, str]] = []
+    events_lock = Lock()
+    fast_done = Event()
+    expected = {
+        "extensions": [{"name": "extension"}],
+        "brokers": [{"name": DEFAULT_BROKER}],
+        "endpoints": [{"name": "endpoint"}],
+        "profiles": [{"name": "profile0"}, {"name": "profile1"}],
+        "assetEndpoints": [{"name": "aep"}],
+        "assets": [{"name": "asset"}],
+        "sscSpcs": [
+            {"name": "spc", "extendedLocation": {"name": ext_loc_name}, "properties": {"clientId": "client"}},
+            {"name": "other", "extendedLocation": {"name": "other"}, "properties": {}},
+        ],
+        "sscSecretSyncs": [{"name": "sync", "extendedLocation": {"name": ext_loc_name}}],
+        "authns": [{"name": "authn"}],
+        "authzs": [{"name": "authz"}],
+        "listeners": [{"name": "listener"}],
+        "dataflows:profile0": [{"name": "dataflow0"}],
+        "dataflows:profile1": [{"name": "dataflow1"}],
+        "sscIdentities": [{"name": "identity"}],
+    }
+
+    # fetches which cannot start before a slow fetch ends
+    blocked_keys = {
+        key
+        for parent, children in FETCH_DEPENDENCIES.items()
+        if parent in slow_keys
+        for key in children
+    }
+
+    def _fetch(key: str) -> list:
+        with events_lock:
+            events.append(("start", key))
+        if key in slow_keys:
+            assert fast_done.wait(5)
+        with events_lock:
+            events.append(("end", key))
+            if all(("end", k) in events for k in expected if k not in slow_keys and k not in blocked_keys):
+                fast_done.set()
+        return expected[key]
+
+    clone_manager = CloneManager.__new__(CloneManager)
+    clone_manager.resource_group_name = generate_random_string()
+    clone_manager.instance_name = generate_random_string()
+    clone_manager.instance_record = {"extendedLocation": {"name": ext_loc_name.upper()}}
+    clone_manager.instances = Mock()
+    clone_manager.resource_map = Mock()
+    client = clone_manager.instances.iotops_mgmt_client
+    ssc_client = clone_manager.instances.ssc_mgmt_client
+    operation_keys = {
+        id(client.broker): "brokers",
+        id(client.dataflow_endpoint): "endpoints",
+        id(client.dataflow_profile): "profiles",
+        id(client.broker_authentication): "authns",
+        id(client.broker_authorization): "authzs",
+        id(client.broker_listener): "listeners",
+    }
+
+    def _list_instance_resources(operations, **kwargs):
+        key = operation_keys[id(operations)]
+        assert kwargs == ({"broker_name": DEFAULT_BROKER} if key in ["authns", "authzs", "listeners"] else {})
+        return _fetch(key)
+
+    clone_manager._list_instance_resources = _list_instance_resources
+    clone_manager.get_resources_of_type = lambda resource_type: _fetch(
+        "assetEndpoints" if resource_type.endswith("assetendpointprofiles") else "assets"
+    )
+    clone_manager.get_identities_by_client_id = lambda client_ids: _fetch("sscIdentities")
+    clone_manager.resource_map.connected_cluster.get_extensions_by_type.side_effect = lambda *_: _fetch("extensions")
+    client.dataflow.list_by_profile_resource.side_effect = lambda **kwargs: _fetch(
+        f"dataflows:{kwargs['dataflow_profile_name']}"
+    )
+    ssc_client.azure_key_vault_secret_provider_classes.list_by_resource_group.side_effect = lambda **_: _fetch(
+        "sscSpcs"
+    )
+    ssc_client.secret_syncs.list_by_resource_group.side_effect = lambda **_: _fetch("sscSecretSyncs")
+    return clone_manager, events, expected
+
+
+@pytest.mark.parametrize(
+    "slow_keys",
+    [
+        [],
+        # parents finishing last
+        ["brokers", "profiles", "sscSpcs"],
+        # earlier planned fetches finishing after later ones
+        ["extensions", "dataflows:profile0", "authns"],
+    ],
+)
+def test_clone_fetch_resources(slow_keys: List[str]):
+    clone_manager, events, expected = _get_fetch_clone_manager(slow_keys)
+    fetched = clone_manager._fetch_resources()
+
+    # dependent fetches start only after the fetch they depend on ends
+    for parent, children in FETCH_DEPENDENCIES.items():
+        for child in children:
+            assert events.index(("end", parent)) < events.index(("start", child))
+    assert len([event for event in events if event[0] == "start"]) == len(expected)
+
+    # keys and values are in planned order, regardless of completion order
+    assert list(fetched) == [
+        "extensions",
+        "brokers",
+        "endpoints",
+        "profiles",
+        "assetEndpoints",
+        "assets",
+        "sscSpcs",
+        "sscSecretSyncs",
+        "authns",
+        "authzs",
+        "listeners",
+        "sscIdentities",
+        "dataflows",
+    ]
+    assert fetched["dataflows"] == [{"name": "dataflow0"}, {"name": "dataflow1"}]
+    assert fetched["sscSpcs"] == expected["sscSpcs"][:1]
+    assert fetched["sscSecretSyncs"] == expected["sscSecretSyncs"]
+    for key in ["extensions", "brokers", "authns", "authzs", "listeners", "assets", "sscIdentities"]:
+        assert fetched[key] == expected[key]
+
+
+def _get_split_deployment_resource(key: str, rtype: str, depends_on: Optional[List[str]] = None) -> dict:
+    resource = {
+        "type": "Microsoft.Resources/deployments",
+        "name": f"[concat(parameters('resourceSlug'), '_{key}')]",
+        "properties": {"template": {"resources": [{"type": rtype, "name": generate_random_string()}]}},
+    }
+    if depends_on:
+        resource["dependsOn"] = depends_on
+    return resource
+
+
+def _get_deployment_id_expr(key: str) -> str:
+    return f"[resourceId('Microsoft.Resources/deployments', concat(parameters('resourceSlug'), '_{key}'))]"
+
+
+def test_template_content_split_deployments():
+    aep_type = "Microsoft.DeviceRegistry/assetEndpointProfiles"
+    asset_type = "Microsoft.DeviceRegistry/assets"
+    content = {
+        "parameters": {"clusterName": {"type": "string"}},
+        "resources": {
+            "instance": {"type": "Microsoft.IoTOperations/instances"},
+            "authns_1": _get_split_deployment_resource("authns_1", "Microsoft.IoTOperations/instances/brokers"),
+            "assetEndpointProfiles_1": _get_split_deployment_resource("assetEndpointProfiles_1", aep_type),
+            "assetEndpointProfiles_11": _get_split_deployment_resource("assetEndpointProfiles_11", aep_type),
+            "assets_1": _get_split_deployment_resource(
+                "assets_1", asset_type, [_get_deployment_id_expr("assetEndpointProfiles_11")]
+            ),
+            "assets_2": _get_split_deployment_resource(
+                "assets_2", asset_type, [_get_deployment_id_expr("assetEndpointProfiles_11")]
+            ),
+        },
+    }
+    split_deployments = TemplateContent(content).get_split_deployments()
+
+    assert [d.depends_on for d in split_deployments] == [(), (0,), (0,), (0, 2), (0, 2)]
+    assert set(split_deployments[0].content["resources"]) == {"instance", "authns_1"}
+    for deployment in split_deployments[1:]:
+        assert deployment.content["parameters"] == content["parameters"]
+    assert TemplateContent(content).get_split_content() == [d.content for d in split_deployments]
+
+
+def test_template_content_split_shares_model():
+    content = {
+        "parameters": {"clusterName": {"type": "string"}},
+        "resources": {
+            "instance": {"type": "Microsoft.IoTOperations/instances"},
+            "assets_1": _get_split_deployment_resource("assets_1", "Microsoft.DeviceRegistry/assets"),
+        },
+    }
+    expected_content = deepcopy(content)
+    template_content = TemplateContent(content)
+
+    assert template_content.get_deployment() == SplitDeployment(content=content, depends_on=())
+    assert template_content.get_deployment().content is content
+
+    root, assets = template_content.get_split_deployments()
+    assert root.content["resources"]["instance"] is content["resources"]["instance"]
+    assert assets.content["resources"] is content["resources"]["assets_1"]["properties"]["template"]["resources"]
+
+    root_content, linked = template_content._get_deployments("path")
+    assets_properties = root_content["resources"]["assets_1"]["properties"]
+    assert assets_properties == {"templateLink": {"relativePath": "path/assets_1.json"}}
+    assert linked == [("assets_1", content["resources"]["assets_1"]["properties"]["template"])]
+    # the model is left intact
+    assert content == expected_content
+
+
+def test_write_json(mocker):
+    mocked_open = _mock_open_capture(mocker)
+    content = {"resources": {generate_random_string(): {"value": [1, "two", None, {"ü": 3.5}]} for _ in range(50)}}
+
+    write_json(file_path="template.json", content=content)
+
+    mocked_open.assert_called_once_with(file="template.json", mode="w", encoding="utf8")
+    assert mocked_open.written == [json.dumps(content, indent=2)]
+
+
+def _get_restore_client(mocker, mocked_cmd: Mock) -> InstanceRestore:
+    mocker.patch("azext_edge.edge.providers.orchestration.clone.ConnectedCluster", autospec=True)
+    mocker.patch("azext_edge.edge.providers.orchestration.clone.get_resource_client", autospec=True)
+    return InstanceRestore(
+        cmd=mocked_cmd,
+        instances=Mock(),
+        instance_record={"name": generate_random_string()},
+        namespace=generate_random_string(),
+        parsed_cluster_id=parse_resource_id(
+            generate_resource_id(
+                resource_group_name=generate_random_string(),
+                resource_provider="Microsoft.Kubernetes",
+                resource_path=f"/connectedClusters/{generate_random_string()}",
+            )
+        ),
+        template_content=Mock(),
+    )
+
+
+def test_instance_restore_deploy_split(mocker, mocked_cmd: Mock):
+    mocked_sleep = mocker.patch("azext_edge.edge.providers.orchestration.clone.sleep")
+    restore_client = _get_restore_client(mocker, mocked_cmd)
+
+    # root, independent aep chunks, asset chunks waiting on the last aep chunk
+    aep_pages = RESTORE_MAX_CONCURRENCY + 2
+    deployment_work = [SplitDeployment(content={"page": 0}, depends_on=())]
+    deployment_work.extend(SplitDeployment(content={"page": i}, depends_on=(0,)) for i in range(1, aep_pages + 1))
+    deployment_work.extend(
+        SplitDeployment(content={"page": i}, depends_on=(0, aep_pages)) for i in range(aep_pages + 1, aep_pages + 3)
+    )
+
+    events = []
+    polls_to_done = {}
+
+    def _deploy_template(content: dict, parameters: dict, deployment_name: str):
+        page = content["page"]
+        events.append(("start", page))
+        polls_to_done[page] = 2
+        poller = Mock()
+
+        def _done():
+            polls_to_done[page] -= 1
+            return polls_to_done[page] <= 0
+
+        def _result():
+            events.append(("end", page))
+
+        poller.done.side_effect = _done
+        poller.result.side_effect = _result
+        return poller
+
+    mocker.patch.object(restore_client, "_deploy_template", side_effect=_deploy_template)
+    restore_client._deploy_split(
+        deployment_work=deployment_work,
+        parameters={},
+        deployment_name=generate_random_string(),
+        console=Mock(),
+    )
+
+    started = [page for event, page in events if event == "start"]
+    assert sorted(started) == list(range(len(deployment_work)))
+    running = set()
+    ended = set()
+    for event, page in events:
+        if event == "start":
+            assert all(dependency in ended for dependency in deployment_work[page].depends_on)
+            running.add(page)
+            assert len(running) <= RESTORE_MAX_CONCURRENCY
+        else:
+            running.remove(page)
+            ended.add(page)
+    # independent pages overlap
+    assert events.index(("start", 2)) < events.index(("end", 1))
+    assert mocked_sleep.called
+
+
+def test_instance_restore_deploy_throttled(mocker, mocked_cmd: Mock):
+    from azure.core.pipeline.policies import RetryPolicy
+
+    from azext_edge.edge.util.az_client import get_resource_client
+
+    restore_client = _get_restore_client(mocker, mocked_cmd)
+    begin_create = restore_client.resource_client.deployments.begin_create_or_update
+    assert restore_client._deploy_template(content={}, parameters={}, deployment_name="deployment") == (
+        begin_create.return_value
+    )
+    begin_create.assert_called_once()
+
+    # throttled submissions are retried by the client pipeline
+    retry_policy = get_resource_client(subscription_id=generate_random_string())._config.retry_policy
+    assert isinstance(retry_policy, RetryPolicy)
+    assert 429 in retry_policy._retry_on_status_codes
 
 
 @pytest.mark.parametrize("instance_features", [None, {"connectors": {"settings": {"preview": "Enabled"}, "mode": ""}}])
@@ -1219,7 +1549,7 @@ def test_clone_to_dir(
 
     if template_mode == TemplateMode.NESTED:
         mock_open_write.assert_called_once_with(file=f"{target_path}.json", mode="w", encoding="utf8")
-        mock_open_write().write.assert_called_once_with(json.dumps(content, indent=2))
+        assert mock_open_write.written == [json.dumps(content, indent=2)]
 
     if template_mode == TemplateMode.LINKED:
         assert mock_pathlib_path.mock_calls[0].args == (target_path,)
@@ -1229,7 +1559,7 @@ def test_clone_to_dir(
             "mode": "w",
             "encoding": "utf8",
         }
-        root_content = json.loads(mock_open_write().write.call_args_list[0].args[0])
+        root_content = json.loads(mock_open_write.written[0])
         asset_keys = [key for key in root_content["resources"] if "asset" in key]
         for key in asset_keys:
             asset_deployment = root_content["resources"][key]
@@ -1240,7 +1570,7 @@ def test_clone_to_dir(
                 assert template_link == {"uri": f"{linked_base_uri}/path/{key.lower()}.json"}
 
         # TODO: assert linked template content
-        # json.loads(mock_open_write().write.call_args_list[1].args[0])
+        # json.loads(mock_open_write.written[1])
         aep_pages = math.ceil(add_aeps / DEPLOYMENT_CHUNK_LEN)
         for i in range(aep_pages):
             assert mock_open_write.call_args_list[i + 1].kwargs == {
@@ -123,6 +123,27 @@ def test_connected_cluster_queries(
         """
     )
 
+    target_custom_locations = [generate_random_string(), generate_random_string()]
+    _assert_query_result(connected_cluster.get_aio_custom_location_resources(target_custom_locations))
+    mocked_resource_graph.return_value.query_resources.assert_called_with(
+        query=f"""
+        resources
+        | where type startswith 'microsoft.iotoperations'
+            or type startswith 'microsoft.deviceregistry'
+            or type startswith 'microsoft.secretsync'
+            or type =~ 'microsoft.extendedlocation/customlocations/resourcesyncrules'
+        | extend customLocationId = tolower(iff(
+            type =~ 'microsoft.extendedlocation/customlocations/resourcesyncrules',
+            substring(id, 0, indexof(tolower(id), '/resourcesyncrules/')),
+            tostring(extendedLocation.name)))
+        | where customLocationId in ('{target_custom_locations[0].lower()}', '{target_custom_locations[1].lower()}')
+        | project id, name, apiVersion, type, customLocationId
+        """
+    )
+    query_count = mocked_resource_graph.return_value.query_resources.call_count
+    assert connected_cluster.get_aio_custom_location_resources([]) is None
+    assert mocked_resource_graph.return_value.query_resources.call_count == query_count
+
     _assert_query_result(connected_cluster.get_resource_sync_rules(custom_location_id=target_custom_location))
     mocked_resource_graph.return_value.query_resources.assert_called_with(
         query=f"""
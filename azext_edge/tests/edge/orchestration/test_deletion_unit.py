@@ -38,12 +38,6 @@ def mocked_get_resource_client(mocker):
     yield patched
 
 
-@pytest.fixture
-def mocked_wait_for_terminal_states(mocker):
-    patched = mocker.patch("azext_edge.edge.providers.orchestration.deletion.wait_for_terminal_states", autospec=True)
-    yield patched
-
-
 @pytest.fixture
 def mocked_live_display(mocker):
     patched = mocker.patch("azext_edge.edge.providers.orchestration.deletion.Live")
@@ -59,7 +53,7 @@ def spy_deletion_manager(mocker):
         "_display_resource_tree": mocker.spy(DeletionManager, "_display_resource_tree"),
         "_render_display": mocker.spy(DeletionManager, "_render_display"),
         "_stop_display": mocker.spy(DeletionManager, "_stop_display"),
-        "_delete_batch": mocker.spy(DeletionManager, "_delete_batch"),
+        "_delete_resource": mocker.spy(DeletionManager, "_delete_resource"),
     }
 
 
@@ -103,7 +97,6 @@ def _assemble_resource_map_mock(
             "extensions": [generate_ops_resource()],
             "meta": {
                 "expected_total": 4,
-                "resource_batches": 1,
             },
         },
         {
@@ -118,12 +111,11 @@ def _assemble_resource_map_mock(
             "extensions": [generate_ops_resource(), generate_ops_resource()],
             "meta": {
                 "expected_total": 7,
-                "resource_batches": 3,
             },
         },
     ],
 )
-def test_batch_resources(
+def test_build_deletion_graph(
     mocker,
     mocked_cmd: Mock,
     mocked_get_resource_client: Mock,
@@ -140,29 +132,149 @@ def test_batch_resources(
         instance_name=instance_name,
         resource_group_name=rg_name,
     )
-    batches = deletion_manager._batch_resources(
+    graph = deletion_manager._build_deletion_graph(
         resources=expected_resources_map["resources"],
         resource_sync_rules=expected_resources_map["resource sync rules"],
         custom_locations=expected_resources_map["custom locations"],
         extensions=expected_resources_map["extensions"],
     )
+    assert len(graph) == expected_resources_map["meta"]["expected_total"]
+
+    # every resource of a later tier is blocked by every resource of the earlier tiers
+    tiers = [
+        (expected_resources_map["resources"] or []) + (expected_resources_map["resource sync rules"] or []),
+        expected_resources_map["custom locations"] or [],
+        expected_resources_map["extensions"] or [],
+    ]
+    prior_ids = set()
+    for tier in tiers:
+        tier_ids = {resource.resource_id.lower() for resource in tier}
+        for resource_id in tier_ids:
+            assert graph[resource_id][1] - tier_ids == prior_ids
+        prior_ids.update(tier_ids)
+
+
+def test_build_deletion_graph_children(mocked_cmd: Mock, mocked_get_resource_client: Mock, mocked_resource_map: Mock):
+    from azext_edge.edge.providers.orchestration.deletion import DeletionManager
+
+    instance = generate_ops_resource(2)
+    broker = IoTOperationsResource(f"{instance.resource_id}/brokers/default", "default", "api")
+    listener = IoTOperationsResource(f"{broker.resource_id}/listeners/Default", "listener", "api")
+    asset = generate_ops_resource(2)
+
+    deletion_manager = DeletionManager(
+        cmd=mocked_cmd, instance_name=generate_random_string(), resource_group_name=generate_random_string()
+    )
+    graph = deletion_manager._build_deletion_graph(resources=[listener, broker, instance, asset])
 
-    actual_total = 0
-    if expected_resources_map["resources"]:
-        assert "resources" in batches
-        assert expected_resources_map["meta"]["resource_batches"] == len(batches["resources"])
-        for batch in batches["resources"]:
-            actual_total += len(batch)
-            segments_set = set([r.segments for r in batch])
-            assert len(segments_set) == 1
+    # parents are blocked by their descendants present in the graph, unrelated resources are not blocked
+    assert graph[instance.resource_id.lower()][1] == {broker.resource_id.lower(), listener.resource_id.lower()}
+    assert graph[broker.resource_id.lower()][1] == {listener.resource_id.lower()}
+    assert graph[listener.resource_id.lower()][1] == set()
+    assert graph[asset.resource_id.lower()][1] == set()
+
+
+def test_build_deletion_graph_types(mocked_cmd: Mock, mocked_get_resource_client: Mock, mocked_resource_map: Mock):
+    from azext_edge.edge.providers.orchestration.deletion import DeletionManager
+
+    def _resource(resource_id: str) -> IoTOperationsResource:
+        return IoTOperationsResource(resource_id, resource_id.split("/")[-1], "api")
+
+    rg_id = f"/subscriptions/{generate_random_string()}/resourceGroups/{generate_random_string()}"
+    instance = _resource(f"{rg_id}/providers/Microsoft.IoTOperations/instances/{generate_random_string()}")
+    other_instance = _resource(f"{rg_id}/providers/Microsoft.IoTOperations/instances/{generate_random_string()}")
+    broker = _resource(f"{instance.resource_id}/brokers/default")
+    listener = _resource(f"{broker.resource_id}/listeners/default")
+    authn = _resource(f"{broker.resource_id}/authentications/default")
+    authz = _resource(f"{broker.resource_id}/authorizations/default")
+    endpoint = _resource(f"{instance.resource_id}/dataflowEndpoints/default")
+    dataflow = _resource(f"{instance.resource_id}/dataflowProfiles/default/dataflows/{generate_random_string()}")
+    other_dataflow = _resource(
+        f"{other_instance.resource_id}/dataflowProfiles/default/dataflows/{generate_random_string()}"
+    )
+    aep = _resource(f"{rg_id}/providers/Microsoft.DeviceRegistry/assetEndpointProfiles/{generate_random_string()}")
+    asset = _resource(f"{rg_id}/providers/Microsoft.DeviceRegistry/assets/{generate_random_string()}")
+
+    deletion_manager = DeletionManager(
+        cmd=mocked_cmd, instance_name=generate_random_string(), resource_group_name=generate_random_string()
+    )
+    graph = deletion_manager._build_deletion_graph(
+        resources=[dataflow, other_dataflow, listener, authn, authz, endpoint, broker, instance, aep, asset]
+    )
 
-    for map_key in ["resource sync rules", "custom locations", "extensions"]:
-        if expected_resources_map[map_key]:
-            assert map_key in batches
-            for batch in batches[map_key]:
-                actual_total += len(batch)
+    # referenced resources wait on the resources referencing them under the same parent
+    assert graph[endpoint.resource_id.lower()][1] == {dataflow.resource_id.lower()}
+    assert graph[authn.resource_id.lower()][1] == {listener.resource_id.lower()}
+    assert graph[authz.resource_id.lower()][1] == {listener.resource_id.lower()}
+    assert graph[aep.resource_id.lower()][1] == {asset.resource_id.lower()}
+    assert graph[broker.resource_id.lower()][1] == {
+        listener.resource_id.lower(),
+        authn.resource_id.lower(),
+        authz.resource_id.lower(),
+    }
+    for resource in [dataflow, other_dataflow, listener, asset]:
+        assert graph[resource.resource_id.lower()][1] == set()
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 2, 16])
+def test_delete_graph(
+    mocker, mocked_cmd: Mock, mocked_get_resource_client: Mock, mocked_resource_map: Mock, max_concurrency: int
+):
+    from azext_edge.edge.providers.orchestration.deletion import DeletionManager
+
+    mocker.patch("azext_edge.edge.providers.orchestration.deletion.sleep")
+    instance = generate_ops_resource(2)
+    broker = IoTOperationsResource(f"{instance.resource_id}/brokers/default", "default", "api")
+    assets = [generate_ops_resource(2) for _ in range(5)]
+    custom_location = generate_ops_resource()
+    extension = generate_ops_resource()
+
+    events = []
+    in_flight = set()
+    max_in_flight = 0
+
+    class FakePoller:
+        def __init__(self, resource_id: str):
+            self.resource_id = resource_id
+            self.checks = 0
+
+        def done(self):
+            # each deletion completes on its second check
+            self.checks += 1
+            return self.checks > 1
+
+        def result(self):
+            in_flight.discard(self.resource_id)
+            events.append(self.resource_id)
+
+    def begin_delete_by_id(resource_id: str, api_version: str):
+        nonlocal max_in_flight
+        in_flight.add(resource_id)
+        max_in_flight = max(max_in_flight, len(in_flight))
+        return FakePoller(resource_id)
+
+    mocked_get_resource_client.return_value.resources.begin_delete_by_id.side_effect = begin_delete_by_id
+
+    deletion_manager = DeletionManager(
+        cmd=mocked_cmd,
+        instance_name=generate_random_string(),
+        resource_group_name=generate_random_string(),
+        no_progress=True,
+        max_concurrency=max_concurrency,
+    )
+    graph = deletion_manager._build_deletion_graph(
+        resources=[broker, instance, *assets], custom_locations=[custom_location], extensions=[extension]
+    )
+    deletion_manager._delete_graph(graph)
 
-    assert actual_total == expected_resources_map["meta"]["expected_total"]
+    assert len(events) == len(graph)
+    assert max_in_flight <= max_concurrency
+    assert events.index(broker.resource_id) < events.index(instance.resource_id)
+    assert events.index(custom_location.resource_id) > max(events.index(r.resource_id) for r in [instance, *assets])
+    assert events[-1] == extension.resource_id
+    if max_concurrency > len(assets) + 1:
+        # resources without dependencies are deleted in the first wave, not behind the instance
+        assert set(events[: len(assets) + 1]) == {broker.resource_id, *[a.resource_id for a in assets]}
 
 
 # IoTOperationsResourceMap returns empty array over None
@@ -177,7 +289,6 @@ def test_batch_resources(
             "extensions": [],
             "meta": {
                 "expected_total": 0,
-                "expected_delete_calls": 1,  # aio extension
             },
         },
         {
@@ -187,8 +298,6 @@ def test_batch_resources(
             "extensions": [generate_ops_resource()],
             "meta": {
                 "expected_total": 5,
-                "resource_batches": 2,
-                "expected_delete_calls": 5,
             },
         },
         # Currently no associated custom location means no non-extensions get deleted
@@ -199,8 +308,6 @@ def test_batch_resources(
             "extensions": [generate_ops_resource()],
             "meta": {
                 "expected_total": 4,
-                "resource_batches": 2,
-                "expected_delete_calls": 1,
             },
         },
         {
@@ -210,8 +317,6 @@ def test_batch_resources(
             "extensions": [generate_ops_resource()],
             "meta": {
                 "expected_total": 1,
-                "resource_batches": 0,
-                "expected_delete_calls": 1,
                 "no_progress": True,
             },
         },
@@ -223,7 +328,6 @@ def test_delete_lifecycle(
     mocked_cmd: Mock,
     mocked_resource_map: Mock,
     mocked_get_resource_client: Mock,
-    mocked_wait_for_terminal_states: Mock,
     mocked_live_display: Mock,
     mocked_logger: Mock,
     spy_deletion_manager: Dict[str, Mock],
@@ -254,7 +358,16 @@ def test_delete_lifecycle(
 
     delete_ops_resources(**kwargs)
 
-    expected_delete_calls: int = expected_resources_map["meta"].get("expected_delete_calls", 0)
+    # resources are only found through custom locations, and only the aio extension is deleted without dependencies
+    expected_delete_calls = len({e.resource_id.lower() for e in mocked_resource_map().extensions})
+    if not include_dependencies:
+        expected_delete_calls = 1
+    if expected_resources_map["custom locations"]:
+        expected_delete_calls += (
+            len(expected_resources_map["custom locations"])
+            + len(expected_resources_map["resources"])
+            + len(expected_resources_map["resource sync rules"])
+        )
 
     spy_deletion_manager["_display_resource_tree"].assert_called_once()
     spy_deletion_manager["_process"].assert_called_once()
@@ -268,14 +381,14 @@ def test_delete_lifecycle(
         ]
     ):
         assert mocked_logger.warning.call_args[0][0] == "Nothing to delete :)"
-        spy_deletion_manager["_delete_batch"].assert_not_called()
+        spy_deletion_manager["_delete_resource"].assert_not_called()
         return
 
     if expected_delete_calls > 0:
         spy_deletion_manager["_render_display"].assert_called()
         spy_deletion_manager["_stop_display"].assert_called_once()
 
-    assert spy_deletion_manager["_delete_batch"].call_count == expected_delete_calls
+    assert spy_deletion_manager["_delete_resource"].call_count == expected_delete_calls
     assert mocked_live_display.call_count >= 1
 
     if kwargs["no_progress"]:
@@ -12,6 +12,7 @@ from random import randint
 import pytest
 from rich.tree import Tree
 
+from azext_edge.edge.providers.orchestration.connected_cluster import RESOURCE_SYNC_RULE_TYPE
 from azext_edge.edge.providers.orchestration.resource_map import IoTOperationsResource
 from azext_edge.edge.providers.orchestration.common import EXTENSION_TYPE_OPS
 
@@ -66,8 +67,23 @@ def _assemble_connected_cluster_mock(
     cluster_mock().resource_group_name = rg_name
     cluster_mock().get_aio_extensions.return_value = extensions
     cluster_mock().get_aio_custom_locations.return_value = custom_locations
-    cluster_mock().get_aio_resources.return_value = resources
-    cluster_mock().get_resource_sync_rules.return_value = sync_rules
+    # every custom location has the same resources and sync rules
+    cl_resources = []
+    for cl in custom_locations or []:
+        cl_resources.extend(
+            {**resource, "type": "microsoft.iotoperations/instances", "customLocationId": cl["id"].lower()}
+            for resource in resources or []
+        )
+        cl_resources.extend(
+            {**rule, "type": RESOURCE_SYNC_RULE_TYPE, "customLocationId": cl["id"].lower()}
+            for rule in sync_rules or []
+        )
+    # resources of unrelated custom locations are ignored
+    cl_resources.extend(
+        {**resource, "type": "microsoft.iotoperations/instances", "customLocationId": generate_random_string()}
+        for resource in _generate_records(2)
+    )
+    cluster_mock().get_aio_custom_location_resources.return_value = cl_resources
     cluster_mock().get_extensions_by_type.return_value = {EXTENSION_TYPE_OPS: aio_extension}
 
 
@@ -122,9 +138,15 @@ def test_resource_map(
     mocked_connected_cluster().get_aio_custom_locations.assert_called_once()
     _assert_ops_resource_eq(resource_map.custom_locations, expected_custom_locations)
 
-    cl_count = 0 if not expected_custom_locations else len(expected_custom_locations)
-    assert mocked_connected_cluster().get_aio_resources.call_count == cl_count
-    assert mocked_connected_cluster().get_resource_sync_rules.call_count == cl_count
+    # custom location resources are resolved in one batched query rather than per custom location
+    mocked_connected_cluster().get_aio_resources.assert_not_called()
+    mocked_connected_cluster().get_resource_sync_rules.assert_not_called()
+    if expected_custom_locations:
+        mocked_connected_cluster().get_aio_custom_location_resources.assert_called_once_with(
+            [cl["id"] for cl in expected_custom_locations]
+        )
+    else:
+        mocked_connected_cluster().get_aio_custom_location_resources.assert_not_called()
 
     if expected_custom_locations:
         for cl in expected_custom_locations:
@@ -4,8 +4,12 @@
 # Licensed under the MIT License. See License file in the project root for license information.
 # ----------------------------------------------------------------------------------------------
 
+from copy import deepcopy
 from typing import Dict, Optional
+import csv
+import io
 import json
+import os
 import pytest
 import responses
 
@@ -25,7 +29,9 @@ from azext_edge.edge.commands_assets import (
     remove_asset_data_point,
     add_asset_event,
     export_asset_events,
+    export_assets,
     import_asset_data_points,
+    import_assets,
     list_asset_events,
     remove_asset_event,
 )
@@ -1040,6 +1046,205 @@ def test_event_import(
     assert point_map[dup_name]["observabilityMode"] == point["observabilityMode"]
 
 
+@pytest.mark.parametrize("replace", [False, True])
+def test_asset_import(
+    mocker,
+    mocked_cmd,
+    mocked_responses: responses,
+    mocked_check_cluster_connectivity,
+    mocked_deserialize_file_content,
+    replace
+):
+    # remove logger warnings
+    mocker.patch("azext_edge.edge.providers.rpsaas.adr.assets.logger")
+    resource_group_name = generate_random_string()
+    file_path = generate_random_string()
+    same_asset, changed_asset, failed_asset = [generate_random_string() for _ in range(3)]
+    snapshot = {}
+    for asset_name in [same_asset, changed_asset, failed_asset]:
+        record = get_asset_record(asset_name=asset_name, asset_resource_group=resource_group_name)
+        record["properties"]["datasets"] = [{
+            "name": "default",
+            "dataPoints": [{"name": "point1", "dataSource": "nodeA"}]
+        }]
+        record["properties"]["events"] = []
+        # server populated values projected by Resource Graph
+        record["properties"].update(
+            {"provisioningState": "Succeeded", "status": {"errors": []}, "uuid": generate_random_string(), "version": 1}
+        )
+        snapshot[asset_name] = record
+    # two assets per snapshot query
+    mocker.patch("azext_edge.edge.providers.rpsaas.adr.assets.ASSET_IMPORT_QUERY_BATCH", 2)
+    records = list(snapshot.values())
+    mocked_pages = mocker.patch(
+        "azext_edge.edge.util.resource_graph.ResourceGraph.iter_partitioned_pages",
+        return_value=iter([records[:2], records[2:]])
+    )
+
+    # csv rows carry every column, with empty cells for the values a row does not set
+    file_content = "\n".join([
+        "Asset,Dataset,Name,Data Source,Event Notifier,Queue Size",
+        # same data-point as the cloud
+        f"{same_asset},,point1,nodeA,,",
+        # duplicate data-point that only lands on replace
+        f"{changed_asset},default,point1,nodeB,,",
+        f"{changed_asset.upper()},,event1,,notifier,2",
+        f"{failed_asset},,point2,nodeC,,",
+    ])
+    mocked_deserialize_file_content.return_value = list(csv.DictReader(io.StringIO(file_content)))
+    for asset_name, status in [(changed_asset, 200), (failed_asset, 400)]:
+        mocked_responses.add(
+            method=responses.PUT,
+            url=get_asset_mgmt_uri(asset_name=asset_name, asset_resource_group=resource_group_name),
+            json={"properties": {}},
+            status=status,
+            content_type="application/json",
+        )
+
+    result = import_assets(
+        cmd=mocked_cmd,
+        file_path=file_path,
+        resource_group_name=resource_group_name,
+        replace=replace,
+        wait_sec=0,
+    )
+
+    mocked_deserialize_file_content.assert_called_once_with(file_path=file_path)
+    queries = mocked_pages.call_args.kwargs["queries"]
+    assert len(queries) == 2
+    assert all(f"resourceGroup =~ \"{resource_group_name}\"" in query for query in queries)
+    assert all(any(f"\"{name}\"" in query for query in queries) for name in snapshot)
+
+    assert result["unchanged"] == [same_asset]
+    assert result["updated"] == [changed_asset]
+    assert list(result["failed"]) == [failed_asset]
+    # one connectivity check per custom location
+    assert mocked_check_cluster_connectivity.call_count == 1
+    # unchanged assets are never sent
+    assert len(mocked_responses.calls) == 2
+
+    request_bodies = {
+        call.request.url.split("?")[0].split("/")[-1]: json.loads(call.request.body) for call in mocked_responses.calls
+    }
+    assert same_asset not in request_bodies
+    changed_body = request_bodies[changed_asset]
+    assert set(changed_body) == {"location", "extendedLocation", "tags", "properties"}
+    assert not {"provisioningState", "status", "uuid", "version"}.intersection(changed_body["properties"])
+    assert changed_body["properties"]["datasets"][0]["dataPoints"] == [{
+        "name": "point1", "dataSource": "nodeB" if replace else "nodeA"
+    }]
+    assert changed_body["properties"]["events"] == [{
+        "name": "event1", "eventNotifier": "notifier", "eventConfiguration": "{\"queueSize\": 2}"
+    }]
+    failed_points = request_bodies[failed_asset]["properties"]["datasets"][0]["dataPoints"]
+    assert [point["name"] for point in failed_points] == ["point1", "point2"]
+
+
+def test_asset_import_error(
+    mocker,
+    mocked_cmd,
+    mocked_responses: responses,
+    mocked_deserialize_file_content,
+):
+    resource_group_name = generate_random_string()
+    asset_name = generate_random_string()
+    missing_asset = generate_random_string()
+    asset_record = get_asset_record(asset_name=asset_name, asset_resource_group=resource_group_name)
+    mocker.patch(
+        "azext_edge.edge.util.resource_graph.ResourceGraph.iter_partitioned_pages",
+        side_effect=lambda **_: iter([[asset_record]])
+    )
+    mocked_deserialize_file_content.return_value = [
+        {"Asset": asset_name, "Name": "point1", "Data Source": "nodeA"},
+        {"Asset": missing_asset, "Name": "point1", "Data Source": "nodeA"},
+    ]
+    with pytest.raises(InvalidArgumentValueError) as e:
+        import_assets(cmd=mocked_cmd, file_path=generate_random_string(), resource_group_name=resource_group_name)
+    assert missing_asset in e.value.error_msg
+
+    mocked_deserialize_file_content.return_value = [{"Name": "point1", "Data Source": "nodeA"}]
+    with pytest.raises(InvalidArgumentValueError):
+        import_assets(cmd=mocked_cmd, file_path=generate_random_string(), resource_group_name=resource_group_name)
+    assert not mocked_responses.calls
+
+
+def test_asset_import_empty_file(
+    mocker,
+    mocked_cmd,
+    mocked_responses: responses,
+    mocked_deserialize_file_content,
+):
+    mocked_send_raw_request = mocker.patch("azext_edge.edge.util.resource_graph.send_raw_request")
+    mocked_deserialize_file_content.return_value = []
+
+    result = import_assets(
+        cmd=mocked_cmd, file_path=generate_random_string(), resource_group_name=generate_random_string()
+    )
+    assert result == {"updated": [], "unchanged": [], "failed": {}}
+    mocked_send_raw_request.assert_not_called()
+    assert not mocked_responses.calls
+
+
+@pytest.mark.parametrize("extension", ["csv", "json"])
+@pytest.mark.parametrize("instance_name", [None, "myinstance"])
+def test_asset_export(mocker, mocked_cmd, tmp_path, extension, instance_name):
+    from azext_edge.edge.providers.rpsaas.adr.assets import _group_sub_points_by_asset
+    from azext_edge.edge.util import deserialize_file_content
+    resource_group_name = generate_random_string()
+    data_point = {
+        "name": generate_random_string(),
+        "dataSource": generate_random_string(),
+        "dataPointConfiguration": "{\"samplingInterval\": 100, \"queueSize\": 50}",
+        "observabilityMode": "Gauge",
+    }
+    event = {"name": generate_random_string(), "eventNotifier": generate_random_string()}
+    pages = [
+        [
+            {"name": "asset1", "properties": {"datasets": [{"name": "default", "dataPoints": [data_point]}]}},
+            {"name": "asset2", "properties": {"events": [event]}},
+        ],
+        [{"name": "asset3", "properties": {}}],
+    ]
+    original_pages = deepcopy(pages)
+    mocked_pages = mocker.patch(
+        "azext_edge.edge.util.resource_graph.ResourceGraph.iter_resource_pages", return_value=iter(pages)
+    )
+
+    result = export_assets(
+        cmd=mocked_cmd,
+        extension=extension,
+        instance_name=instance_name,
+        output_dir=str(tmp_path),
+        resource_group_name=resource_group_name,
+    )
+
+    asset_query = f"Resources | where type =~\"Microsoft.DeviceRegistry/assets\" "\
+        f"| where resourceGroup =~ \"{resource_group_name}\" "\
+        "| extend customLocation = tostring(extendedLocation.name) "
+    expected_query = asset_query
+    if instance_name:
+        expected_query = "Resources | where type =~ 'microsoft.iotoperations/instances' "\
+            f"| where name =~ \"{instance_name}\" | extend customLocation = tostring(extendedLocation.name) "\
+            f"| project customLocation | join kind=innerunique ({asset_query}) on customLocation "\
+            "| project-away customLocation1"
+    mocked_pages.assert_called_once_with(
+        query=f"{expected_query} | project id, name, properties", partition_by_subscription=not instance_name
+    )
+    assert result == {
+        "file_path": os.path.join(str(tmp_path), f"assets_sub_points.{extension}"),
+        "assets": 3,
+        "dataPoints": 1,
+        "events": 1,
+    }
+    # exporting does not modify the assets
+    assert pages == original_pages
+
+    # the exported file can be imported
+    rows = list(deserialize_file_content(file_path=result["file_path"]))
+    grouped = _group_sub_points_by_asset(rows)
+    assert grouped == {"asset1": ({"default": [data_point]}, []), "asset2": ({}, [event])}
+
+
 @pytest.mark.parametrize("events_present", [True, False])
 def test_event_list(
     mocked_cmd,
@@ -6,6 +6,7 @@
 
 from functools import partial
 from typing import List
+from unittest.mock import Mock
 
 from azext_edge.edge.providers.support.arcagents import ARC_AGENTS
 from ...generators import generate_random_string
@@ -13,6 +14,12 @@ from ...generators import generate_random_string
 import pytest
 
 
+def mock_log_response(log: str) -> Mock:
+    response = Mock()
+    response.stream.side_effect = lambda *args, **kwargs: iter([log.encode()])
+    return response
+
+
 def add_pod_to_mocked_pods(
     mocked_client, expected_pod_map, mock_names: List[str] = None, mock_init_containers: bool = False
 ):
@@ -44,7 +51,15 @@ def add_pod_to_mocked_pods(
     pods_list = V1PodList(items=pod_list)
     mocked_client.CoreV1Api().list_pod_for_all_namespaces.return_value = pods_list
     mocked_client.CoreV1Api().list_namespaced_pod.return_value = pods_list
-    mocked_client.CoreV1Api().read_namespaced_pod_log.return_value = mock_log
+    mocked_client.CoreV1Api().read_namespaced_pod_log.return_value = mock_log_response(mock_log)
+
+
+@pytest.fixture
+def mocked_cluster_snapshot(mocker):
+    # Bundle tests assert selector based list calls, so bypass the shared cluster snapshot.
+    from contextlib import nullcontext
+
+    yield mocker.patch("azext_edge.edge.providers.support.snapshot.cluster_snapshot", nullcontext)
 
 
 @pytest.fixture
@@ -175,7 +190,7 @@ def mocked_list_pods(mocked_client):
 
     pods_list = V1PodList(items=pods)
     mocked_client.CoreV1Api().list_pod_for_all_namespaces.return_value = pods_list
-    mocked_client.CoreV1Api().read_namespaced_pod_log.return_value = mock_log
+    mocked_client.CoreV1Api().read_namespaced_pod_log.return_value = mock_log_response(mock_log)
 
     yield expected_pod_map
 
@@ -33,6 +33,7 @@ a_bundle_dir = f"support_test_{generate_random_string()}"
 
 def test_create_bundle_acsa(
     mocked_client,
+    mocked_cluster_snapshot,
     mocked_config,
     mocked_os_makedirs,
     mocked_zipfile,
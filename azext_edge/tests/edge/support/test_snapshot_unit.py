@@ -0,0 +1,201 @@
+# coding=utf-8
+# ----------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License file in the project root for license information.
+# ----------------------------------------------------------------------------------------------
+
+from typing import Dict, List, Optional
+
+import pytest
+from kubernetes.client.exceptions import ApiException
+from kubernetes.client.models import (
+    V1Container,
+    V1DeploymentList,
+    V1ObjectMeta,
+    V1Pod,
+    V1PodList,
+    V1PodSpec,
+    V1PodStatus,
+)
+
+from azext_edge.edge.providers.support.base import process_deployments, process_v1_pods
+from azext_edge.edge.providers.support.snapshot import (
+    OP_EQUALS,
+    OP_EXISTS,
+    OP_IN,
+    OP_NOT_EQUALS,
+    OP_NOT_EXISTS,
+    OP_NOT_IN,
+    ClusterSnapshot,
+    SelectorRequirement,
+    cluster_snapshot,
+    get_cluster_snapshot,
+    matches_requirements,
+    parse_selector,
+)
+
+from .conftest import mock_log_response
+
+
+def _pod(name: str, namespace: str, labels: Optional[Dict[str, str]] = None) -> V1Pod:
+    return V1Pod(
+        metadata=V1ObjectMeta(name=name, namespace=namespace, labels=labels),
+        spec=V1PodSpec(containers=[V1Container(name="container")]),
+        status=V1PodStatus(phase="Running"),
+    )
+
+
+@pytest.mark.parametrize(
+    "selector, expected",
+    [
+        (None, []),
+        ("", []),
+        ("app=broker", [SelectorRequirement("app", OP_EQUALS, {"broker"})]),
+        ("metadata.name==aio-opc", [SelectorRequirement("metadata.name", OP_EQUALS, {"aio-opc"})]),
+        ("app!=broker", [SelectorRequirement("app", OP_NOT_EQUALS, {"broker"})]),
+        (
+            "app.kubernetes.io/name in (aio-opc, opcplc)",
+            [SelectorRequirement("app.kubernetes.io/name", OP_IN, {"aio-opc", "opcplc"})],
+        ),
+        (
+            "app notin (a),tier=backend, !legacy, trust.cert-manager.io/bundle",
+            [
+                SelectorRequirement("app", OP_NOT_IN, {"a"}),
+                SelectorRequirement("tier", OP_EQUALS, {"backend"}),
+                SelectorRequirement("legacy", OP_NOT_EXISTS, set()),
+                SelectorRequirement("trust.cert-manager.io/bundle", OP_EXISTS, set()),
+            ],
+        ),
+    ],
+)
+def test_parse_selector(selector: Optional[str], expected: List[SelectorRequirement]):
+    assert parse_selector(selector) == expected
+
+
+@pytest.mark.parametrize(
+    "selector, labels, expected",
+    [
+        ("app in (a, b)", {"app": "b"}, True),
+        ("app in (a, b)", {"app": "c"}, False),
+        ("app in (a, b)", {}, False),
+        ("app notin (a, b)", {}, True),
+        ("app notin (a, b)", {"app": "a"}, False),
+        ("app=a,tier", {"app": "a", "tier": "x"}, True),
+        ("app=a,tier", {"app": "a"}, False),
+        ("!tier", {"app": "a"}, True),
+        ("!tier", {"tier": "a"}, False),
+        ("app!=a", {"app": "b"}, True),
+    ],
+)
+def test_matches_requirements(selector: str, labels: Dict[str, str], expected: bool):
+    assert matches_requirements(labels, parse_selector(selector)) is expected
+
+
+def test_cluster_snapshot_list_resources(mocker):
+    pods = V1PodList(
+        api_version="v1",
+        items=[
+            _pod("broker-0", "ns1", {"app": "broker"}),
+            _pod("broker-1", "ns2", {"app": "broker"}),
+            _pod("opc-0", "ns1", {"app": "opc", "tier": "edge"}),
+            _pod("unlabeled", "ns1"),
+        ],
+    )
+    fetch = mocker.Mock(return_value=pods)
+    snapshot = ClusterSnapshot()
+
+    def _names(**kwargs) -> List[str]:
+        result = snapshot.list_resources(kind="Pod", fetch=fetch, **kwargs)
+        assert isinstance(result, V1PodList)
+        assert result.api_version == "v1"
+        return [pod.metadata.name for pod in result.items]
+
+    assert _names() == ["broker-0", "broker-1", "opc-0", "unlabeled"]
+    assert _names(label_selector="app in (broker)") == ["broker-0", "broker-1"]
+    assert _names(label_selector="app=broker", namespace="ns2") == ["broker-1"]
+    assert _names(namespace="ns1", label_selector="!app") == ["unlabeled"]
+    assert _names(label_selector="tier") == ["opc-0"]
+    assert _names(field_selector="metadata.name=opc-0") == ["opc-0"]
+    assert _names(namespace="missing") == []
+
+    # returned item lists are not shared with the snapshot
+    snapshot.list_resources(kind="Pod", fetch=fetch).items.clear()
+    assert len(_names()) == 4
+
+    fetch.assert_called_once_with()
+    assert snapshot.list_calls == 1
+
+
+def test_cluster_snapshot_unsupported_field_selector(mocker):
+    fetch = mocker.Mock(return_value=V1PodList(items=[_pod("pod", "ns")]))
+    snapshot = ClusterSnapshot()
+
+    assert snapshot.list_resources(kind="Pod", fetch=fetch, field_selector="status.phase=Running") is None
+    fetch.assert_not_called()
+    assert snapshot.list_calls == 0
+
+
+def test_cluster_snapshot_forbidden(mocker):
+    fetch = mocker.Mock(side_effect=ApiException(status=403))
+    snapshot = ClusterSnapshot()
+
+    for _ in range(2):
+        assert snapshot.list_resources(kind="Pod", fetch=fetch, label_selector="app=broker") is None
+    # the denied list is not retried
+    fetch.assert_called_once_with()
+    assert snapshot.list_calls == 1
+
+    fetch.side_effect = ApiException(status=500)
+    with pytest.raises(ApiException):
+        snapshot.list_resources(kind="Deployment", fetch=fetch)
+
+
+def test_cluster_snapshot_context():
+    assert get_cluster_snapshot() is None
+    with cluster_snapshot() as snapshot:
+        assert get_cluster_snapshot() is snapshot
+    assert get_cluster_snapshot() is None
+
+
+def test_process_v1_pods_with_snapshot(mocker):
+    mocked_client = mocker.patch("azext_edge.edge.providers.support.base.client", autospec=True)
+    v1_api = mocked_client.CoreV1Api()
+    pod = _pod("aio-broker-0", "ns", {"app.kubernetes.io/name": "microsoft-iotoperations-mqttbroker"})
+    pod.spec.init_containers = [V1Container(name="init")]
+    v1_api.list_pod_for_all_namespaces.return_value = V1PodList(
+        api_version="v1", items=[pod, _pod("other", "ns", {"app": "other"})]
+    )
+    v1_api.read_namespaced_pod_log.return_value = mock_log_response("log")
+
+    with cluster_snapshot():
+        for _ in range(2):
+            processed = process_v1_pods(
+                directory_path="broker",
+                label_selector="app.kubernetes.io/name in (microsoft-iotoperations-mqttbroker)",
+                pod_prefix_for_init_container_logs=["aio-broker"],
+                capture_previous_logs=False,
+            )
+            assert [p["zinfo"] for p in processed] == [
+                "ns/broker/pod.aio-broker-0.yaml",
+                "ns/broker/pod.aio-broker-0.container.log",
+                "ns/broker/pod.aio-broker-0.init.log",
+            ]
+
+    v1_api.list_pod_for_all_namespaces.assert_called_once_with()
+    # init containers are not appended to the shared pod spec
+    assert [c.name for c in pod.spec.containers] == ["container"]
+
+
+def test_process_deployments_snapshot_forbidden(mocker):
+    mocked_client = mocker.patch("azext_edge.edge.providers.support.base.client", autospec=True)
+    apps_api = mocked_client.AppsV1Api()
+    apps_api.list_deployment_for_all_namespaces.side_effect = ApiException(status=403)
+    apps_api.list_namespaced_deployment.return_value = V1DeploymentList(items=[])
+
+    with cluster_snapshot():
+        process_deployments(directory_path="broker", label_selector="app=broker", namespace="ns")
+
+    apps_api.list_deployment_for_all_namespaces.assert_called_once_with()
+    apps_api.list_namespaced_deployment.assert_called_once_with(
+        namespace="ns", label_selector="app=broker", field_selector=None
+    )
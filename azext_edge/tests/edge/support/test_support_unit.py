@@ -7,9 +7,9 @@
 import copy
 import random
 from os.path import abspath, expanduser, join
-from typing import List, Optional, Union
+from typing import Any, List, Optional, Union
 from zipfile import ZipInfo
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock
 
 import pytest
 
@@ -63,6 +63,7 @@ a_bundle_dir = f"support_test_{generate_random_string()}"
 def test_create_bundle(
     mocked_client,
     mocked_cluster_resources,
+    mocked_cluster_snapshot,
     mocked_config,
     mocked_os_makedirs,
     mocked_zipfile,
@@ -502,6 +503,7 @@ def assert_list_pods(
                                 since_seconds=kwargs["since_seconds"],
                                 container=container_name,
                                 previous=previous_logs,
+                                _preload_content=False,
                             )
                             assert_zipfile_write(
                                 mocked_zipfile,
@@ -760,6 +762,11 @@ def assert_shared_kpis(mocked_client, mocked_zipfile):
 def assert_zipfile_write(mocked_zipfile, zinfo: Union[str, ZipInfo], data: str):
     # pylint: disable=unnecessary-dunder-call
     if isinstance(zinfo, str):
+        if zinfo.endswith(".log"):
+            # container logs are streamed into the archive
+            mocked_zipfile(file="").__enter__().open.assert_any_call(zinfo, mode="w", force_zip64=True)
+            mocked_zipfile(file="").__enter__().open().__enter__().write.assert_any_call(data.encode())
+            return
         mocked_zipfile(file="").__enter__().writestr.assert_any_call(
             zinfo_or_arcname=zinfo,
             data=data,
@@ -803,6 +810,18 @@ def test_get_bundle_path(mocked_os_makedirs):
     ],
     indirect=True,
 )
+@pytest.mark.parametrize(
+    "trace_filter_kwargs",
+    [
+        {},
+        {
+            "broker_trace_age_seconds": 60,
+            "broker_trace_services": ["aio-broker-frontend"],
+            "broker_trace_min_duration_ms": 10.5,
+            "broker_trace_sample_rate": 0.5,
+        },
+    ],
+)
 def test_create_bundle_mq_traces(
     mocked_client,
     mocked_cluster_resources,
@@ -822,9 +841,15 @@ def test_create_bundle_mq_traces(
     mocked_mq_active_api,
     mocked_mq_get_traces,
     mocked_get_config_map,
+    trace_filter_kwargs,
 ):
+    # trace filters imply --broker-traces
     result = support_bundle(
-        None, ops_services=[OpsServiceType.mq.value], bundle_dir=a_bundle_dir, include_mq_traces=True
+        None,
+        ops_services=[OpsServiceType.mq.value],
+        bundle_dir=a_bundle_dir,
+        include_mq_traces=not trace_filter_kwargs,
+        **trace_filter_kwargs,
     )
 
     assert result["bundlePath"]
@@ -833,6 +858,15 @@ def test_create_bundle_mq_traces(
 
     assert get_trace_kwargs["namespace"] == "mock_namespace"  # TODO: Not my favorite
     assert get_trace_kwargs["trace_ids"] == ["!support_bundle!"]  # TODO: Magic string
+    trace_filter = get_trace_kwargs["trace_filter"]
+    if not trace_filter_kwargs:
+        assert trace_filter is None
+    else:
+        assert trace_filter.start_time
+        assert trace_filter.service_names == trace_filter_kwargs["broker_trace_services"]
+        assert trace_filter.span_names is None
+        assert trace_filter.min_duration_ms == trace_filter_kwargs["broker_trace_min_duration_ms"]
+        assert trace_filter.sample_rate == trace_filter_kwargs["broker_trace_sample_rate"]
     test_zipinfo = ZipInfo("mock_namespace/broker/traces/trace_key")
     test_zipinfo.file_size = 0
     test_zipinfo.compress_size = 0
@@ -849,6 +883,7 @@ def test_create_bundle_mq_traces(
 def test_create_bundle_arc_agents(
     mocked_client,
     mocked_cluster_resources,
+    mocked_cluster_snapshot,
     mocked_config,
     mocked_os_makedirs,
     mocked_zipfile,
@@ -907,6 +942,7 @@ def test_create_bundle_arc_agents(
 
 def test_create_bundle_schemas(
     mocked_client,
+    mocked_cluster_snapshot,
     mocked_config,
     mocked_os_makedirs,
     mocked_zipfile,
@@ -964,3 +1000,545 @@ def test_create_bundle_schemas(
         directory_path=SCHEMAS_DIRECTORY_PATH,
         label_selector=SCHEMAS_NAME_LABEL,
     )
+
+
+def test_create_bundle_schemas_snapshot(
+    mocked_client,
+    mocked_config,
+    mocked_os_makedirs,
+    mocked_zipfile,
+    mocked_list_config_maps,
+    mocked_list_statefulsets,
+    mocked_list_services,
+    mocked_list_nodes,
+    mocked_list_cluster_events,
+    mocked_list_storage_classes,
+    mocked_list_persistent_volume_claims,
+    mocked_root_logger,
+    mocked_get_config_map,
+):
+    from kubernetes.client.models import V1Container, V1ObjectMeta, V1Pod, V1PodList, V1PodSpec, V1PodStatus
+
+    from .conftest import mock_log_response
+
+    def _pod(name: str, labels: dict) -> V1Pod:
+        return V1Pod(
+            metadata=V1ObjectMeta(name=name, namespace="namespace", labels=labels),
+            spec=V1PodSpec(containers=[V1Container(name="container")]),
+            status=V1PodStatus(phase="Running"),
+        )
+
+    v1_api = mocked_client.CoreV1Api()
+    v1_api.list_pod_for_all_namespaces.return_value = V1PodList(
+        items=[
+            _pod("aio-schemas-0", {"app.kubernetes.io/name": "microsoft-iotoperations-schemas"}),
+            _pod("other", {"app.kubernetes.io/name": "other"}),
+        ]
+    )
+    v1_api.read_namespaced_pod_log.return_value = mock_log_response("log")
+
+    support_bundle(None, ops_services=[OpsServiceType.schemaregistry.value], bundle_dir=a_bundle_dir)
+
+    # runtime resources are listed once, cluster-wide, and filtered locally
+    v1_api.list_pod_for_all_namespaces.assert_called_once_with()
+    v1_api.list_namespaced_pod.assert_not_called()
+    written = [
+        call.kwargs["zinfo_or_arcname"]
+        for call in mocked_zipfile(file="").__enter__().writestr.mock_calls  # pylint: disable=unnecessary-dunder-call
+    ]
+    assert f"namespace/{SCHEMAS_DIRECTORY_PATH}/pod.aio-schemas-0.yaml" in written
+    assert f"namespace/{SCHEMAS_DIRECTORY_PATH}/pod.other.yaml" not in written
+
+
+@pytest.mark.parametrize("max_workers", [None, 1, 4])
+def test_process_pending_work(max_workers: Optional[int]):
+    from threading import Event
+
+    from azext_edge.edge.providers.support_bundle import process_pending_work
+
+    release = Event()
+
+    def blocked():
+        release.wait(2)
+        return {"data": "first", "zinfo": "first.log"}
+
+    def failure():
+        raise RuntimeError("boom")
+
+    pending_work = {
+        "svc_a": {"first": blocked, "broken": failure},
+        "svc_b": {"second": lambda: {"data": "second", "zinfo": "second.log"}},
+    }
+    results = []
+    completed = []
+
+    def on_complete(service: str, element: str):
+        completed.append((service, element))
+        if len(completed) == 2:
+            release.set()
+
+    process_pending_work(
+        pending_work=pending_work,
+        on_result=lambda service, element, result, index: results.append(((service, element), result, index)),
+        max_workers=max_workers,
+        on_complete=on_complete,
+    )
+
+    assert sorted(completed) == [("svc_a", "broken"), ("svc_a", "first"), ("svc_b", "second")]
+    # results are handed over with the position of their element in pending work
+    assert sorted(results, key=lambda result: result[2]) == [
+        (("svc_a", "first"), {"data": "first", "zinfo": "first.log"}, 0),
+        (("svc_b", "second"), {"data": "second", "zinfo": "second.log"}, 2),
+    ]
+    if max_workers != 1:
+        # as they complete, without waiting on the blocked earlier element
+        assert results[0][0] == ("svc_b", "second")
+
+
+def test_process_pending_work_duplicate_zinfo(tmp_path):
+    from threading import Event
+    from zipfile import ZipFile
+
+    from azext_edge.edge.providers.support_bundle import BundleZipWriter, process_pending_work
+
+    release = Event()
+    written = Event()
+
+    def slow_first():
+        release.wait(2)
+        # only finishes once the later element's entry is in the archive
+        written.wait(2)
+        return {"data": "first", "zinfo": "shared.log"}
+
+    def fast_second():
+        release.set()
+        return [{"data": "second", "zinfo": "shared.log"}, {"data": "other", "zinfo": "other.log"}]
+
+    def write_element(service: str, element: str, result: Any, index: int):
+        writer.write_element(service, element, result, precedence=index)
+        written.set()
+
+    bundle_path = str(tmp_path / "bundle.zip")
+    with ZipFile(bundle_path, "w") as zip_file:
+        writer = BundleZipWriter(zip_file)
+        process_pending_work(
+            pending_work={"svc_a": {"first": slow_first}, "svc_b": {"second": fast_second}},
+            on_result=write_element,
+            max_workers=2,
+        )
+
+    # the earliest pending work element wins even though it finished last
+    with ZipFile(bundle_path) as zip_file:
+        assert zip_file.namelist() == ["other.log", "shared.log"]
+        assert zip_file.read("shared.log") == b"first"
+        assert zip_file.read("other.log") == b"other"
+
+
+def test_process_pending_work_timeout(mocked_root_logger):
+    from threading import Event
+
+    from azext_edge.edge.providers.support_bundle import process_pending_work
+
+    release = Event()
+    pending_work = {
+        "svc": {
+            "hung": lambda: release.wait(5),
+            "quick": lambda: {"data": "quick", "zinfo": "quick.log"},
+            "after": lambda: {"data": "after", "zinfo": "after.log"},
+        }
+    }
+    results = {}
+    completed = []
+
+    try:
+        # the hung element holds the only worker, work after it still runs once it is abandoned
+        process_pending_work(
+            pending_work=pending_work,
+            on_result=lambda _, element, result, __: results.update({element: result}),
+            max_workers=1,
+            element_timeout=1,
+            on_complete=lambda service, element: completed.append(element),
+        )
+    finally:
+        release.set()
+
+    assert sorted(completed) == ["after", "hung", "quick"]
+    mocked_root_logger.warning.assert_called_once()
+    assert results == {
+        "quick": {"data": "quick", "zinfo": "quick.log"},
+        "after": {"data": "after", "zinfo": "after.log"},
+    }
+
+
+def test_bundle_zip_writer():
+    from azext_edge.edge.providers.support_bundle import BundleZipWriter
+
+    zip_file = MagicMock()
+    writer = BundleZipWriter(zip_file)
+    writer.write({"data": {"kind": "Pod"}, "zinfo": "pod.yaml"})
+    writer.write([{"data": "log line", "zinfo": "pod.log"}, None, {"data": "", "zinfo": "empty.log"}])
+    # duplicate zinfo of the same or higher precedence is skipped
+    writer.write({"data": "other", "zinfo": "pod.log"})
+    writer.write(None)
+    # other entries are streamed in chunks
+    chunks = MagicMock()
+    chunks.__iter__.return_value = iter([b"chunk 1\n", b"chunk 2\n"])
+    writer.write({"data": chunks, "zinfo": "stream.log"})
+
+    assert zip_file.writestr.call_count == 2
+    zip_file.writestr.assert_any_call(zinfo_or_arcname="pod.yaml", data="kind: Pod\n")
+    zip_file.writestr.assert_any_call(zinfo_or_arcname="pod.log", data="log line")
+    zip_file.open.assert_called_once_with("stream.log", mode="w", force_zip64=True)
+    stream_entry = zip_file.open.return_value.__enter__.return_value
+    assert [call.args[0] for call in stream_entry.write.mock_calls] == [b"chunk 1\n", b"chunk 2\n"]
+    chunks.close.assert_called_once()
+
+
+@pytest.mark.parametrize("max_bytes", [None, 4, 10, 64])
+@pytest.mark.parametrize("tail_lines", [None, 10])
+def test_read_pod_container_log(mocker, max_bytes: Optional[int], tail_lines: Optional[int]):
+    from azext_edge.edge.providers.support.base import PodLog, _read_pod_container_log
+
+    # small chunks so long logs are spooled to disk and compacted
+    mocker.patch("azext_edge.edge.providers.support.base.POD_LOG_SPOOL_BYTES", 8)
+    mocker.patch("azext_edge.edge.providers.support.base.POD_LOG_CHUNK_BYTES", 3)
+    chunks = [f"line {i}\n".encode() for i in range(1, 10)]
+    v1_api = Mock()
+    v1_api.read_namespaced_pod_log.return_value.stream.return_value = iter(chunks)
+
+    log = _read_pod_container_log(
+        v1_api=v1_api,
+        pod_name="pod",
+        pod_namespace="namespace",
+        container_name="container",
+        since_seconds=60,
+        tail_lines=tail_lines,
+        max_bytes=max_bytes,
+    )
+
+    expected_kwargs = {"tail_lines": tail_lines} if tail_lines else {}
+    v1_api.read_namespaced_pod_log.assert_called_once_with(
+        name="pod",
+        namespace="namespace",
+        since_seconds=60,
+        container="container",
+        previous=False,
+        _preload_content=False,
+        **expected_kwargs,
+    )
+    v1_api.read_namespaced_pod_log.return_value.release_conn.assert_called_once()
+
+    assert isinstance(log, PodLog)
+    full_log = b"".join(chunks)
+    if max_bytes:
+        # the spool never holds more than twice max_bytes
+        assert log.end <= 2 * max_bytes
+    log_chunks = list(log)
+    assert log.spool.closed
+    if not max_bytes or max_bytes >= len(full_log):
+        assert b"".join(log_chunks) == full_log
+    else:
+        omitted = len(full_log) - max_bytes
+        assert len(log) == max_bytes
+        assert b"".join(log_chunks) == f"[log truncated, first {omitted} bytes omitted]\n".encode() + full_log[omitted:]
+
+
+def test_read_pod_container_log_error():
+    from azext_edge.edge.providers.support.base import _read_pod_container_log
+
+    v1_api = Mock()
+    v1_api.read_namespaced_pod_log.return_value.stream.side_effect = RuntimeError("connection reset")
+
+    with pytest.raises(RuntimeError):
+        _read_pod_container_log(v1_api=v1_api, pod_name="pod", pod_namespace="namespace", container_name="container")
+    v1_api.read_namespaced_pod_log.return_value.release_conn.assert_called_once()
+
+
+def test_capture_pod_container_logs_since_previous(mocker):
+    from kubernetes.client.models import V1Container
+
+    from azext_edge.edge.providers.support.base import _capture_pod_container_logs, pod_log_capture
+
+    mocker.patch("azext_edge.edge.providers.support.base.time", return_value=1000.0)
+    v1_api = Mock()
+    v1_api.read_namespaced_pod_log.return_value.stream.side_effect = lambda _: iter([b"line\n"])
+    log_targets = [("namespace", "pod", [V1Container(name="seen"), V1Container(name="new")])]
+
+    with pod_log_capture(previous_epochs={"namespace/dir/pod.pod.seen.log": 969.5}):
+        logs = _capture_pod_container_logs(
+            directory_path="dir", log_targets=log_targets, v1_api=v1_api, capture_previous_logs=False, since_seconds=600
+        )
+
+    since_seconds = {
+        call.kwargs["container"]: call.kwargs["since_seconds"] for call in v1_api.read_namespaced_pod_log.call_args_list
+    }
+    # containers captured by the previous bundle are read from its capture time, rounded up
+    assert since_seconds == {"seen": 31, "new": 600}
+    assert [log["captureEpoch"] for log in logs] == [1000.0, 1000.0]
+
+
+def test_bundle_zip_writer_delta():
+    import json
+
+    from azext_edge.edge.providers.support_bundle import BUNDLE_MANIFEST_NAME, BundleZipWriter
+
+    previous_manifest = {
+        "captureEpoch": 100.0,
+        "resources": {
+            "unchanged.yaml": "1",
+            "changed.yaml": "1",
+            "removed.yaml": "1",
+            "failed.yaml": "1",
+            "unselected.yaml": "1",
+        },
+        "elements": {
+            "svc/pods": ["changed.yaml", "removed.yaml", "unchanged.yaml"],
+            "svc/failed": ["failed.yaml"],
+            "other/pods": ["unselected.yaml"],
+        },
+        "logs": {"pod.log": 90.0, "quiet.log": 95.0},
+    }
+    zip_file = Mock()
+    writer = BundleZipWriter(zip_file, capture_epoch=200.0, previous_manifest=previous_manifest)
+    writer.write_element(
+        "svc",
+        "pods",
+        [
+            {"data": {"metadata": {"resourceVersion": "1"}}, "zinfo": "unchanged.yaml"},
+            {"data": {"metadata": {"resourceVersion": "2"}}, "zinfo": "changed.yaml"},
+            {"data": {"metadata": {"resourceVersion": "1"}}, "zinfo": "new.yaml"},
+            {"data": "new lines", "zinfo": "pod.log", "captureEpoch": 201.0},
+        ],
+    )
+    # svc/failed did not complete and other/pods was not selected for this capture
+    writer.write_manifest()
+
+    written = {call.kwargs["zinfo_or_arcname"]: call.kwargs["data"] for call in zip_file.writestr.mock_calls}
+    assert set(written) == {"changed.yaml", "new.yaml", "pod.log", BUNDLE_MANIFEST_NAME}
+    assert json.loads(written[BUNDLE_MANIFEST_NAME]) == {
+        "captureEpoch": 200.0,
+        "baseCaptureEpoch": 100.0,
+        "resources": {
+            "unchanged.yaml": "1",
+            "changed.yaml": "2",
+            "new.yaml": "1",
+            "failed.yaml": "1",
+            "unselected.yaml": "1",
+        },
+        "elements": {
+            "svc/pods": ["changed.yaml", "new.yaml", "unchanged.yaml"],
+            "svc/failed": ["failed.yaml"],
+            "other/pods": ["unselected.yaml"],
+        },
+        # logs without new lines keep their previous capture time
+        "logs": {"pod.log": 201.0, "quiet.log": 95.0},
+        # only resources of completed elements can be removed
+        "removed": ["removed.yaml"],
+    }
+
+
+def _write_bundle(path: str, entries: dict, manifest: dict):
+    import json
+    from zipfile import ZipFile
+
+    from azext_edge.edge.providers.support_bundle import BUNDLE_MANIFEST_NAME
+
+    with ZipFile(path, "w") as bundle_zip:
+        for name, data in entries.items():
+            bundle_zip.writestr(name, data)
+        bundle_zip.writestr(BUNDLE_MANIFEST_NAME, json.dumps(manifest))
+
+
+def test_merge_bundles(tmp_path):
+    from zipfile import ZipFile
+
+    from azext_edge.edge.providers.support_bundle import (
+        BUNDLE_MANIFEST_NAME,
+        merge_bundles,
+        read_bundle_manifest,
+    )
+
+    base_path = str(tmp_path / "base.zip")
+    delta_path = str(tmp_path / "delta.zip")
+    merged_path = str(tmp_path / "merged.zip")
+    _write_bundle(
+        base_path,
+        {
+            "unchanged.yaml": "unchanged",
+            "changed.yaml": "old",
+            "removed.yaml": "removed",
+            "pod.log": "line 1\nline 2\n",
+            "other.log": "line a\nline a",
+        },
+        {"captureEpoch": 100.0, "resources": {}},
+    )
+    delta_manifest = {"captureEpoch": 200.0, "baseCaptureEpoch": 100.0, "resources": {}, "removed": ["removed.yaml"]}
+    _write_bundle(
+        delta_path,
+        {
+            "changed.yaml": "new",
+            "added.yaml": "added",
+            # delta log windows may start before the end of the base log
+            "pod.log": "line 2\nline 3\n",
+            "other.log": "line a\nline b\n",
+        },
+        delta_manifest,
+    )
+
+    assert merge_bundles(base_path, delta_path, merged_path) == {"bundlePath": merged_path}
+
+    with ZipFile(merged_path) as merged_zip:
+        assert sorted(merged_zip.namelist()) == sorted(
+            ["unchanged.yaml", "changed.yaml", "added.yaml", "pod.log", "other.log", BUNDLE_MANIFEST_NAME]
+        )
+        assert merged_zip.read("unchanged.yaml") == b"unchanged"
+        assert merged_zip.read("changed.yaml") == b"new"
+        assert merged_zip.read("pod.log") == b"line 1\nline 2\nline 3\n"
+        assert merged_zip.read("other.log") == b"line a\nline a\nline b\n"
+    assert read_bundle_manifest(merged_path) == delta_manifest
+
+
+def test_merge_bundles_not_delta_of_base(tmp_path):
+    from azure.cli.core.azclierror import InvalidArgumentValueError
+
+    from azext_edge.edge.providers.support_bundle import merge_bundles
+
+    base_path = str(tmp_path / "base.zip")
+    delta_path = str(tmp_path / "delta.zip")
+    _write_bundle(base_path, {}, {"captureEpoch": 100.0, "resources": {}})
+    _write_bundle(delta_path, {}, {"captureEpoch": 200.0, "baseCaptureEpoch": 150.0, "resources": {}})
+
+    with pytest.raises(InvalidArgumentValueError):
+        merge_bundles(base_path, delta_path, str(tmp_path / "merged.zip"))
+
+
+def test_merge_support_bundles_command(mocker):
+    from azext_edge.edge.commands_edge import merge_support_bundles
+
+    mocked_merge = mocker.patch(
+        "azext_edge.edge.providers.support_bundle.merge_bundles", return_value={"bundlePath": "merged.zip"}
+    )
+    mocker.patch("azext_edge.edge.commands_edge.get_bundle_path", return_value="merged.zip")
+
+    assert merge_support_bundles(None, base_bundle="base.zip", delta_bundle="delta.zip") == {
+        "bundlePath": "merged.zip"
+    }
+    mocked_merge.assert_called_once_with(
+        base_bundle_path="base.zip", delta_bundle_path="delta.zip", file_path="merged.zip"
+    )
+
+
+def test_read_bundle_manifest_error(tmp_path):
+    from zipfile import ZipFile
+
+    from azure.cli.core.azclierror import FileOperationError
+
+    from azext_edge.edge.providers.support_bundle import read_bundle_manifest
+
+    no_manifest_path = str(tmp_path / "no_manifest.zip")
+    with ZipFile(no_manifest_path, "w") as bundle_zip:
+        bundle_zip.writestr("pod.log", "line")
+
+    for path in [no_manifest_path, str(tmp_path / "missing.zip")]:
+        with pytest.raises(FileOperationError):
+            read_bundle_manifest(path)
+
+
+def test_create_bundle_since_bundle(
+    mocker,
+    mocked_client,
+    mocked_cluster_snapshot,
+    mocked_config,
+    mocked_os_makedirs,
+    mocked_zipfile,
+    mocked_list_pods,
+    mocked_list_config_maps,
+    mocked_list_statefulsets,
+    mocked_list_services,
+    mocked_list_nodes,
+    mocked_list_cluster_events,
+    mocked_list_storage_classes,
+    mocked_list_persistent_volume_claims,
+    mocked_root_logger,
+    mocked_get_config_map,
+):
+    from time import time
+
+    previous_bundle = "previous_bundle.zip"
+    mocked_read_manifest = mocker.patch(
+        "azext_edge.edge.providers.support_bundle.read_bundle_manifest",
+        return_value={"captureEpoch": time() - 3600, "resources": {}, "elements": {}, "logs": {}},
+    )
+    support_bundle(
+        None,
+        ops_services=[OpsServiceType.schemaregistry.value],
+        bundle_dir=a_bundle_dir,
+        since_bundle=previous_bundle,
+    )
+
+    mocked_read_manifest.assert_called_once_with(previous_bundle)
+    # logs are only captured since the previous bundle instead of the default log age
+    log_calls = mocked_client.CoreV1Api().read_namespaced_pod_log.call_args_list
+    assert log_calls
+    for call in log_calls:
+        assert 3600 <= call.kwargs["since_seconds"] <= 3660
+
+
+@pytest.mark.parametrize("log_tail_lines, log_max_mb", [(None, None), (100, 16)])
+def test_create_bundle_log_limits(
+    mocker,
+    mocked_client,
+    mocked_cluster_snapshot,
+    mocked_config,
+    mocked_os_makedirs,
+    mocked_zipfile,
+    mocked_list_pods,
+    mocked_list_config_maps,
+    mocked_list_statefulsets,
+    mocked_list_services,
+    mocked_list_nodes,
+    mocked_list_cluster_events,
+    mocked_list_storage_classes,
+    mocked_list_persistent_volume_claims,
+    mocked_root_logger,
+    mocked_get_config_map,
+    log_tail_lines: Optional[int],
+    log_max_mb: Optional[int],
+):
+    from azext_edge.edge.providers.support.base import POD_LOG_MAX_BYTES
+
+    mocked_read_log = mocker.patch(
+        "azext_edge.edge.providers.support.base._read_pod_container_log", return_value="log line"
+    )
+    support_bundle(
+        None,
+        ops_services=[OpsServiceType.schemaregistry.value],
+        bundle_dir=a_bundle_dir,
+        log_tail_lines=log_tail_lines,
+        log_max_mb=log_max_mb,
+    )
+
+    assert mocked_read_log.call_args_list
+    for call in mocked_read_log.call_args_list:
+        assert call.kwargs["tail_lines"] == log_tail_lines
+        assert call.kwargs["max_bytes"] == (log_max_mb * 1024 * 1024 if log_max_mb else POD_LOG_MAX_BYTES)
+
+
+@pytest.mark.parametrize("log_limits", [{"log_tail_lines": 0}, {"log_max_mb": -1}])
+def test_create_bundle_log_limits_error(log_limits: dict):
+    from azure.cli.core.azclierror import ArgumentUsageError
+
+    with pytest.raises(ArgumentUsageError):
+        support_bundle(None, bundle_dir=a_bundle_dir, **log_limits)
+
+
+@pytest.mark.parametrize(
+    "fetch_limits", [{"max_workers": 0}, {"max_workers": -1}, {"element_timeout": 0}, {"element_timeout": -5}]
+)
+def test_create_bundle_fetch_limits_error(mocker, fetch_limits: dict):
+    from azure.cli.core.azclierror import InvalidArgumentValueError
+
+    mocked_build_bundle = mocker.patch("azext_edge.edge.providers.support_bundle.build_bundle")
+    with pytest.raises(InvalidArgumentValueError):
+        support_bundle(None, bundle_dir=a_bundle_dir, **fetch_limits)
+    mocked_build_bundle.assert_not_called()
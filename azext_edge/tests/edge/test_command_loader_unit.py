@@ -0,0 +1,41 @@
+# coding=utf-8
+# ----------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License file in the project root for license information.
+# ----------------------------------------------------------------------------------------------
+
+import json
+import os
+import sys
+from pathlib import Path
+from subprocess import run
+
+import pytest
+
+LOAD_COMMAND_TABLE_SCRIPT = """
+import json, sys
+from azure.cli.core.mock import DummyCli
+from azext_edge import OpsExtensionCommandsLoader
+
+loader = OpsExtensionCommandsLoader(cli_ctx=DummyCli())
+command_table = loader.load_command_table(None)
+print(json.dumps({"commands": len(command_table), "modules": list(sys.modules)}))
+"""
+
+
+@pytest.mark.parametrize("deferred_module", ["kubernetes", "azure.identity", "azext_edge.edge.vendor"])
+def test_load_command_table_defers_imports(deferred_module: str):
+    # a fresh interpreter, since other tests import these modules
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(Path(__file__).parents[3]), env.get("PYTHONPATH")]))
+    result = run(
+        [sys.executable, "-c", LOAD_COMMAND_TABLE_SCRIPT], capture_output=True, text=True, check=True, env=env
+    )
+    loaded = json.loads(result.stdout.strip().splitlines()[-1])
+
+    assert loaded["commands"]
+    assert not [
+        module
+        for module in loaded["modules"]
+        if module == deferred_module or module.startswith(f"{deferred_module}.")
+    ]
@@ -296,3 +296,22 @@ def generate_ops_resource(segments: int = 1) -> IoTOperationsResource:
     )
 
     return resource
+
+
+def build_recv_into(stream: bytes, max_chunk: Optional[int] = None):
+    """
+    Returns a socket.recv_into side effect that serves stream, at most max_chunk bytes per call.
+    An empty read is returned once the stream is exhausted.
+    """
+    position = 0
+
+    def _recv_into(buffer, nbytes: int = 0):
+        nonlocal position
+        size = min(nbytes or len(buffer), len(stream) - position)
+        if max_chunk:
+            size = min(size, max_chunk)
+        buffer[:size] = stream[position:position + size]
+        position += size
+        return size
+
+    return _recv_into
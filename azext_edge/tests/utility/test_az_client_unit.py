@@ -13,19 +13,67 @@ AZ_CLIENT_PATH = "azext_edge.edge.util.az_client"
 @pytest.mark.parametrize("done", [True, False])
 def test_wait_for_terminal_state(mocker, done):
     # could be fixture with param
-    sleep_patch = mocker.patch(f"{AZ_CLIENT_PATH}.sleep")
+    mocked_event_wait = mocker.patch(f"{AZ_CLIENT_PATH}.Event.wait")
     poll_num = 10
     mocker.patch(f"{AZ_CLIENT_PATH}.POLL_RETRIES", poll_num)
+    mocked_monotonic = mocker.patch(f"{AZ_CLIENT_PATH}.monotonic")
+    # each wait advances the clock by the requested wait
+    clock = [0.0]
+    mocked_monotonic.side_effect = lambda: clock[0]
+    mocked_event_wait.side_effect = lambda timeout: clock.__setitem__(0, clock[0] + timeout)
 
     poller = mocker.Mock()
     poller.done.return_value = done
     poller.result.return_value = generate_random_string()
 
-    from azext_edge.edge.util.az_client import wait_for_terminal_state
+    from azext_edge.edge.util.az_client import POLL_INITIAL_WAIT_SEC, wait_for_terminal_state
 
-    result = wait_for_terminal_state(poller)
+    result = wait_for_terminal_state(poller, wait_sec=2)
     assert result == poller.result.return_value
-    assert sleep_patch.call_count == (1 if done else poll_num)
+    poller.add_done_callback.assert_called_once()
+    if done:
+        # no waiting for operations that are already complete
+        mocked_event_wait.assert_not_called()
+        return
+
+    waits = [c.args[0] for c in mocked_event_wait.call_args_list]
+    # backs off exponentially up to wait_sec, until retries * wait_sec passes
+    assert waits[:4] == [POLL_INITIAL_WAIT_SEC, POLL_INITIAL_WAIT_SEC * 2, POLL_INITIAL_WAIT_SEC * 4, 2]
+    assert max(waits) == 2
+    assert sum(waits) == poll_num * 2
+
+
+def test_iter_completed_pollers(mocker):
+    from azext_edge.edge.util.az_client import iter_completed_pollers
+
+    pollers = [mocker.Mock(), mocker.Mock(), mocker.Mock()]
+    # the second poller finishes first, the third never does
+    done_states = {0: iter([False, True]), 1: iter([True]), 2: iter(lambda: False, True)}
+    for i, poller in enumerate(pollers):
+        poller.done.side_effect = lambda i=i: next(done_states[i])
+
+    completed = list(iter_completed_pollers(*pollers, retries=4, wait_sec=0.01))
+    assert completed == [pollers[1], pollers[0]]
+
+
+def test_iter_completed_pollers_callback(mocker):
+    from time import monotonic, sleep
+    from azure.core.polling import LROPoller, NoPolling
+
+    from azext_edge.edge.util.az_client import iter_completed_pollers
+
+    class _SlowPolling(NoPolling):
+        def run(self):
+            sleep(0.2)
+
+    # without the done callback the first completion check would only happen after a minute
+    mocker.patch(f"{AZ_CLIENT_PATH}.POLL_INITIAL_WAIT_SEC", 60)
+    poller = LROPoller(
+        client=None, initial_response=None, deserialization_callback=lambda _: None, polling_method=_SlowPolling()
+    )
+    start = monotonic()
+    assert list(iter_completed_pollers(poller, wait_sec=60)) == [poller]
+    assert monotonic() - start < 30
 
 
 def test_get_tenant_id(mocker):
@@ -38,3 +86,174 @@ def test_get_tenant_id(mocker):
     result = get_tenant_id()
     assert result == tenant_id
     profile_patch.assert_called_once()
+
+
+def test_client_pool(mocker):
+    from azext_edge.edge.util.az_client import (
+        clear_client_pool,
+        get_keyvault_client,
+        get_registry_mgmt_client,
+        get_resource_client,
+    )
+
+    clear_client_pool()
+    subscription_id = generate_random_string()
+    client = get_resource_client(subscription_id=subscription_id)
+    assert get_resource_client(subscription_id=subscription_id) is client
+    # pooled by client type, subscription and kwargs
+    assert get_resource_client(subscription_id=generate_random_string()) is not client
+    assert get_registry_mgmt_client(subscription_id=subscription_id) is not client
+    api_client = get_registry_mgmt_client(subscription_id=subscription_id, api_version="2024-11-01")
+    assert get_registry_mgmt_client(subscription_id=subscription_id, api_version="2024-11-01") is api_client
+    assert get_registry_mgmt_client(subscription_id=subscription_id, api_version="2024-09-01-preview") is not api_client
+    assert get_keyvault_client(subscription_id=subscription_id) is get_keyvault_client(subscription_id=subscription_id)
+
+    # clients with custom policies are not pooled
+    policy = mocker.Mock()
+    assert get_resource_client(subscription_id=subscription_id, http_logging_policy=policy) is not get_resource_client(
+        subscription_id=subscription_id, http_logging_policy=policy
+    )
+
+    # every client shares one session
+    sessions = {id(c._client._pipeline._transport.session) for c in [client, api_client]}
+    assert len(sessions) == 1
+
+    clear_client_pool()
+    assert get_resource_client(subscription_id=subscription_id) is not client
+
+
+def test_client_pool_identity(mocker):
+    from azext_edge.edge.util.az_client import clear_client_pool, get_resource_client
+
+    clear_client_pool()
+    mocked_identity = mocker.patch(
+        f"{AZ_CLIENT_PATH}._get_cli_identity", return_value=("AzureCloud", "tenant", "user", "user1")
+    )
+    subscription_id = generate_random_string()
+    client = get_resource_client(subscription_id=subscription_id)
+    assert get_resource_client(subscription_id=subscription_id) is client
+
+    # az login as another account or az cloud set do not reuse the client
+    mocked_identity.return_value = ("AzureCloud", "tenant", "user", "user2")
+    other_account_client = get_resource_client(subscription_id=subscription_id)
+    assert other_account_client is not client
+    mocked_identity.return_value = ("AzureUSGovernment", "tenant", "user", "user2")
+    assert get_resource_client(subscription_id=subscription_id) not in [client, other_account_client]
+    clear_client_pool()
+
+
+def test_get_cli_identity(mocker):
+    from azext_edge.edge.util.az_client import _get_cli_identity
+
+    mocker.patch.dict("os.environ", {"AZURE_CLOUD_NAME": "AzureUSGovernment"})
+    user = {"name": generate_random_string(), "type": "user"}
+    subscriptions = [
+        {"isDefault": True, "environmentName": "AzureCloud", "tenantId": "public", "user": user},
+        {"isDefault": False, "environmentName": "AzureUSGovernment", "tenantId": "other", "user": user},
+        {"isDefault": True, "environmentName": "AzureUSGovernment", "tenantId": "gov", "user": user},
+    ]
+    mocker.patch("azure.cli.core._session.ACCOUNT", {"subscriptions": subscriptions})
+    assert _get_cli_identity() == ("AzureUSGovernment", "gov", "user", user["name"])
+
+    mocker.patch("azure.cli.core._session.ACCOUNT", {})
+    assert _get_cli_identity() == ("AzureUSGovernment", None, None, None)
+
+
+def test_cached_token_credential(mocker):
+    from azure.core.credentials import AccessToken
+    from azext_edge.edge.util.az_client import TOKEN_REFRESH_MARGIN_SEC, CachedTokenCredential
+
+    mocked_time = mocker.patch(f"{AZ_CLIENT_PATH}.time", return_value=1000)
+    credential = mocker.Mock()
+    credential.get_token.side_effect = lambda *_, **__: AccessToken(
+        generate_random_string(), mocked_time.return_value + TOKEN_REFRESH_MARGIN_SEC + 60
+    )
+    cached_credential = CachedTokenCredential(credential)
+
+    scope = "https://management.azure.com/.default"
+    token = cached_credential.get_token(scope)
+    assert cached_credential.get_token(scope) is token
+    assert credential.get_token.call_count == 1
+
+    # tokens are cached per scopes and tenant
+    assert cached_credential.get_token("https://vault.azure.net/.default") is not token
+    assert cached_credential.get_token(scope, tenant_id=generate_random_string()) is not token
+    # claims challenges bypass the cache
+    assert cached_credential.get_token(scope, claims=generate_random_string()) is not token
+    assert cached_credential.get_token(scope) is token
+
+    # tokens are refreshed before they expire
+    mocked_time.return_value += 61
+    refreshed_token = cached_credential.get_token(scope)
+    assert refreshed_token is not token
+    assert cached_credential.get_token(scope) is refreshed_token
+
+    cached_credential.clear()
+    assert cached_credential.get_token(scope) is not refreshed_token
+
+
+def test_cached_token_credential_identity(mocker):
+    from azure.core.credentials import AccessToken
+    from azext_edge.edge.util.az_client import CachedTokenCredential
+
+    credential = mocker.Mock()
+    credential.get_token.side_effect = lambda *_, **__: AccessToken(generate_random_string(), 2**40)
+    identity = mocker.Mock(return_value=("AzureCloud", "tenant", "user", "user1"))
+    cached_credential = CachedTokenCredential(credential, identity=identity)
+
+    scope = "https://management.azure.com/.default"
+    token = cached_credential.get_token(scope)
+    assert cached_credential.get_token(scope) is token
+    # tokens of a previous account are not reused
+    identity.return_value = ("AzureCloud", "tenant", "user", "user2")
+    assert cached_credential.get_token(scope) is not token
+
+
+def test_cached_token_credential_concurrency(mocker):
+    from threading import Event, Thread
+    from azure.core.credentials import AccessToken
+    from azext_edge.edge.util.az_client import CachedTokenCredential
+
+    vault_scope = "https://vault.azure.net/.default"
+    release = Event()
+
+    def _get_token(*scopes, **_):
+        if vault_scope in scopes:
+            release.wait(5)
+        return AccessToken(generate_random_string(), 2**40)
+
+    credential = mocker.Mock()
+    credential.get_token.side_effect = _get_token
+    cached_credential = CachedTokenCredential(credential)
+
+    tokens = []
+    waiters = [Thread(target=lambda: tokens.append(cached_credential.get_token(vault_scope))) for _ in range(2)]
+    for waiter in waiters:
+        waiter.start()
+    # another scope is not blocked by the pending acquisition
+    cached_credential.get_token("https://management.azure.com/.default")
+    assert not tokens
+    release.set()
+    for waiter in waiters:
+        waiter.join()
+    # concurrent requests for one scope share a single acquisition
+    assert tokens[0] is tokens[1]
+    assert credential.get_token.call_count == 2
+
+
+def test_cached_token_credential_factory(mocker):
+    from azext_edge.edge.util.az_client import CachedTokenCredential
+
+    credential = mocker.Mock()
+    credential_factory = mocker.Mock(return_value=credential)
+    cached_credential = CachedTokenCredential(credential_factory=credential_factory)
+    # the credential is created on first use
+    credential_factory.assert_not_called()
+
+    cached_credential.get_token("https://management.azure.com/.default")
+    cached_credential.get_token("https://vault.azure.net/.default")
+    credential_factory.assert_called_once()
+    assert credential.get_token.call_count == 2
+
+    with pytest.raises(ValueError):
+        CachedTokenCredential()
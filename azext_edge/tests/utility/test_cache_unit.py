@@ -0,0 +1,87 @@
+# coding=utf-8
+# ----------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License file in the project root for license information.
+# ----------------------------------------------------------------------------------------------
+
+import pytest
+
+from azext_edge.edge.util.cache import MISSING, TTLCache
+
+
+@pytest.fixture
+def mocked_monotonic(mocker):
+    patched = mocker.patch("azext_edge.edge.util.cache.monotonic", autospec=True)
+    patched.return_value = 1000.0
+    yield patched
+
+
+def test_ttl_cache_lru_eviction(mocked_monotonic):
+    cache = TTLCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # touch a so b becomes least recently used
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("b", MISSING) is MISSING
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats() == {"entries": 2, "hits": 3, "misses": 1, "evictions": 1}
+
+
+def test_ttl_cache_expiry(mocked_monotonic):
+    cache = TTLCache(ttl_sec=10)
+    cache.set("default", "value")
+    cache.set("short", "value", ttl_sec=1)
+    cache.set("forever", "value", ttl_sec=None)
+
+    mocked_monotonic.return_value = 1005.0
+    assert cache.get("short") is None
+    assert cache.get("default") == "value"
+
+    mocked_monotonic.return_value = 1000000.0
+    assert "default" not in cache
+    assert cache.get("default") is None
+    assert cache.get("forever") == "value"
+    # falsy values are cached like any other
+    cache.set("empty", None)
+    assert cache.get("empty", MISSING) is None
+
+
+def test_ttl_cache_invalidate():
+    cache = TTLCache()
+    for key in [("ctx1", "a"), ("ctx1", "b"), ("ctx2", "a")]:
+        cache.set(key, True)
+
+    assert cache.invalidate(lambda key: key[0] == "ctx1") == 2
+    assert len(cache) == 1
+    assert cache.invalidate() == 1
+    assert len(cache) == 0
+
+
+def test_cluster_caches_scoped_and_invalidated(mocker):
+    from azext_edge.edge.providers import base
+
+    mocked_client = mocker.patch("azext_edge.edge.providers.base.client", autospec=True)
+    list_objects = mocked_client.CustomObjectsApi().list_cluster_custom_object
+    list_objects.side_effect = lambda **kwargs: {"items": [kwargs]}
+    mocker.patch.object(base, "_cache_scope", ("context1", "https://server1"))
+    base.invalidate_cluster_caches()
+
+    kwargs = {"group": "group", "version": "v1", "plural": "widgets"}
+    base.get_custom_objects(**kwargs)
+    base.get_custom_objects(**kwargs)
+    assert list_objects.call_count == 1
+
+    # a different kube context does not see entries from another context
+    mocker.patch.object(base, "_cache_scope", ("context2", "https://server2"))
+    base.get_custom_objects(**kwargs)
+    assert list_objects.call_count == 2
+
+    # writes invalidate matching custom object entries
+    base.create_namespaced_custom_objects(namespace="ns", yaml_objects=[{"metadata": {"name": "w"}}], **kwargs)
+    base.get_custom_objects(**kwargs)
+    assert list_objects.call_count == 3
+    assert base.get_cluster_cache_stats()["customObjects"]["hits"] >= 1
@@ -4,6 +4,7 @@
 # Licensed under the MIT License. See License file in the project root for license information.
 # ----------------------------------------------------------------------------------------------
 
+import json
 import string
 from os import environ
 from typing import List, Tuple
@@ -11,6 +12,7 @@ from typing import List, Tuple
 import pytest
 
 from azext_edge.edge.util import (
+    chunk_list,
     is_enabled_str,
     is_env_flag_enabled,
     parse_dot_notation,
@@ -139,3 +141,36 @@ def test_parse_dot_notation(input_data: List[str], expected: dict):
 def test_upsert_by_discriminator(initial, disc_key, new_config, expected):
     result = upsert_by_discriminator(initial=initial, disc_key=disc_key, config=new_config)
     assert result == expected
+
+
+@pytest.mark.parametrize("chunk_len", [1, 7, 800])
+@pytest.mark.parametrize("data_size", [1, 4])
+@pytest.mark.parametrize("pack", [False, True])
+def test_chunk_list(chunk_len: int, data_size: int, pack: bool):
+    data = [{"name": generate_random_string(), "spec": "x" * (idx * 37 % 1500)} for idx in range(300)]
+    result = chunk_list(data=data, chunk_len=chunk_len, data_size=data_size, pack=pack)
+
+    assert all(result)
+    if pack:
+        assert sorted(item["name"] for chunk in result for item in chunk) == sorted(item["name"] for item in data)
+    else:
+        assert [item for chunk in result for item in chunk] == data
+
+    for chunk in result:
+        assert len(chunk) <= chunk_len
+        # only an item exceeding the size limit on its own may produce an oversized chunk
+        assert len(chunk) == 1 or len(json.dumps(chunk).encode("utf-8")) <= data_size * 1024
+
+    if not pack:
+        # greedy in order: the first item of each next chunk would not have fit the previous chunk
+        for chunk, next_chunk in zip(result, result[1:]):
+            grown = chunk + next_chunk[:1]
+            assert len(grown) > chunk_len or len(json.dumps(grown).encode("utf-8")) > data_size * 1024
+    else:
+        assert len(result) <= len(chunk_list(data=data, chunk_len=chunk_len, data_size=data_size))
+
+
+def test_chunk_list_size_unit():
+    data = [{"value": "x" * 1000} for _ in range(3000)]
+    assert len(chunk_list(data=data, chunk_len=len(data), data_size=1, size_unit="mb")) == 3
+    assert chunk_list(data=[], chunk_len=10) == []
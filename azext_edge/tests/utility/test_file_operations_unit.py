@@ -230,3 +230,47 @@ def test_try_loading_as(mocker, error, raise_error, return_value):
         )
         assert result == (None if error else return_value)
     loader.assert_called_once_with(content)
+
+
+@pytest.mark.parametrize("extension", ["csv", "json"])
+@pytest.mark.parametrize("row_count", [0, 1, 3])
+def test_dump_rows_to_file(tmp_path, extension, row_count):
+    from azext_edge.edge.util import dump_rows_to_file
+
+    fieldnames = ["name", "value"]
+    rows = [{"name": generate_random_string(), "value": str(i)} for i in range(row_count)]
+    file_name = generate_random_string()
+
+    file_path = dump_rows_to_file(
+        rows=iter(rows), file_name=file_name, extension=extension, fieldnames=fieldnames, output_dir=str(tmp_path)
+    )
+    assert file_path == os.path.join(str(tmp_path), f"{file_name}.{extension}")
+    with open(file_path, encoding="utf-8") as f:
+        if extension == "csv":
+            assert f.readline().strip() == ",".join(fieldnames)
+            assert list(csv.DictReader(f, fieldnames=fieldnames)) == rows
+        else:
+            assert json.load(f) == rows
+
+    with pytest.raises(FileExistsError):
+        dump_rows_to_file(
+            rows=iter(rows), file_name=file_name, extension=extension, fieldnames=fieldnames, output_dir=str(tmp_path)
+        )
+    dump_rows_to_file(
+        rows=iter([]),
+        file_name=file_name,
+        extension=extension,
+        fieldnames=fieldnames,
+        output_dir=str(tmp_path),
+        replace=True
+    )
+
+
+def test_dump_rows_to_file_error(tmp_path):
+    from azure.cli.core.azclierror import InvalidArgumentValueError
+    from azext_edge.edge.util import dump_rows_to_file
+
+    with pytest.raises(InvalidArgumentValueError):
+        dump_rows_to_file(
+            rows=[], file_name=generate_random_string(), extension="yaml", fieldnames=[], output_dir=str(tmp_path)
+        )
@@ -0,0 +1,51 @@
+# coding=utf-8
+# ----------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License file in the project root for license information.
+# ----------------------------------------------------------------------------------------------
+
+import secrets
+
+import pytest
+
+from azext_edge.edge.util.framing import FramedReader
+
+from ..helpers import build_recv_into
+
+
+def _frame(payload: bytes) -> bytes:
+    return len(payload).to_bytes(4, byteorder="big") + payload
+
+
+@pytest.mark.parametrize("max_chunk", [None, 1, 3, 1000])
+@pytest.mark.parametrize("payload_sizes", [[10], [1, 20, 5], [100, 5000]])
+def test_framed_reader(mocker, max_chunk, payload_sizes):
+    payloads = [secrets.token_bytes(size) for size in payload_sizes]
+    socket_mock = mocker.MagicMock()
+    socket_mock.recv_into.side_effect = build_recv_into(b"".join(_frame(p) for p in payloads), max_chunk=max_chunk)
+
+    reader = FramedReader(socket_mock, initial_buffer_size=16)
+    for payload in payloads:
+        assert bytes(reader.read_frame()) == payload
+    # closed on a frame boundary
+    assert reader.read_frame() is None
+    # the buffer grows to fit the largest frame
+    assert len(reader._buffer) >= max(payload_sizes)
+
+
+def test_framed_reader_partial_and_limits(mocker):
+    socket_mock = mocker.MagicMock()
+
+    # closed part way through a frame
+    socket_mock.recv_into.side_effect = build_recv_into(_frame(b"0123456789")[:8])
+    with pytest.raises(ConnectionAbortedError):
+        FramedReader(socket_mock).read_frame()
+
+    # an empty frame is treated as closed
+    socket_mock.recv_into.side_effect = build_recv_into(_frame(b""))
+    assert FramedReader(socket_mock).read_frame() is None
+
+    # frames above the size limit are rejected before reading the payload
+    socket_mock.recv_into.side_effect = build_recv_into(_frame(b"0123456789"))
+    with pytest.raises(ValueError):
+        FramedReader(socket_mock, max_frame_size=9).read_frame()
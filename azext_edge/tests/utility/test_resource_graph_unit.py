@@ -115,3 +115,128 @@ def test_query_resources(mocker, mocked_cmd, test_scenario: dict):
                 assert mocked_send_raw_request.call_args_list[i + 1].kwargs == expected_send_raw_request_call
 
     assert mocked_send_raw_request.call_count == total_send_raw_request_calls
+
+
+def test_iter_resource_pages(mocker, mocked_cmd):
+    mocked_send_raw_request: Mock = mocker.patch("azext_edge.edge.util.resource_graph.send_raw_request")
+    pages = [
+        {"data": [{"id": generate_random_string()}], "$skipToken": generate_random_string()},
+        {"data": [{"id": generate_random_string()}, {"id": generate_random_string()}]},
+    ]
+    mocked_send_raw_request.return_value.json.side_effect = pages
+
+    from azext_edge.edge.util.resource_graph import ResourceGraph
+
+    resource_graph = ResourceGraph(cmd=mocked_cmd, subscriptions=[get_zeroed_subscription()])
+    page_iter = resource_graph.iter_resource_pages(query=generate_random_string())
+
+    # pages are requested as they are consumed
+    assert next(page_iter) == pages[0]["data"]
+    assert mocked_send_raw_request.call_count == 1
+    assert next(page_iter) == pages[1]["data"]
+    assert json.loads(mocked_send_raw_request.call_args.kwargs["body"])["options"] == {
+        "$skipToken": pages[0]["$skipToken"]
+    }
+    assert list(page_iter) == []
+    assert mocked_send_raw_request.call_count == 2
+
+
+def _mock_partition_responses(mocker, pages_by_partition: dict):
+    """Mocks ARG responses per (subscription, query) partition. Pages after the first are keyed by skipToken."""
+    mocked_send_raw_request: Mock = mocker.patch("azext_edge.edge.util.resource_graph.send_raw_request")
+
+    def _send(**kwargs):
+        body = json.loads(kwargs["body"])
+        pages = pages_by_partition[(tuple(body["subscriptions"]), body["query"])]
+        page_index = int(body["options"].get("$skipToken", 0))
+        if isinstance(pages, Exception):
+            raise pages
+        response = {"data": pages[page_index]}
+        if page_index + 1 < len(pages):
+            response["$skipToken"] = str(page_index + 1)
+        response_mock = mocker.MagicMock()
+        response_mock.json.return_value = response
+        return response_mock
+
+    mocked_send_raw_request.side_effect = _send
+    return mocked_send_raw_request
+
+
+@pytest.mark.parametrize("partition_by_subscription", [True, False])
+def test_iter_partitioned_pages(mocker, mocked_cmd, partition_by_subscription):
+    from azext_edge.edge.util.resource_graph import ResourceGraph
+
+    subscriptions = [generate_random_string(), generate_random_string()]
+    queries = [generate_random_string(), generate_random_string()]
+    partitions = (
+        [((sub,), query) for query in queries for sub in subscriptions]
+        if partition_by_subscription
+        else [(tuple(subscriptions), query) for query in queries]
+    )
+    pages_by_partition = {
+        partition: [[{"id": generate_random_string()}] for _ in range(3)] for partition in partitions
+    }
+    mocked_send_raw_request = _mock_partition_responses(mocker, pages_by_partition)
+
+    resource_graph = ResourceGraph(cmd=mocked_cmd, subscriptions=subscriptions)
+    result = list(
+        resource_graph.iter_partitioned_pages(queries=queries, partition_by_subscription=partition_by_subscription)
+    )
+
+    # every page of every partition, in arrival order
+    expected_pages = [page for pages in pages_by_partition.values() for page in pages]
+    assert sorted(page[0]["id"] for page in result) == sorted(page[0]["id"] for page in expected_pages)
+    assert mocked_send_raw_request.call_count == len(expected_pages)
+    # pages of each partition keep their order
+    for pages in pages_by_partition.values():
+        ids = [page[0]["id"] for page in pages]
+        assert [page[0]["id"] for page in result if page[0]["id"] in ids] == ids
+
+    # a single partition is paged without a pool
+    mocked_executor = mocker.patch("azext_edge.edge.util.resource_graph.ThreadPoolExecutor")
+    resource_graph = ResourceGraph(cmd=mocked_cmd, subscriptions=subscriptions[:1])
+    pages_by_partition[((subscriptions[0],), queries[0])] = [[{"id": "single"}]]
+    assert list(resource_graph.iter_resources(query=queries[0], partition_by_subscription=True)) == [{"id": "single"}]
+    mocked_executor.assert_not_called()
+
+
+def test_iter_partitioned_pages_error(mocker, mocked_cmd):
+    from azext_edge.edge.util.resource_graph import ResourceGraph
+
+    subscriptions = [generate_random_string(), generate_random_string()]
+    query = generate_random_string()
+    error = ValueError(generate_random_string())
+    _mock_partition_responses(
+        mocker,
+        {((subscriptions[0],), query): [[{"id": generate_random_string()}]], ((subscriptions[1],), query): error},
+    )
+    resource_graph = ResourceGraph(cmd=mocked_cmd, subscriptions=subscriptions)
+    with pytest.raises(ValueError) as e:
+        list(resource_graph.iter_resources(query=query, partition_by_subscription=True))
+    assert e.value is error
+
+
+def test_iter_partitioned_pages_early_exit(mocker, mocked_cmd):
+    from azext_edge.edge.util.resource_graph import RESOURCE_GRAPH_PREFETCH_PAGES, ResourceGraph
+
+    subscriptions = [generate_random_string(), generate_random_string()]
+    query = generate_random_string()
+    page_count = RESOURCE_GRAPH_PREFETCH_PAGES * 10
+    mocked_send_raw_request = _mock_partition_responses(
+        mocker, {((sub,), query): [[{"id": i}] for i in range(page_count)] for sub in subscriptions}
+    )
+    resource_graph = ResourceGraph(cmd=mocked_cmd, subscriptions=subscriptions)
+    rows = resource_graph.iter_resources(query=query, partition_by_subscription=True)
+    next(rows)
+    # closing the consumer stops the partitions rather than fetching every page
+    rows.close()
+    assert mocked_send_raw_request.call_count < page_count * 2
+
+
+def test_iter_partitioned_pages_empty(mocker, mocked_cmd):
+    from azext_edge.edge.util.resource_graph import ResourceGraph
+
+    mocked_send_raw_request = mocker.patch("azext_edge.edge.util.resource_graph.send_raw_request")
+    resource_graph = ResourceGraph(cmd=mocked_cmd, subscriptions=[generate_random_string()])
+    assert list(resource_graph.iter_partitioned_pages(queries=[], partition_by_subscription=True)) == []
+    mocked_send_raw_request.assert_not_called()
@@ -0,0 +1,103 @@
+# coding=utf-8
+# ----------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License file in the project root for license information.
+# ----------------------------------------------------------------------------------------------
+"""
+Measures the startup cost of az iot ops: loading the command table, loading the arguments of a command
+and importing each command module. Every sample runs in a fresh interpreter so module caching does not
+hide import cost.
+
+Usage: python startup_benchmark.py [command, default "iot ops show"] [runs, default 5]
+"""
+import sys
+from statistics import median
+from subprocess import run
+from time import perf_counter
+from unittest import mock
+
+COMMAND_MODULES = [
+    "azext_edge.edge.commands_edge",
+    "azext_edge.edge.commands_assets",
+    "azext_edge.edge.commands_asset_endpoint_profiles",
+    "azext_edge.edge.commands_connector",
+    "azext_edge.edge.commands_dataflow",
+    "azext_edge.edge.commands_mq",
+    "azext_edge.edge.commands_schema",
+    "azext_edge.edge.commands_secretsync",
+]
+# Heavy dependencies that should only be imported once a command runs.
+DEFERRED_MODULES = ["kubernetes", "azure.identity", "azext_edge.edge.vendor"]
+
+
+def _get_loader():
+    from azure.cli.core.mock import DummyCli
+    from azext_edge import OpsExtensionCommandsLoader
+
+    return OpsExtensionCommandsLoader(cli_ctx=DummyCli())
+
+
+def _measure_command_table():
+    loader = _get_loader()
+    start = perf_counter()
+    loader.load_command_table(None)
+    elapsed = perf_counter() - start
+    loaded = [name for name in DEFERRED_MODULES if any(m == name or m.startswith(f"{name}.") for m in sys.modules)]
+    return elapsed, loaded
+
+
+def _measure_arguments(command: str):
+    loader = _get_loader()
+    loader.load_command_table(None)
+    loader.cli_ctx.invocation = mock.MagicMock(data={"command_string": command})
+    loader.command_name = command
+    start = perf_counter()
+    loader.load_arguments(command)
+    return perf_counter() - start, []
+
+
+def _measure_import(module: str):
+    _get_loader()
+    start = perf_counter()
+    __import__(module)
+    return perf_counter() - start, []
+
+
+def _sample(phase: str, arg: str, runs: int) -> str:
+    timings = []
+    loaded = ""
+    for _ in range(runs):
+        result = run([sys.executable, __file__, "--child", phase, arg], capture_output=True, text=True, check=True)
+        elapsed, loaded = result.stdout.strip().split("|")
+        timings.append(float(elapsed))
+    summary = f"{median(timings) * 1000:8.1f} ms (min {min(timings) * 1000:.1f})"
+    if loaded:
+        summary += f" loaded: {loaded}"
+    return summary
+
+
+def run_benchmark(command: str = "iot ops show", runs: int = 5):
+    print(f"Median of {runs} runs, each in a fresh interpreter.")
+    print(f"{'load_command_table':<60}{_sample('table', '', runs)}")
+    print(f"{'load_arguments ' + command:<60}{_sample('args', command, runs)}")
+    for module in COMMAND_MODULES:
+        print(f"{'import ' + module:<60}{_sample('import', module, runs)}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        phase, arg = sys.argv[2], sys.argv[3]
+        if phase == "table":
+            elapsed, loaded = _measure_command_table()
+        elif phase == "args":
+            elapsed, loaded = _measure_arguments(arg)
+        else:
+            elapsed, loaded = _measure_import(arg)
+        print(f"{elapsed}|{','.join(loaded)}")
+        sys.exit(0)
+
+    if len(sys.argv) > 3:
+        print("Usage: python startup_benchmark.py [command] [runs]")
+        sys.exit(1)
+    run_benchmark(*sys.argv[1:2], *[int(runs) for runs in sys.argv[2:3]])
+    sys.exit(0)